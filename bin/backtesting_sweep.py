@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+from typing import Any, Dict, List
+
+import pandas as pd
+import path_util  # noqa: F401
+import yaml
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.parameter_sweep import BacktestingSweepRunner, grid_overrides, random_overrides
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Backtests many variants of a controller config in parallel.")
+        self.add_argument("--controller-config", "-c",
+                          type=str,
+                          required=True,
+                          help="Specify a file in `conf/controllers` with the base controller config.")
+        self.add_argument("--start",
+                          type=str,
+                          required=True,
+                          help="Start of the backtests, as a timestamp in seconds or a UTC date (e.g. 2024-01-01).")
+        self.add_argument("--end",
+                          type=str,
+                          required=True,
+                          help="End of the backtests, as a timestamp in seconds or a UTC date (e.g. 2024-12-31).")
+        self.add_argument("--param", "-p",
+                          type=str,
+                          action="append",
+                          default=[],
+                          help="Candidate values of a config parameter, as name=value1,value2,... "
+                               "Can be used multiple times.")
+        self.add_argument("--samples", "-n",
+                          type=int,
+                          required=False,
+                          help="Backtest a random sample of this size of the parameter grid instead of the whole grid.")
+        self.add_argument("--seed",
+                          type=int,
+                          required=False,
+                          help="Seed of the random sample.")
+        self.add_argument("--resolution",
+                          type=str,
+                          default="1m",
+                          help="Interval of the candles used to simulate the executors.")
+        self.add_argument("--trade-cost",
+                          type=float,
+                          default=0.0006,
+                          help="Cost per trade.")
+        self.add_argument("--workers", "-w",
+                          type=int,
+                          required=False,
+                          help="Number of worker processes, defaults to the number of CPUs.")
+        self.add_argument("--output", "-o",
+                          type=str,
+                          default="backtesting_sweep.csv",
+                          help="CSV file where each result is appended as soon as it is available.")
+        self.add_argument("--vectorized",
+                          action="store_true",
+                          help="Use the event driven simulation, faster but only evaluating the controller when its "
+                               "signal changes.")
+        self.add_argument("--no-candles-store",
+                          action="store_true",
+                          help="Download the candles from the exchange instead of using the local candles store.")
+
+
+def parse_timestamp(value: str) -> int:
+    if value.isdigit():
+        return int(value)
+    return int(pd.Timestamp(value, tz="UTC").timestamp())
+
+
+def parse_param_grid(params: List[str]) -> Dict[str, List[Any]]:
+    param_grid = {}
+    for param in params:
+        name, _, values = param.partition("=")
+        if not name or not values:
+            raise ValueError(f"Invalid parameter {param}. Expected name=value1,value2,...")
+        param_grid[name.strip()] = [yaml.safe_load(value) for value in values.split(",")]
+    return param_grid
+
+
+async def main_async(args: argparse.Namespace):
+    param_grid = parse_param_grid(args.param)
+    if args.samples is not None:
+        overrides = random_overrides(param_grid, args.samples, seed=args.seed)
+    else:
+        overrides = grid_overrides(param_grid)
+    runner = BacktestingSweepRunner(
+        base_config=BacktestingEngineBase.load_controller_config(args.controller_config),
+        start=parse_timestamp(args.start),
+        end=parse_timestamp(args.end),
+        backtesting_resolution=args.resolution,
+        trade_cost=args.trade_cost,
+        max_workers=args.workers,
+        vectorized=args.vectorized,
+        candles_store=None if args.no_candles_store else CandlesStore(),
+    )
+    print(f"Running {len(overrides)} backtests...")
+    results_df = await runner.run(overrides, output_path=args.output)
+    print(results_df.sort_values("net_pnl_quote", ascending=False).to_string(index=False))
+    print(f"Results saved to {args.output}")
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
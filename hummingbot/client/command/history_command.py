@@ -39,6 +39,7 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        self.trading_core.flush_trade_fills()
         with self.trading_core.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -56,6 +57,7 @@ class HistoryCommand:
         if self.strategy_file_name is None:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        self.trading_core.flush_trade_fills()
         with self.trading_core.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -183,6 +185,7 @@ class HistoryCommand:
 
         lines = []
 
+        self.trading_core.flush_trade_fills()
         with self.trading_core.trade_fill_db.get_new_session() as session:
             queried_trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
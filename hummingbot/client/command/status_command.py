@@ -77,6 +77,9 @@ class StatusCommand:
         else:
             st_status = self.trading_core.strategy.format_status()
         status = paper_trade + "\n" + st_status
+        clock = self.trading_core.clock
+        if not live and clock is not None and clock.timing_profile.has_delays:
+            status += "\n\n" + clock.timing_profile.format_status()
         return status
 
     def application_warning(self):
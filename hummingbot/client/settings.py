@@ -1,14 +1,18 @@
 import importlib
+import json
+import logging
+import os
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
 from hummingbot.connector.gateway.common_types import ConnectorType as GatewayConnectorType, get_connector_type
+from hummingbot.core.data_type import trade_fee
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
 if TYPE_CHECKING:
@@ -53,6 +57,8 @@ GATEAWAY_CLIENT_CERT_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_cert.pem"
 GATEAWAY_CLIENT_KEY_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_key.pem"
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
+# Cache of the connector settings read from the connector utils modules, rebuilt when any of them changes
+CONNECTOR_SETTINGS_MANIFEST_PATH = CONF_DIR_PATH / ".connector_settings_manifest.json"
 
 
 class ConnectorType(Enum):
@@ -236,17 +242,72 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class LazyConfigKeys(NamedTuple):
+    """
+    Reference to the config keys of a connector in its utils module, which is only imported when the keys are used.
+    """
+    util_module_path: str
+    domain: Optional[str] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        util_module = importlib.import_module(self.util_module_path)
+        if self.domain is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[self.domain]
+
+
+class LazyConnectorSetting(ConnectorSetting):
+    """
+    ConnectorSetting whose config keys are loaded from the connector utils module the first time they are used, so the
+    settings of all the connectors can be read from the manifest without importing their modules.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = tuple.__getitem__(self, ConnectorSetting._fields.index("config_keys"))
+        if isinstance(config_keys, LazyConfigKeys):
+            config_keys = config_keys.load()
+        return config_keys
+
+
 class AllConnectorSettings:
     paper_trade_connectors_names: List[str] = []
     all_connector_settings: Dict[str, ConnectorSetting] = {}
+    connector_settings_manifest_path: str = str(CONNECTOR_SETTINGS_MANIFEST_PATH)
 
     @classmethod
     def create_connector_settings(cls):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Creates a dictionary of exchange names to ConnectorSetting, from the manifest if the connector utils modules
+        did not change since it was written, or otherwise by importing every connector utils module.
         """
         cls.all_connector_settings = {}  # reset
+        util_modules = cls._connector_util_modules()
+        manifest_key = cls._connector_settings_manifest_key(util_modules)
+        connector_settings = cls._load_connector_settings_manifest(manifest_key)
+        if connector_settings is None:
+            connector_settings, complete = cls._import_connector_settings(util_modules)
+            # The manifest is not written if a connector could not be imported, since it would be missing from the
+            # manifest even after its dependencies are installed
+            if complete:
+                cls._save_connector_settings_manifest(manifest_key, connector_settings)
+        cls.all_connector_settings = connector_settings
+
+        # add gateway connectors dynamically from Gateway API
+        # Gateway connectors are now configured in Gateway, not in Hummingbot
+        # Gateway connectors will be added by GatewayHttpClient when it connects to Gateway
+
+        return cls.all_connector_settings
+
+    @staticmethod
+    def _connector_util_modules() -> List[Tuple[str, str, str]]:
+        """
+        Iterate over files in specific Python directories to find the utils module of every connector.
+        :return: the connector type directory, connector name and utils module path of each connector
+        """
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        util_modules = []
 
         type_dirs: List[DirEntry] = [
             cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
@@ -262,56 +323,152 @@ class AllConnectorSettings:
             for connector_dir in connector_dirs:
                 if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
                     continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+                util_modules.append((type_dir.name, connector_dir.name, connector_dir.path))
+        return util_modules
 
-        # add gateway connectors dynamically from Gateway API
-        # Gateway connectors are now configured in Gateway, not in Hummingbot
-        # Gateway connectors will be added by GatewayHttpClient when it connects to Gateway
+    @staticmethod
+    def _connector_settings_manifest_key(util_modules: List[Tuple[str, str, str]]) -> Dict[str, Any]:
+        """
+        The hummingbot version and the modification times of the connector utils files (and of the modules defining
+        the manifest format), which invalidate the manifest when hummingbot is updated or a connector is added, removed
+        or changed.
+        """
+        version_path = root_path() / "hummingbot" / "VERSION"
+        version = version_path.read_text().strip() if version_path.exists() else ""
+        paths = [__file__, trade_fee.__file__] + [join(connector_path, f"{connector_name}_utils.py")
+                                                  for _, connector_name, connector_path in util_modules]
+        return {
+            "version": version,
+            "files": [[path, os.stat(path).st_mtime_ns if exists(path) else 0] for path in sorted(paths)],
+        }
 
-        return cls.all_connector_settings
+    @classmethod
+    def _load_connector_settings_manifest(cls, manifest_key: Dict[str, Any]) -> Optional[Dict[str, ConnectorSetting]]:
+        """
+        Reads the connector settings from the manifest. The manifest is plain JSON data, so a tampered or corrupted
+        file can at most make the settings be imported from the utils modules again.
+        """
+        try:
+            with open(cls.connector_settings_manifest_path, "r") as manifest_file:
+                manifest = json.load(manifest_file)
+            if not isinstance(manifest, dict) or manifest.get("key") != manifest_key:
+                return None
+            return {name: cls._connector_setting_from_json(setting)
+                    for name, setting in manifest["connector_settings"].items()}
+        except Exception:
+            return None
+
+    @classmethod
+    def _save_connector_settings_manifest(cls,
+                                          manifest_key: Dict[str, Any],
+                                          connector_settings: Dict[str, ConnectorSetting]):
+        tmp_path = f"{cls.connector_settings_manifest_path}.tmp"
+        try:
+            manifest = {
+                "key": manifest_key,
+                "connector_settings": {name: cls._connector_setting_to_json(setting)
+                                       for name, setting in connector_settings.items()},
+            }
+            with open(tmp_path, "w") as manifest_file:
+                json.dump(manifest, manifest_file)
+            os.replace(tmp_path, cls.connector_settings_manifest_path)
+        except Exception:
+            # The manifest is only a cache, the settings are read from the utils modules again on the next start
+            logging.getLogger(__name__).debug("Could not write the connector settings manifest.", exc_info=True)
+
+    @staticmethod
+    def _connector_setting_to_json(connector_setting: ConnectorSetting) -> Dict[str, Any]:
+        """
+        The config keys are not stored, they are loaded from the utils module of the connector (or of its parent
+        connector for the other domains) when they are used.
+        """
+        return {
+            "name": connector_setting.name,
+            "type": connector_setting.type.value,
+            "example_pair": connector_setting.example_pair,
+            "centralised": connector_setting.centralised,
+            "use_ethereum_wallet": connector_setting.use_ethereum_wallet,
+            "trade_fee_schema": connector_setting.trade_fee_schema.to_json(),
+            "is_sub_domain": connector_setting.is_sub_domain,
+            "parent_name": connector_setting.parent_name,
+            "domain_parameter": connector_setting.domain_parameter,
+            "use_eth_gas_lookup": connector_setting.use_eth_gas_lookup,
+        }
+
+    @staticmethod
+    def _connector_setting_from_json(data: Dict[str, Any]) -> ConnectorSetting:
+        connector_type = ConnectorType(data["type"])
+        connector_name = data["parent_name"] if data["is_sub_domain"] else data["name"]
+        util_module_path = f"hummingbot.connector.{connector_type.value}.{connector_name}.{connector_name}_utils"
+        return LazyConnectorSetting(
+            name=data["name"],
+            type=connector_type,
+            example_pair=data["example_pair"],
+            centralised=data["centralised"],
+            use_ethereum_wallet=data["use_ethereum_wallet"],
+            trade_fee_schema=TradeFeeSchema.from_json(data["trade_fee_schema"]),
+            config_keys=LazyConfigKeys(util_module_path, data["name"] if data["is_sub_domain"] else None),
+            is_sub_domain=data["is_sub_domain"],
+            parent_name=data["parent_name"],
+            domain_parameter=data["domain_parameter"],
+            use_eth_gas_lookup=data["use_eth_gas_lookup"],
+        )
+
+    @classmethod
+    def _import_connector_settings(cls,
+                                   util_modules: List[Tuple[str, str, str]]) -> Tuple[Dict[str, ConnectorSetting], bool]:
+        """
+        Imports every connector utils module to create the connector settings.
+        :return: the connector settings, and whether all the utils modules could be imported
+        """
+        connector_settings: Dict[str, ConnectorSetting] = {}
+        complete = True
+        for type_dir_name, connector_name, connector_path in util_modules:
+            if connector_name in connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_name} name.")
+            util_module_path: str = f"hummingbot.connector.{type_dir_name}.{connector_name}.{connector_name}_utils"
+            try:
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                complete = complete and not exists(join(connector_path, f"{connector_name}_utils.py"))
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_name, trade_fee_settings
+            )
+            connector_settings[connector_name] = LazyConnectorSetting(
+                name=connector_name,
+                type=ConnectorType[type_dir_name.capitalize()],
+                centralised=getattr(util_module, "CENTRALIZED", True),
+                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                trade_fee_schema=trade_fee_schema,
+                config_keys=LazyConfigKeys(util_module_path),
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            )
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                parent = connector_settings[connector_name]
+                connector_settings[domain] = LazyConnectorSetting(
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
+                    trade_fee_schema=trade_fee_schema,
+                    config_keys=LazyConfigKeys(util_module_path, domain),
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                )
+        return connector_settings, complete
 
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
@@ -319,18 +476,12 @@ class AllConnectorSettings:
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the config keys of lazy settings unloaded
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
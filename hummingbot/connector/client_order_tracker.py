@@ -1,9 +1,9 @@
 import asyncio
 import logging
 from collections import defaultdict
+from collections.abc import Mapping
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
 
 from cachetools import TTLCache
 
@@ -29,6 +29,69 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersView(Mapping):
+    """
+    Read only view of the union of several collections of orders keyed by client order id, without copying them.
+    When an order id is present in several collections, the order of the last collection is the one returned.
+    Lookups are O(1) for each collection, while `len` and iteration are O(n). Since the view reflects the changes of
+    the collections, they must not be modified while the view is iterated.
+    """
+
+    def __init__(self, *orders_collections: Mapping):
+        self._orders_collections = orders_collections
+
+    def __getitem__(self, client_order_id: str) -> InFlightOrder:
+        for orders in reversed(self._orders_collections):
+            order = orders.get(client_order_id)
+            if order is not None:
+                return order
+        raise KeyError(client_order_id)
+
+    def __iter__(self) -> Iterator[str]:
+        for index, orders in enumerate(self._orders_collections):
+            following_collections = self._orders_collections[index + 1:]
+            for client_order_id in orders:
+                if not any(client_order_id in following for following in following_collections):
+                    yield client_order_id
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)})"
+
+
+class OrdersByExchangeOrderIdView(Mapping):
+    """
+    Read only view of a collection of orders keyed by exchange order id. Lookups use the exchange order id index
+    of the order tracker, while `len` and iteration build the complete mapping, so they are O(n).
+    """
+
+    def __init__(self, order_tracker: "ClientOrderTracker", orders: OrdersView):
+        self._order_tracker = order_tracker
+        self._orders = orders
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        if exchange_order_id is None:
+            return self._orders_map()[exchange_order_id]
+        order = self._order_tracker._fetch_order_by_exchange_order_id(exchange_order_id, self._orders)
+        if order is None:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._orders_map())
+
+    def __len__(self) -> int:
+        return len(self._orders_map())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._orders_map()})"
+
+    def _orders_map(self) -> Dict[str, InFlightOrder]:
+        return {order.exchange_order_id: order for order in self._orders.values()}
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -62,6 +125,12 @@ class ClientOrderTracker:
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
+        # Index of the tracked orders (active, cached and lost) by exchange order id. Orders without an exchange order
+        # id yet are indexed as soon as it is known, and the entries of orders no longer tracked are validated on
+        # lookup and pruned when the index grows.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_pending_exchange_order_id: Dict[str, InFlightOrder] = {}
+
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
         """
@@ -81,42 +150,75 @@ class ClientOrderTracker:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return dict(self.all_orders_view)
+
+    @property
+    def all_orders_view(self) -> Mapping:
+        """
+        Same as `all_orders`, but as a read only view of the tracked orders instead of a copy.
+        The view must not be iterated while the tracked orders can change (e.g. across an await).
+        """
+        return OrdersView(self._in_flight_orders, self._cached_orders)
 
     @property
     def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return dict(self.all_fillable_orders_view)
+
+    @property
+    def all_fillable_orders_view(self) -> Mapping:
+        """
+        Same as `all_fillable_orders`, but as a read only view of the tracked orders instead of a copy.
+        The view must not be iterated while the tracked orders can change (e.g. across an await).
+        """
+        return OrdersView(self._in_flight_orders, self._cached_orders, self._lost_orders)
 
     @property
     def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return dict(self.all_fillable_orders_by_exchange_order_id_view)
+
+    @property
+    def all_fillable_orders_by_exchange_order_id_view(self) -> Mapping:
+        """
+        Same as `all_fillable_orders_by_exchange_order_id`, but as a read only view using the exchange order id index
+        instead of a copy.
+        """
+        return OrdersByExchangeOrderIdView(self, self.all_fillable_orders_view)
 
     @property
     def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return dict(self.all_updatable_orders_view)
+
+    @property
+    def all_updatable_orders_view(self) -> Mapping:
+        """
+        Same as `all_updatable_orders`, but as a read only view of the tracked orders instead of a copy.
+        The view must not be iterated while the tracked orders can change (e.g. across an await).
+        """
+        return OrdersView(self._in_flight_orders, self._lost_orders)
 
     @property
     def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return dict(self.all_updatable_orders_by_exchange_order_id_view)
+
+    @property
+    def all_updatable_orders_by_exchange_order_id_view(self) -> Mapping:
+        """
+        Same as `all_updatable_orders_by_exchange_order_id`, but as a read only view using the exchange order id index
+        instead of a copy.
+        """
+        return OrdersByExchangeOrderIdView(self, self.all_updatable_orders_view)
 
     @property
     def current_timestamp(self) -> int:
@@ -130,6 +232,7 @@ class ClientOrderTracker:
         """
         Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
         """
+        # A copy is returned since the lost orders are removed while connectors iterate them to cancel them
         return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
 
     @property
@@ -142,6 +245,7 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -149,6 +253,11 @@ class ClientOrderTracker:
             del self._in_flight_orders[client_order_id]
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
+            # Orders that never got an exchange order id are not expected to get one after being completed
+            pending_order = self._orders_pending_exchange_order_id.pop(client_order_id, None)
+            if pending_order is not None and pending_order.exchange_order_id is not None:
+                self._orders_by_exchange_order_id[pending_order.exchange_order_id] = pending_order
+            self._prune_exchange_order_id_index()
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -162,6 +271,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_order(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -173,13 +283,12 @@ class ClientOrderTracker:
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
         found_order = None
+        all_orders = self.all_orders_view
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
+        if client_order_id in all_orders:
+            found_order = all_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+            found_order = self._fetch_order_by_exchange_order_id(exchange_order_id, all_orders)
 
         return found_order
 
@@ -191,9 +300,7 @@ class ClientOrderTracker:
         if client_order_id in self._lost_orders:
             found_order = self._lost_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+            found_order = self._fetch_order_by_exchange_order_id(exchange_order_id, self._lost_orders)
 
         return found_order
 
@@ -203,7 +310,7 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders_view.get(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -249,6 +356,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._index_order(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -290,6 +398,8 @@ class ClientOrderTracker:
             previous_state: OrderState = tracked_order.current_state
 
             updated: bool = tracked_order.update_with_order_update(order_update)
+            if tracked_order.client_order_id in self._orders_pending_exchange_order_id:
+                self._index_order(tracked_order)
             if updated:
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
@@ -440,6 +550,40 @@ class ClientOrderTracker:
 
         self.stop_tracking_order(tracked_order.client_order_id)
 
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_pending_exchange_order_id[order.client_order_id] = order
+        else:
+            self._orders_pending_exchange_order_id.pop(order.client_order_id, None)
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+
+    def _fetch_order_by_exchange_order_id(self, exchange_order_id: str, orders: Mapping) -> Optional[InFlightOrder]:
+        """
+        Looks up an order of the collection `orders` by its exchange order id, using the exchange order id index.
+        """
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None or order.exchange_order_id != exchange_order_id:
+            # The exchange order id might have been assigned to the order directly, without an order update
+            for pending_order in list(self._orders_pending_exchange_order_id.values()):
+                if pending_order.exchange_order_id is not None:
+                    self._index_order(pending_order)
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if (order is not None
+                and order.exchange_order_id == exchange_order_id
+                and orders.get(order.client_order_id) is order):
+            return order
+        return None
+
+    def _prune_exchange_order_id_index(self):
+        # Cached orders are dropped silently by the TTL cache, so the index is cleaned when it grows too much
+        max_index_size = 2 * self.MAX_CACHE_SIZE + len(self._in_flight_orders) + len(self._lost_orders)
+        if len(self._orders_by_exchange_order_id) > max_index_size:
+            fillable_orders = self.all_fillable_orders_view
+            self._orders_by_exchange_order_id = {
+                exchange_order_id: order for exchange_order_id, order in self._orders_by_exchange_order_id.items()
+                if fillable_orders.get(order.client_order_id) is order
+            }
+
     @staticmethod
     def _restore_order_from_json(serialized_order: Dict):
         order = InFlightOrder.from_json(serialized_order)
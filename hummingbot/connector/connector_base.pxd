@@ -17,6 +17,7 @@ cdef class ConnectorBase(NetworkIterator):
         public object _trade_fee_schema
         public object _trade_volume_metric_collector
         public object _balance_asset_limit
+        object _spilled_order_filled_balances
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
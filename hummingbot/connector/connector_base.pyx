@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union, Optional
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, TYPE_CHECKING, Union, Optional
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -61,6 +61,9 @@ cdef class ConnectorBase(NetworkIterator):
         self._exchange_order_ids = dict()
         self._trade_fee_schema = None
         self._balance_asset_limit: Dict[str, Dict[str, object]] = balance_asset_limit or dict()
+        # Balance changes of the order fill events spilled to disk by the event logger, with the version of the
+        # spilled events log they were calculated from
+        self._spilled_order_filled_balances = (0, {})
 
     @property
     def real_time_balance_update(self) -> bool:
@@ -132,9 +135,26 @@ cdef class ConnectorBase(NetworkIterator):
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
         balances = {}
+        spilled_events = self._event_logger.spilled_order_filled_events
+        if spilled_events.max_timestamp > starting_timestamp:
+            if starting_timestamp < spilled_events.min_timestamp:
+                # All the spilled events are included, so they are only read from disk again when the spilled events
+                # change (more are spilled or they are cleared)
+                if self._spilled_order_filled_balances[0] != spilled_events.version:
+                    self._spilled_order_filled_balances = (spilled_events.version,
+                                                           self._add_order_filled_balances({}, spilled_events))
+                balances = dict(self._spilled_order_filled_balances[1])
+            else:
+                balances = self._add_order_filled_balances(
+                    {}, (e for e in spilled_events if e.timestamp > starting_timestamp))
+        order_filled_events = [e for e in self.event_logs
+                               if isinstance(e, OrderFilledEvent) and e.timestamp > starting_timestamp]
+        return self._add_order_filled_balances(balances, order_filled_events)
+
+    @staticmethod
+    def _add_order_filled_balances(balances: Dict[str, Decimal],
+                                   order_filled_events: Iterable[OrderFilledEvent]) -> Dict[str, Decimal]:
         for event in order_filled_events:
             base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
             if event.trade_type is TradeType.BUY:
@@ -151,6 +171,14 @@ cdef class ConnectorBase(NetworkIterator):
             balances[quote] += quote_value
         return balances
 
+    def iter_order_filled_events(self, starting_timestamp: Optional[float] = None) -> Iterator[OrderFilledEvent]:
+        """
+        Iterates all the order filled events of the connector, including the older ones the event logger spilled to
+        disk, without loading all of them in memory.
+        :param starting_timestamp: if provided, only the events after this timestamp are returned
+        """
+        return self._event_logger.iter_order_filled_events(starting_timestamp=starting_timestamp)
+
     def get_exchange_limit_config(self, market: str) -> Dict[str, object]:
         """
         Retrieves the Balance Limits for the specified market.
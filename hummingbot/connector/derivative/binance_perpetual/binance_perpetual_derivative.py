@@ -383,7 +383,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
         if event_type == "ORDER_TRADE_UPDATE":
             order_message = event_message.get("o")
             client_order_id = order_message.get("c", None)
-            tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+            tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
             if tracked_order is not None:
                 trade_id: str = str(order_message["t"])
 
@@ -418,7 +418,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
                     )
                     self._order_tracker.process_trade_update(trade_update)
 
-            tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+            tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
             if tracked_order is not None:
                 order_update: OrderUpdate = OrderUpdate(
                     trading_pair=tracked_order.trading_pair,
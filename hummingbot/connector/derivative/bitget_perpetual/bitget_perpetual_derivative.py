@@ -833,7 +833,7 @@ class BitgetPerpetualDerivative(PerpetualDerivativePyBase):
         """
         order_status = CONSTANTS.STATE_TYPES[order_msg["status"]]
         client_order_id = str(order_msg["clientOid"])
-        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
 
         if updatable_order is not None:
             new_order_update: OrderUpdate = OrderUpdate(
@@ -875,7 +875,7 @@ class BitgetPerpetualDerivative(PerpetualDerivativePyBase):
         """
 
         client_order_id = str(trade_msg["clientOid"])
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
 
         if fillable_order and "tradeId" in trade_msg:
             trade_update = self._parse_websocket_trade_update(
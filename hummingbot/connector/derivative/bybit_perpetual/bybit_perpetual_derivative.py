@@ -633,7 +633,7 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
         """
 
         client_order_id = str(trade_msg["orderLinkId"])
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
 
         if fillable_order is not None:
             trade_update = self._parse_trade_update(trade_msg=trade_msg, tracked_order=fillable_order)
@@ -683,7 +683,7 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
         """
         order_status = CONSTANTS.ORDER_STATE[order_msg["orderStatus"]]
         client_order_id = str(order_msg["orderLinkId"])
-        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
 
         if updatable_order is not None:
             new_order_update: OrderUpdate = OrderUpdate(
@@ -388,7 +388,7 @@ class DydxV4PerpetualDerivative(PerpetualDerivativePyBase):
                     for order in data["orders"]:
                         client_order_id: str = order["clientId"]
                         exchange_order_id: str = order["id"]
-                        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                        tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
                         trading_pair = await self.trading_pair_associated_to_exchange_symbol(order["ticker"])
                         if tracked_order is not None:
                             state = CONSTANTS.ORDER_STATE[order["status"]]
@@ -528,7 +528,7 @@ class DydxV4PerpetualDerivative(PerpetualDerivativePyBase):
                     self.logger().debug(f"Received untracked order with exchange order id of {exchange_order_id}")
                     return trade_updates
                 client_order_id = order_update.client_order_id
-                tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
             else:
                 tracked_order = _cli_tracked_orders[0]
             trade_update = self._process_order_fills(fill_data=fill_data, order=tracked_order)
@@ -653,7 +653,7 @@ class DydxV4PerpetualDerivative(PerpetualDerivativePyBase):
                 )
                 if updated_order_data is None:
                     return None
-                tracked_order = self._order_tracker.all_updatable_orders.get(str(updated_order_data["clientId"]))
+                tracked_order = self._order_tracker.all_updatable_orders_view.get(str(updated_order_data["clientId"]))
             else:
                 updated_order_data = next(
                     (order for order in orders_rsp if
@@ -0,0 +1,43 @@
+from typing import Any, Dict, Optional
+
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.order_entry_transport import WSOrderEntryTransport
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+
+class BinanceAPIOrderEntryTransport(WSOrderEntryTransport):
+    """
+    Sends the orders through the Binance WebSocket API. Each request is signed, no login is required.
+    """
+
+    def __init__(self,
+                 auth: BinanceAuth,
+                 api_factory: WebAssistantsFactory,
+                 domain: str = CONSTANTS.DEFAULT_DOMAIN):
+        super().__init__(api_factory=api_factory)
+        self._auth: BinanceAuth = auth
+        self._domain = domain
+
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        await ws.connect(ws_url=CONSTANTS.WSS_API_URL.format(self._domain),
+                         ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
+        return ws
+
+    def _request_payload(self, request_id: str, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": request_id,
+            "method": method,
+            "params": self._auth.add_auth_to_ws_api_params(params=params),
+        }
+
+    def _response_request_id(self, response: Any) -> Optional[str]:
+        return response.get("id") if isinstance(response, dict) else None
+
+    def _process_response(self, method: str, response: Any) -> Any:
+        status = response.get("status")
+        if status != CONSTANTS.WS_API_SUCCESS_STATUS:
+            raise IOError(f"Error executing request {method}. Status is {status}. Error: {response.get('error')}")
+        return response["result"]
@@ -9,6 +9,7 @@ MAX_ORDER_ID_LEN = 32
 # Base URL
 REST_URL = "https://api.binance.{}/api/"
 WSS_URL = "wss://stream.binance.{}:9443/ws"
+WSS_API_URL = "wss://ws-api.binance.{}:443/ws-api/v3"
 
 PUBLIC_API_VERSION = "v3"
 PRIVATE_API_VERSION = "v3"
@@ -30,6 +31,11 @@ BINANCE_USER_STREAM_PATH_URL = "/userDataStream"
 
 WS_HEARTBEAT_TIME_INTERVAL = 30
 
+# WebSocket API methods
+WS_API_ORDER_PLACE_METHOD = "order.place"
+WS_API_ORDER_CANCEL_METHOD = "order.cancel"
+WS_API_SUCCESS_STATUS = 200
+
 # Binance params
 
 SIDE_BUY = "BUY"
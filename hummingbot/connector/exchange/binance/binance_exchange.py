@@ -11,9 +11,11 @@ from hummingbot.connector.exchange.binance import (
     binance_web_utils as web_utils,
 )
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.connector.exchange.binance.binance_api_order_entry_transport import BinanceAPIOrderEntryTransport
 from hummingbot.connector.exchange.binance.binance_api_user_stream_data_source import BinanceAPIUserStreamDataSource
 from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.order_entry_transport import WSOrderEntryTransport
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -157,6 +159,13 @@ class BinanceExchange(ExchangePyBase):
             domain=self.domain,
         )
 
+    def _create_order_entry_transport(self) -> Optional[WSOrderEntryTransport]:
+        return BinanceAPIOrderEntryTransport(
+            auth=self._auth,
+            api_factory=self._web_assistants_factory,
+            domain=self.domain,
+        )
+
     def _get_fee(self,
                  base_currency: str,
                  quote_currency: str,
@@ -177,20 +186,13 @@ class BinanceExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
         order_result = None
-        amount_str = f"{amount:f}"
-        type_str = BinanceExchange.binance_order_type(order_type)
-        side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-        api_params = {"symbol": symbol,
-                      "side": side_str,
-                      "quantity": amount_str,
-                      "type": type_str,
-                      "newClientOrderId": order_id}
-        if order_type is OrderType.LIMIT or order_type is OrderType.LIMIT_MAKER:
-            price_str = f"{price:f}"
-            api_params["price"] = price_str
-        if order_type == OrderType.LIMIT:
-            api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        api_params = await self._order_request_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price)
 
         try:
             order_result = await self._api_post(
@@ -200,16 +202,73 @@ class BinanceExchange(ExchangePyBase):
             o_id = str(order_result["orderId"])
             transact_time = order_result["transactTime"] * 1e-3
         except IOError as e:
-            error_description = str(e)
-            is_server_overloaded = ("status is 503" in error_description
-                                    and "Unknown error, please check your request or try again later." in error_description)
-            if is_server_overloaded:
+            if self._is_server_overloaded_error(e):
+                o_id = "UNKNOWN"
+                transact_time = self._time_synchronizer.time()
+            else:
+                raise
+        return o_id, transact_time
+
+    async def _place_order_ws(self,
+                              order_id: str,
+                              trading_pair: str,
+                              amount: Decimal,
+                              trade_type: TradeType,
+                              order_type: OrderType,
+                              price: Decimal,
+                              **kwargs) -> Tuple[str, float]:
+        api_params = await self._order_request_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price)
+        try:
+            order_result = await self._order_entry_transport.send_request(
+                method=CONSTANTS.WS_API_ORDER_PLACE_METHOD,
+                params=api_params,
+                throttler_limit_id=CONSTANTS.ORDER_PATH_URL)
+            o_id = str(order_result["orderId"])
+            transact_time = order_result["transactTime"] * 1e-3
+        except IOError as e:
+            if self._is_server_overloaded_error(e):
                 o_id = "UNKNOWN"
                 transact_time = self._time_synchronizer.time()
             else:
                 raise
         return o_id, transact_time
 
+    @staticmethod
+    def _is_server_overloaded_error(exception: Exception) -> bool:
+        # The order might have been created even if the request failed, it has to be checked with the status updates
+        error_description = str(exception)
+        return ("status is 503" in error_description.lower()
+                and "Unknown error, please check your request or try again later." in error_description)
+
+    async def _order_request_params(self,
+                                    order_id: str,
+                                    trading_pair: str,
+                                    amount: Decimal,
+                                    trade_type: TradeType,
+                                    order_type: OrderType,
+                                    price: Decimal) -> Dict[str, Any]:
+        amount_str = f"{amount:f}"
+        type_str = BinanceExchange.binance_order_type(order_type)
+        side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        api_params = {"symbol": symbol,
+                      "side": side_str,
+                      "quantity": amount_str,
+                      "type": type_str,
+                      "newClientOrderId": order_id}
+        if order_type is OrderType.LIMIT or order_type is OrderType.LIMIT_MAKER:
+            price_str = f"{price:f}"
+            api_params["price"] = price_str
+        if order_type == OrderType.LIMIT:
+            api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        return api_params
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
         api_params = {
@@ -224,6 +283,18 @@ class BinanceExchange(ExchangePyBase):
             return True
         return False
 
+    async def _place_cancel_ws(self, order_id: str, tracked_order: InFlightOrder) -> bool:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
+        api_params = {
+            "symbol": symbol,
+            "origClientOrderId": order_id,
+        }
+        cancel_result = await self._order_entry_transport.send_request(
+            method=CONSTANTS.WS_API_ORDER_CANCEL_METHOD,
+            params=api_params,
+            throttler_limit_id=CONSTANTS.ORDER_PATH_URL)
+        return cancel_result.get("status") == "CANCELED"
+
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
         Example:
@@ -305,7 +376,7 @@ class BinanceExchange(ExchangePyBase):
                         client_order_id = event_message.get("C")
 
                     if execution_type == "TRADE":
-                        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+                        tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
                         if tracked_order is not None:
                             fee = TradeFeeBase.new_spot_fee(
                                 fee_schema=self.trade_fee_schema(),
@@ -326,7 +397,7 @@ class BinanceExchange(ExchangePyBase):
                             )
                             self._order_tracker.process_trade_update(trade_update)
 
-                    tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
                     if tracked_order is not None:
                         order_update = OrderUpdate(
                             trading_pair=tracked_order.trading_pair,
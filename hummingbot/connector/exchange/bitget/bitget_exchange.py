@@ -492,7 +492,7 @@ class BitgetExchange(ExchangePyBase):
         """
         order_status = CONSTANTS.STATE_TYPES[order_msg["status"]]
         client_order_id = str(order_msg["clientOid"])
-        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
 
         if updatable_order is not None:
             if (
@@ -553,7 +553,7 @@ class BitgetExchange(ExchangePyBase):
         try:
             order_id = str(fill_msg.get("orderId", ""))
             trade_id = str(fill_msg.get("tradeId", ""))
-            fillable_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(
+            fillable_order = self._order_tracker.all_fillable_orders_by_exchange_order_id_view.get(
                 order_id
             )
 
@@ -394,8 +394,8 @@ class BtcMarketsExchange(ExchangePyBase):
                         infligthOrder = await self._get_order_update(exchange_order_id)
                         client_order_id: Optional[str] = infligthOrder.get("clientOrderId")
 
-                    fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
-                    updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
+                    updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
 
                     new_state = CONSTANTS.ORDER_STATE[event_message["status"]]
                     event_timestamp = int(dateparse(event_message["timestamp"]).timestamp())
@@ -5,6 +5,7 @@ DEFAULT_DOMAIN = "bybit_main"
 
 HBOT_ORDER_ID_PREFIX = "BYBIT-"
 MAX_ORDER_ID_LEN = 32
+MAX_ORDERS_PER_BATCH = 10
 HBOT_BROKER_ID = "Hummingbot"
 
 SIDE_BUY = "BUY"
@@ -66,6 +67,8 @@ ACCOUNT_INFO_PATH_URL = "/v5/account/info"
 BALANCE_PATH_URL = "/v5/account/wallet-balance"
 ORDER_PLACE_PATH_URL = "/v5/order/create"
 ORDER_CANCEL_PATH_URL = "/v5/order/cancel"
+BATCH_ORDER_PLACE_PATH_URL = "/v5/order/create-batch"
+BATCH_ORDER_CANCEL_PATH_URL = "/v5/order/cancel-batch"
 GET_ORDERS_PATH_URL = "/v5/order/realtime"
 TRADE_HISTORY_PATH_URL = "/v5/execution/list"
 EXCHANGE_FEE_RATE_PATH_URL = "/v5/account/fee-rate"
@@ -184,6 +187,22 @@ RATE_LIMITS = {
             LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
         ]
     ),
+    RateLimit(
+        limit_id=BATCH_ORDER_PLACE_PATH_URL,
+        limit=MAX_REQUEST_LIMIT_DEFAULT,
+        time_interval=ONE_SECOND,
+        linked_limits=[
+            LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
+        ]
+    ),
+    RateLimit(
+        limit_id=BATCH_ORDER_CANCEL_PATH_URL,
+        limit=MAX_REQUEST_LIMIT_DEFAULT,
+        time_interval=ONE_SECOND,
+        linked_limits=[
+            LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
+        ]
+    ),
     RateLimit(
         limit_id=GET_ORDERS_PATH_URL,
         limit=MAX_REQUEST_LIMIT_DEFAULT,
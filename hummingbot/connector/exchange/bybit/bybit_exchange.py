@@ -11,6 +11,7 @@ from hummingbot.connector.exchange.bybit.bybit_api_order_book_data_source import
 from hummingbot.connector.exchange.bybit.bybit_api_user_stream_data_source import BybitAPIUserStreamDataSource
 from hummingbot.connector.exchange.bybit.bybit_auth import BybitAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -113,6 +114,14 @@ class BybitExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
     def supported_order_types(self):
         return [OrderType.MARKET, OrderType.LIMIT, OrderType.LIMIT_MAKER]
 
@@ -218,23 +227,15 @@ class BybitExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
-        type_str = self.bybit_order_type(order_type)
-
-        side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-
-        api_params = {
-            "category": self._category,
-            "symbol": symbol,
-            "side": side_str,
-            "orderType": type_str,
-            "qty": f"{amount:f}",
-            "marketUnit": "baseCoin",
-            "price": f"{price:f}",
-            "orderLinkId": order_id
-        }
-        if order_type == OrderType.LIMIT:
-            api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        api_params = await self._order_request_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        api_params["category"] = self._category
 
         response = await self._api_post(
             path_url=CONSTANTS.ORDER_PLACE_PATH_URL,
@@ -274,6 +275,98 @@ class BybitExchange(ExchangePyBase):
             return True
         return False
 
+    async def _place_orders_batch(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        api_params = {
+            "category": self._category,
+            "request": [
+                await self._order_request_params(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                )
+                for order in orders_to_create
+            ],
+        }
+        response = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_PLACE_PATH_URL,
+            data=api_params,
+            is_auth_required=True,
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        transact_time = int(response["time"]) * 1e-3
+        return [
+            PlaceOrderResult(
+                update_timestamp=transact_time,
+                client_order_id=order.client_order_id,
+                exchange_order_id=str(order_result.get("orderId")),
+                trading_pair=order.trading_pair,
+                exception=None if order_status["code"] == 0 else ValueError(f"{order_status['msg']}"),
+            )
+            for order, order_result, order_status in self._batch_response_items(response, orders_to_create)
+        ]
+
+    async def _place_cancels_batch(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        requests = []
+        for order in orders_to_cancel:
+            request = {"symbol": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair)}
+            if order.exchange_order_id:
+                request["orderId"] = order.exchange_order_id
+            else:
+                request["orderLinkId"] = order.client_order_id
+            requests.append(request)
+        response = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+            data={"category": self._category, "request": requests},
+            is_auth_required=True,
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        return [
+            CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                exception=None if order_status["code"] == 0 else ValueError(f"{order_status['msg']}"),
+            )
+            for order, _, order_status in self._batch_response_items(response, orders_to_cancel)
+        ]
+
+    @staticmethod
+    def _batch_response_items(response: Dict[str, Any], orders: List[InFlightOrder]):
+        # The results and their status are listed in the order of the requests
+        order_results = response.get("result", {}).get("list", [])
+        order_statuses = response.get("retExtInfo", {}).get("list", [])
+        return zip(orders, order_results, order_statuses)
+
+    async def _order_request_params(self,
+                                    order_id: str,
+                                    trading_pair: str,
+                                    amount: Decimal,
+                                    trade_type: TradeType,
+                                    order_type: OrderType,
+                                    price: Decimal) -> Dict[str, Any]:
+        type_str = self.bybit_order_type(order_type)
+
+        side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+
+        api_params = {
+            "symbol": symbol,
+            "side": side_str,
+            "orderType": type_str,
+            "qty": f"{amount:f}",
+            "marketUnit": "baseCoin",
+            "price": f"{price:f}",
+            "orderLinkId": order_id
+        }
+        if order_type == OrderType.LIMIT:
+            api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        return api_params
+
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         trading_pair_rules = exchange_info_dict.get("result", []).get("list", [])
         retval = []
@@ -319,7 +412,7 @@ class BybitExchange(ExchangePyBase):
         """
 
         client_order_id = str(trade_msg["orderLinkId"])
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
 
         if fillable_order is not None:
             trade_update = self._parse_trade_update(trade_msg=trade_msg, tracked_order=fillable_order)
@@ -346,7 +439,7 @@ class BybitExchange(ExchangePyBase):
                     for order in data:
                         client_order_id = order.get("orderLinkId")
                         exchange_order_id = order.get("orderId")
-                        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                        updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
                         if updatable_order is not None:
                             new_state = CONSTANTS.ORDER_STATE[order["orderStatus"]]
                             order_update = OrderUpdate(
@@ -489,7 +489,7 @@ class CubeExchange(ExchangePyBase):
                     msg: trade_pb2.OrderResponse = trade_pb2.OrderResponse().FromString(event_message)
 
                     if msg.HasField("new_ack"):
-                        tracked_order = self._order_tracker.all_updatable_orders.get(str(msg.new_ack.client_order_id))
+                        tracked_order = self._order_tracker.all_updatable_orders_view.get(str(msg.new_ack.client_order_id))
                         if tracked_order is not None:
                             new_state = OrderState.OPEN
 
@@ -503,7 +503,7 @@ class CubeExchange(ExchangePyBase):
                             self._order_tracker.process_order_update(order_update=order_update)
 
                     if msg.HasField("cancel_ack"):
-                        tracked_order = self._order_tracker.all_updatable_orders.get(
+                        tracked_order = self._order_tracker.all_updatable_orders_view.get(
                             str(msg.cancel_ack.client_order_id)
                         )
 
@@ -520,7 +520,7 @@ class CubeExchange(ExchangePyBase):
                             self._order_tracker.process_order_update(order_update=order_update)
 
                     if msg.HasField("new_reject"):
-                        tracked_order = self._order_tracker.all_updatable_orders.get(
+                        tracked_order = self._order_tracker.all_updatable_orders_view.get(
                             str(msg.new_reject.client_order_id)
                         )
                         if tracked_order is not None:
@@ -550,7 +550,7 @@ class CubeExchange(ExchangePyBase):
 
                     if msg.HasField("fill"):
                         client_order_id = str(msg.fill.client_order_id)
-                        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+                        tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
                         if tracked_order is not None:
                             fill_token = (
                                 tracked_order.base_asset
@@ -599,7 +599,7 @@ class CubeExchange(ExchangePyBase):
                             )
                             self._order_tracker.process_trade_update(trade_update)
 
-                        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                        tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
                         if tracked_order is not None:
                             new_state = OrderState.PARTIALLY_FILLED
                             if msg.fill.leaves_quantity <= 0:
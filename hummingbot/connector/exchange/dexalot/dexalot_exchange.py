@@ -319,7 +319,7 @@ class DexalotExchange(ExchangePyBase):
         tracked_orders_to_cancel = []
 
         for order in orders_to_cancel:
-            tracked_order = self._order_tracker.all_updatable_orders.get(order.client_order_id)
+            tracked_order = self._order_tracker.all_updatable_orders_view.get(order.client_order_id)
             if tracked_order is not None and tracked_order.exchange_order_id:
                 tracked_orders_to_cancel.append(tracked_order)
             else:
@@ -467,7 +467,7 @@ class DexalotExchange(ExchangePyBase):
     ):
         tracked_orders_to_cancel = []
         for order in orders_to_cancel:
-            tracked_order = self._order_tracker.all_updatable_orders.get(order.client_order_id)
+            tracked_order = self._order_tracker.all_updatable_orders_view.get(order.client_order_id)
             if tracked_order is not None and tracked_order.exchange_order_id:
                 tracked_orders_to_cancel.append(tracked_order)
         try:
@@ -636,7 +636,7 @@ class DexalotExchange(ExchangePyBase):
                 self.logger().debug(f"Received untracked order with exchange order id of {exchange_order_id}")
                 return
             client_order_id = order_update.client_order_id
-            tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+            tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
         else:
             tracked_order = _cli_tracked_orders[0]
 
@@ -663,7 +663,7 @@ class DexalotExchange(ExchangePyBase):
     def _process_order_message(self, raw_msg: Dict[str, Any]):
         order_msg = raw_msg.get("data", {})
         client_order_id = str(order_msg.get("clientOrderId", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
         self._calculate_available_balance_from_orders(order_msg)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
@@ -805,7 +805,7 @@ class DexalotExchange(ExchangePyBase):
             is_auth_required=True,
             limit_id=CONSTANTS.IP_REQUEST_WEIGHT)
         client_order_id = updated_order_data.get("clientOrderId")
-        tracked_order = self._order_tracker.all_fillable_orders.get(
+        tracked_order = self._order_tracker.all_fillable_orders_view.get(
             client_order_id) if not tracked_order else tracked_order
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
@@ -63,7 +63,7 @@ class FoxbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        order_book.apply_snapshot_message(snapshot_msg)
         return order_book
 
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
@@ -10,6 +10,7 @@ from hummingbot.connector.exchange.gate_io.gate_io_api_order_book_data_source im
 from hummingbot.connector.exchange.gate_io.gate_io_api_user_stream_data_source import GateIoAPIUserStreamDataSource
 from hummingbot.connector.exchange.gate_io.gate_io_auth import GateIoAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -102,6 +103,14 @@ class GateIoExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH_CREATE
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH_CANCEL
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.MARKET, OrderType.LIMIT_MAKER]
 
@@ -182,39 +191,14 @@ class GateIoExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
-        order_type_str = order_type.name.lower().split("_")[0]
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-        # When type is market, it refers to different currency according to side
-        # side : buy means quote currency, BTC_USDT means USDT
-        # side : sell means base currency，BTC_USDT means BTC
-        data = {
-            "text": order_id,
-            "currency_pair": symbol,
-            "side": trade_type.name.lower(),
-            "type": order_type_str,
-            "amount": f"{amount:f}",
-        }
-        if order_type.is_limit_type():
-            data.update({
-                "price": f"{price:f}",
-                "time_in_force": "gtc"
-            })
-            if order_type is OrderType.LIMIT_MAKER:
-                data.update({"time_in_force": "poc"})
-        else:
-            data.update({
-                "time_in_force": "ioc",
-            })
-            if trade_type.name.lower() == 'buy':
-                if price.is_nan():
-                    price = self.get_price_for_volume(
-                        trading_pair,
-                        True,
-                        amount
-                    ).result_price
-                data.update({
-                    "amount": f"{price * amount:f}",
-                })
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
 
         # RESTRequest does not support json, and if we pass a dict
         # the underlying aiohttp will encode it to params
@@ -250,6 +234,132 @@ class GateIoExchange(ExchangePyBase):
         canceled = resp.get("status") == "cancelled"
         return canceled
 
+    async def _place_orders_batch(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders_to_create
+        ]
+        orders_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+        )
+
+        orders = {order.client_order_id: order for order in orders_to_create}
+        results = []
+        for order_result in orders_results:
+            order = orders.get(order_result.get("text"))
+            if order is None:
+                continue
+            exception = None
+            if not order_result.get("succeeded", False):
+                exception = IOError({"label": order_result.get("label"), "message": order_result.get("message")})
+            elif order_result.get("status") in {"cancelled"}:
+                exception = IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=str(order_result.get("id")),
+                trading_pair=order.trading_pair,
+                exception=exception,
+            ))
+        return results
+
+    async def _place_cancels_batch(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        # Gate.io cancels orders by exchange order id only
+        exchange_order_ids = await asyncio.gather(
+            *[order.get_exchange_order_id() for order in orders_to_cancel], return_exceptions=True
+        )
+        results = []
+        orders = {}
+        data = []
+        for order, exchange_order_id in zip(orders_to_cancel, exchange_order_ids):
+            if isinstance(exchange_order_id, asyncio.TimeoutError):
+                results.append(CancelOrderResult(
+                    client_order_id=order.client_order_id, trading_pair=order.trading_pair, not_found=True,
+                ))
+            elif isinstance(exchange_order_id, Exception):
+                raise exchange_order_id
+            else:
+                orders[exchange_order_id] = order
+                data.append({
+                    "currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                    "id": exchange_order_id,
+                })
+        if len(data) == 0:
+            return results
+
+        cancel_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_DELETE_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.BATCH_ORDER_DELETE_PATH_URL,
+        )
+        for cancel_result in cancel_results:
+            order = orders.get(str(cancel_result.get("id")))
+            if order is None:
+                continue
+            succeeded = cancel_result.get("succeeded", False)
+            results.append(CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                not_found=cancel_result.get("label") == CONSTANTS.ERR_LABEL_ORDER_NOT_FOUND,
+                exception=(None
+                           if succeeded
+                           else IOError({"label": cancel_result.get("label"), "message": cancel_result.get("message")})),
+            ))
+        return results
+
+    async def _order_request_data(self,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  trade_type: TradeType,
+                                  order_type: OrderType,
+                                  price: Decimal) -> Dict[str, Any]:
+        order_type_str = order_type.name.lower().split("_")[0]
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        # When type is market, it refers to different currency according to side
+        # side : buy means quote currency, BTC_USDT means USDT
+        # side : sell means base currency，BTC_USDT means BTC
+        data = {
+            "text": order_id,
+            "currency_pair": symbol,
+            "side": trade_type.name.lower(),
+            "type": order_type_str,
+            "amount": f"{amount:f}",
+        }
+        if order_type.is_limit_type():
+            data.update({
+                "price": f"{price:f}",
+                "time_in_force": "gtc"
+            })
+            if order_type is OrderType.LIMIT_MAKER:
+                data.update({"time_in_force": "poc"})
+        else:
+            data.update({
+                "time_in_force": "ioc",
+            })
+            if trade_type.name.lower() == 'buy':
+                if price.is_nan():
+                    price = self.get_price_for_volume(
+                        trading_pair,
+                        True,
+                        amount
+                    ).result_price
+                data.update({
+                    "amount": f"{price * amount:f}",
+                })
+        return data
+
     async def _update_balances(self):
         """
         Calls REST API to update total and available balances.
@@ -432,7 +542,7 @@ class GateIoExchange(ExchangePyBase):
         https://www.gate.io/docs/apiv4/en/#list-orders
         """
         client_order_id = str(order_msg.get("text", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
@@ -475,7 +585,7 @@ class GateIoExchange(ExchangePyBase):
         https://www.gate.io/docs/apiv4/en/#retrieve-market-trades
         """
         client_order_id = client_order_id or str(trade["text"])
-        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
         if tracked_order is None:
             self.logger().debug(f"Ignoring trade message with id {client_order_id}: not in in_flight_orders.")
         else:
@@ -3,6 +3,7 @@ import sys
 from hummingbot.core.api_throttler.data_types import RateLimit
 
 MAX_ORDER_ID_LEN = 40
+MAX_ORDERS_PER_BATCH = 5
 TRADING_FEES_SYMBOL_LIMIT = 10
 
 DEFAULT_DOMAIN = "main"
@@ -23,6 +24,7 @@ SERVER_TIME_PATH_URL = "/api/v1/timestamp"
 SYMBOLS_PATH_URL = "/api/v2/symbols"
 ORDERS_PATH_URL = "/api/v1/orders"
 ORDERS_PATH_URL_HFT = "/api/v1/hf/orders"
+MULTIPLE_ORDERS_PATH_SUFFIX = "/multi"
 FEE_PATH_URL = "/api/v1/trade-fees"
 ALL_TICKERS_PATH_URL = "/api/v1/market/allTickers"
 FILLS_PATH_URL = "/api/v1/fills"
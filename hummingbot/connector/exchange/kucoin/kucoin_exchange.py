@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from bidict import bidict
 
@@ -14,6 +14,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source impo
 from hummingbot.connector.exchange.kucoin.kucoin_api_user_stream_data_source import KucoinAPIUserStreamDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -99,6 +100,10 @@ class KucoinExchange(ExchangePyBase):
     def trading_pairs(self):
         return self._trading_pairs
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
     @property
     def is_cancel_request_in_exchange_synchronous(self) -> bool:
         return True
@@ -193,20 +198,14 @@ class KucoinExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
-        side = trade_type.name.lower()
-        order_type_str = "market" if order_type == OrderType.MARKET else "limit"
-        data = {
-            "size": str(amount),
-            "clientOid": order_id,
-            "side": side,
-            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
-            "type": order_type_str,
-        }
-        if order_type is OrderType.LIMIT:
-            data["price"] = str(price)
-        elif order_type is OrderType.LIMIT_MAKER:
-            data["price"] = str(price)
-            data["postOnly"] = True
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
         exchange_order_id = await self._api_post(
             path_url=self.orders_path_url,
             data=data,
@@ -235,6 +234,84 @@ class KucoinExchange(ExchangePyBase):
         else:
             raise IOError(f"Error cancelling order on Kucoin: {cancel_result}")
 
+    async def _place_orders_batch(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        order_list = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders_to_create
+        ]
+        data = {"orderList": order_list}
+        if self.domain != "hft":
+            # The classic endpoint takes the symbol once for all the orders
+            data["symbol"] = order_list[0]["symbol"]
+            for order_data in order_list:
+                del order_data["symbol"]
+        response = await self._api_post(
+            path_url=f"{self.orders_path_url}{CONSTANTS.MULTIPLE_ORDERS_PATH_SUFFIX}",
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
+        )
+        if response.get("data") is None:
+            raise IOError(f"Error placing orders on Kucoin: {response}")
+
+        orders = {order.client_order_id: order for order in orders_to_create}
+        order_results = response["data"] if self.domain == "hft" else response["data"]["data"]
+        results = []
+        for order_result in order_results:
+            order = orders.get(order_result.get("clientOid"))
+            if order is None:
+                continue
+            if self.domain == "hft":
+                success = order_result.get("success", False)
+                exchange_order_id = order_result.get("orderId")
+            else:
+                success = order_result.get("status") == "success"
+                exchange_order_id = order_result.get("id")
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=str(exchange_order_id),
+                trading_pair=order.trading_pair,
+                exception=(None
+                           if success
+                           else IOError(f"Error placing order on Kucoin: {order_result.get('failMsg')}")),
+            ))
+        return results
+
+    def _batch_order_group_key(self, order: InFlightOrder) -> Optional[Hashable]:
+        # Kucoin only creates limit orders of a single symbol in a batch
+        return order.trading_pair if order.order_type.is_limit_type() else None
+
+    async def _order_request_data(self,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  trade_type: TradeType,
+                                  order_type: OrderType,
+                                  price: Decimal) -> Dict[str, Any]:
+        side = trade_type.name.lower()
+        order_type_str = "market" if order_type == OrderType.MARKET else "limit"
+        data = {
+            "size": str(amount),
+            "clientOid": order_id,
+            "side": side,
+            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "type": order_type_str,
+        }
+        if order_type is OrderType.LIMIT:
+            data["price"] = str(price)
+        elif order_type is OrderType.LIMIT_MAKER:
+            data["price"] = str(price)
+            data["postOnly"] = True
+        return data
+
     async def _user_stream_event_listener(self):
         """
         This functions runs in background continuously processing the events received from the exchange by the user
@@ -252,8 +329,8 @@ class KucoinExchange(ExchangePyBase):
                     order_event_type = execution_data["type"]
                     client_order_id: Optional[str] = execution_data.get("clientOid")
 
-                    fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
-                    updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
+                    updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
 
                     event_timestamp = execution_data["ts"] * 1e-9
 
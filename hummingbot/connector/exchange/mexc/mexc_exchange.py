@@ -316,7 +316,7 @@ class MexcExchange(ExchangePyBase):
 
     def _process_trade_message(self, trade: Dict[str, Any], client_order_id: Optional[str] = None):
         client_order_id = client_order_id or str(trade["clientOrderId"])
-        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
         if tracked_order is None:
             self.logger().debug(f"Ignoring trade message with id {client_order_id}: not in in_flight_orders.")
         else:
@@ -338,7 +338,7 @@ class MexcExchange(ExchangePyBase):
 
     def _process_order_message(self, order: Dict[str, Any]):
         client_order_id = str(order.get("clientId", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
@@ -394,7 +394,7 @@ class NdaxExchange(ExchangePyBase):
                     self._process_account_position_event(payload)
                 elif endpoint == CONSTANTS.ORDER_STATE_EVENT_ENDPOINT_NAME:
                     client_order_id = str(payload["ClientOrderId"])
-                    tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
                     if tracked_order is not None:
                         order_update = OrderUpdate(
                             trading_pair=tracked_order.trading_pair,
@@ -428,7 +428,7 @@ class NdaxExchange(ExchangePyBase):
         :param order_msg: The order event message payload
         """
         client_order_id = str(order_msg["ClientOrderId"])
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
         if fillable_order is not None:
             trade_amount = Decimal(str(order_msg["Quantity"]))
             trade_price = Decimal(str(order_msg["Price"]))
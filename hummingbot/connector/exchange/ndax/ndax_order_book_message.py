@@ -71,6 +71,15 @@ class NdaxOrderBookMessage(OrderBookMessage):
         bids.sort(key=lambda row: (row.price, row.update_id))
         return bids
 
+    @property
+    def raw_asks(self) -> None:
+        # NDAX entries carry the side and action type, so they can only be read through `asks`
+        return None
+
+    @property
+    def raw_bids(self) -> None:
+        return None
+
     def _order_book_row_for_entry(self, entry: NdaxOrderBookEntry) -> OrderBookRow:
         price = float(entry.price)
         amount = float(entry.quantity) if entry.actionType != self._DELETE_ACTION_TYPE else 0.0
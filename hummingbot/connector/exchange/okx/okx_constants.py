@@ -6,6 +6,7 @@ from hummingbot.core.data_type.in_flight_order import OrderState
 
 CLIENT_ID_PREFIX = "93027a12dac34fBC"
 MAX_ID_LEN = 32
+MAX_ORDERS_PER_BATCH = 20
 SECONDS_TO_WAIT_TO_RECEIVE_MESSAGE = 30 * 0.8
 
 # URL mapping based on where account is registered:
@@ -53,6 +54,7 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
+OKX_BATCH_ORDER_PLACE_PATH = '/api/v5/trade/batch-orders'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
 OKX_BALANCE_PATH = '/api/v5/account/balance'
 OKX_TRADE_FILLS_PATH = "/api/v5/trade/fills"
@@ -102,6 +104,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=20, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_ORDER_PLACE_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_BALANCE_PATH, limit=10, time_interval=2),
     RateLimit(limit_id=OKX_TRADE_FILLS_PATH, limit=60, time_interval=2),
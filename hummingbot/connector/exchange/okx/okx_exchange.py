@@ -10,6 +10,7 @@ from hummingbot.connector.exchange.okx.okx_api_user_stream_data_source import Ok
 from hummingbot.connector.exchange.okx.okx_auth import OkxAuth
 from hummingbot.connector.exchange_base import s_decimal_NaN
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -99,6 +100,14 @@ class OkxExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
@@ -190,19 +199,14 @@ class OkxExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
 
-        data = {
-            "clOrdId": order_id,
-            "tdMode": "cash",
-            "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
-            "side": trade_type.name.lower(),
-            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
-            "sz": str(amount),
-        }
-        if order_type.is_limit_type():
-            data["px"] = f"{price:f}"
-        else:
-            # Specify that the order quantity for market orders is denominated in base currency
-            data["tgtCcy"] = "base_ccy"
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
 
         exchange_order_id = await self._api_request(
             path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
@@ -242,6 +246,87 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_orders_batch(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders_to_create
+        ]
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_PLACE_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_ORDER_PLACE_PATH,
+        )
+        orders = {order.client_order_id: order for order in orders_to_create}
+        results = []
+        for order_result in response["data"]:
+            order = orders.get(order_result["clOrdId"])
+            if order is None:
+                continue
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=str(order_result["ordId"]),
+                trading_pair=order.trading_pair,
+                exception=(None
+                           if order_result["sCode"] == "0"
+                           else IOError(f"Error submitting order {order.client_order_id}: {order_result['sMsg']}")),
+            ))
+        return results
+
+    async def _place_cancels_batch(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        data = [{"clOrdId": order.client_order_id, "instId": order.trading_pair} for order in orders_to_cancel]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        orders = {order.client_order_id: order for order in orders_to_cancel}
+        results = []
+        for cancel_result in response["data"]:
+            order = orders.get(cancel_result["clOrdId"])
+            if order is None:
+                continue
+            # 51400 and 51401 are returned when the order does not exist or has already been canceled
+            results.append(CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                exception=(None
+                           if cancel_result["sCode"] in ["0", "51400", "51401"]
+                           else IOError(f"Error cancelling order {order.client_order_id}: {cancel_result}")),
+            ))
+        return results
+
+    async def _order_request_data(self,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  trade_type: TradeType,
+                                  order_type: OrderType,
+                                  price: Decimal) -> Dict[str, Any]:
+        data = {
+            "clOrdId": order_id,
+            "tdMode": "cash",
+            "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
+            "side": trade_type.name.lower(),
+            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "sz": str(amount),
+        }
+        if order_type.is_limit_type():
+            data["px"] = f"{price:f}"
+        else:
+            # Specify that the order quantity for market orders is denominated in base currency
+            data["tgtCcy"] = "base_ccy"
+        return data
+
     async def get_last_traded_prices(self, trading_pairs: List[str] = None) -> Dict[str, float]:
         params = {"instType": "SPOT"}
 
@@ -406,8 +491,8 @@ class OkxExchange(ExchangePyBase):
                         order_status = CONSTANTS.ORDER_STATE[data["state"]]
                         client_order_id = data["clOrdId"]
                         trade_id = data["tradeId"]
-                        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
-                        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                        fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
+                        updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
 
                         if (fillable_order is not None
                                 and order_status in [OrderState.PARTIALLY_FILLED, OrderState.FILLED]
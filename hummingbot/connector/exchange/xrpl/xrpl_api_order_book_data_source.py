@@ -33,7 +33,6 @@ class XRPLAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._trade_messages_queue_key = CONSTANTS.TRADE_EVENT_TYPE
         self._diff_messages_queue_key = CONSTANTS.DIFF_EVENT_TYPE
         self._snapshot_messages_queue_key = CONSTANTS.SNAPSHOT_EVENT_TYPE
-        self._open_client_lock = asyncio.Lock()
 
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         return await self._connector.get_last_traded_prices(trading_pairs=trading_pairs)
@@ -47,22 +46,16 @@ class XRPLAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :return: the response from the exchange (JSON dictionary)
         """
         base_currency, quote_currency = self._connector.get_currencies_from_trading_pair(trading_pair)
-        async with self._open_client_lock:
-            max_retries = len(self._connector._node_pool._nodes)
-            retry_count = 0
-            last_error = None
-
-            while retry_count < max_retries:
-                client: AsyncWebsocketClient | None = None
-                node_url: str | None = None
-                try:
-                    client = await self._get_client()
+        max_retries = len(self._connector._node_pool._nodes)
+        retry_count = 0
+        last_error = None
+
+        while retry_count < max_retries:
+            node_url: str | None = None
+            try:
+                # The pooled connection is shared with the other requests, it is evicted by the pool if it fails
+                async with self._connector._connection_pool.client() as client:
                     node_url = client.url
-                    if not client.is_open():
-                        await client.open()
-                    if client._websocket is not None:
-                        client._websocket.max_size = CONSTANTS.WEBSOCKET_MAX_SIZE_BYTES
-                        client._websocket.ping_timeout = CONSTANTS.WEBSOCKET_CONNECTION_TIMEOUT
                     orderbook_asks_task = self.fetch_order_book_side(
                         client, "current", base_currency, quote_currency, CONSTANTS.ORDER_BOOK_DEPTH
                     )
@@ -72,46 +65,41 @@ class XRPLAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     orderbook_asks_info, orderbook_bids_info = await safe_gather(
                         orderbook_asks_task, orderbook_bids_task
                     )
-                    asks = orderbook_asks_info.result.get("offers", None)
-                    bids = orderbook_bids_info.result.get("offers", None)
-                    if asks is None or bids is None:
-                        raise ValueError(f"Error fetching order book snapshot for {trading_pair}")
-                    order_book = {
-                        "asks": asks,
-                        "bids": bids,
-                    }
-                    await client.close()
-                    return order_book
-
-                except (TimeoutError, asyncio.exceptions.TimeoutError, ConnectionError) as e:
-                    last_error = e
-                    if node_url is not None:
-                        self._connector._node_pool.mark_bad_node(node_url)
-                    self.logger().warning(
-                        f"Node {node_url} failed with {type(e).__name__} when fetching order book snapshot for {trading_pair}. "
-                        f"Retrying with different node... (Attempt {retry_count + 1}/{max_retries})"
-                    )
-                except Exception as e:
-                    if node_url is not None:
-                        self._connector._node_pool.mark_bad_node(node_url)
-                    self.logger().error(
-                        f"{type(e).__name__} Exception fetching order book snapshot for {trading_pair}: {e}",
-                        exc_info=True,
-                    )
-                    raise e
-                finally:
-                    if client is not None:
-                        await client.close()
-                    retry_count += 1
-
-            # If we've exhausted all nodes, raise the last error
-            if last_error is not None:
+                asks = orderbook_asks_info.result.get("offers", None)
+                bids = orderbook_bids_info.result.get("offers", None)
+                if asks is None or bids is None:
+                    raise ValueError(f"Error fetching order book snapshot for {trading_pair}")
+                order_book = {
+                    "asks": asks,
+                    "bids": bids,
+                }
+                return order_book
+
+            except (TimeoutError, asyncio.exceptions.TimeoutError, ConnectionError) as e:
+                last_error = e
+                self.logger().warning(
+                    f"Node {node_url} failed with {type(e).__name__} when fetching order book snapshot for {trading_pair}. "
+                    f"Retrying with different node... (Attempt {retry_count + 1}/{max_retries})"
+                )
+            except Exception as e:
+                if node_url is not None:
+                    self._connector._node_pool.mark_bad_node(node_url)
                 self.logger().error(
-                    f"All nodes failed when fetching order book snapshot for {trading_pair}. "
-                    f"Last error: {type(last_error).__name__}: {str(last_error)}"
+                    f"{type(e).__name__} Exception fetching order book snapshot for {trading_pair}: {e}",
+                    exc_info=True,
                 )
-                raise last_error
-            raise Exception("Failed to fetch order book snapshot: All nodes failed")
+                raise e
+            finally:
+                retry_count += 1
+
+        # If we've exhausted all nodes, raise the last error
+        if last_error is not None:
+            self.logger().error(
+                f"All nodes failed when fetching order book snapshot for {trading_pair}. "
+                f"Last error: {type(last_error).__name__}: {str(last_error)}"
+            )
+            raise last_error
+        raise Exception("Failed to fetch order book snapshot: All nodes failed")
 
     async def fetch_order_book_side(
         self, client: AsyncWebsocketClient, ledger_index, taker_gets, taker_pays, limit, try_count: int = 0
@@ -110,6 +110,11 @@ CLIENT_REFRESH_INTERVAL = 30
 WEBSOCKET_MAX_SIZE_BYTES = 2**22  # 4MB
 WEBSOCKET_CONNECTION_TIMEOUT = 30
 
+# Connection pool configuration
+CONNECTION_POOL_HEALTH_CHECK_INTERVAL = 30
+CONNECTION_POOL_HEALTH_CHECK_TIMEOUT = 5
+CONNECTION_POOL_MAX_IDLE_TIME = 300
+
 # XRPL maximum digit for issued currency
 XRPL_MAX_DIGIT = 16
 
@@ -54,6 +54,7 @@ from hummingbot.connector.exchange.xrpl.xrpl_utils import (  # AddLiquidityReque
     PoolInfo,
     QuoteLiquidityResponse,
     RemoveLiquidityResponse,
+    XRPLConnectionPool,
     XRPLMarket,
     XRPLNodePool,
     _wait_for_final_transaction_outcome,
@@ -103,6 +104,7 @@ class XrplExchange(ExchangePyBase):
             proactive_switch_interval=100,
             cooldown=100,
         )
+        self._connection_pool = XRPLConnectionPool(node_pool=self._node_pool)
         self._trading_required = trading_required
         self._trading_pairs = trading_pairs
         self._xrpl_auth: XRPLAuth = self.authenticator
@@ -185,9 +187,18 @@ class XrplExchange(ExchangePyBase):
         return self._trading_required
 
     async def _get_async_client(self):
+        # Dedicated client, for the subscriptions. Requests use the long lived clients of the connection pool
         url = await self._node_pool.get_node()
         return AsyncWebsocketClient(url)
 
+    async def start_network(self):
+        await super().start_network()
+        self._connection_pool.start()
+
+    async def stop_network(self):
+        await super().stop_network()
+        await self._connection_pool.stop()
+
     @property
     def user_stream_client(self) -> AsyncWebsocketClient:
         # For user stream, always get a fresh client from the pool
@@ -581,7 +592,7 @@ class XrplExchange(ExchangePyBase):
             request = await strategy.create_order_transaction()
 
             while retry < CONSTANTS.PLACE_ORDER_MAX_RETRY:
-                async with await self._get_async_client() as client:
+                async with self._connection_pool.client() as client:
                     filled_tx = await self.tx_autofill(request, client)
                     signed_tx = self.tx_sign(filled_tx, self._xrpl_auth.get_wallet())
                     o_id = f"{signed_tx.sequence}-{signed_tx.last_ledger_sequence}"
@@ -781,7 +792,7 @@ class XrplExchange(ExchangePyBase):
 
         try:
             self._node_pool.add_burst_tokens(5)
-            async with await self._get_async_client() as client:
+            async with self._connection_pool.client() as client:
                 sequence, _ = exchange_order_id.split("-")
                 memo = Memo(
                     memo_data=convert_string_to_hex(order_id, padding=False),
@@ -2262,12 +2273,8 @@ class XrplExchange(ExchangePyBase):
 
     async def _make_network_check_request(self):
         self._node_pool.add_burst_tokens(1)
-        client = await self._get_async_client()
-        try:
-            await client.open()
-        finally:
-            # Ensure client is always closed to prevent memory leak
-            await client.close()
+        # Opens a connection to the node if the pool has none
+        await self._connection_pool.get_client()
 
     async def _make_trading_rules_request(self) -> Dict[str, Any]:
         zeroTransferRate = 1000000000
@@ -2424,7 +2431,7 @@ class XrplExchange(ExchangePyBase):
         raise XRPLRequestFailureException(response.result)
 
     async def wait_for_final_transaction_outcome(self, transaction, prelim_result) -> Response:
-        async with await self._get_async_client() as client:
+        async with self._connection_pool.client() as client:
             resp = await _wait_for_final_transaction_outcome(
                 transaction.get_hash(), client, prelim_result, transaction.last_ledger_sequence
             )
@@ -2437,16 +2444,10 @@ class XrplExchange(ExchangePyBase):
         lock: Optional[Lock] = None,
         delay_time: float = 0.0,
     ) -> Response:
-        # Use proper context manager to prevent memory leaks
-        client = await self._get_async_client()
+        client = None
         try:
-            # Configure client before using in context manager
-            await client.open()
-            if hasattr(client, "_websocket") and client._websocket is not None:
-                client._websocket.max_size = CONSTANTS.WEBSOCKET_MAX_SIZE_BYTES
-                client._websocket.ping_timeout = CONSTANTS.WEBSOCKET_CONNECTION_TIMEOUT
-
-            # Use context manager properly - client is already opened
+            # The client is shared with the other requests, it is not closed after the request
+            client = await self._connection_pool.get_client()
             if lock is not None:
                 async with lock:
                     resp = await client.request(request)
@@ -2457,10 +2458,10 @@ class XrplExchange(ExchangePyBase):
             return resp
 
         except Exception as e:
-            # If timeout error or connection error, mark node as bad
-            if isinstance(e, (TimeoutError, ConnectionError)):
+            # If timeout error or connection error, mark node as bad and close its connection
+            if client is not None and isinstance(e, (TimeoutError, ConnectionError)):
                 self.logger().error(f"Node {client.url} is bad, marking as bad")
-                self._node_pool.mark_bad_node(client.url)
+                await self._connection_pool.evict(client.url)
 
             if max_retries > 0:
                 await self._sleep(CONSTANTS.REQUEST_RETRY_INTERVAL)
@@ -2468,9 +2469,6 @@ class XrplExchange(ExchangePyBase):
             else:
                 self.logger().error(f"Max retries reached. Request {request} failed: {e}", exc_info=True)
                 raise e
-        finally:
-            # Ensure client is always closed to prevent memory leak
-            await client.close()
 
     def get_token_symbol_from_all_markets(self, code: str, issuer: str) -> Optional[str]:
         all_markets = self._make_xrpl_trading_pairs_request()
@@ -2949,7 +2947,7 @@ class XrplExchange(ExchangePyBase):
         while retry_count < max_retries:
             try:
                 async with self._xrpl_place_order_client_lock:
-                    async with await self._get_async_client() as client:
+                    async with self._connection_pool.client() as client:
                         # Autofill transaction details
                         filled_tx = await self.tx_autofill(transaction, client)
 
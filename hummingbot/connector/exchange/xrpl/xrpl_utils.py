@@ -3,14 +3,17 @@ import binascii
 import logging
 import time
 from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from decimal import Decimal
 from random import randrange
-from typing import Dict, Final, List, Optional, cast
+from typing import AsyncIterator, Dict, Final, List, Optional, cast
 
 from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_validator
+from websockets.exceptions import ConnectionClosed
 from xrpl.asyncio.account import get_next_valid_seq_number
 from xrpl.asyncio.clients import AsyncWebsocketClient, Client, XRPLRequestFailureException
+from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
 from xrpl.asyncio.transaction import XRPLReliableSubmissionException
 from xrpl.asyncio.transaction.main import _LEDGER_OFFSET, _calculate_fee_per_transaction_type, _tx_needs_networkID
 from xrpl.models import Currency, IssuedCurrency, Request, Response, ServerInfo, Transaction, TransactionMetadata, Tx
@@ -31,6 +34,7 @@ from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
 from hummingbot.client.config.config_validators import validate_with_regex
 from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
 CENTRALIZED = True
@@ -756,6 +760,157 @@ class XRPLNodePool:
         return self._rate_limiter.burst_tokens
 
 
+class XRPLConnectionPool:
+    """
+    Long lived websocket clients to the nodes of a XRPLNodePool, shared by all the requests of the connector instead
+    of opening a new connection for each request. The xrpl-py clients match each response to the id of its request,
+    so concurrent requests are multiplexed over the same connection.
+
+    The node to use is still chosen (and rate limited) by the node pool. Clients failing a request or a health check
+    are closed and their node is marked as bad, clients not used for a while are closed.
+    """
+
+    _logger = None
+
+    def __init__(
+        self,
+        node_pool: XRPLNodePool,
+        health_check_interval: float = CONSTANTS.CONNECTION_POOL_HEALTH_CHECK_INTERVAL,
+        health_check_timeout: float = CONSTANTS.CONNECTION_POOL_HEALTH_CHECK_TIMEOUT,
+        max_idle_time: float = CONSTANTS.CONNECTION_POOL_MAX_IDLE_TIME,
+    ):
+        """
+        Args:
+            node_pool: The node pool choosing the node to use for each request
+            health_check_interval: Seconds between the health checks of the open clients
+            health_check_timeout: Seconds a node has to answer the health check request
+            max_idle_time: Seconds after which a client not used is closed
+        """
+        self._node_pool = node_pool
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._max_idle_time = max_idle_time
+        self._clients: Dict[str, AsyncWebsocketClient] = {}
+        self._last_used_times: Dict[str, float] = {}
+        self._open_locks: Dict[str, asyncio.Lock] = {}
+        self._health_check_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @property
+    def open_nodes(self) -> List[str]:
+        return list(self._clients.keys())
+
+    def start(self):
+        if self._health_check_task is None or self._health_check_task.done():
+            self._health_check_task = safe_ensure_future(self._health_check_loop())
+
+    async def stop(self):
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            self._health_check_task = None
+        for url in list(self._clients.keys()):
+            await self.evict(url, mark_bad=False)
+
+    async def get_client(self, use_burst: bool = True) -> AsyncWebsocketClient:
+        """
+        Get an open client to the node chosen by the node pool, opening the connection only if there is none yet.
+
+        Args:
+            use_burst: Whether to use a burst token if available
+
+        Returns:
+            An open client, shared with the other requests. It must not be closed by the caller
+        """
+        url = await self._node_pool.get_node(use_burst)
+        client = self._clients.get(url)
+        if client is None or not client.is_open():
+            lock = self._open_locks.setdefault(url, asyncio.Lock())
+            async with lock:
+                client = self._clients.get(url)
+                if client is None or not client.is_open():
+                    client = await self._open_client(url)
+                    self._clients[url] = client
+        self._last_used_times[url] = time.time()
+        return client
+
+    @asynccontextmanager
+    async def client(self, use_burst: bool = True) -> AsyncIterator[AsyncWebsocketClient]:
+        """
+        Same as get_client, to be used as `async with pool.client() as client`. The client is evicted if the
+        connection fails or is closed while it is used.
+        """
+        client = await self.get_client(use_burst)
+        try:
+            yield client
+        except (TimeoutError, ConnectionError, ConnectionClosed, XRPLWebsocketException):
+            await self.evict(client.url)
+            raise
+
+    async def evict(self, url: str, mark_bad: bool = True):
+        """
+        Close the client of a node. The next request to the node opens a new connection.
+
+        Args:
+            url: The node URL
+            mark_bad: Whether to mark the node as bad in the node pool
+        """
+        client = self._clients.pop(url, None)
+        self._last_used_times.pop(url, None)
+        if mark_bad:
+            self._node_pool.mark_bad_node(url)
+        if client is not None:
+            try:
+                await client.close()
+            except Exception as e:
+                self.logger().debug(f"Error closing the client of node {url}: {e}")
+
+    async def check_clients_health(self):
+        """Close the idle clients, the clients closed by their node and the clients of unresponsive nodes"""
+        now = time.time()
+        for url, client in list(self._clients.items()):
+            if now - self._last_used_times.get(url, 0) > self._max_idle_time or not client.is_open():
+                await self.evict(url, mark_bad=False)
+                continue
+            try:
+                await asyncio.wait_for(client.request(ServerInfo()), timeout=self._health_check_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger().warning(f"Health check of node {url} failed ({e}), closing its connection")
+                await self.evict(url)
+
+    async def _open_client(self, url: str) -> AsyncWebsocketClient:
+        client = AsyncWebsocketClient(url)
+        try:
+            await client.open()
+        except Exception:
+            self._node_pool.mark_bad_node(url)
+            raise
+        if hasattr(client, "_websocket") and client._websocket is not None:
+            client._websocket.max_size = CONSTANTS.WEBSOCKET_MAX_SIZE_BYTES
+            client._websocket.ping_timeout = CONSTANTS.WEBSOCKET_CONNECTION_TIMEOUT
+        self.logger().debug(f"Opened pooled connection to node {url}")
+        return client
+
+    async def _health_check_loop(self):
+        while True:
+            try:
+                await self._sleep(self._health_check_interval)
+                await self.check_clients_health()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception("Unexpected error checking the health of the XRPL node connections")
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
+
 def parse_offer_create_transaction(tx: dict) -> dict:
     """
     Helper to parse an OfferCreate transaction and its metadata to extract price (quality) and quantity transferred.
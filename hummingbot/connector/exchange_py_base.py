@@ -4,22 +4,26 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterable, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
+from hummingbot.connector.order_entry_transport import OrderEntryTransportNotConnectedError, WSOrderEntryTransport
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase, request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -61,14 +65,13 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
-            rate_limits=self.rate_limits_rules,
-            limits_share_percentage=rate_limits_share_pct)
+        self._throttler: AsyncThrottlerBase = self._create_throttler(rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        self._order_entry_transport: Optional[WSOrderEntryTransport] = self._create_order_entry_transport()
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
@@ -103,6 +106,29 @@ class ExchangePyBase(ExchangeBase, ABC):
     def rate_limits_rules(self) -> List[RateLimit]:
         raise NotImplementedError
 
+    @property
+    def rate_limits_reserved_capacity_pct(self) -> float:
+        """
+        Fraction (0 to 1) of each rate limit reserved for the requests with the top priority (order cancelations)
+        """
+        return 0.0
+
+    @property
+    def batch_order_create_max_size(self) -> int:
+        """
+        Maximum number of orders the exchange accepts in one batch order creation request. Exchanges implementing
+        `_place_orders_batch` return their limit, 0 means orders are created one by one.
+        """
+        return 0
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        """
+        Maximum number of orders the exchange accepts in one batch order cancelation request. Exchanges implementing
+        `_place_cancels_batch` return their limit, 0 means orders are canceled one by one.
+        """
+        return 0
+
     @property
     @abstractmethod
     def domain(self) -> str:
@@ -243,6 +269,15 @@ class ExchangePyBase(ExchangeBase, ABC):
             raise ValueError(f"No order book exists for '{trading_pair}'.")
         return self.order_book_tracker.order_books[trading_pair]
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Checks if the order book for a particular market has already been initialized, even if the order books for
+        other markets are still loading
+
+        :param trading_pair: the pair of tokens for which the order book should be checked
+        """
+        return self.order_book_tracker.is_order_book_ready(trading_pair)
+
     def tick(self, timestamp: float):
         """
         Includes the logic that has to be processed every time a new tick happens in the bot. Particularly it enables
@@ -356,6 +391,44 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def batch_order_create(
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Creates the orders with as few requests as the exchange batch order creation endpoint allows. Exchanges without
+        one create the orders one by one.
+
+        :param orders_to_create: the orders to create, their client order ids can be blank
+
+        :return: the orders to create, with their generated client order ids
+        """
+        if self.batch_order_create_max_size <= 0:
+            return super().batch_order_create(orders_to_create=orders_to_create)
+
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length,
+            )
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels the orders with as few requests as the exchange batch order cancelation endpoint allows. Exchanges
+        without one cancel the orders one by one.
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        if self.batch_order_cancel_max_size <= 0:
+            super().batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        else:
+            safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         Cancels all currently active orders. The cancellations are performed in parallel tasks.
@@ -406,6 +479,48 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = await self._start_tracking_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            return
+        try:
+            await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+
+    async def _start_tracking_and_validate_order(self,
+                                                 trade_type: TradeType,
+                                                 order_id: str,
+                                                 trading_pair: str,
+                                                 amount: Decimal,
+                                                 order_type: OrderType,
+                                                 price: Optional[Decimal] = None,
+                                                 **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking a new order, with its price and amount quantized, and checks it meets the trading rules.
+        The order is marked as failed when it does not.
+
+        :return: the tracked order, or None if it can't be created
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -434,49 +549,35 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._update_order_after_failure(
                 order_id=order_id, trading_pair=trading_pair,
                 exception=ValueError(f"{order_type} is not in the list of supported order types"))
-            return
+            return None
 
         elif quantized_amount < trading_rule.min_order_size:
             self._update_order_after_failure(
                 order_id=order_id, trading_pair=trading_pair,
                 exception=ValueError(f"Order amount {amount} is lower than minimum order size {trading_rule.min_order_size} "
                                      f"for the pair {trading_pair}. The order will not be created."))
-            return
+            return None
 
         elif notional_size < trading_rule.min_notional_size:
             self._update_order_after_failure(
                 order_id=order_id, trading_pair=trading_pair,
                 exception=ValueError(f"Order notional {notional_size} is lower than minimum notional size {trading_rule.min_notional_size}"
                                      f" for the pair {trading_pair}. The order will not be created."))
-            return
-        try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
+            return None
+        return order
 
-        except asyncio.CancelledError:
-            raise
-        except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
+    async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
+        with request_priority(RequestPriority.CREATE):
+            exchange_order_id, update_timestamp = await self._place_order_through_available_transport(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
                 **kwargs,
             )
 
-    async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
-
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
             exchange_order_id=str(exchange_order_id),
@@ -488,6 +589,14 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return exchange_order_id
 
+    async def _place_order_through_available_transport(self, **kwargs) -> Tuple[str, float]:
+        if self._order_entry_transport is not None and self._order_entry_transport.is_connected:
+            try:
+                return await self._place_order_ws(**kwargs)
+            except OrderEntryTransportNotConnectedError:
+                self.logger().debug(f"Order {kwargs['order_id']} sent through REST, the order entry connection is down.")
+        return await self._place_order(**kwargs)
+
     def _on_order_failure(
         self,
         order_id: str,
@@ -545,7 +654,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         return None
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        with request_priority(RequestPriority.CANCEL):
+            cancelled = await self._place_cancel_through_available_transport(order.client_order_id, order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -561,6 +671,14 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._order_tracker.process_order_update(order_update)
         return cancelled
 
+    async def _place_cancel_through_available_transport(self, order_id: str, tracked_order: InFlightOrder) -> bool:
+        if self._order_entry_transport is not None and self._order_entry_transport.is_connected:
+            try:
+                return await self._place_cancel_ws(order_id=order_id, tracked_order=tracked_order)
+            except OrderEntryTransportNotConnectedError:
+                self.logger().debug(f"Cancelation of {order_id} sent through REST, the order entry connection is down.")
+        return await self._place_cancel(order_id, tracked_order)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -575,6 +693,170 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        inflight_orders_to_create = []
+        for order in orders_to_create:
+            valid_order = await self._start_tracking_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
+                order_type=order.order_type(),
+                price=s_decimal_NaN if order.price is None else order.price,
+            )
+            if valid_order is not None:
+                inflight_orders_to_create.append(valid_order)
+
+        await safe_gather(*[
+            self._execute_batch_inflight_order_create(inflight_orders_to_create=batch)
+            for batch in self._split_in_batches(orders=inflight_orders_to_create,
+                                                max_size=self.batch_order_create_max_size)
+        ])
+
+    async def _execute_batch_inflight_order_create(self, inflight_orders_to_create: List[InFlightOrder]):
+        """
+        Creates the orders with a single request. A batch of one order is sent with the single order endpoint.
+        """
+        try:
+            if len(inflight_orders_to_create) == 1:
+                await self._place_order_and_process_update(order=inflight_orders_to_create[0])
+                return
+            with request_priority(RequestPriority.CREATE):
+                place_order_results = await self._place_orders_batch(orders_to_create=inflight_orders_to_create)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            for order in inflight_orders_to_create:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=ex,
+                )
+            return
+
+        results = {result.client_order_id: result for result in place_order_results}
+        for order in inflight_orders_to_create:
+            result = results.get(order.client_order_id)
+            exception = (IOError(f"No result for the order {order.client_order_id} in the batch order creation response.")
+                         if result is None
+                         else result.exception)
+            if exception is not None:
+                self.logger().error(
+                    f"Error submitting {order.trade_type.name.lower()} {order.order_type.name.upper()} order "
+                    f"{order.client_order_id} to {self.name_cap} for {order.amount} {order.trading_pair} "
+                    f"{order.price}: {exception}")
+                self._update_order_after_failure(
+                    order_id=order.client_order_id, trading_pair=order.trading_pair, exception=exception)
+            else:
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(result.exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=result.update_timestamp,
+                    new_state=OrderState.OPEN,
+                    misc_updates=result.misc_updates,
+                )
+                self._order_tracker.process_order_update(order_update)
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        results = []
+        tracked_orders_to_cancel = []
+
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders_to_cancel.append(tracked_order)
+            else:
+                results.append(CancellationResult(order_id=order.client_order_id, success=False))
+
+        batches_results = await safe_gather(*[
+            self._execute_batch_order_cancel(orders_to_cancel=batch)
+            for batch in self._split_in_batches(orders=tracked_orders_to_cancel,
+                                                max_size=self.batch_order_cancel_max_size)
+        ])
+        for batch_results in batches_results:
+            results.extend(batch_results)
+
+        return results
+
+    async def _execute_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancellationResult]:
+        """
+        Cancels the orders with a single request. A batch of one order is sent with the single order endpoint.
+        """
+        if len(orders_to_cancel) == 1:
+            order = orders_to_cancel[0]
+            canceled_order_id = await self._execute_order_cancel(order=order)
+            return [CancellationResult(order_id=order.client_order_id, success=canceled_order_id is not None)]
+
+        try:
+            with request_priority(RequestPriority.CANCEL):
+                cancel_order_results = await self._place_cancels_batch(orders_to_cancel=orders_to_cancel)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(
+                f"Failed to cancel orders {', '.join([order.client_order_id for order in orders_to_cancel])}",
+                exc_info=True,
+            )
+            return [CancellationResult(order_id=order.client_order_id, success=False) for order in orders_to_cancel]
+
+        results = {result.client_order_id: result for result in cancel_order_results}
+        cancelation_results = []
+        for order in orders_to_cancel:
+            result = results.get(order.client_order_id)
+            success = False
+            if result is None:
+                self.logger().error(f"Failed to cancel order {order.client_order_id} (no result in the batch "
+                                    f"order cancelation response)")
+            elif result.not_found or (
+                    result.exception is not None
+                    and self._is_order_not_found_during_cancelation_error(cancelation_exception=result.exception)):
+                self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+            elif result.exception is not None:
+                self.logger().error(f"Failed to cancel order {order.client_order_id}: {result.exception}")
+            else:
+                self._update_order_after_cancelation_success(order=order)
+                success = True
+            cancelation_results.append(CancellationResult(order_id=order.client_order_id, success=success))
+
+        return cancelation_results
+
+    def _update_order_after_cancelation_success(self, order: InFlightOrder):
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
+    def _split_in_batches(self, orders: List[InFlightOrder], max_size: int) -> List[List[InFlightOrder]]:
+        """
+        Splits the orders in batches of at most `max_size` orders sharing the same batch group key. The orders without
+        group key are sent on their own.
+        """
+        batches = []
+        orders_by_group: Dict[Hashable, List[InFlightOrder]] = {}
+        for order in orders:
+            group_key = self._batch_order_group_key(order)
+            if group_key is None:
+                batches.append([order])
+            else:
+                orders_by_group.setdefault(group_key, []).append(order)
+        for group_orders in orders_by_group.values():
+            batches.extend(group_orders[index:index + max_size] for index in range(0, len(group_orders), max_size))
+        return batches
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -648,6 +930,64 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_order_ws(self,
+                              order_id: str,
+                              trading_pair: str,
+                              amount: Decimal,
+                              trade_type: TradeType,
+                              order_type: OrderType,
+                              price: Decimal,
+                              **kwargs,
+                              ) -> Tuple[str, float]:
+        """
+        Same as `_place_order`, sending the order through the order entry transport. Only called by the exchanges
+        creating one in `_create_order_entry_transport`, while its connection is up.
+
+        :raises OrderEntryTransportNotConnectedError: if the order could not be sent, to send it through REST instead
+        """
+        raise NotImplementedError
+
+    async def _place_cancel_ws(self, order_id: str, tracked_order: InFlightOrder) -> bool:
+        """
+        Same as `_place_cancel`, sending the cancelation through the order entry transport. Only called by the exchanges
+        creating one in `_create_order_entry_transport`, while its connection is up.
+
+        :raises OrderEntryTransportNotConnectedError: if the cancelation could not be sent, to send it through REST
+            instead
+        """
+        raise NotImplementedError
+
+    async def _place_orders_batch(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """
+        Sends the orders to the exchange in a single batch order creation request. Only called by the exchanges
+        declaring a `batch_order_create_max_size`.
+
+        :param orders_to_create: the orders to create, at most `batch_order_create_max_size` of them, all with the same
+            batch group key
+
+        :return: the result of the creation of each order. An order without result is considered failed
+        """
+        raise NotImplementedError
+
+    async def _place_cancels_batch(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """
+        Sends the cancelations to the exchange in a single batch order cancelation request. Only called by the
+        exchanges declaring a `batch_order_cancel_max_size`.
+
+        :param orders_to_cancel: the orders to cancel, at most `batch_order_cancel_max_size` of them, all with the same
+            batch group key
+
+        :return: the result of the cancelation of each order. An order without result is considered not canceled
+        """
+        raise NotImplementedError
+
+    def _batch_order_group_key(self, order: InFlightOrder) -> Optional[Hashable]:
+        """
+        Only the orders with the same key are sent in the same batch request. Orders with None as key can't be batched
+        and are sent with the single order endpoints.
+        """
+        return order.trading_pair
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -682,6 +1022,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            if self._order_entry_transport is not None:
+                self._order_entry_transport.start()
 
     async def check_network(self) -> NetworkStatus:
         """
@@ -724,6 +1066,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._order_entry_transport is not None:
+            await self._order_entry_transport.stop()
 
     # === loops and sync related methods ===
     #
@@ -734,7 +1078,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.REFERENCE_DATA):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -754,7 +1099,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.REFERENCE_DATA):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -782,7 +1128,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                with request_priority(RequestPriority.STATUS):
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -1073,6 +1420,25 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
+    def _create_throttler(self, rate_limits_share_pct: Decimal) -> AsyncThrottlerBase:
+        """
+        Creates the throttler shared by all the requests of the connector. Connectors that need a different
+        throttling strategy can override it.
+
+        :param rate_limits_share_pct: percentage of the rate limits to be used by this instance
+        """
+        return SlidingWindowThrottler(
+            rate_limits=self.rate_limits_rules,
+            limits_share_percentage=rate_limits_share_pct,
+            reserved_capacity_pct=self.rate_limits_reserved_capacity_pct)
+
+    def _create_order_entry_transport(self) -> Optional[WSOrderEntryTransport]:
+        """
+        Exchanges offering a trading API over websocket return the transport to send the orders and cancelations
+        through it, falling back to REST while its connection is down. Orders are sent through REST by default.
+        """
+        return None
+
     async def _initialize_trading_pair_symbol_map(self):
         try:
             exchange_info = await self._make_trading_pairs_request()
@@ -4,9 +4,10 @@ import logging
 import os.path
 import threading
 import time
+from collections import OrderedDict
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -45,6 +46,7 @@ from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.position import Position
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
+from hummingbot.model.sql_batch_writer import SessionOperation, SQLBatchWriter, after_commit, execute_operations
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
@@ -54,6 +56,7 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 class MarketsRecorder:
     _logger = None
     _shared_instance: "MarketsRecorder" = None
+    ORDER_IDS_CACHE_SIZE = 100000
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -76,7 +79,12 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 write_behind: bool = False):
+        """
+        :param write_behind: if True, the order events and the market data are written to the database by a dedicated
+        thread, in batched transactions, instead of being committed synchronously on the event loop
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,6 +95,14 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._db_writer: Optional[SQLBatchWriter] = SQLBatchWriter(sql) if write_behind else None
+        # Ids of the orders known to be stored, used to update them without querying them first. Only accessed by
+        # the thread writing to the database.
+        self._order_ids: OrderedDict[str, None] = OrderedDict()
+        # Latest tracking states of each market not saved yet, only the most recent ones need to be written. They are
+        # removed once saved, after the commit.
+        self._pending_market_states: Dict[str, Dict[str, Any]] = {}
+        self._pending_market_states_lock = threading.Lock()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -96,6 +112,8 @@ class MarketsRecorder:
 
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
+            for order in exchange_order_ids:
+                self._cache_order_id(order.id)
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -131,28 +149,28 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    market_data_records: List[MarketData] = []
+                    for market in self._markets:
+                        exchange = market.display_name
+                        for trading_pair in market.trading_pairs:
+                            mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                            best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                            best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                            order_book = market.get_order_book(trading_pair)
+                            depth = self._market_data_collection_config.market_data_collection_depth + 1
+                            market_data = MarketData(
+                                timestamp=self.db_timestamp,
+                                exchange=exchange,
+                                trading_pair=trading_pair,
+                                mid_price=mid_price,
+                                best_bid=best_bid,
+                                best_ask=best_ask,
+                                order_book={
+                                    "bid": list(order_book.bid_entries_top(depth)),
+                                    "ask": list(order_book.ask_entries_top(depth))}
+                            )
+                            market_data_records.append(market_data)
+                    self._write(lambda session: session.add_all(market_data_records))
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -176,6 +194,17 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind(self) -> bool:
+        return self._db_writer is not None
+
+    def flush(self):
+        """
+        Blocks until all the records submitted to the database writer thread are written.
+        """
+        if self._db_writer is not None:
+            self._db_writer.flush()
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
@@ -219,6 +248,8 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._db_writer is not None:
+            self._db_writer.stop()
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -308,6 +339,7 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -323,6 +355,7 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -334,20 +367,87 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._save_market_states(config_file_path, market.display_name, market.tracking_states, session=session)
+
+    def _save_market_states(self,
+                            config_file_path: str,
+                            market_name: str,
+                            tracking_states: Dict[str, Any],
+                            session: Session):
+        query: Query = (session
+                        .query(MarketState)
+                        .filter(MarketState.config_file_path == config_file_path,
+                                MarketState.market == market_name))
+        market_states: Optional[MarketState] = query.one_or_none()
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
+    def _market_states_operation(self, market: ConnectorBase) -> SessionOperation:
+        """
+        Takes a snapshot of the tracking states of the market, and returns the operation saving it. When several
+        snapshots are waiting to be written, only the last one is saved.
+        """
+        market_name: str = market.display_name
+        with self._pending_market_states_lock:
+            self._pending_market_states[market_name] = market.tracking_states
+
+        def save(session: Session):
+            with self._pending_market_states_lock:
+                tracking_states = self._pending_market_states.get(market_name)
+            saved_states_key = ("market_states", market_name)
+            if tracking_states is not None and session.info.get(saved_states_key) is not tracking_states:
+                self._save_market_states(self._config_file_path, market_name, tracking_states, session=session)
+                session.info[saved_states_key] = tracking_states
+                after_commit(session, lambda: self._discard_pending_market_states(market_name, tracking_states))
+
+        return save
+
+    def _discard_pending_market_states(self, market_name: str, saved_tracking_states: Dict[str, Any]):
+        with self._pending_market_states_lock:
+            # Newer states might have been taken in the meantime, they still have to be saved
+            if self._pending_market_states.get(market_name) is saved_tracking_states:
+                del self._pending_market_states[market_name]
+
+    def _write(self, operation: SessionOperation):
+        if self._db_writer is not None:
+            self._db_writer.submit(operation)
+        else:
+            execute_operations(self._sql_manager, [operation])
+
+    def _cache_order_id(self, order_id: str):
+        self._order_ids[order_id] = None
+        self._order_ids.move_to_end(order_id)
+        if len(self._order_ids) > self.ORDER_IDS_CACHE_SIZE:
+            self._order_ids.popitem(last=False)
+
+    def _update_order_record(self, order_id: str, status: str, timestamp: int, session: Session) -> bool:
+        """
+        Updates the last status of an order, and returns False if the order is not stored.
+        """
+        if order_id in self._order_ids:
+            session.query(Order).filter(Order.id == order_id).update(
+                {Order.last_status: status, Order.last_update_timestamp: timestamp},
+                synchronize_session=False)
+            return True
+        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        if order_record is None:
+            return False
+        order_record.last_status = status
+        order_record.last_update_timestamp = timestamp
+        after_commit(session, lambda: self._cache_order_id(order_id))
+        return True
+
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
 
@@ -377,31 +477,35 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        save_market_states: SessionOperation = self._market_states_operation(market)
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+            save_market_states(session)
+            after_commit(session, lambda: self._cache_order_id(evt.order_id))
+
+        self._write(write)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -416,56 +520,55 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        save_market_states: SessionOperation = self._market_states_operation(market)
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            self._update_order_record(order_id, event_type.name, timestamp, session=session)
+            session.add(order_status)
+            session.add(trade_fill_record)
+            save_market_states(session)
+
+        self._write(write)
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -476,20 +579,21 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+
+        self._write(write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -535,18 +639,17 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        save_market_states: SessionOperation = self._market_states_operation(market)
+
+        def write(session: Session):
+            if self._update_order_record(order_id, event_type.name, timestamp, session=session):
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                save_market_states(session)
+
+        self._write(write)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -581,16 +684,18 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        save_market_states: SessionOperation = self._market_states_operation(connector)
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            session.add(rp_update)
+            save_market_states(session)
+
+        self._write(write)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -600,17 +705,20 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        save_market_states: SessionOperation = self._market_states_operation(connector)
+
+        def write(session: Session):
+            session.add(rp_fees)
+            save_market_states(session)
+
+        self._write(write)
 
     @staticmethod
     async def _sleep(delay):
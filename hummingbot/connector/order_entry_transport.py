@@ -0,0 +1,222 @@
+import asyncio
+import itertools
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class OrderEntryTransportNotConnectedError(ConnectionError):
+    """
+    Raised when a request could not be sent because the order entry connection is down. The request never reached
+    the exchange, so it can safely be sent through REST instead.
+    """
+
+
+class WSOrderEntryTransport(ABC):
+    """
+    Sends order creations and cancelations through the trading API the exchange offers over an authenticated
+    websocket connection, saving the setup of a REST request on each order.
+
+    A single connection is kept open, and reopened when it drops. Each request gets a unique id, and the response
+    carrying the same id is routed back to the coroutine waiting for it, so several requests can be in flight at the
+    same time. While the connection is down requests fail with `OrderEntryTransportNotConnectedError` without being
+    sent, for the connector to fall back to REST.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(self,
+                 api_factory: WebAssistantsFactory,
+                 request_timeout: float = 10.0,
+                 reconnect_delay: float = 5.0):
+        """
+        :param api_factory: the factory of the connector, to create the websocket assistant and throttle the requests
+        :param request_timeout: the seconds to wait for the response of a request
+        :param reconnect_delay: the seconds to wait before reconnecting after the connection dropped
+        """
+        self._api_factory = api_factory
+        self._request_timeout = request_timeout
+        self._reconnect_delay = reconnect_delay
+        self._ws_assistant: Optional[WSAssistant] = None
+        self._connected_event = asyncio.Event()
+        self._pending_requests: Dict[str, asyncio.Future] = {}
+        self._request_id_counter = itertools.count(1)
+        self._connection_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @property
+    def is_connected(self) -> bool:
+        return self._ws_assistant is not None and self._connected_event.is_set()
+
+    @property
+    def pending_requests_count(self) -> int:
+        return len(self._pending_requests)
+
+    def start(self):
+        if self._connection_task is None or self._connection_task.done():
+            self._connection_task = safe_ensure_future(self._connection_loop())
+
+    async def stop(self):
+        if self._connection_task is not None:
+            self._connection_task.cancel()
+            self._connection_task = None
+        await self._on_connection_interruption(websocket_assistant=self._ws_assistant)
+        self._ws_assistant = None
+
+    async def wait_until_connected(self):
+        await self._connected_event.wait()
+
+    async def send_request(self, method: str, params: Dict[str, Any], throttler_limit_id: Optional[str] = None) -> Any:
+        """
+        Sends a request and waits for its response
+
+        :param method: the exchange method to execute (e.g. the order creation method)
+        :param params: the parameters of the method
+        :param throttler_limit_id: the rate limit the request counts against, if any
+
+        :return: the result of the request, as extracted from the response by `_process_response`
+        """
+        if not self.is_connected:
+            raise OrderEntryTransportNotConnectedError(f"The order entry connection is down, {method} was not sent.")
+
+        websocket_assistant = self._ws_assistant
+        request_id = self._next_request_id()
+        response_future = asyncio.get_running_loop().create_future()
+        self._pending_requests[request_id] = response_future
+        try:
+            payload = self._request_payload(request_id=request_id, method=method, params=params)
+            if throttler_limit_id is not None:
+                async with self._api_factory.throttler.execute_task(limit_id=throttler_limit_id):
+                    await self._send(websocket_assistant=websocket_assistant, payload=payload, method=method)
+            else:
+                await self._send(websocket_assistant=websocket_assistant, payload=payload, method=method)
+            try:
+                response = await asyncio.wait_for(response_future, timeout=self._request_timeout)
+            except asyncio.TimeoutError:
+                raise IOError(f"No response received for the {method} request {request_id} after "
+                              f"{self._request_timeout} seconds.")
+        finally:
+            self._pending_requests.pop(request_id, None)
+
+        return self._process_response(method=method, response=response)
+
+    async def _send(self, websocket_assistant: WSAssistant, payload: Dict[str, Any], method: str):
+        if not self.is_connected or websocket_assistant is not self._ws_assistant:
+            raise OrderEntryTransportNotConnectedError(f"The order entry connection is down, {method} was not sent.")
+        try:
+            await websocket_assistant.send(WSJSONRequest(payload=payload))
+        except (ConnectionError, RuntimeError) as send_exception:
+            raise OrderEntryTransportNotConnectedError(
+                f"The order entry connection is down, {method} was not sent ({send_exception}).")
+
+    async def _connection_loop(self):
+        while True:
+            try:
+                self._ws_assistant = await self._connected_websocket_assistant()
+                await self._authenticate(websocket_assistant=self._ws_assistant)
+                self._connected_event.set()
+                await self._process_websocket_messages(websocket_assistant=self._ws_assistant)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The order entry websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    f"Unexpected error in the order entry websocket connection. Orders are sent through REST until "
+                    f"it is reconnected in {self._reconnect_delay} seconds...")
+            finally:
+                await self._on_connection_interruption(websocket_assistant=self._ws_assistant)
+                self._ws_assistant = None
+            await self._sleep(self._reconnect_delay)
+
+    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        async for ws_response in websocket_assistant.iter_messages():
+            data = ws_response.data
+            request_id = self._response_request_id(response=data)
+            response_future = self._pending_requests.get(request_id) if request_id is not None else None
+            if response_future is not None:
+                if not response_future.done():
+                    response_future.set_result(data)
+            else:
+                await self._process_event_message(event_message=data)
+
+    async def _on_connection_interruption(self, websocket_assistant: Optional[WSAssistant]):
+        self._connected_event.clear()
+        # The requests waiting for a response might or might not have been executed by the exchange, they must not
+        # be sent again through REST
+        for request_id, response_future in self._pending_requests.items():
+            if not response_future.done():
+                response_future.set_exception(
+                    IOError(f"The order entry connection was closed before receiving the response of the request "
+                            f"{request_id}."))
+        websocket_assistant and await websocket_assistant.disconnect()
+
+    def _next_request_id(self) -> str:
+        return str(next(self._request_id_counter))
+
+    async def _authenticate(self, websocket_assistant: WSAssistant):
+        """
+        Authenticates the connection, for exchanges requiring a login before trading. Exchanges signing each request
+        don't need to override it.
+
+        :param websocket_assistant: the websocket assistant connected to the exchange
+        """
+        pass
+
+    async def _process_event_message(self, event_message: Any):
+        """
+        Processes the messages that are not the response of a request (e.g. heartbeats). They are ignored by default.
+        """
+        pass
+
+    @abstractmethod
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        """
+        Creates an instance of WSAssistant connected to the exchange trading API
+
+        :return: an instance of WSAssistant connected to the exchange
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _request_payload(self, request_id: str, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Builds the message sent to the exchange, including the request id and the authentication of the request if
+        the exchange requires it
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _response_request_id(self, response: Any) -> Optional[str]:
+        """
+        :return: the id of the request the message is the response to, or None if the message is not a response
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _process_response(self, method: str, response: Any) -> Any:
+        """
+        Extracts the result from the response of a request
+
+        :raises IOError: if the exchange rejected the request
+        """
+        raise NotImplementedError
+
+    async def _sleep(self, delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+
+        :param delay: number of seconds to sleep
+        """
+        await asyncio.sleep(delay)
@@ -12,6 +12,7 @@ from aioresponses.core import RequestCall
 from bidict import bidict
 
 from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
@@ -614,6 +615,12 @@ class AbstractExchangeConnectorTests:
             with self.assertRaises(asyncio.CancelledError):
                 await (self.exchange.check_network())
 
+        def test_throttler_applies_the_connector_rate_limits(self):
+            self.assertIsInstance(self.exchange._throttler, SlidingWindowThrottler)
+            self.assertEqual(
+                sorted(rate_limit.limit_id for rate_limit in self.exchange.rate_limits_rules),
+                sorted(rate_limit.limit_id for rate_limit in self.exchange._throttler._rate_limits))
+
         def test_initial_status_dict(self):
             self.exchange._set_trading_pair_symbol_map(None)
 
@@ -1,11 +1,12 @@
 import asyncio
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -34,6 +35,9 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: RequestPriority = RequestPriority.STATUS,
+                 waiting_priorities: Optional[Dict[Tuple[str, RequestPriority], int]] = None,
+                 reserved_capacity_pct: float = 0.0,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +46,9 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param priority: The priority class of this API Request
+        :param waiting_priorities: Shared count of the requests waiting for capacity, by limit id and priority
+        :param reserved_capacity_pct: Fraction of each limit that only requests with the top priority can use
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +56,13 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = priority
+        self._waiting_priorities: Dict[Tuple[str, RequestPriority], int] = (
+            waiting_priorities if waiting_priorities is not None else {})
+        self._limit_ids: Set[str] = {limit.limit_id for limit, _ in related_limits}
+        if rate_limit is not None:
+            self._limit_ids.add(rate_limit.limit_id)
+        self._reserved_capacity_pct: float = reserved_capacity_pct
 
     def flush(self):
         """
@@ -65,14 +79,38 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def effective_limit(self, rate_limit: RateLimit) -> int:
+        """
+        The part of the limit this request can use. Only the top priority can use the reserved capacity.
+        """
+        if self._priority == max(RequestPriority) or self._reserved_capacity_pct <= 0:
+            return rate_limit.limit
+        return max(1, math.floor(rate_limit.limit * (1 - self._reserved_capacity_pct)))
+
+    def higher_priority_waiting(self) -> bool:
+        """
+        Only the requests waiting for one of the limits of this request have precedence, requests on unrelated limits
+        don't block it.
+        """
+        return any(count > 0
+                   for (limit_id, priority), count in self._waiting_priorities.items()
+                   if priority > self._priority and limit_id in self._limit_ids)
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+        for limit_id in self._limit_ids:
+            key = (limit_id, self._priority)
+            self._waiting_priorities[key] = self._waiting_priorities.get(key, 0) + 1
+        try:
+            while True:
+                async with self._lock:
+                    self.flush()
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
+                    if not self.higher_priority_waiting() and self.within_capacity():
+                        break
+                await asyncio.sleep(self._retry_interval)
+        finally:
+            for limit_id in self._limit_ids:
+                self._waiting_priorities[(limit_id, self._priority)] -= 1
         async with self._lock:
             now = time.time()
             # Each related limit is represented as it own individual TaskLog
@@ -1,14 +1,14 @@
 import collections
 import time
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
-from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase, current_request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -36,7 +36,7 @@ class AsyncRequestContext(AsyncRequestContextBase):
                                           if
                                           Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
 
-                if capacity_used + weight > rate_limit.limit:
+                if capacity_used + weight > self.effective_limit(rate_limit):
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
                         msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
                               f"{rate_limit.time_interval}s) has almost reached. Limits used " \
@@ -55,7 +55,8 @@ class AsyncThrottler(AsyncThrottlerBase):
     """
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
     within defined limits.
-    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO).
+    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO)
+    within the same priority. Tasks with a lower priority wait while tasks with a higher priority are waiting.
     (i.e)
         Pool 0 - rate limit is 100 calls per second
         Pool 1 - rate limit is 10 calls per second
@@ -63,11 +64,12 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the APi request, defaults to the priority set for the current context
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
@@ -78,4 +80,7 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            priority=priority if priority is not None else current_request_priority(),
+            waiting_priorities=self._waiting_priorities,
+            reserved_capacity_pct=self._reserved_capacity_pct,
         )
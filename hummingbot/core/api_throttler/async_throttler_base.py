@@ -3,13 +3,38 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.logger import HummingbotLogger
 
+_request_priority: ContextVar[RequestPriority] = ContextVar("request_priority", default=RequestPriority.STATUS)
+
+
+def current_request_priority() -> RequestPriority:
+    """
+    The priority used by the throttlers for the requests executed in the current context
+    """
+    return _request_priority.get()
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Sets the priority of all the throttled requests executed within the context (including the ones executed by
+    tasks created within it)
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -30,7 +55,8 @@ class AsyncThrottlerBase(ABC):
                  rate_limits: List[RateLimit],
                  retry_interval: float = 0.1,
                  safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
-                 limits_share_percentage: Optional[Decimal] = None
+                 limits_share_percentage: Optional[Decimal] = None,
+                 reserved_capacity_pct: float = 0.0,
                  ):
         """
         :param rate_limits: List of RateLimit(s).
@@ -39,6 +65,7 @@ class AsyncThrottlerBase(ABC):
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
             bots operate with the same account)
+        :param reserved_capacity_pct: Fraction (0 to 1) of each limit that only requests with the top priority can use
         """
         # If configured, users can define the percentage of rate limits to allocate to the throttler.
         share_percentage = limits_share_percentage or Decimal("100")
@@ -52,6 +79,10 @@ class AsyncThrottlerBase(ABC):
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
+        self._reserved_capacity_pct: float = reserved_capacity_pct
+
+        # Number of requests waiting for capacity, by limit id and priority
+        self._waiting_priorities: Counter = Counter()
 
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
@@ -86,5 +117,5 @@ class AsyncThrottlerBase(ABC):
         return rate_limit, related_limits
 
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
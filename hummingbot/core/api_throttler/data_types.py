@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,17 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority classes for throttled requests. When requests wait for capacity, the ones with a higher priority are
+    served first, and the top priority can use the capacity reserved in the throttler.
+    """
+    REFERENCE_DATA = 0
+    STATUS = 1
+    CREATE = 2
+    CANCEL = 3
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -0,0 +1,231 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase, current_request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the weights consumed for a single RateLimit. Entries are kept in arrival order together with
+    the running total, so expired entries are evicted from the left and capacity checks are O(1) amortized.
+    """
+
+    __slots__ = ("limit", "duration", "_entries", "_used")
+
+    def __init__(self, limit: int, duration: float):
+        """
+        :param limit: The total weight permitted within the window
+        :param duration: The length of the window in seconds, including any safety margin
+        """
+        self.limit: int = limit
+        self.duration: float = duration
+        self._entries: Deque[Tuple[float, int]] = deque()
+        self._used: int = 0
+
+    @property
+    def used(self) -> int:
+        return self._used
+
+    def evict(self, now: float):
+        entries = self._entries
+        while entries and entries[0][0] + self.duration <= now:
+            _, weight = entries.popleft()
+            self._used -= weight
+
+    def has_capacity(self, weight: int, limit: Optional[int] = None) -> bool:
+        return self._used + weight <= (self.limit if limit is None else limit)
+
+    def add(self, now: float, weight: int):
+        self._entries.append((now, weight))
+        self._used += weight
+
+    def time_until_capacity(self, weight: int, now: float, limit: Optional[int] = None) -> float:
+        """
+        Calculates how long it takes until the window can take the weight, assuming no other entries are added.
+        """
+        excess = self._used + weight - (self.limit if limit is None else limit)
+        if excess <= 0:
+            return 0.0
+        freed = 0
+        for timestamp, entry_weight in self._entries:
+            freed += entry_weight
+            if freed >= excess:
+                return max(0.0, timestamp + self.duration - now)
+        # The weight alone exceeds the limit, it will never fit. Check again after a full window.
+        return self.duration
+
+
+class SlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that waits in the SlidingWindowThrottler queue until all the rate
+    limits associated with the request have capacity.
+    """
+
+    def __init__(self,
+                 throttler: "SlidingWindowThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 safety_margin_pct: float,
+                 priority: RequestPriority = RequestPriority.STATUS,
+                 reserved_capacity_pct: float = 0.0):
+        super().__init__(
+            task_logs=[],
+            rate_limit=rate_limit,
+            related_limits=related_limits,
+            lock=throttler._lock,
+            safety_margin_pct=safety_margin_pct,
+            priority=priority,
+            reserved_capacity_pct=reserved_capacity_pct,
+        )
+        self._throttler: SlidingWindowThrottler = throttler
+
+    @property
+    def priority(self) -> RequestPriority:
+        return self._priority
+
+    @property
+    def limits_with_weights(self) -> List[Tuple[RateLimit, int]]:
+        if self._rate_limit is None:
+            return []
+        return [(self._rate_limit, self._rate_limit.weight)] + self._related_limits
+
+    def flush(self):
+        # Expired entries are evicted by each RateLimitWindow when it is checked
+        pass
+
+    def within_capacity(self) -> bool:
+        return self._throttler.within_capacity(self)
+
+    async def acquire(self):
+        await self._throttler.acquire(self)
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Drop-in alternative to AsyncThrottler that keeps one sliding window with a running total per RateLimit instead of
+    a shared list of TaskLog. Linked limits are updated incrementally when a task is acquired, and tasks waiting for
+    capacity are queued (by priority, then FIFO) and woken by a timer scheduled at the exact time the capacity frees
+    up, instead of polling every retry_interval.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._waiters: Deque[Tuple[SlidingWindowRequestContext, asyncio.Future]] = deque()
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+        super().__init__(*args, **kwargs)
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        self._windows = {}
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the APi request, defaults to the priority set for the current context
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return SlidingWindowRequestContext(
+            throttler=self,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            safety_margin_pct=self._safety_margin_pct,
+            priority=priority if priority is not None else current_request_priority(),
+            reserved_capacity_pct=self._reserved_capacity_pct,
+        )
+
+    def within_capacity(self, context: SlidingWindowRequestContext) -> bool:
+        now = self._time()
+        for rate_limit, weight in context.limits_with_weights:
+            window = self._window(rate_limit)
+            window.evict(now)
+            if not window.has_capacity(weight, context.effective_limit(rate_limit)):
+                return False
+        return True
+
+    async def acquire(self, context: SlidingWindowRequestContext):
+        position = len(self._waiters)
+        while position > 0 and self._waiters[position - 1][0].priority < context.priority:
+            position -= 1
+        if position == 0 and self._try_acquire(context):
+            return
+
+        self._log_capacity_warning(context)
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.insert(position, (context, future))
+        self._schedule_wakeup()
+        await future
+
+    def _window(self, rate_limit: RateLimit) -> RateLimitWindow:
+        window = self._windows.get(rate_limit.limit_id)
+        if window is None:
+            window = RateLimitWindow(
+                limit=rate_limit.limit,
+                duration=rate_limit.time_interval * (1 + self._safety_margin_pct))
+            self._windows[rate_limit.limit_id] = window
+        return window
+
+    def _try_acquire(self, context: SlidingWindowRequestContext) -> bool:
+        if not self.within_capacity(context):
+            return False
+        now = self._time()
+        for rate_limit, weight in context.limits_with_weights:
+            self._window(rate_limit).add(now, weight)
+        return True
+
+    def _time_until_capacity(self, context: SlidingWindowRequestContext) -> float:
+        now = self._time()
+        return max(
+            (self._window(rate_limit).time_until_capacity(weight, now, context.effective_limit(rate_limit))
+             for rate_limit, weight in context.limits_with_weights),
+            default=0.0)
+
+    def _process_waiters(self):
+        self._wakeup_handle = None
+        while len(self._waiters) > 0:
+            context, future = self._waiters[0]
+            if future.done():
+                # The waiting task was cancelled
+                self._waiters.popleft()
+                continue
+            if not self._try_acquire(context):
+                break
+            self._waiters.popleft()
+            future.set_result(None)
+        self._schedule_wakeup()
+
+    def _schedule_wakeup(self):
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        while len(self._waiters) > 0 and self._waiters[0][1].done():
+            self._waiters.popleft()
+        if len(self._waiters) > 0:
+            delay = self._time_until_capacity(self._waiters[0][0])
+            self._wakeup_handle = asyncio.get_event_loop().call_later(delay, self._process_waiters)
+
+    def _log_capacity_warning(self, context: SlidingWindowRequestContext):
+        now = self._time()
+        if AsyncRequestContextBase._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            for rate_limit, weight in context.limits_with_weights:
+                window = self._window(rate_limit)
+                if not window.has_capacity(weight, context.effective_limit(rate_limit)):
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {window.used} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    AsyncRequestContextBase._last_max_cap_warning_ts = now
+                    break
+
+    def _time(self) -> float:
+        return time.time()
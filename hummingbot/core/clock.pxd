@@ -10,3 +10,6 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _timing_profile
+        bint _skip_overrunning_iterators
+        dict _iterator_skipped_ticks
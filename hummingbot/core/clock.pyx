@@ -8,6 +8,7 @@ from typing import List
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_profile import ClockTimingProfile
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -21,12 +22,16 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 skip_overrunning_iterators: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param skip_overrunning_iterators: (real time mode only) if True, a child iterator whose tick took longer than
+        the tick size is skipped for as many ticks as its tick lasted, so the other iterators keep their pace. Its next
+        tick covers the skipped ones.
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +41,9 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._timing_profile = ClockTimingProfile(tick_size)
+        self._skip_overrunning_iterators = skip_overrunning_iterators
+        self._iterator_skipped_ticks = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +65,23 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def timing_profile(self) -> ClockTimingProfile:
+        """
+        The tick lag, tick durations and child iterator tick durations recorded while running in real time
+        """
+        return self._timing_profile
+
+    @property
+    def skip_overrunning_iterators(self) -> bool:
+        return self._skip_overrunning_iterators
+
+    @skip_overrunning_iterators.setter
+    def skip_overrunning_iterators(self, value: bool):
+        self._skip_overrunning_iterators = value
+        if not value:
+            self._iterator_skipped_ticks.clear()
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -81,6 +106,8 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._timing_profile.remove_iterator(iterator)
+        self._iterator_skipped_ticks.pop(id(iterator), None)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +117,12 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            double iterator_start
+            double duration
+            double lag
+            int missed_ticks
+            int ticks_to_skip
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -109,12 +142,22 @@ cdef class Clock:
 
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                missed_ticks = max(<int>round((next_tick_time - self._current_tick) / self._tick_size) - 1, 0)
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                lag = max(time.time() - next_tick_time, 0)
+                tick_start = time.perf_counter()
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if self._skip_overrunning_iterators:
+                        ticks_to_skip = self._iterator_skipped_ticks.get(id(ci), 0)
+                        if ticks_to_skip > 0:
+                            self._iterator_skipped_ticks[id(ci)] = ticks_to_skip - 1
+                            self._timing_profile.iterator_profile(ci).skipped_ticks += 1
+                            continue
+                    iterator_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,6 +165,12 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    duration = time.perf_counter() - iterator_start
+                    self._timing_profile.record_iterator_tick(ci, duration)
+                    if self._skip_overrunning_iterators and duration > self._tick_size:
+                        self._iterator_skipped_ticks[id(ci)] = <int>(duration // self._tick_size)
+
+                self._timing_profile.record_tick(lag, time.perf_counter() - tick_start, missed_ticks)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
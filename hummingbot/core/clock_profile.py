@@ -0,0 +1,220 @@
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+# Upper bounds (in seconds) of the timing histogram buckets. The last bucket has no upper bound.
+TIMING_BUCKET_BOUNDS: List[float] = [
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, float("inf")
+]
+
+
+class TimingHistogram:
+    """
+    Histogram of durations over fixed exponential buckets, with the count, total and maximum duration recorded.
+    """
+
+    def __init__(self):
+        self._bucket_counts: List[int] = [0] * len(TIMING_BUCKET_BOUNDS)
+        self._count: int = 0
+        self._total: float = 0.0
+        self._max: float = 0.0
+        self._last: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def last(self) -> float:
+        return self._last
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    @property
+    def bucket_counts(self) -> Dict[float, int]:
+        """
+        The number of durations recorded in each bucket, by bucket upper bound
+        """
+        return dict(zip(TIMING_BUCKET_BOUNDS, self._bucket_counts))
+
+    def record(self, duration: float):
+        self._bucket_counts[bisect_left(TIMING_BUCKET_BOUNDS, duration)] += 1
+        self._count += 1
+        self._total += duration
+        self._last = duration
+        if duration > self._max:
+            self._max = duration
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :param percentile: the percentile, between 0 and 100
+        :return: the upper bound of the bucket containing the percentile, capped by the maximum duration recorded
+        """
+        if self._count == 0:
+            return 0.0
+        threshold = self._count * percentile / 100
+        cumulative_count = 0
+        for bound, bucket_count in zip(TIMING_BUCKET_BOUNDS, self._bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= threshold and bucket_count > 0:
+                return min(bound, self._max)
+        return self._max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self._count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self._max,
+            "last": self._last,
+        }
+
+
+class IteratorTimingProfile:
+    """
+    Tick durations of a clock child iterator.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.durations: TimingHistogram = TimingHistogram()
+        self.overruns: int = 0
+        self.skipped_ticks: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            **self.durations.to_dict(),
+            "overruns": self.overruns,
+            "skipped_ticks": self.skipped_ticks,
+        }
+
+
+class ClockTimingProfile:
+    """
+    Timing profile of a real time clock:
+    - the lag of each tick, between the tick boundary and the moment the clock actually woke up to process it
+    - the time spent processing each tick, and the ticks whose processing took longer than the tick size (overruns)
+    - the tick boundaries missed because the processing of the previous tick was not done yet
+    - the time spent in the tick of each child iterator
+    """
+
+    def __init__(self, tick_size: float):
+        self._tick_size: float = tick_size
+        self.lags: TimingHistogram = TimingHistogram()
+        self.tick_durations: TimingHistogram = TimingHistogram()
+        self.overruns: int = 0
+        self.missed_ticks: int = 0
+        self._iterator_profiles: Dict[int, IteratorTimingProfile] = {}
+
+    @property
+    def tick_size(self) -> float:
+        return self._tick_size
+
+    @property
+    def ticks(self) -> int:
+        return self.tick_durations.count
+
+    @property
+    def iterator_profiles(self) -> List[IteratorTimingProfile]:
+        return list(self._iterator_profiles.values())
+
+    @property
+    def has_delays(self) -> bool:
+        """
+        True if at least one tick was missed or took longer than the tick size
+        """
+        return self.overruns > 0 or self.missed_ticks > 0
+
+    def iterator_profile(self, iterator: Any) -> IteratorTimingProfile:
+        profile = self._iterator_profiles.get(id(iterator))
+        if profile is None:
+            profile = IteratorTimingProfile(self._iterator_name(iterator))
+            self._iterator_profiles[id(iterator)] = profile
+        return profile
+
+    def remove_iterator(self, iterator: Any):
+        self._iterator_profiles.pop(id(iterator), None)
+
+    def record_tick(self, lag: float, duration: float, missed_ticks: int):
+        self.lags.record(lag)
+        self.tick_durations.record(duration)
+        self.missed_ticks += missed_ticks
+        if duration > self._tick_size:
+            self.overruns += 1
+
+    def record_iterator_tick(self, iterator: Any, duration: float) -> IteratorTimingProfile:
+        profile = self.iterator_profile(iterator)
+        profile.durations.record(duration)
+        if duration > self._tick_size:
+            profile.overruns += 1
+        return profile
+
+    def reset(self):
+        self.lags = TimingHistogram()
+        self.tick_durations = TimingHistogram()
+        self.overruns = 0
+        self.missed_ticks = 0
+        self._iterator_profiles = {
+            key: IteratorTimingProfile(profile.name) for key, profile in self._iterator_profiles.items()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tick_size": self._tick_size,
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "missed_ticks": self.missed_ticks,
+            "lag": self.lags.to_dict(),
+            "tick_duration": self.tick_durations.to_dict(),
+            "iterators": [profile.to_dict() for profile in self._iterator_profiles.values()],
+        }
+
+    def iterators_df(self) -> pd.DataFrame:
+        """
+        :return: the tick durations of the child iterators, in milliseconds, slowest first
+        """
+        columns = ["Iterator", "Ticks", "Mean (ms)", "p99 (ms)", "Max (ms)", "Overruns", "Skipped"]
+        data = [
+            [profile.name,
+             profile.durations.count,
+             profile.durations.mean * 1e3,
+             profile.durations.percentile(99) * 1e3,
+             profile.durations.max * 1e3,
+             profile.overruns,
+             profile.skipped_ticks]
+            for profile in sorted(self._iterator_profiles.values(), key=lambda p: p.durations.total, reverse=True)
+        ]
+        return pd.DataFrame(data=data, columns=columns)
+
+    def format_status(self) -> str:
+        lines = [
+            f"  Clock: {self.ticks} ticks of {self._tick_size}s, {self.overruns} overruns, "
+            f"{self.missed_ticks} missed ticks, lag mean {self.lags.mean * 1e3:.1f}ms / "
+            f"max {self.lags.max * 1e3:.1f}ms"
+        ]
+        if len(self._iterator_profiles) > 0:
+            lines.extend(["    " + line for line in
+                          self.iterators_df().to_string(index=False, float_format="%.2f").split("\n")])
+        return "\n".join(lines)
+
+    @staticmethod
+    def _iterator_name(iterator: Any) -> str:
+        name: Optional[str] = None
+        try:
+            name = getattr(iterator, "display_name", None)
+        except Exception:
+            pass
+        return name if isinstance(name, str) else type(iterator).__name__
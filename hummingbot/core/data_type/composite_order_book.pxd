@@ -1,8 +1,12 @@
 # distutils: language=c++
+from libc.stdint cimport int64_t
+
 from hummingbot.core.data_type.order_book cimport OrderBook
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
+    cdef int64_t c_fill_bids_array(self, double[:, :] out)
+    cdef int64_t c_fill_asks_array(self, double[:, :] out)
     cdef double c_get_price(self, bint is_buy) except? -1
@@ -1,10 +1,12 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+from itertools import islice
 from typing import Iterator
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
@@ -175,6 +177,33 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    def bid_entries_top(self, int n) -> Iterator[OrderBookRow]:
+        return islice(self.bid_entries(), n)
+
+    def ask_entries_top(self, int n) -> Iterator[OrderBookRow]:
+        return islice(self.ask_entries(), n)
+
+    cdef int64_t c_fill_bids_array(self, double[:, :] out):
+        # The composite entries are walked in full so the traded order book gets pruned, as in bid_entries().
+        cdef int64_t count = 0
+        for row in self.bid_entries():
+            if count < out.shape[0]:
+                out[count, 0] = row.price
+                out[count, 1] = row.amount
+                out[count, 2] = row.update_id
+                count += 1
+        return count
+
+    cdef int64_t c_fill_asks_array(self, double[:, :] out):
+        cdef int64_t count = 0
+        for row in self.ask_entries():
+            if count < out.shape[0]:
+                out[count, 0] = row.price
+                out[count, 1] = row.amount
+                out[count, 2] = row.update_id
+                count += 1
+        return count
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -4,6 +4,7 @@ import bisect
 import logging
 import time
 from typing import (
+    Any,
     Dict,
     Iterator,
     List,
@@ -27,6 +28,7 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopOfBookChangedEvent,
     OrderBookTradeEvent
 )
 
@@ -36,8 +38,35 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef vector[OrderBookEntry] c_parse_raw_entries(object raw_entries, int64_t update_id) except *:
+    """
+    Parses exchange entries of the form [price, amount, ...], with prices and amounts as strings or numbers, directly
+    into order book entries.
+    """
+    cdef:
+        vector[OrderBookEntry] entries
+    entries.reserve(len(raw_entries))
+    for raw_entry in raw_entries:
+        entries.push_back(OrderBookEntry(float(raw_entry[0]), float(raw_entry[1]), update_id))
+    return entries
+
+
+cdef vector[OrderBookEntry] c_parse_buffer_entries(const double[:, :] buffer, int64_t update_id):
+    """
+    Parses a contiguous (n, 2) buffer of [price, amount] rows into order book entries.
+    """
+    cdef:
+        vector[OrderBookEntry] entries
+        Py_ssize_t i
+    entries.reserve(buffer.shape[0])
+    for i in range(buffer.shape[0]):
+        entries.push_back(OrderBookEntry(buffer[i, 0], buffer[i, 1], update_id))
+    return entries
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -55,6 +84,10 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._emit_top_of_book_events = False
+        self._top_of_book_debounce_interval = 0
+        self._last_top_of_book_event_time = -1000
+        self._emitted_best_bid = self._emitted_best_ask = float("NaN")
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -96,6 +129,9 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        if self._emit_top_of_book_events:
+            self.c_check_top_of_book_changed(update_id)
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -136,11 +172,56 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        if self._emit_top_of_book_events:
+            self.c_check_top_of_book_changed(update_id)
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_check_top_of_book_changed(self, int64_t update_id):
+        cdef:
+            double now
+        if ((self._best_bid == self._emitted_best_bid or (self._best_bid != self._best_bid and
+                                                          self._emitted_best_bid != self._emitted_best_bid)) and
+                (self._best_ask == self._emitted_best_ask or (self._best_ask != self._best_ask and
+                                                              self._emitted_best_ask != self._emitted_best_ask))):
+            return
+        now = time.perf_counter()
+        if now - self._last_top_of_book_event_time < self._top_of_book_debounce_interval:
+            return
+        self._last_top_of_book_event_time = now
+        self._emitted_best_bid = self._best_bid
+        self._emitted_best_ask = self._best_ask
+        self.c_trigger_event(
+            self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+            OrderBookTopOfBookChangedEvent(time.time(), self._best_bid, self._best_ask, update_id)
+        )
+
+    @property
+    def top_of_book_events_enabled(self) -> bool:
+        return self._emit_top_of_book_events
+
+    def enable_top_of_book_events(self, debounce_interval: float = 0.0):
+        """
+        Emits an OrderBookTopOfBookChangedEvent when the best bid or the best ask price changes after applying diffs or
+        a snapshot.
+
+        The events are debounced: changes applied less than `debounce_interval` seconds after the last event are not
+        emitted on their own, they are emitted with the first update applied after the interval if the top of the book
+        still differs from the last event.
+
+        :param debounce_interval: the minimum time in seconds between two events
+        """
+        self._emit_top_of_book_events = True
+        self._top_of_book_debounce_interval = debounce_interval
+
+    def disable_top_of_book_events(self):
+        self._emit_top_of_book_events = False
+        self._emitted_best_bid = self._emitted_best_ask = float("NaN")
+        self._last_top_of_book_event_time = -1000
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -171,10 +252,16 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.get_snapshot()
+
+    def get_snapshot(self, depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Returns the bid and ask books as data frames with the [price, amount, update_id] columns, best levels first.
+
+        :param depth: the maximum number of levels per side, or None for the full book
+        """
+        bids_df = pd.DataFrame(data=self.get_bids_array(depth), columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=self.get_asks_array(depth), columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
@@ -197,6 +284,54 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, raw_bids: List[List[Any]], raw_asks: List[List[Any]], update_id: int):
+        """
+        Applies diffs in the exchange payload format, i.e. [[price, amount, ...], ...] with prices and amounts as
+        strings or numbers, without building intermediate OrderBookRow objects.
+        """
+        self.c_apply_diffs(c_parse_raw_entries(raw_bids, update_id),
+                           c_parse_raw_entries(raw_asks, update_id),
+                           update_id)
+
+    def apply_raw_snapshot(self, raw_bids: List[List[Any]], raw_asks: List[List[Any]], update_id: int):
+        """
+        Applies a snapshot in the exchange payload format, i.e. [[price, amount, ...], ...] with prices and amounts
+        as strings or numbers, without building intermediate OrderBookRow objects.
+        """
+        self.c_apply_snapshot(c_parse_raw_entries(raw_bids, update_id),
+                              c_parse_raw_entries(raw_asks, update_id),
+                              update_id)
+
+    def apply_buffer_diffs(self, bids_buffer: np.ndarray, asks_buffer: np.ndarray, update_id: int):
+        """
+        Applies diffs from contiguous float64 buffers of shape (n, 2), with [price, amount] rows.
+        """
+        self.c_apply_diffs(c_parse_buffer_entries(bids_buffer, update_id),
+                           c_parse_buffer_entries(asks_buffer, update_id),
+                           update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, reading the raw exchange entries when the message exposes them.
+        """
+        raw_bids = message.raw_bids
+        raw_asks = message.raw_asks
+        if raw_bids is None or raw_asks is None:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+        else:
+            self.apply_raw_diffs(raw_bids, raw_asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, reading the raw exchange entries when the message exposes them.
+        """
+        raw_bids = message.raw_bids
+        raw_asks = message.raw_asks
+        if raw_bids is None or raw_asks is None:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+        else:
+            self.apply_raw_snapshot(raw_bids, raw_asks, message.update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -208,19 +343,22 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If update_id is not given, the largest update id of the rows is used as the book's last diff update id.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        A negative update_id means the largest update id of the rows is used.
         """
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -233,6 +371,8 @@ cdef class OrderBook(PubSub):
         for row in asks_array:
             cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
             last_update_id = max(last_update_id, <int64_t>row[2])
+        if update_id >= 0:
+            last_update_id = update_id
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -280,6 +420,112 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def bid_entries_top(self, int n) -> Iterator[OrderBookRow]:
+        """
+        Iterates over the best n bid levels only, without walking the rest of the book.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            int count = 0
+        while count < n and it != self._bid_book.rend():
+            entry = deref(it)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
+            count += 1
+
+    def ask_entries_top(self, int n) -> Iterator[OrderBookRow]:
+        """
+        Iterates over the best n ask levels only, without walking the rest of the book.
+        """
+        cdef:
+            set[OrderBookEntry].iterator it = self._ask_book.begin()
+            OrderBookEntry entry
+            int count = 0
+        while count < n and it != self._ask_book.end():
+            entry = deref(it)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
+            count += 1
+
+    cdef int64_t c_fill_bids_array(self, double[:, :] out):
+        cdef:
+            set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            int64_t max_rows = out.shape[0]
+            int64_t count = 0
+        while count < max_rows and it != self._bid_book.rend():
+            entry = deref(it)
+            out[count, 0] = entry.getPrice()
+            out[count, 1] = entry.getAmount()
+            out[count, 2] = <double>entry.getUpdateId()
+            inc(it)
+            count += 1
+        return count
+
+    cdef int64_t c_fill_asks_array(self, double[:, :] out):
+        cdef:
+            set[OrderBookEntry].iterator it = self._ask_book.begin()
+            OrderBookEntry entry
+            int64_t max_rows = out.shape[0]
+            int64_t count = 0
+        while count < max_rows and it != self._ask_book.end():
+            entry = deref(it)
+            out[count, 0] = entry.getPrice()
+            out[count, 1] = entry.getAmount()
+            out[count, 2] = <double>entry.getUpdateId()
+            inc(it)
+            count += 1
+        return count
+
+    def fill_bids_array(self, out: np.ndarray) -> int:
+        """
+        Writes the best bid levels into a preallocated float64 array of shape (n, 3), as [price, amount, update_id]
+        rows, best bid first. No Python objects are created per level.
+
+        :param out: the destination array, its first dimension is the maximum number of levels written
+        :return: the number of rows written
+        """
+        if out.ndim != 2 or out.shape[1] < 3:
+            raise ValueError(f"Expected an array of shape (n, 3), got {out.shape}.")
+        return self.c_fill_bids_array(out)
+
+    def fill_asks_array(self, out: np.ndarray) -> int:
+        """
+        Writes the best ask levels into a preallocated float64 array of shape (n, 3), as [price, amount, update_id]
+        rows, best ask first. No Python objects are created per level.
+
+        :param out: the destination array, its first dimension is the maximum number of levels written
+        :return: the number of rows written
+        """
+        if out.ndim != 2 or out.shape[1] < 3:
+            raise ValueError(f"Expected an array of shape (n, 3), got {out.shape}.")
+        return self.c_fill_asks_array(out)
+
+    def get_bids_array(self, depth: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the best bid levels as a new float64 array of shape (n, 3).
+
+        :param depth: the maximum number of levels, or None for the full book
+        """
+        cdef int64_t size = self._bid_book.size()
+        if depth is not None:
+            size = min(size, max(depth, 0))
+        out = np.empty((size, 3), dtype=np.float64)
+        return out[:self.c_fill_bids_array(out)]
+
+    def get_asks_array(self, depth: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the best ask levels as a new float64 array of shape (n, 3).
+
+        :param depth: the maximum number of levels, or None for the full book
+        """
+        cdef int64_t size = self._ask_book.size()
+        if depth is not None:
+            size = min(size, max(depth, 0))
+        out = np.empty((size, 3), dtype=np.float64)
+        return out[:self.c_fill_asks_array(out)]
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
@@ -478,6 +724,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -1,7 +1,7 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -64,6 +64,22 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def raw_asks(self) -> Optional[List[List[Any]]]:
+        """
+        The ask entries as sent by the exchange ([price, amount, ...]), or None when the message content can only be
+        read through `asks`.
+        """
+        return self.content["asks"]
+
+    @property
+    def raw_bids(self) -> Optional[List[List[Any]]]:
+        """
+        The bid entries as sent by the exchange ([price, amount, ...]), or None when the message content can only be
+        read through `bids`.
+        """
+        return self.content["bids"]
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
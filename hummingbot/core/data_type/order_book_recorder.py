@@ -0,0 +1,283 @@
+import math
+import os
+import struct
+import time
+from bisect import bisect_right
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+# Binary recording format. All the values are little endian.
+#
+# The recording of each trading pair is made of an append only records file, starting with RECORDS_FILE_MAGIC, and of
+# an index file, starting with INDEX_FILE_MAGIC, with one INDEX_ENTRY (received timestamp, record offset) per snapshot.
+#
+# Each record is a RECORD_HEADER (message type, received timestamp, payload size) followed by its payload:
+# - snapshots and diffs: BOOK_PAYLOAD (timestamp, update id, first update id, number of bids, number of asks, float
+#   update ids flag) followed by the [price, amount] bids and then asks, as float64 values. The update ids are int64
+#   values, or float64 values (FLOAT_IDS_BOOK_PAYLOAD) when the flag is set, for the connectors using timestamps as
+#   update ids
+# - trades: TRADE_PAYLOAD (timestamp, price, amount, trade type, integer trade id flag) followed by the trade id
+#   encoded in UTF-8
+RECORDS_FILE_MAGIC = b"HBOBREC\x02"
+INDEX_FILE_MAGIC = b"HBOBIDX\x02"
+RECORD_HEADER = struct.Struct("<BdI")
+BOOK_PAYLOAD = struct.Struct("<dqqIIB")
+FLOAT_IDS_BOOK_PAYLOAD = struct.Struct("<dddIIB")
+TRADE_PAYLOAD = struct.Struct("<dddBB")
+INDEX_ENTRY = struct.Struct("<dQ")
+
+RECORDS_FILE_EXTENSION = ".obrec"
+INDEX_FILE_EXTENSION = ".obidx"
+
+
+class RecordedOrderBookMessage(NamedTuple):
+    received_timestamp: float
+    offset: int
+    message: OrderBookMessage
+
+
+def recording_file_paths(directory: str, trading_pair: str) -> Tuple[str, str]:
+    """
+    :return: the paths of the records file and of the index file of a trading pair
+    """
+    return (os.path.join(directory, f"{trading_pair}{RECORDS_FILE_EXTENSION}"),
+            os.path.join(directory, f"{trading_pair}{INDEX_FILE_EXTENSION}"))
+
+
+def _encode_entries(entries: Any) -> np.ndarray:
+    if isinstance(entries, np.ndarray):
+        return np.ascontiguousarray(entries[:, :2], dtype="<f8")
+    if len(entries) == 0:
+        return np.empty((0, 2), dtype="<f8")
+    return np.array([(float(entry[0]), float(entry[1])) for entry in entries], dtype="<f8")
+
+
+def encode_message(message: OrderBookMessage) -> bytes:
+    """
+    Encodes the payload of an order book message, without the record header.
+    """
+    timestamp = math.nan if message.timestamp is None else float(message.timestamp)
+    if message.type is OrderBookMessageType.TRADE:
+        trade_id = message.trade_id
+        trade_type = TradeType.SELL if float(message.content["trade_type"]) == float(TradeType.SELL.value) \
+            else TradeType.BUY
+        return TRADE_PAYLOAD.pack(timestamp,
+                                  float(message.content["price"]),
+                                  float(message.content["amount"]),
+                                  trade_type.value,
+                                  isinstance(trade_id, int)) + str(trade_id).encode("utf-8")
+
+    raw_bids = message.raw_bids
+    raw_asks = message.raw_asks
+    if raw_bids is None or raw_asks is None:
+        raw_bids = [(row.price, row.amount) for row in message.bids]
+        raw_asks = [(row.price, row.amount) for row in message.asks]
+    bids = _encode_entries(raw_bids)
+    asks = _encode_entries(raw_asks)
+    update_id = message.update_id
+    first_update_id = message.first_update_id
+    if isinstance(update_id, float) or isinstance(first_update_id, float):
+        header = FLOAT_IDS_BOOK_PAYLOAD.pack(timestamp, float(update_id), float(first_update_id), len(bids), len(asks),
+                                             True)
+    else:
+        header = BOOK_PAYLOAD.pack(timestamp, int(update_id), int(first_update_id), len(bids), len(asks), False)
+    return header + bids.tobytes() + asks.tobytes()
+
+
+def decode_message(message_type: OrderBookMessageType, trading_pair: str, payload: bytes) -> OrderBookMessage:
+    """
+    Decodes a record payload into an order book message. Prices and amounts are restored as floats.
+    """
+    if message_type is OrderBookMessageType.TRADE:
+        timestamp, price, amount, trade_type, is_int_trade_id = TRADE_PAYLOAD.unpack_from(payload)
+        trade_id = payload[TRADE_PAYLOAD.size:].decode("utf-8")
+        content = {
+            "trading_pair": trading_pair,
+            "trade_type": float(trade_type),
+            "trade_id": int(trade_id) if is_int_trade_id else trade_id,
+            "price": price,
+            "amount": amount,
+        }
+    else:
+        payload_struct = FLOAT_IDS_BOOK_PAYLOAD if payload[BOOK_PAYLOAD.size - 1] else BOOK_PAYLOAD
+        timestamp, update_id, first_update_id, n_bids, n_asks, _ = payload_struct.unpack_from(payload)
+        entries = np.frombuffer(payload, dtype="<f8", offset=BOOK_PAYLOAD.size).reshape(-1, 2)
+        content = {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": entries[:n_bids].tolist(),
+            "asks": entries[n_bids:n_bids + n_asks].tolist(),
+        }
+        if message_type is OrderBookMessageType.DIFF:
+            content["first_update_id"] = first_update_id
+    return OrderBookMessage(message_type, content, timestamp=None if math.isnan(timestamp) else timestamp)
+
+
+class _TradingPairRecording:
+
+    def __init__(self, directory: str, trading_pair: str, buffer_size: int):
+        records_path, index_path = recording_file_paths(directory, trading_pair)
+        self.records_file: IO[bytes] = self._open(records_path, RECORDS_FILE_MAGIC, buffer_size)
+        self.index_file: IO[bytes] = self._open(index_path, INDEX_FILE_MAGIC, buffer_size)
+
+    @staticmethod
+    def _open(path: str, magic: bytes, buffer_size: int) -> IO[bytes]:
+        file = open(path, "ab", buffering=buffer_size)
+        if file.tell() == 0:
+            file.write(magic)
+        return file
+
+    def write(self, message_type: OrderBookMessageType, received_timestamp: float, payload: bytes):
+        if message_type is OrderBookMessageType.SNAPSHOT:
+            self.index_file.write(INDEX_ENTRY.pack(received_timestamp, self.records_file.tell()))
+        self.records_file.write(RECORD_HEADER.pack(message_type.value, received_timestamp, len(payload)))
+        self.records_file.write(payload)
+
+    def flush(self):
+        self.records_file.flush()
+        self.index_file.flush()
+
+    def close(self):
+        self.records_file.close()
+        self.index_file.close()
+
+
+class OrderBookRecorder:
+    """
+    Records the order book snapshots, diffs and trades received by an `OrderBookTracker`, in the compact append only
+    binary format described at the top of this module, with one records file and one index file per trading pair.
+    The recordings can be replayed with `OrderBookReplayDataSource`.
+
+    Messages are written as soon as they are received, to buffered files. Prices and amounts are stored as float64,
+    which is the precision of `OrderBook`.
+    """
+
+    def __init__(self, directory: Optional[str] = None, buffer_size: int = 1 << 16):
+        """
+        :param directory: the directory of the recordings, defaults to `order_book_recordings` in the data directory
+        :param buffer_size: the size of the write buffer of each file
+        """
+        self._directory = directory or os.path.join(data_path(), "order_book_recordings")
+        self._buffer_size = buffer_size
+        self._recordings: Dict[str, _TradingPairRecording] = {}
+        os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def record_message(self, message: OrderBookMessage, received_timestamp: Optional[float] = None):
+        """
+        :param message: the snapshot, diff or trade message to record
+        :param received_timestamp: the time the message was received, defaults to now
+        """
+        received_timestamp = time.time() if received_timestamp is None else received_timestamp
+        self._recording(message.trading_pair).write(message.type, received_timestamp, encode_message(message))
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, received_timestamp: Optional[float] = None):
+        """
+        Records the current content of an order book as a snapshot. Used for the initial order books, which are not
+        created from snapshot messages going through the tracker.
+        """
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {
+                "trading_pair": trading_pair,
+                "update_id": order_book.snapshot_uid,
+                "bids": order_book.get_bids_array(),
+                "asks": order_book.get_asks_array(),
+            },
+            timestamp=received_timestamp)
+        self.record_message(snapshot, received_timestamp=received_timestamp)
+
+    def flush(self):
+        for recording in self._recordings.values():
+            recording.flush()
+
+    def close(self):
+        for recording in self._recordings.values():
+            recording.close()
+        self._recordings.clear()
+
+    def _recording(self, trading_pair: str) -> _TradingPairRecording:
+        recording = self._recordings.get(trading_pair)
+        if recording is None:
+            recording = _TradingPairRecording(self._directory, trading_pair, self._buffer_size)
+            self._recordings[trading_pair] = recording
+        return recording
+
+
+class OrderBookRecordingReader:
+    """
+    Reads the recording of a trading pair written by `OrderBookRecorder`.
+    """
+
+    def __init__(self, directory: str, trading_pair: str):
+        self._trading_pair = trading_pair
+        self._records_path, self._index_path = recording_file_paths(directory, trading_pair)
+        if not os.path.exists(self._records_path):
+            raise FileNotFoundError(f"There is no order book recording for {trading_pair} in {directory}.")
+        self._index: Optional[List[Tuple[float, int]]] = None
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def snapshots_index(self) -> List[Tuple[float, int]]:
+        """
+        The (received timestamp, record offset) of each recorded snapshot
+        """
+        if self._index is None:
+            self._index = self._read_index()
+        return self._index
+
+    def offset_for_timestamp(self, timestamp: float) -> int:
+        """
+        :return: the offset of the last snapshot received at or before the timestamp, or of the first record if there
+            is none
+        """
+        index = self.snapshots_index
+        position = bisect_right([received_timestamp for received_timestamp, _ in index], timestamp)
+        return index[position - 1][1] if position > 0 else len(RECORDS_FILE_MAGIC)
+
+    def iter_messages(self, offset: Optional[int] = None) -> Iterator[RecordedOrderBookMessage]:
+        """
+        Iterates over the recorded messages, in the order they were received. A record truncated by an interrupted
+        recording ends the iteration.
+
+        :param offset: the offset of the first record to read, defaults to the first record
+        """
+        with open(self._records_path, "rb") as file:
+            if file.read(len(RECORDS_FILE_MAGIC)) != RECORDS_FILE_MAGIC:
+                raise ValueError(f"{self._records_path} is not an order book recording.")
+            if offset is not None:
+                file.seek(offset)
+            while True:
+                record_offset = file.tell()
+                header = file.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    return
+                message_type, received_timestamp, payload_size = RECORD_HEADER.unpack(header)
+                payload = file.read(payload_size)
+                if len(payload) < payload_size:
+                    return
+                message = decode_message(OrderBookMessageType(message_type), self._trading_pair, payload)
+                yield RecordedOrderBookMessage(received_timestamp, record_offset, message)
+
+    def _read_index(self) -> List[Tuple[float, int]]:
+        if not os.path.exists(self._index_path):
+            return []
+        with open(self._index_path, "rb") as file:
+            data = file.read()
+        if not data.startswith(INDEX_FILE_MAGIC):
+            raise ValueError(f"{self._index_path} is not an order book recording index.")
+        data = data[len(INDEX_FILE_MAGIC):]
+        data = data[:len(data) - len(data) % INDEX_ENTRY.size]
+        return [entry for entry in INDEX_ENTRY.iter_unpack(data)]
@@ -0,0 +1,150 @@
+import asyncio
+import heapq
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecordingReader, RecordedOrderBookMessage
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class _ReplayEntry(NamedTuple):
+    # The offset and the trading pair break the ties between messages received at the same time, so that the
+    # messages themselves are never compared
+    received_timestamp: float
+    offset: int
+    trading_pair: str
+    recorded_message: RecordedOrderBookMessage
+
+
+class OrderBookReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source replaying the recordings written by `OrderBookRecorder`, instead of connecting to an
+    exchange. It can be used with an `OrderBookTracker` like any other data source.
+
+    The initial order book of each trading pair is the first snapshot recorded (or the last one received before
+    `start_timestamp`). All the following messages of all the trading pairs are then replayed in the order they were
+    received, either as fast as possible or paced by their received timestamps.
+    """
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 directory: str,
+                 speed: Optional[float] = None,
+                 start_timestamp: Optional[float] = None,
+                 end_timestamp: Optional[float] = None):
+        """
+        :param trading_pairs: the trading pairs to replay
+        :param directory: the directory of the recordings
+        :param speed: the replay speed relative to real time (1.0 for real time), or None to replay the messages as
+            fast as they are consumed
+        :param start_timestamp: the received timestamp to start replaying from
+        :param end_timestamp: the received timestamp to stop replaying at
+        """
+        super().__init__(trading_pairs=trading_pairs)
+        self._speed = speed
+        self._start_timestamp = start_timestamp
+        self._end_timestamp = end_timestamp
+        self._readers: Dict[str, OrderBookRecordingReader] = {
+            trading_pair: OrderBookRecordingReader(directory, trading_pair) for trading_pair in trading_pairs
+        }
+        self._initial_snapshots: Dict[str, RecordedOrderBookMessage] = {}
+        self._initial_snapshot_requested: Dict[str, asyncio.Event] = {
+            trading_pair: asyncio.Event() for trading_pair in trading_pairs
+        }
+        self._last_traded_prices: Dict[str, float] = {}
+        self._replay_finished = asyncio.Event()
+        self._replayed_messages_count = 0
+
+    @property
+    def replayed_messages_count(self) -> int:
+        return self._replayed_messages_count
+
+    @property
+    def is_replay_finished(self) -> bool:
+        return self._replay_finished.is_set()
+
+    async def wait_replay_finished(self):
+        await self._replay_finished.wait()
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        """
+        Returns the price of the last trade replayed for each trading pair, or NaN if no trade was replayed yet.
+        """
+        return {
+            trading_pair: self._last_traded_prices.get(trading_pair, float("nan"))
+            for trading_pair in trading_pairs
+        }
+
+    async def listen_for_subscriptions(self):
+        """
+        Replays the recorded messages once the initial order books have been requested, so that no diff has to be
+        buffered by the order book tracker while it waits for them.
+        """
+        await asyncio.gather(*[event.wait() for event in self._initial_snapshot_requested.values()])
+        replay_start = time.perf_counter()
+        first_received_timestamp: Optional[float] = None
+
+        for entry in heapq.merge(*[self._replay_entries(trading_pair) for trading_pair in self._trading_pairs]):
+            if self._end_timestamp is not None and entry.received_timestamp > self._end_timestamp:
+                break
+            if self._speed is not None:
+                if first_received_timestamp is None:
+                    first_received_timestamp = entry.received_timestamp
+                delay = ((entry.received_timestamp - first_received_timestamp) / self._speed
+                         - (time.perf_counter() - replay_start))
+                await self._sleep(max(delay, 0))
+            else:
+                await self._sleep(0)
+            self._route_message(entry.recorded_message.message)
+
+        self._replay_finished.set()
+
+    def _route_message(self, message: OrderBookMessage):
+        if message.type is OrderBookMessageType.TRADE:
+            self._last_traded_prices[message.trading_pair] = message.content["price"]
+            channel = self._trade_messages_queue_key
+        elif message.type is OrderBookMessageType.DIFF:
+            channel = self._diff_messages_queue_key
+        else:
+            channel = self._snapshot_messages_queue_key
+        self._message_queue[channel].put_nowait(message)
+        self._replayed_messages_count += 1
+
+    def _replay_entries(self, trading_pair: str) -> Iterator[_ReplayEntry]:
+        initial_snapshot = self._initial_snapshot(trading_pair)
+        for recorded_message in self._readers[trading_pair].iter_messages(offset=initial_snapshot.offset):
+            if recorded_message.offset != initial_snapshot.offset:
+                yield _ReplayEntry(recorded_message.received_timestamp, recorded_message.offset, trading_pair,
+                                   recorded_message)
+
+    def _initial_snapshot(self, trading_pair: str) -> RecordedOrderBookMessage:
+        if trading_pair not in self._initial_snapshots:
+            reader = self._readers[trading_pair]
+            offset = None if self._start_timestamp is None else reader.offset_for_timestamp(self._start_timestamp)
+            snapshot = next(
+                (recorded_message for recorded_message in reader.iter_messages(offset=offset)
+                 if recorded_message.message.type is OrderBookMessageType.SNAPSHOT),
+                None)
+            if snapshot is None:
+                raise ValueError(f"The order book recording of {trading_pair} has no snapshot to start from.")
+            self._initial_snapshots[trading_pair] = snapshot
+        return self._initial_snapshots[trading_pair]
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        snapshot = self._initial_snapshot(trading_pair).message
+        self._initial_snapshot_requested[trading_pair].set()
+        return snapshot
+
+    async def _request_order_book_snapshots(self, output: asyncio.Queue):
+        # All the snapshots are replayed from the recording, no snapshot can be requested
+        pass
+
+    async def _parse_trade_message(self, raw_message: Any, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: Any, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: Any, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
@@ -3,16 +3,18 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +25,8 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    COALESCE_MAX_BATCH_SIZE: int = 1000
+    DEFAULT_INIT_CONCURRENCY: int = 10
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +35,31 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 coalesce_diffs: bool = False,
+                 init_concurrency: Optional[int] = None,
+                 recorder: Optional[OrderBookRecorder] = None):
+        """
+        :param data_source: the data source providing the order book snapshots, diffs and trades
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, if the connector supports more than one
+        :param coalesce_diffs: if True each trading pair worker drains all the queued diff messages and applies them
+            as a single net update
+        :param init_concurrency: the maximum number of order book snapshots requested at the same time during
+            initialization. The requests are still subject to the data source throttler rate limits
+        :param recorder: if set, records the initial order books and all the snapshot, diff and trade messages received
+        """
         self._domain: Optional[str] = domain
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._init_concurrency: int = init_concurrency or self.DEFAULT_INIT_CONCURRENCY
         self._data_source: OrderBookTrackerDataSource = data_source
+        self._recorder: Optional[OrderBookRecorder] = recorder
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -60,6 +84,14 @@ class OrderBookTracker:
     def data_source(self) -> OrderBookTrackerDataSource:
         return self._data_source
 
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[OrderBookRecorder]):
+        self._recorder = recorder
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
@@ -68,6 +100,20 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        The trading pairs whose order books are already initialized
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        event = self._order_book_ready_events.get(trading_pair)
+        return event is not None and event.is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,6 +184,10 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_ready_events.values():
+            event.clear()
+        if self._recorder is not None:
+            self._recorder.flush()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
@@ -174,17 +224,43 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books concurrently, up to the configured concurrency. Each order book is marked as ready as
+        soon as its snapshot is applied.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        semaphore = asyncio.Semaphore(self._init_concurrency)
+        completed = 0
+
+        async def init_order_book(trading_pair: str):
+            nonlocal completed
+            async with semaphore:
+                await self._init_single_order_book(trading_pair)
+            completed += 1
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+                               f"{completed}/{len(self._trading_pairs)} completed.")
+
+        await safe_gather(*[init_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
+    async def _init_single_order_book(self, trading_pair: str):
+        while True:
+            try:
+                self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not initialize order book for {trading_pair}. Retrying after 5 seconds."
+                )
+                await self._sleep(delay=5.0)
+        if self._recorder is not None:
+            self._record(lambda: self._recorder.record_order_book(trading_pair, self._order_books[trading_pair]))
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -197,6 +273,7 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                self._record_message(ob_message)
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
@@ -242,6 +319,7 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
+                self._record_message(ob_message)
                 trading_pair: str = ob_message.trading_pair
                 if trading_pair not in self._tracking_message_queues:
                     continue
@@ -260,21 +338,35 @@ class OrderBookTracker:
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
                 # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                if pending_message is not None:
+                    message = pending_message
+                    pending_message = None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    if self._coalesce_diffs:
+                        diff_messages, pending_message = self._drain_diff_messages(
+                            message, saved_messages, message_queue)
+                    else:
+                        diff_messages = [message]
+                    if len(diff_messages) == 1:
+                        order_book.apply_diff_message(message)
+                    else:
+                        bids, asks = self._coalesce_diff_messages(diff_messages)
+                        order_book.apply_numpy_diffs(
+                            bids, asks, update_id=max(diff_message.update_id for diff_message in diff_messages))
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -295,6 +387,63 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _drain_diff_messages(
+            self,
+            first_message: OrderBookMessage,
+            saved_messages: Deque[OrderBookMessage],
+            message_queue: asyncio.Queue,
+    ) -> Tuple[List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Takes the consecutive diff messages already waiting, without yielding to the event loop. The saved messages
+        are older than the ones in the queue, so the queue is only read once the saved messages are exhausted.
+
+        :param first_message: the diff message that starts the batch
+        :param saved_messages: the messages received before the book tracking started
+        :param message_queue: the tracking message queue of the trading pair
+        :return: the diff messages, starting with first_message, and the first non diff message found (if any), that
+            has to be processed after them
+        """
+        diff_messages: List[OrderBookMessage] = [first_message]
+        while len(diff_messages) < self.COALESCE_MAX_BATCH_SIZE:
+            if len(saved_messages) > 0:
+                message: OrderBookMessage = saved_messages.popleft()
+            elif not message_queue.empty():
+                message: OrderBookMessage = message_queue.get_nowait()
+            else:
+                break
+            if message.type is not OrderBookMessageType.DIFF:
+                return diff_messages, message
+            diff_messages.append(message)
+        return diff_messages, None
+
+    @staticmethod
+    def _coalesce_diff_messages(diff_messages: List[OrderBookMessage]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Merges consecutive diff messages into one net update per price level. The latest amount for each price wins.
+
+        :return: the bid and ask [price, amount, update_id] arrays, ready for OrderBook.apply_numpy_diffs
+        """
+        bids: Dict[float, Tuple[float, float, float]] = {}
+        asks: Dict[float, Tuple[float, float, float]] = {}
+        for message in diff_messages:
+            update_id: int = message.update_id
+            raw_bids = message.raw_bids
+            raw_asks = message.raw_asks
+            if raw_bids is None or raw_asks is None:
+                for row in message.bids:
+                    bids[row.price] = (row.price, row.amount, row.update_id)
+                for row in message.asks:
+                    asks[row.price] = (row.price, row.amount, row.update_id)
+            else:
+                for price, amount, *_ in raw_bids:
+                    price = float(price)
+                    bids[price] = (price, float(amount), update_id)
+                for price, amount, *_ in raw_asks:
+                    price = float(price)
+                    asks[price] = (price, float(amount), update_id)
+        return (np.array(list(bids.values()), dtype=np.float64).reshape(-1, 3),
+                np.array(list(asks.values()), dtype=np.float64).reshape(-1, 3))
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -303,6 +452,7 @@ class OrderBookTracker:
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
+                self._record_message(trade_message)
                 trading_pair: str = trade_message.trading_pair
 
                 if trading_pair not in self._order_books:
@@ -340,6 +490,17 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _record_message(self, message: OrderBookMessage):
+        if self._recorder is not None:
+            self._record(lambda: self._recorder.record_message(message))
+
+    def _record(self, record_function: Callable[[], None]):
+        # A recording failure must not interrupt the order book tracking
+        try:
+            record_function()
+        except Exception:
+            self.logger().error("Unexpected error recording order book messages.", exc_info=True)
+
     @staticmethod
     async def _sleep(delay: float):
         await asyncio.sleep(delay=delay)
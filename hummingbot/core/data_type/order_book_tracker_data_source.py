@@ -64,7 +64,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        order_book.apply_snapshot_message(snapshot_msg)
         return order_book
 
     async def listen_for_subscriptions(self):
@@ -217,6 +217,18 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def _channel_for_typed_message(self, event_message: Any) -> Optional[str]:
+        """
+        Identifies the channel for messages already decoded into typed structs by a connector specific schema
+        decoder (see `MsgspecDecoder`), so they can be routed without walking their content.
+        Returns None by default, to route all messages with `_channel_originating_message`
+
+        :param event_message: the event received through the websocket connection
+
+        :return: the message channel, or None if the message has to be routed by its content
+        """
+        return None
+
     async def _process_message_for_unknown_channel(
         self, event_message: Dict[str, Any], websocket_assistant: WSAssistant
     ):
@@ -233,7 +245,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         async for ws_response in websocket_assistant.iter_messages():
             data: Dict[str, Any] = ws_response.data
             if data is not None:  # data will be None when the websocket is disconnected
-                channel: str = self._channel_originating_message(event_message=data)
+                channel: str = (self._channel_for_typed_message(event_message=data)
+                                or self._channel_originating_message(event_message=data))
                 valid_channels = self._get_messages_queue_keys()
                 if channel in valid_channels:
                     self._message_queue[channel].put_nowait(data)
@@ -3,29 +3,74 @@ from collections import deque
 
 from async_timeout import timeout
 from typing import (
+    Iterator,
     List,
     Optional,
 )
 
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.event.spilled_events_log import SpilledEventsLog
+
+MAX_ORDER_FILLED_EVENTS_IN_MEMORY = 10000
+
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 max_order_filled_events: Optional[int] = MAX_ORDER_FILLED_EVENTS_IN_MEMORY):
+        """
+        :param event_source: the name of the source of the events
+        :param max_order_filled_events: the number of order fill events kept in memory, the older ones are spilled
+        to a temporary file. If None all of them are kept in memory
+        """
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
+        # But we keep all order fill events, because they are required for PnL calculation. Only the most recent ones
+        # are kept in memory, the older ones are spilled to disk and read back by iter_order_filled_events
         self._generic_logged_events = deque(maxlen=50)
         self._order_filled_logged_events = deque()
+        self._spilled_order_filled_events = SpilledEventsLog()
+        self._max_order_filled_events = max_order_filled_events
         self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
+        """
+        The most recent events, including the order fill events kept in memory. Use iter_order_filled_events to get
+        all the order fill events.
+        """
         return list(self._generic_logged_events) + list(self._order_filled_logged_events)
 
+    @property
+    def order_filled_events_count(self) -> int:
+        return len(self._spilled_order_filled_events) + len(self._order_filled_logged_events)
+
+    @property
+    def spilled_order_filled_events(self) -> SpilledEventsLog:
+        return self._spilled_order_filled_events
+
+    def iter_order_filled_events(self, starting_timestamp: Optional[float] = None) -> Iterator[OrderFilledEvent]:
+        """
+        Iterates all the order fill events in the order they were logged, reading the spilled ones from disk one at a
+        time.
+        :param starting_timestamp: if provided, only the events after this timestamp are returned
+        """
+        if starting_timestamp is None:
+            yield from self._spilled_order_filled_events
+            yield from list(self._order_filled_logged_events)
+        else:
+            if self._spilled_order_filled_events.max_timestamp > starting_timestamp:
+                for event in self._spilled_order_filled_events:
+                    if event.timestamp > starting_timestamp:
+                        yield event
+            for event in list(self._order_filled_logged_events):
+                if event.timestamp > starting_timestamp:
+                    yield event
+
     @property
     def event_source(self) -> str:
         return self._event_source
@@ -33,6 +78,13 @@ cdef class EventLogger(EventListener):
     def clear(self):
         self._generic_logged_events.clear()
         self._order_filled_logged_events.clear()
+        self._spilled_order_filled_events.clear()
+
+    cdef c_spill_order_filled_events(self):
+        # Spill half of the events at once, so the file is not written on every fill
+        spilled_count = len(self._order_filled_logged_events) - self._max_order_filled_events // 2
+        self._spilled_order_filled_events.extend(
+            [self._order_filled_logged_events.popleft() for _ in range(spilled_count)])
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -53,6 +105,10 @@ cdef class EventLogger(EventListener):
     cdef c_call(self, object event_object):
         self._logged_events.get(type(event_object), self._generic_logged_events).append(event_object)
         event_object_type = type(event_object)
+        if (event_object_type is OrderFilledEvent
+                and self._max_order_filled_events is not None
+                and len(self._order_filled_logged_events) > self._max_order_filled_events):
+            self.c_spill_order_filled_events()
 
         should_notify = []
         for notifier, waiting_event_type in self._waiting.items():
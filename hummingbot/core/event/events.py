@@ -38,6 +38,7 @@ class MarketEvent(Enum):
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
     OrderBookDataSourceUpdateEvent = 904
+    TopOfBookChangedEvent = 905
 
 
 class OrderBookDataSourceEvent(int, Enum):
@@ -158,6 +159,13 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookTopOfBookChangedEvent(NamedTuple):
+    timestamp: float
+    best_bid: float
+    best_ask: float
+    update_id: int
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
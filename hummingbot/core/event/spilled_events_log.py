@@ -0,0 +1,77 @@
+import pickle
+import tempfile
+from typing import IO, Any, Iterable, Iterator, Optional
+
+
+class SpilledEventsLog:
+    """
+    Append only log of events pickled into an anonymous temporary file, to keep a long history of events without
+    holding them in memory. Only the number of events and the range of their timestamps are kept in memory.
+
+    The file is deleted when the log is cleared or closed, or when the process exits.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        :param directory: the directory of the temporary file, defaults to the system temporary directory
+        """
+        self._directory = directory
+        self._file: Optional[IO[bytes]] = None
+        self._count = 0
+        self._min_timestamp = float("inf")
+        self._max_timestamp = float("-inf")
+        # Incremented on every change, for the readers caching values calculated from the events
+        self._version = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def min_timestamp(self) -> float:
+        return self._min_timestamp
+
+    @property
+    def max_timestamp(self) -> float:
+        return self._max_timestamp
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def extend(self, events: Iterable[Any]):
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._directory)
+        self._file.seek(0, 2)
+        self._version += 1
+        for event in events:
+            pickle.dump(event, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._count += 1
+            timestamp = getattr(event, "timestamp", None)
+            if timestamp is not None:
+                self._min_timestamp = min(self._min_timestamp, timestamp)
+                self._max_timestamp = max(self._max_timestamp, timestamp)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._file is None:
+            return
+        self._file.flush()
+        count = self._count
+        offset = 0
+        for _ in range(count):
+            # The position is restored before every read, since events can be appended between two reads
+            self._file.seek(offset)
+            event = pickle.load(self._file)
+            offset = self._file.tell()
+            yield event
+
+    def clear(self):
+        self.close()
+        self._version += 1
+        self._count = 0
+        self._min_timestamp = float("inf")
+        self._max_timestamp = float("-inf")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -23,6 +23,11 @@ from hummingbot.client.settings import (
 from hummingbot.connector.gateway.common_types import ConnectorType, get_connector_type
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_metadata_cache import (
+    GatewayMetadataCache,
+    GatewayMetadataKey,
+    GatewayMetadataType,
+)
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.gateway_config_utils import build_config_namespace_keys
 from hummingbot.logger import HummingbotLogger
@@ -94,6 +99,7 @@ class GatewayHttpClient:
             self._use_ssl = use_ssl
             self._gateway_ready_event = asyncio.Event()
         self._gateway_config = gateway_config
+        self._metadata_cache = GatewayMetadataCache()
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -138,6 +144,7 @@ class GatewayHttpClient:
     @base_url.setter
     def base_url(self, url: str):
         self._base_url = url
+        self.invalidate_metadata_cache()
 
     @property
     def ready(self) -> bool:
@@ -159,6 +166,13 @@ class GatewayHttpClient:
     def gateway_config_keys(self, new_config: List[str]):
         self._gateway_config_keys = new_config
 
+    def invalidate_metadata_cache(self, *metadata_types: GatewayMetadataType):
+        """
+        Removes the cached gateway metadata of the given types, or all of it if no type is given. Called after each
+        change made through this client, it only has to be called when the gateway is configured by other means.
+        """
+        self._metadata_cache.invalidate(*metadata_types)
+
     def start_monitor(self):
         """Start the gateway status monitoring loop"""
         if self._monitor_task is None:
@@ -190,6 +204,9 @@ class GatewayHttpClient:
             try:
                 if await asyncio.wait_for(self.ping_gateway(), timeout=POLL_TIMEOUT):
                     if self.gateway_status is GatewayStatus.OFFLINE:
+                        # The gateway might have been restarted with a different configuration
+                        self.invalidate_metadata_cache()
+
                         # Clear all collections
                         GATEWAY_CONNECTORS.clear()
                         GATEWAY_ETH_CONNECTORS.clear()
@@ -458,6 +475,31 @@ class GatewayHttpClient:
 
         return parsed_response
 
+    async def _cached_api_request(
+        self,
+        metadata_type: GatewayMetadataType,
+        path_url: str,
+        params: Dict[str, Any] = {},
+        fail_silently: bool = False,
+    ) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Sends a GET request for gateway metadata, unless the response is cached. Concurrent identical requests are
+        sent only once.
+        """
+        key = GatewayMetadataKey(
+            metadata_type=metadata_type,
+            params=(path_url, tuple(sorted(params.items())), fail_silently),
+        )
+        return await self._metadata_cache.get(
+            key=key,
+            fetch=lambda: self.api_request("get", path_url, params=params, fail_silently=fail_silently),
+            is_cacheable=self._is_cacheable_response,
+        )
+
+    @staticmethod
+    def _is_cacheable_response(response: Any) -> bool:
+        return bool(response) and not (isinstance(response, dict) and "error" in response)
+
     # ============================================
     # Gateway Status and Restart Methods
     # ============================================
@@ -499,12 +541,14 @@ class GatewayHttpClient:
             "path": path,
             "value": value,
         })
+        self.invalidate_metadata_cache()
         self.logger().info("Detected change to Gateway config - restarting Gateway...", exc_info=False)
         await self.post_restart()
         return response
 
     async def post_restart(self):
         await self.api_request("post", "restart", fail_silently=False)
+        self.invalidate_metadata_cache()
 
     # ============================================
     # Configuration Methods
@@ -512,16 +556,20 @@ class GatewayHttpClient:
 
     async def get_configuration(self, namespace: str = None, fail_silently: bool = False) -> Dict[str, Any]:
         params = {"namespace": namespace} if namespace is not None else {}
-        return await self.api_request("get", "config", params=params, fail_silently=fail_silently)
+        return await self._cached_api_request(
+            GatewayMetadataType.CONFIGURATION, "config", params=params, fail_silently=fail_silently)
 
     async def get_connectors(self, fail_silently: bool = False) -> Dict[str, Any]:
-        return await self.api_request("get", "config/connectors", fail_silently=fail_silently)
+        return await self._cached_api_request(
+            GatewayMetadataType.CONNECTORS, "config/connectors", fail_silently=fail_silently)
 
     async def get_chains(self, fail_silently: bool = False) -> Dict[str, Any]:
-        return await self.api_request("get", "config/chains", fail_silently=fail_silently)
+        return await self._cached_api_request(
+            GatewayMetadataType.CHAINS, "config/chains", fail_silently=fail_silently)
 
     async def get_namespaces(self, fail_silently: bool = False) -> Dict[str, Any]:
-        return await self.api_request("get", "config/namespaces", fail_silently=fail_silently)
+        return await self._cached_api_request(
+            GatewayMetadataType.NAMESPACES, "config/namespaces", fail_silently=fail_silently)
 
     # ============================================
     # Fetch Defaults
@@ -590,7 +638,10 @@ class GatewayHttpClient:
         if private_key:
             request["privateKey"] = private_key
         request.update(kwargs)
-        return await self.api_request(method="post", path_url="wallet/add", params=request)
+        response = await self.api_request(method="post", path_url="wallet/add", params=request)
+        # The default wallet is part of the chain configuration
+        self.invalidate_metadata_cache(GatewayMetadataType.CONFIGURATION)
+        return response
 
     async def add_hardware_wallet(
         self, chain: str, network: str = None, address: str = None, set_default: bool = True, **kwargs
@@ -600,19 +651,26 @@ class GatewayHttpClient:
         if address:
             request["address"] = address
         request.update(kwargs)
-        return await self.api_request(method="post", path_url="wallet/add-hardware", params=request)
+        response = await self.api_request(method="post", path_url="wallet/add-hardware", params=request)
+        self.invalidate_metadata_cache(GatewayMetadataType.CONFIGURATION)
+        return response
 
     async def remove_wallet(
         self, chain: str, address: str
     ) -> Dict[str, Any]:
-        return await self.api_request(method="delete", path_url="wallet/remove", params={"chain": chain, "address": address})
+        response = await self.api_request(
+            method="delete", path_url="wallet/remove", params={"chain": chain, "address": address})
+        self.invalidate_metadata_cache(GatewayMetadataType.CONFIGURATION)
+        return response
 
     async def set_default_wallet(self, chain: str, address: str) -> Dict[str, Any]:
-        return await self.api_request(
+        response = await self.api_request(
             method="post",
             path_url="wallet/setDefault",
             params={"chain": chain, "address": address}
         )
+        self.invalidate_metadata_cache(GatewayMetadataType.CONFIGURATION)
+        return response
 
     # ============================================
     # Balance and Allowance Methods
@@ -1275,8 +1333,8 @@ class GatewayHttpClient:
         if search:
             params["search"] = search
 
-        response = await self.api_request(
-            "get",
+        response = await self._cached_api_request(
+            GatewayMetadataType.TOKENS,
             "tokens",
             params=params
         )
@@ -1292,8 +1350,8 @@ class GatewayHttpClient:
         """Get details for a specific token by symbol or address."""
         params = {"chain": chain, "network": network}
         try:
-            response = await self.api_request(
-                "get",
+            response = await self._cached_api_request(
+                GatewayMetadataType.TOKEN,
                 f"tokens/{symbol_or_address}",
                 params=params,
                 fail_silently=fail_silently
@@ -1309,7 +1367,7 @@ class GatewayHttpClient:
         token_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Add a new token to the gateway."""
-        return await self.api_request(
+        response = await self.api_request(
             "post",
             "tokens",
             params={
@@ -1318,6 +1376,8 @@ class GatewayHttpClient:
                 "token": token_data
             }
         )
+        self.invalidate_metadata_cache(GatewayMetadataType.TOKENS, GatewayMetadataType.TOKEN)
+        return response
 
     async def remove_token(
         self,
@@ -1326,7 +1386,7 @@ class GatewayHttpClient:
         network: str
     ) -> Dict[str, Any]:
         """Remove a token from the gateway."""
-        return await self.api_request(
+        response = await self.api_request(
             "delete",
             f"tokens/{address}",
             params={
@@ -1334,6 +1394,8 @@ class GatewayHttpClient:
                 "network": network
             }
         )
+        self.invalidate_metadata_cache(GatewayMetadataType.TOKENS, GatewayMetadataType.TOKEN)
+        return response
 
     # ============================================
     # Pool Methods
@@ -1361,7 +1423,7 @@ class GatewayHttpClient:
             "type": type
         }
 
-        response = await self.api_request("get", f"pools/{trading_pair}", params=params)
+        response = await self._cached_api_request(GatewayMetadataType.POOL, f"pools/{trading_pair}", params=params)
         return response
 
     async def add_pool(
@@ -1391,7 +1453,9 @@ class GatewayHttpClient:
             "network": network,
             **pool_data
         }
-        return await self.api_request("post", "pools", params=params)
+        response = await self.api_request("post", "pools", params=params)
+        self.invalidate_metadata_cache(GatewayMetadataType.POOL)
+        return response
 
     async def remove_pool(
         self,
@@ -1414,7 +1478,9 @@ class GatewayHttpClient:
             "network": network,
             "type": pool_type
         }
-        return await self.api_request("delete", f"pools/{address}", params=params)
+        response = await self.api_request("delete", f"pools/{address}", params=params)
+        self.invalidate_metadata_cache(GatewayMetadataType.POOL)
+        return response
 
     # ============================================
     # Gateway Command Utils - API Functions
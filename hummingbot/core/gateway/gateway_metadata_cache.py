@@ -0,0 +1,125 @@
+import asyncio
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+
+class GatewayMetadataType(Enum):
+    CONFIGURATION = "configuration"
+    CONNECTORS = "connectors"
+    CHAINS = "chains"
+    NAMESPACES = "namespaces"
+    TOKENS = "tokens"
+    TOKEN = "token"
+    POOL = "pool"
+
+
+# Seconds each type of metadata is kept. The configuration only changes through the gateway client, which invalidates
+# the cache, so its TTL only bounds the staleness when the gateway is configured by other means.
+DEFAULT_METADATA_TTLS: Dict[GatewayMetadataType, float] = {
+    GatewayMetadataType.CONFIGURATION: 60.0,
+    GatewayMetadataType.CONNECTORS: 300.0,
+    GatewayMetadataType.CHAINS: 300.0,
+    GatewayMetadataType.NAMESPACES: 300.0,
+    GatewayMetadataType.TOKENS: 300.0,
+    GatewayMetadataType.TOKEN: 300.0,
+    GatewayMetadataType.POOL: 300.0,
+}
+
+
+class GatewayMetadataKey(NamedTuple):
+    metadata_type: GatewayMetadataType
+    params: Tuple[Hashable, ...] = ()
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    expiration_time: float
+
+
+class GatewayMetadataCache:
+    """
+    Cache of the gateway metadata (configuration, connectors, chains, tokens and pools), which rarely changes but is
+    looked up on every price update of the gateway connectors.
+
+    Each value is kept for the TTL of its type. Concurrent lookups of a value not cached share the same request to the
+    gateway. Failed lookups are not cached.
+    """
+
+    def __init__(self, ttls: Optional[Dict[GatewayMetadataType, float]] = None):
+        self._ttls: Dict[GatewayMetadataType, float] = {**DEFAULT_METADATA_TTLS, **(ttls or {})}
+        self._entries: Dict[GatewayMetadataKey, _CacheEntry] = {}
+        self._in_flight: Dict[GatewayMetadataKey, asyncio.Future] = {}
+        # Incremented on each invalidation, so that the lookups in flight at that time don't store their result
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self,
+                  key: GatewayMetadataKey,
+                  fetch: Callable[[], Awaitable[Any]],
+                  is_cacheable: Callable[[Any], bool] = lambda value: True) -> Any:
+        """
+        :param key: the key of the metadata
+        :param fetch: the coroutine function requesting the metadata to the gateway if it is not cached
+        :param is_cacheable: tells if a fetched value can be cached (e.g. it is not an error response)
+
+        :return: the cached value, or the fetched one
+        """
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expiration_time > self._time():
+                    return entry.value
+                del self._entries[key]
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # The lookup was cancelled with the caller that started it, start a new one
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        generation = self._generation
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as ex:
+            future.set_exception(ex)
+            # The exception is raised to this caller, it must not be reported as never retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if generation == self._generation and is_cacheable(value):
+                self._entries[key] = _CacheEntry(value=value, expiration_time=self._time() + self._ttls[key.metadata_type])
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        return value
+
+    def invalidate(self, *metadata_types: GatewayMetadataType):
+        """
+        Removes the cached values of the given types, or all of them if no type is given
+        """
+        if len(metadata_types) == 0:
+            self._entries.clear()
+            self._in_flight.clear()
+        else:
+            for key in [key for key in self._entries if key.metadata_type in metadata_types]:
+                del self._entries[key]
+            for key in [key for key in self._in_flight if key.metadata_type in metadata_types]:
+                del self._in_flight[key]
+        self._generation += 1
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
@@ -365,12 +365,21 @@ class TradingCore:
             list(self.connector_manager.connectors.values()),
             self._strategy_file_name or db_name,
             self.strategy_name or db_name,
-            self.client_config_map.market_data_collection
+            self.client_config_map.market_data_collection,
+            write_behind=True,
         )
 
         self.markets_recorder.start()
         self.logger().info(f"Markets recorder initialized with database: {db_name}")
 
+    def flush_trade_fills(self):
+        """
+        Waits until the records queued by the markets recorder are written, so that queries to the trade fills
+        database include the latest fills.
+        """
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush()
+
     def load_script_class(self, script_name: str) -> Tuple[Type, Optional[BaseClientModel]]:
         """
         Load script strategy class following Hummingbot's pattern.
@@ -660,6 +669,7 @@ class TradingCore:
             'connectors': self.connector_manager.get_status(),
             'kill_switch_enabled': self.client_config_map.kill_switch_mode.model_config.get("title") == "kill_switch_enabled",
             'markets_recorder_active': self.markets_recorder is not None,
+            'clock_timing': self.clock.timing_profile.to_dict() if self.clock is not None else None,
         }
 
     def add_notifier(self, notifier: NotifierBase):
@@ -738,6 +748,7 @@ class TradingCore:
 
         start_time = self.init_time
 
+        self.flush_trade_fills()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
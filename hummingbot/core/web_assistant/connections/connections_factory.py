@@ -1,7 +1,8 @@
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.json_decoders import JSONDecoderBase
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -35,13 +36,15 @@ class ConnectionsFactory:
         client = await self._get_shared_client()
         return RESTConnection(aiohttp_client_session=client)
 
-    async def get_ws_connection(self) -> WSConnection:
+    async def get_ws_connection(self, decoder: Optional[JSONDecoderBase] = None) -> WSConnection:
         """
         Get a WebSocket connection using either the independent session (if set)
         or the shared client.
+
+        :param decoder: the decoder for the received text frames, defaults to the fastest JSON decoder available
         """
         client = self._ws_independent_session or await self._get_shared_client()
-        return WSConnection(aiohttp_client_session=client)
+        return WSConnection(aiohttp_client_session=client, decoder=decoder)
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
         """
@@ -0,0 +1,92 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Tuple, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JSONDecoderBase(ABC):
+    """
+    Decodes the payload of the text frames received through a `WSConnection`.
+
+    Subclasses implement `_decode` with a specific backend. Payloads the backend can not decode are retried with the
+    standard library decoder (e.g. integers wider than 64 bits, or NaN values), and payloads that are not valid JSON
+    are returned unchanged.
+    """
+
+    decode_errors: Tuple[Type[Exception], ...] = (ValueError,)
+
+    def decode(self, payload: Union[str, bytes]) -> Any:
+        try:
+            return self._decode(payload)
+        except self.decode_errors:
+            try:
+                return json.loads(payload)
+            except ValueError:
+                return payload
+
+    @abstractmethod
+    def _decode(self, payload: Union[str, bytes]) -> Any:
+        raise NotImplementedError
+
+
+class StdlibJSONDecoder(JSONDecoderBase):
+
+    def _decode(self, payload: Union[str, bytes]) -> Any:
+        return json.loads(payload)
+
+
+class OrjsonDecoder(JSONDecoderBase):
+    """
+    Note: depending on the orjson version, integers wider than 64 bits are either rejected (and then decoded with the
+    standard library) or decoded as floats.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson package is required to use the OrjsonDecoder.")
+
+    def _decode(self, payload: Union[str, bytes]) -> Any:
+        return orjson.loads(payload)
+
+
+class MsgspecDecoder(JSONDecoderBase):
+    """
+    Decodes the payloads with msgspec. If a schema type is provided (e.g. a Union of `msgspec.Struct` classes for
+    the depth and trade channels of an exchange), the matching frames are decoded straight into those typed structs,
+    and the rest of the frames (subscription confirmations, heartbeats...) are decoded as plain JSON.
+    """
+
+    def __init__(self, schema_type: Optional[Any] = None):
+        if msgspec is None:
+            raise ImportError("The msgspec package is required to use the MsgspecDecoder.")
+        self.decode_errors = (msgspec.DecodeError,)
+        self._generic_decoder = msgspec.json.Decoder()
+        self._schema_decoder = msgspec.json.Decoder(type=schema_type) if schema_type is not None else None
+
+    def _decode(self, payload: Union[str, bytes]) -> Any:
+        if self._schema_decoder is not None:
+            try:
+                return self._schema_decoder.decode(payload)
+            except msgspec.ValidationError:
+                pass
+        return self._generic_decoder.decode(payload)
+
+
+def default_json_decoder() -> JSONDecoderBase:
+    """
+    Returns the fastest JSON decoder available in the environment: orjson, msgspec, or the standard library.
+    """
+    if orjson is not None:
+        return OrjsonDecoder()
+    if msgspec is not None:
+        return MsgspecDecoder()
+    return StdlibJSONDecoder()
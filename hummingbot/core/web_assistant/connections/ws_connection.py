@@ -1,19 +1,20 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoders import JSONDecoderBase, default_json_decoder
 
 
 class WSConnection:
     _MAX_MSG_SIZE = 4 * 1024 * 1024  # default aiohttp: 4 * 1024 * 1024
 
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, decoder: Optional[JSONDecoderBase] = None):
         self._client_session = aiohttp_client_session
+        self._decoder: JSONDecoderBase = decoder or default_json_decoder()
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -27,6 +28,14 @@ class WSConnection:
     def connected(self) -> bool:
         return self._connected
 
+    @property
+    def decoder(self) -> JSONDecoderBase:
+        return self._decoder
+
+    @decoder.setter
+    def decoder(self, decoder: JSONDecoderBase):
+        self._decoder = decoder
+
     async def connect(
         self,
         ws_url: str,
@@ -141,14 +150,10 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
-            try:
-                data = msg.json()
-            except JSONDecodeError:
-                data = msg.data
+            data = self._decoder.decode(msg.data)
         response = WSResponse(data)
         return response
@@ -4,6 +4,7 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -44,6 +45,7 @@ class RESTAssistant:
         return_err: bool = False,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
+        priority: Optional[RequestPriority] = None,
     ) -> Union[str, Dict[str, Any]]:
         response = await self.execute_request_and_get_response(
             url=url,
@@ -55,6 +57,7 @@ class RESTAssistant:
             return_err=return_err,
             timeout=timeout,
             headers=headers,
+            priority=priority,
         )
         response_json = await response.json()
         return response_json
@@ -70,7 +73,14 @@ class RESTAssistant:
             return_err: bool = False,
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[RequestPriority] = None,
     ) -> RESTResponse:
+        """
+        Executes the request once the throttler has capacity for it.
+
+        :param priority: the throttler priority of the request, defaults to the priority set for the current context
+            (see `hummingbot.core.api_throttler.async_throttler_base.request_priority`)
+        """
 
         headers = headers or {}
 
@@ -91,7 +101,7 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
+        async with self._throttler.execute_task(limit_id=throttler_limit_id, priority=priority):
             response = await self.call(request=request, timeout=timeout)
 
             if 400 <= response.status:
@@ -1,21 +1,24 @@
 import asyncio
 import os
 import time
-from collections import deque
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 from bidict import bidict
 
-from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesRingBuffer
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import CandlesIndicators, StreamingIndicator
 
 
 class CandlesBase(NetworkBase):
@@ -48,10 +51,12 @@ class CandlesBase(NetworkBase):
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
-        async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
-        self._api_factory = WebAssistantsFactory(throttler=async_throttler)
+        self._api_factory = WebAssistantsFactory(throttler=self._create_throttler())
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesRingBuffer(maxlen=max_records, n_columns=len(self.columns))
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_cache_version = -1
+        self._indicators = CandlesIndicators(self._candles)
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -91,7 +96,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,13 +146,58 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is cached and only rebuilt when a candle is added or updated. A deep copy of it is returned, so
+        the caller can modify it (e.g. add indicators or overwrite values) without affecting the other callers.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df_cache_version != self._candles.version:
+            self._candles_df_cache = pd.DataFrame(self._candles.view(), columns=self.columns, dtype=float, copy=True)
+            self._candles_df_cache_version = self._candles.version
+        return self._candles_df_cache.copy(deep=True)
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a read only (n_candles, n_columns) NumPy view of the candles, in the order of the
+        columns attribute, without copying them. The view is only valid until the next candle update.
+        """
+        return self._candles.view()
+
+    def add_indicator(self, indicator: StreamingIndicator) -> StreamingIndicator:
+        """
+        Adds an indicator that is updated incrementally with the candles, instead of being calculated again over all
+        the candles every time they are read.
+        :param indicator: the indicator to add
+        :return: the indicator calculating the same columns, which is the one already added if there is one
+        """
+        return self._indicators.add(indicator)
+
+    def get_indicator_values(self, column: str) -> np.ndarray:
+        """
+        Returns a read only view of the values of an indicator column, aligned with candles_array.
+        """
+        return self._indicators.get_column(column)
+
+    def get_candles_df_with_indicators(self, indicators: Sequence[StreamingIndicator]) -> pd.DataFrame:
+        """
+        Returns the candles DataFrame with the columns of the indicators, adding the indicators that were not added
+        yet.
+        """
+        columns = [column for indicator in indicators for column in self.add_indicator(indicator).columns]
+        candles_df = self.candles_df
+        indicators_df = self._indicators.get_df(columns)
+        indicators_df.index = candles_df.index
+        return pd.concat([candles_df, indicators_df], axis=1)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
 
+    def _create_throttler(self) -> AsyncThrottlerBase:
+        """
+        Creates the throttler of the candles requests. Feeds that need a different throttling strategy can override it.
+        """
+        return SlidingWindowThrottler(rate_limits=self.rate_limits)
+
     def load_candles_from_csv(self, data_path: str):
         """
         This method loads the candles from a CSV file.
@@ -161,28 +211,19 @@ class CandlesBase(NetworkBase):
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
 
-    async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
+    async def get_historical_candles(self, config: HistoricalCandlesConfig, candles_store: Optional[CandlesStore] = None):
+        """
+        Fetches the candles between the start and end time of the config.
+        :param config: the historical candles configuration
+        :param candles_store: if provided, the closed candles are read from the store, and only the ranges not stored
+        yet are fetched from the exchange (and added to the store)
+        """
         try:
             await self.initialize_exchange_data()
-            current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
-            current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                candles = await self.fetch_candles(start_time=current_start_time,
-                                                   end_time=current_end_time,
-                                                   limit=missing_records)
-                if len(candles) <= 1 or missing_records == 0:
-                    fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                    candles_df = pd.concat([fetched_candles_df, candles_df])
-                    break
-                candles = candles[candles[:, 0] <= current_end_time]
-                current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
+            if candles_store is None:
+                candles_df = await self._fetch_historical_candles(config.start_time, config.end_time)
+            else:
+                candles_df = await self._get_historical_candles_from_store(config, candles_store)
             candles_df = candles_df[(candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
             return candles_df
         except ValueError as e:
@@ -192,6 +233,54 @@ class CandlesBase(NetworkBase):
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
             raise e
 
+    async def _fetch_historical_candles(self, start_time: int, end_time: int) -> pd.DataFrame:
+        current_end_time = self._round_timestamp_to_interval_multiple(end_time)
+        current_start_time = self._round_timestamp_to_interval_multiple(start_time)
+        # Pages are fetched from the newest to the oldest, and concatenated once at the end
+        pages = []
+        while current_end_time >= current_start_time:
+            missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
+            candles = await self.fetch_candles(start_time=current_start_time,
+                                               end_time=current_end_time,
+                                               limit=missing_records)
+            if len(candles) <= 1 or missing_records == 0:
+                if len(candles) > 0:
+                    pages.append(candles)
+                break
+            candles = candles[candles[:, 0] <= current_end_time]
+            current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
+            pages.append(candles)
+        if len(pages) == 0:
+            return pd.DataFrame(columns=self.columns)
+        candles_df = pd.DataFrame(np.concatenate(pages[::-1]), columns=self.columns)
+        candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
+        candles_df.reset_index(drop=True, inplace=True)
+        self.check_candles_sorted_and_equidistant(candles_df.values)
+        return candles_df
+
+    async def _get_historical_candles_from_store(self, config: HistoricalCandlesConfig,
+                                                 candles_store: CandlesStore) -> pd.DataFrame:
+        start_time = self._round_timestamp_to_interval_multiple(config.start_time)
+        end_time = self._round_timestamp_to_interval_multiple(config.end_time)
+        # The candle in progress can still change, only the closed candles are stored
+        last_closed_time = self._round_timestamp_to_interval_multiple(self._time()) - self.interval_in_seconds
+        for missing_start, missing_end in candles_store.missing_ranges(
+                config.connector_name, config.trading_pair, config.interval,
+                start_time=start_time, end_time=min(end_time, last_closed_time),
+                interval_in_seconds=self.interval_in_seconds):
+            fetched_df = await self._fetch_historical_candles(missing_start, missing_end)
+            candles_store.write(config.connector_name, config.trading_pair, config.interval,
+                                fetched_df[fetched_df["timestamp"] <= missing_end],
+                                start_time=missing_start, end_time=missing_end,
+                                interval_in_seconds=self.interval_in_seconds)
+        candles_df = candles_store.read(config.connector_name, config.trading_pair, config.interval,
+                                        start_time=start_time, end_time=end_time)
+        if end_time > last_closed_time:
+            recent_df = await self._fetch_historical_candles(max(start_time, last_closed_time + self.interval_in_seconds),
+                                                             end_time)
+            candles_df = pd.concat([candles_df, recent_df[recent_df["timestamp"] > last_closed_time]], ignore_index=True)
+        return candles_df
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
@@ -321,7 +410,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
@@ -0,0 +1,137 @@
+from typing import Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+
+class CandlesRingBuffer:
+    """
+    Fixed size buffer of candles backed by preallocated column-major NumPy arrays (one contiguous row per candle
+    column), with the interface of a `deque` with maxlen: appending to a full buffer drops the candle at the opposite
+    end.
+
+    The candles are kept contiguous in a storage three times larger than `maxlen`, and they are moved back to the
+    middle of the storage only when one of its ends is reached, so appends are O(1) amortized and `view` returns the
+    candles in chronological order without copying them.
+
+    Every change increments `version`, which allows to cache structures derived from the candles.
+    """
+
+    def __init__(self, maxlen: int, n_columns: int):
+        """
+        :param maxlen: the maximum number of candles kept
+        :param n_columns: the number of values of each candle
+        """
+        self._maxlen = maxlen
+        self._n_columns = n_columns
+        self._storage = np.zeros((n_columns, 3 * max(maxlen, 1)), dtype=float)
+        self._start = self._end = self._middle
+        self._version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def _middle(self) -> int:
+        return max(self._maxlen, 1)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[List[float]]:
+        for position in range(self._start, self._end):
+            yield self._storage[:, position].tolist()
+
+    def __reversed__(self) -> Iterator[List[float]]:
+        for position in range(self._end - 1, self._start - 1, -1):
+            yield self._storage[:, position].tolist()
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[List[float], np.ndarray]:
+        if isinstance(index, slice):
+            return self.view()[index].copy()
+        return self._storage[:, self._position(index)].tolist()
+
+    def __setitem__(self, index: int, candle: Iterable[float]):
+        self._storage[:, self._position(index)] = candle
+        self._version += 1
+
+    def __array__(self, dtype: Optional[np.dtype] = None, copy: Optional[bool] = None) -> np.ndarray:
+        candles = self.view().copy()
+        return candles if dtype is None else candles.astype(dtype)
+
+    def view(self) -> np.ndarray:
+        """
+        Returns a read only (n_candles, n_columns) view of the candles, in chronological order. The view is not a
+        copy, so it is only valid until the buffer is modified again.
+        """
+        candles = self._storage[:, self._start:self._end].T
+        candles.flags.writeable = False
+        return candles
+
+    def column(self, index: int) -> np.ndarray:
+        """
+        Returns a read only contiguous view of one of the columns of the candles. Only valid until the buffer is
+        modified again.
+        """
+        values = self._storage[index, self._start:self._end]
+        values.flags.writeable = False
+        return values
+
+    def append(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        if self._end == self._storage.shape[1]:
+            self._recenter()
+        self._storage[:, self._end] = candle
+        self._end += 1
+        if len(self) > self._maxlen:
+            self._start += 1
+        self._version += 1
+
+    def appendleft(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        if self._start == 0:
+            self._recenter()
+        self._start -= 1
+        self._storage[:, self._start] = candle
+        if len(self) > self._maxlen:
+            self._end -= 1
+        self._version += 1
+
+    def extend(self, candles: Iterable[Iterable[float]]):
+        for candle in candles:
+            self.append(candle)
+
+    def extendleft(self, candles: Iterable[Iterable[float]]):
+        for candle in candles:
+            self.appendleft(candle)
+
+    def pop(self) -> List[float]:
+        candle = self[-1]
+        self._end -= 1
+        self._version += 1
+        return candle
+
+    def clear(self):
+        self._start = self._end = self._middle
+        self._version += 1
+
+    def _position(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("candles index out of range")
+        return self._start + index
+
+    def _recenter(self):
+        length = len(self)
+        start = self._middle
+        self._storage[:, start:start + length] = self._storage[:, self._start:self._end].copy()
+        self._start = start
+        self._end = start + length
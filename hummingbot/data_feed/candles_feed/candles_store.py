@@ -0,0 +1,149 @@
+import json
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+
+CandlesRange = Tuple[int, int]
+
+
+class CandlesStore:
+    """
+    On-disk cache of historical candles, keyed by connector, trading pair and interval.
+
+    The candles of each key are stored column-wise in a NumPy file (one row per column of the candles, sorted by
+    timestamp), so range reads memory-map the file and only touch the pages of the requested candles. A JSON file next
+    to it keeps the ranges of timestamps already downloaded (including ranges where the exchange has no candles), so
+    only the missing ranges have to be fetched from the exchange.
+    """
+
+    def __init__(self, root_path: Optional[str] = None):
+        self._root_path = root_path
+
+    @property
+    def root_path(self) -> str:
+        if self._root_path is None:
+            self._root_path = os.path.join(data_path(), "candles")
+        return self._root_path
+
+    def covered_ranges(self, connector_name: str, trading_pair: str, interval: str) -> List[CandlesRange]:
+        """
+        Returns the ranges of timestamps (both ends included) already stored for the key, sorted and non overlapping.
+        """
+        metadata = self._read_metadata(connector_name, trading_pair, interval)
+        return [(int(start), int(end)) for start, end in metadata.get("ranges", [])]
+
+    def missing_ranges(self,
+                       connector_name: str,
+                       trading_pair: str,
+                       interval: str,
+                       start_time: int,
+                       end_time: int,
+                       interval_in_seconds: int) -> List[CandlesRange]:
+        """
+        Calculates the ranges of timestamps within start_time and end_time (both included and multiples of the
+        interval) that are not stored yet.
+        """
+        missing = []
+        current_start = start_time
+        for covered_start, covered_end in self.covered_ranges(connector_name, trading_pair, interval):
+            if covered_end < current_start:
+                continue
+            if covered_start > end_time:
+                break
+            if covered_start > current_start:
+                missing.append((current_start, min(covered_start - interval_in_seconds, end_time)))
+            current_start = max(current_start, covered_end + interval_in_seconds)
+        if current_start <= end_time:
+            missing.append((current_start, end_time))
+        return missing
+
+    def read(self, connector_name: str, trading_pair: str, interval: str, start_time: float,
+             end_time: float) -> pd.DataFrame:
+        """
+        Reads the stored candles with timestamps between start_time and end_time (both included).
+        """
+        metadata = self._read_metadata(connector_name, trading_pair, interval)
+        columns = metadata.get("columns", [])
+        file_path = self._candles_path(connector_name, trading_pair, interval)
+        if not os.path.exists(file_path):
+            return pd.DataFrame(columns=columns)
+        candles = np.load(file_path, mmap_mode="r")
+        timestamps = candles[0]
+        start_index = timestamps.searchsorted(start_time, side="left")
+        end_index = timestamps.searchsorted(end_time, side="right")
+        return pd.DataFrame(np.array(candles[:, start_index:end_index]).T, columns=columns)
+
+    def write(self, connector_name: str, trading_pair: str, interval: str, candles_df: pd.DataFrame,
+              start_time: int, end_time: int, interval_in_seconds: int):
+        """
+        Merges the candles into the store, and marks the range between start_time and end_time as covered, even if
+        the exchange did not return candles for part of it.
+        :param candles_df: the candles downloaded for the range
+        :param start_time: first timestamp of the downloaded range
+        :param end_time: last timestamp of the downloaded range
+        :param interval_in_seconds: the duration of the candles, ranges separated by one candle are merged
+        """
+        metadata = self._read_metadata(connector_name, trading_pair, interval)
+        columns = metadata.get("columns", list(candles_df.columns))
+        file_path = self._candles_path(connector_name, trading_pair, interval)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        if not candles_df.empty:
+            new_candles = candles_df[columns].to_numpy(dtype=float).T
+            if os.path.exists(file_path):
+                new_candles = np.concatenate([np.load(file_path), new_candles], axis=1)
+            # Keep the latest download of each timestamp
+            _, unique_indexes = np.unique(new_candles[0][::-1], return_index=True)
+            new_candles = new_candles[:, new_candles.shape[1] - 1 - unique_indexes]
+            self._replace_file(file_path, lambda f: np.save(f, new_candles))
+
+        metadata["columns"] = columns
+        metadata["ranges"] = self._merge_ranges(
+            self.covered_ranges(connector_name, trading_pair, interval) + [(int(start_time), int(end_time))],
+            interval_in_seconds=interval_in_seconds)
+        self._replace_file(self._metadata_path(connector_name, trading_pair, interval),
+                           lambda f: f.write(json.dumps(metadata).encode()))
+
+    def clear(self, connector_name: str, trading_pair: str, interval: str):
+        for file_path in (self._candles_path(connector_name, trading_pair, interval),
+                          self._metadata_path(connector_name, trading_pair, interval)):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    @staticmethod
+    def _merge_ranges(ranges: List[CandlesRange], interval_in_seconds: int) -> List[List[int]]:
+        merged = []
+        for start, end in sorted(ranges):
+            if len(merged) > 0 and start <= merged[-1][1] + interval_in_seconds:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return merged
+
+    @staticmethod
+    def _replace_file(file_path: str, write_function):
+        # The file is written next to the destination and then moved, so readers never see a partial file
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            write_function(f)
+        os.replace(tmp_path, file_path)
+
+    def _read_metadata(self, connector_name: str, trading_pair: str, interval: str) -> dict:
+        metadata_path = self._metadata_path(connector_name, trading_pair, interval)
+        if not os.path.exists(metadata_path):
+            return {}
+        with open(metadata_path, "r") as f:
+            return json.load(f)
+
+    def _key_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return os.path.join(self.root_path, connector_name, trading_pair, interval)
+
+    def _candles_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return f"{self._key_path(connector_name, trading_pair, interval)}.npy"
+
+    def _metadata_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return f"{self._key_path(connector_name, trading_pair, interval)}.json"
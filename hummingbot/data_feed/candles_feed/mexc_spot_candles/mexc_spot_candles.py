@@ -2,7 +2,6 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.mexc.mexc_post_processor import MexcPostProcessor
-from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
@@ -21,8 +20,8 @@ class MexcSpotCandles(CandlesBase):
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__(trading_pair, interval, max_records)
-        async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
-        self._api_factory = WebAssistantsFactory(throttler=async_throttler, ws_post_processors=[MexcPostProcessor])
+        self._api_factory = WebAssistantsFactory(throttler=self._create_throttler(),
+                                                 ws_post_processors=[MexcPostProcessor])
 
     @property
     def name(self):
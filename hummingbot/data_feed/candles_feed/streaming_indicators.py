@@ -0,0 +1,438 @@
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesRingBuffer
+
+NaN = float("nan")
+
+
+class Candle(NamedTuple):
+    timestamp: float
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class _RollingWindow:
+    """
+    Fixed length window with running sums, to get the mean and the population standard deviation in O(1).
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self._values: Deque[float] = deque(maxlen=length)
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._pushes = 0
+
+    def reset(self):
+        self._values.clear()
+        self._sum = self._sum_sq = 0.0
+        self._pushes = 0
+
+    def stats(self, value: float) -> Tuple[float, float]:
+        """
+        Calculates the mean and standard deviation of the window after adding the value, without adding it.
+        """
+        if len(self._values) + 1 < self.length:
+            return NaN, NaN
+        total, total_sq = self._sum + value, self._sum_sq + value * value
+        if len(self._values) == self.length:
+            oldest = self._values[0]
+            total, total_sq = total - oldest, total_sq - oldest * oldest
+        mean = total / self.length
+        return mean, math.sqrt(max(total_sq / self.length - mean * mean, 0.0))
+
+    def push(self, value: float):
+        if len(self._values) == self.length:
+            oldest = self._values[0]
+            self._sum -= oldest
+            self._sum_sq -= oldest * oldest
+        self._values.append(value)
+        self._sum += value
+        self._sum_sq += value * value
+        self._pushes += 1
+        if self._pushes % (self.length * 100) == 0:
+            # Recalculate the running sums from time to time to avoid accumulating rounding errors
+            self._sum = sum(self._values)
+            self._sum_sq = sum(v * v for v in self._values)
+
+
+class _SeededMovingAverage:
+    """
+    Exponential moving average seeded with the simple average of the first `length` values, with alpha 2 / (length + 1)
+    (EMA) or 1 / length (Wilder's RMA).
+    """
+
+    def __init__(self, length: int, alpha: float):
+        self.length = length
+        self.alpha = alpha
+        self.reset()
+
+    def reset(self):
+        self._count = 0
+        self._seed_sum = 0.0
+        self._value = NaN
+
+    def value(self, value: float) -> float:
+        """
+        Calculates the average after adding the value, without adding it.
+        """
+        if math.isnan(value):
+            return self._value if self._count >= self.length else NaN
+        if self._count + 1 < self.length:
+            return NaN
+        if self._count + 1 == self.length:
+            return (self._seed_sum + value) / self.length
+        return self._value + self.alpha * (value - self._value)
+
+    def push(self, value: float):
+        if math.isnan(value):
+            return
+        self._value = self.value(value)
+        if self._count < self.length:
+            self._seed_sum += value
+        self._count += 1
+
+
+def ema(length: int) -> _SeededMovingAverage:
+    return _SeededMovingAverage(length, alpha=2 / (length + 1))
+
+
+def rma(length: int) -> _SeededMovingAverage:
+    return _SeededMovingAverage(length, alpha=1 / length)
+
+
+class StreamingIndicator(ABC):
+    """
+    Indicator updated incrementally with each candle.
+
+    The last candle of a feed is still in progress, so `update` is called with `closed=False` every time it changes,
+    which calculates the values without modifying the state of the indicator, and once more with `closed=True` when a
+    newer candle starts, which adds it to the state.
+
+    The columns are named as in pandas_ta, so they can replace the `df.ta` columns used by the controllers, but the
+    values are only checked against the textbook definitions of the indicators. The moving averages are seeded with
+    the simple average of their first values (as in TA-Lib), so the first values can differ from the pandas_ta ones.
+    """
+
+    @property
+    @abstractmethod
+    def columns(self) -> List[str]:
+        """
+        The names of the values of the indicator, following the pandas_ta naming.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def reset(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, candle: Candle, closed: bool) -> Tuple[float, ...]:
+        raise NotImplementedError
+
+
+class BBands(StreamingIndicator):
+    """
+    Bollinger Bands over a simple moving average and the population standard deviation.
+    """
+
+    def __init__(self, length: int = 5, lower_std: float = 2.0, upper_std: float = 2.0):
+        self.length = length
+        self.lower_std = lower_std
+        self.upper_std = upper_std
+        self._window = _RollingWindow(length)
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self.length}_{self.lower_std}_{self.upper_std}"
+        return [f"BBL_{suffix}", f"BBM_{suffix}", f"BBU_{suffix}", f"BBB_{suffix}", f"BBP_{suffix}"]
+
+    def reset(self):
+        self._window.reset()
+
+    def update(self, candle: Candle, closed: bool) -> Tuple[float, ...]:
+        mid, std = self._window.stats(candle.close)
+        if closed:
+            self._window.push(candle.close)
+        lower = mid - self.lower_std * std
+        upper = mid + self.upper_std * std
+        bandwidth = 100 * (upper - lower) / mid if mid else NaN
+        percent = (candle.close - lower) / (upper - lower) if upper != lower else NaN
+        return lower, mid, upper, bandwidth, percent
+
+
+class MACD(StreamingIndicator):
+    """
+    Moving Average Convergence Divergence. As in TA-Lib, both averages are seeded at the same candle, the signal line
+    is seeded with the average of the first MACD values, and the values are only returned once the signal line is
+    available.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self._fast_ema = ema(fast)
+        self._slow_ema = ema(slow)
+        self._signal_ema = ema(signal)
+        self._count = 0
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self.fast}_{self.slow}_{self.signal}"
+        return [f"MACD_{suffix}", f"MACDh_{suffix}", f"MACDs_{suffix}"]
+
+    def reset(self):
+        for average in (self._fast_ema, self._slow_ema, self._signal_ema):
+            average.reset()
+        self._count = 0
+
+    def update(self, candle: Candle, closed: bool) -> Tuple[float, ...]:
+        seeds_fast_ema = self._count >= self.slow - self.fast
+        fast = self._fast_ema.value(candle.close) if seeds_fast_ema else NaN
+        macd = fast - self._slow_ema.value(candle.close)
+        signal = self._signal_ema.value(macd)
+        if closed:
+            if seeds_fast_ema:
+                self._fast_ema.push(candle.close)
+            self._slow_ema.push(candle.close)
+            self._signal_ema.push(macd)
+            self._count += 1
+        if math.isnan(signal):
+            return NaN, NaN, NaN
+        return macd, macd - signal, signal
+
+
+class RSI(StreamingIndicator):
+    """
+    Relative Strength Index with Wilder's smoothing of the gains and losses.
+    """
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self._gains = rma(length)
+        self._losses = rma(length)
+        self._prev_close = NaN
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"RSI_{self.length}"]
+
+    def reset(self):
+        self._gains.reset()
+        self._losses.reset()
+        self._prev_close = NaN
+
+    def update(self, candle: Candle, closed: bool) -> Tuple[float, ...]:
+        change = candle.close - self._prev_close
+        gain, loss = (max(change, 0.0), max(-change, 0.0)) if not math.isnan(change) else (NaN, NaN)
+        avg_gain, avg_loss = self._gains.value(gain), self._losses.value(loss)
+        if closed:
+            self._gains.push(gain)
+            self._losses.push(loss)
+            self._prev_close = candle.close
+        total = avg_gain + avg_loss
+        return (100 * avg_gain / total if total else 0.0),
+
+
+class _AverageTrueRange:
+
+    def __init__(self, length: int):
+        self._rma = rma(length)
+        self._prev_close = NaN
+
+    def reset(self):
+        self._rma.reset()
+        self._prev_close = NaN
+
+    def update(self, candle: Candle, closed: bool) -> float:
+        # The true range of the first candle is not defined, as it depends on the previous close
+        true_range = max(candle.high - candle.low,
+                         abs(candle.high - self._prev_close),
+                         abs(candle.low - self._prev_close)) if not math.isnan(self._prev_close) else NaN
+        atr = self._rma.value(true_range)
+        if closed:
+            self._rma.push(true_range)
+            self._prev_close = candle.close
+        return atr
+
+
+class NATR(StreamingIndicator):
+    """
+    Normalized Average True Range (in percentage of the close price), with Wilder's smoothing of the true range.
+    """
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self._atr = _AverageTrueRange(length)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"NATR_{self.length}"]
+
+    def reset(self):
+        self._atr.reset()
+
+    def update(self, candle: Candle, closed: bool) -> Tuple[float, ...]:
+        return 100 * self._atr.update(candle, closed) / candle.close,
+
+
+class SuperTrend(StreamingIndicator):
+    """
+    SuperTrend over the hl2 price and the average true range: the trend, its direction (1 or -1), and the long and
+    short bands.
+    """
+
+    def __init__(self, length: int = 7, multiplier: float = 3.0):
+        self.length = length
+        self.multiplier = multiplier
+        self._atr = _AverageTrueRange(length)
+        self.reset()
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self.length}_{self.multiplier}"
+        return [f"SUPERT_{suffix}", f"SUPERTd_{suffix}", f"SUPERTl_{suffix}", f"SUPERTs_{suffix}"]
+
+    def reset(self):
+        self._atr.reset()
+        self._direction = 1
+        self._upper_band = NaN
+        self._lower_band = NaN
+
+    def update(self, candle: Candle, closed: bool) -> Tuple[float, ...]:
+        hl2 = (candle.high + candle.low) / 2
+        band_range = self.multiplier * self._atr.update(candle, closed)
+        upper_band, lower_band = hl2 + band_range, hl2 - band_range
+        if candle.close > self._upper_band:
+            direction = 1
+        elif candle.close < self._lower_band:
+            direction = -1
+        else:
+            direction = self._direction
+            if direction > 0 and lower_band < self._lower_band:
+                lower_band = self._lower_band
+            if direction < 0 and upper_band > self._upper_band:
+                upper_band = self._upper_band
+        if closed:
+            self._direction, self._upper_band, self._lower_band = direction, upper_band, lower_band
+        if direction > 0:
+            return lower_band, direction, lower_band, NaN
+        return upper_band, direction, NaN, upper_band
+
+
+class CandlesIndicators:
+    """
+    Set of streaming indicators calculated over the candles of a CandlesRingBuffer.
+
+    The values are synchronized lazily, when they are read: only the candles added since the last read are processed,
+    and the whole history is processed again only if older candles were added (e.g. when the history is filled) or the
+    buffer was reset.
+    """
+
+    def __init__(self, candles: CandlesRingBuffer):
+        self._candles = candles
+        self._indicators: Dict[Tuple[str, ...], StreamingIndicator] = {}
+        self._columns: List[str] = []
+        self._values: Optional[CandlesRingBuffer] = None
+        self._synced_version = -1
+        self._committed_timestamp: Optional[float] = None
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def add(self, indicator: StreamingIndicator) -> StreamingIndicator:
+        """
+        Adds the indicator, unless an indicator with the same columns was added already.
+        :return: the indicator calculating the columns
+        """
+        key = tuple(indicator.columns)
+        if key not in self._indicators:
+            self._indicators[key] = indicator
+            self._columns.extend(indicator.columns)
+            self._values = None
+        return self._indicators[key]
+
+    def get_column(self, column: str) -> np.ndarray:
+        """
+        Returns a read only view of the values of the column, aligned with the candles. Only valid until the candles
+        are modified again.
+        """
+        self.sync()
+        return self._values.column(self._columns.index(column) + 1)
+
+    def get_df(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Returns the values of the indicators (or of the requested columns only) as a DataFrame aligned with the
+        candles.
+        """
+        self.sync()
+        columns = self._columns if columns is None else list(columns)
+        return pd.DataFrame({column: self._values.column(self._columns.index(column) + 1) for column in columns})
+
+    def sync(self):
+        if self._values is not None and self._synced_version == self._candles.version:
+            return
+        candles = self._candles.view()
+        timestamps = candles[:, 0]
+        if self._values is None or len(self._values) == 0 or not self._can_continue(timestamps):
+            self._rebuild()
+        start = 0
+        if self._committed_timestamp is not None:
+            start = int(timestamps.searchsorted(self._committed_timestamp, side="right"))
+            # The values of the candle in progress are calculated again
+            while len(self._values) > 0 and self._values[-1][0] > self._committed_timestamp:
+                self._values.pop()
+        for index in range(start, len(candles)):
+            closed = index < len(candles) - 1
+            candle = Candle(*candles[index, :6])
+            row = [candle.timestamp]
+            for indicator in self._indicators.values():
+                row.extend(indicator.update(candle, closed))
+            self._values.append(row)
+            if closed:
+                self._committed_timestamp = candle.timestamp
+        self._synced_version = self._candles.version
+
+    def _can_continue(self, timestamps: np.ndarray) -> bool:
+        if len(timestamps) == 0 or self._committed_timestamp is None:
+            return False
+        first_timestamp = self._values[0][0]
+        committed_index = timestamps.searchsorted(self._committed_timestamp)
+        return (timestamps[0] >= first_timestamp and committed_index < len(timestamps)
+                and timestamps[committed_index] == self._committed_timestamp)
+
+    def _rebuild(self):
+        for indicator in self._indicators.values():
+            indicator.reset()
+        self._values = CandlesRingBuffer(maxlen=self._candles.maxlen, n_columns=len(self._columns) + 1)
+        self._committed_timestamp = None
+
+
+def calculate_indicators(candles_df: pd.DataFrame, indicators: Sequence[StreamingIndicator]) -> pd.DataFrame:
+    """
+    Calculates the indicators over all the candles of the DataFrame, considering all of them closed.
+    :return: a DataFrame with the columns of the indicators, with the same index as candles_df
+    """
+    values = candles_df[["timestamp", "open", "high", "low", "close", "volume"]].to_numpy(dtype=float)
+    rows = []
+    for indicator in indicators:
+        indicator.reset()
+    for candle_values in values:
+        candle = Candle(*candle_values)
+        row = []
+        for indicator in indicators:
+            row.extend(indicator.update(candle, closed=True))
+        rows.append(row)
+    columns = [column for indicator in indicators for column in indicator.columns]
+    return pd.DataFrame(rows, columns=columns, index=candles_df.index)
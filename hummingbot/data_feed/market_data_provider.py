@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
@@ -20,6 +20,7 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import StreamingIndicator
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 
@@ -351,13 +352,16 @@ class MarketDataProvider:
         connector = self.get_connector_with_fallback(connector_name)
         return connector.get_funding_info(trading_pair)
 
-    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500,
+                       indicators: Optional[Sequence[StreamingIndicator]] = None):
         """
         Retrieves the candles for a trading pair from the specified connector.
         :param connector_name: str
         :param trading_pair: str
         :param interval: str
         :param max_records: int
+        :param indicators: streaming indicators whose columns are added to the candles, they are updated
+        incrementally by the candles feed
         :return: Candles dataframe.
         """
         candles = self.get_candles_feed(CandlesConfig(
@@ -366,6 +370,8 @@ class MarketDataProvider:
             interval=interval,
             max_records=max_records,
         ))
+        if indicators:
+            return candles.get_candles_df_with_indicators(indicators).iloc[-max_records:]
         return candles.candles_df.iloc[-max_records:]
 
     async def get_historical_candles_df(self, connector_name: str, trading_pair: str, interval: str,
@@ -542,17 +548,19 @@ class MarketDataProvider:
         order_book = connector.get_order_book(trading_pair)
         return order_book.get_price_for_volume(is_buy, volume)
 
-    def get_order_book_snapshot(self, connector_name, trading_pair) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def get_order_book_snapshot(self, connector_name, trading_pair,
+                                depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Retrieves the order book snapshot for a trading pair from the specified connector, as a tuple of bid and ask in
         DataFrame format.
         :param connector_name: str
         :param trading_pair: str
+        :param depth: Maximum number of levels per side, None for the full book.
         :return: Tuple of bid and ask in DataFrame format.
         """
         connector = self.get_connector_with_fallback(connector_name)
         order_book = connector.get_order_book(trading_pair)
-        return order_book.snapshot
+        return order_book.get_snapshot(depth)
 
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float,
                                    is_buy: bool) -> OrderBookQueryResult:
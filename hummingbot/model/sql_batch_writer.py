@@ -0,0 +1,148 @@
+import logging
+import queue
+import threading
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+SessionOperation = Callable[[Session], None]
+
+_AFTER_COMMIT_CALLBACKS_KEY = "after_commit_callbacks"
+
+
+def after_commit(session: Session, callback: Callable[[], None]):
+    """
+    Registers a callback run once the transaction of the session is committed, for the operations updating in memory
+    state that must not change if the transaction is rolled back.
+    """
+    session.info.setdefault(_AFTER_COMMIT_CALLBACKS_KEY, []).append(callback)
+
+
+def execute_operations(sql: SQLConnectionManager, operations: List[SessionOperation]):
+    """
+    Runs the operations in a single transaction, then the callbacks they registered with `after_commit`.
+    """
+    with sql.get_new_session() as session:
+        with session.begin():
+            for operation in operations:
+                operation(session)
+        callbacks = session.info.pop(_AFTER_COMMIT_CALLBACKS_KEY, [])
+    for callback in callbacks:
+        callback()
+
+
+class SQLBatchWriter:
+    """
+    Write-behind queue of database operations, executed by a dedicated thread.
+
+    Each operation is a callable receiving the session of the transaction it runs in. The writer thread drains all
+    the operations queued at a time (up to `max_batch_size`) and runs them in a single transaction, in the order they
+    were submitted. If the transaction fails, the operations of the batch are retried one by one, so a single failing
+    operation does not discard the others. Operations must therefore not change any state outside the session before
+    the transaction is committed, they register those changes with `after_commit` instead.
+
+    The queue is bounded: when it is full, `submit` blocks until the writer thread catches up.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql: SQLConnectionManager, max_queue_size: int = 10000, max_batch_size: int = 500):
+        """
+        :param sql: the connection manager used to create the sessions
+        :param max_queue_size: the maximum number of operations waiting to be written
+        :param max_batch_size: the maximum number of operations written in a single transaction
+        """
+        self._sql_manager = sql
+        self._max_batch_size = max_batch_size
+        self._queue: "queue.Queue[Optional[SessionOperation]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pending_operations(self) -> int:
+        return self._queue.unfinished_tasks
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        with self._lock:
+            if not self.is_running:
+                self._thread = threading.Thread(target=self._run, name="SQLBatchWriter", daemon=True)
+                self._thread.start()
+
+    def submit(self, operation: SessionOperation):
+        if not self.is_running:
+            self.start()
+        self._queue.put(operation)
+
+    def flush(self):
+        """
+        Blocks until all the operations submitted so far are written.
+        """
+        if self.is_running:
+            self._queue.join()
+
+    def stop(self):
+        """
+        Writes all the pending operations and stops the writer thread.
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
+
+    def _run(self):
+        while True:
+            operations: List[SessionOperation] = []
+            stop_requested = False
+            operation = self._queue.get()
+            while True:
+                if operation is None:
+                    stop_requested = True
+                else:
+                    operations.append(operation)
+                if len(operations) >= self._max_batch_size:
+                    break
+                try:
+                    operation = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                self._write(operations)
+            finally:
+                for _ in range(len(operations) + int(stop_requested)):
+                    self._queue.task_done()
+            if stop_requested:
+                break
+
+    def _write(self, operations: List[SessionOperation]):
+        if len(operations) == 0:
+            return
+        try:
+            self._execute(operations)
+        except Exception:
+            if len(operations) == 1:
+                self.logger().error("Unexpected error while writing to the database.", exc_info=True)
+                return
+            self.logger().warning(f"Error writing a batch of {len(operations)} operations to the database. "
+                                  f"Retrying them one by one.", exc_info=True)
+            for operation in operations:
+                try:
+                    self._execute([operation])
+                except Exception:
+                    self.logger().error("Unexpected error while writing to the database.", exc_info=True)
+
+    def _execute(self, operations: List[SessionOperation]):
+        execute_operations(self._sql_manager, operations)
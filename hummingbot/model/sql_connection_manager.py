@@ -3,7 +3,7 @@ from enum import Enum
 from os.path import join
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
@@ -73,6 +73,8 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            if self._engine.dialect.name == "sqlite":
+                event.listen(self._engine, "connect", self._enable_sqlite_wal_mode)
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -96,6 +98,14 @@ class SQLConnectionManager(TransactionBase):
         if connection_type is SQLConnectionType.TRADE_FILLS and (not called_from_migrator):
             self.check_and_migrate_db(client_config_map)
 
+    @staticmethod
+    def _enable_sqlite_wal_mode(dbapi_connection, connection_record):
+        # In WAL mode, readers do not block the writer and commits do not rewrite the database file, which makes the
+        # frequent small transactions of the markets recorder much cheaper.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
     @property
     def engine(self) -> Engine:
         return self._engine
@@ -12,16 +12,26 @@ cdef class TradingIntensityIndicator:
     cdef:
         double _alpha
         double _kappa
-        dict _trade_samples
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        object _quote_timestamps
+        object _quote_prices
+        object _sample_timestamps
+        object _sample_price_levels
+        object _sample_amounts
         int _sampling_length
         int _samples_length
+        int _n_samples
+        double _min_refit_change
+        double _volume_changed_since_fit
+        bint _samples_changed
 
     cdef c_calculate(self, timestamp)
+    cdef c_sample_trades(self)
+    cdef c_trim_samples(self)
+    cdef bint c_should_refit(self)
     cdef c_register_trade(self, object trade)
     cdef c_estimate_intensity(self)
 
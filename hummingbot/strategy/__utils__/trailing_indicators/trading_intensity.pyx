@@ -3,7 +3,7 @@
 
 import warnings
 from decimal import Decimal
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -27,10 +27,20 @@ cdef class TradesForwarder(EventListener):
 
 cdef class TradingIntensityIndicator:
 
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 min_refit_change: float = 0.0):
+        """
+        :param order_book: the order book whose trades are sampled
+        :param price_delegate: the source of the mid price quotes
+        :param sampling_length: the number of quote timestamps with trades kept in the samples
+        :param min_refit_change: the fraction of the sampled volume that has to be added or removed since the last
+        fit to fit the intensity again, by default any change triggers a new fit
+        """
         self._alpha = 0
         self._kappa = 0
-        self._trade_samples = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +48,17 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._min_refit_change = min_refit_change
+        # Quotes in ascending timestamp order
+        self._quote_timestamps = np.empty(0, dtype=float)
+        self._quote_prices = np.empty(0, dtype=float)
+        # One entry per sampled trade, the sample timestamp is the one of its quote plus one
+        self._sample_timestamps = np.empty(0, dtype=float)
+        self._sample_price_levels = np.empty(0, dtype=float)
+        self._sample_amounts = np.empty(0, dtype=float)
+        self._n_samples = 0
+        self._volume_changed_since_fit = 0.0
+        self._samples_changed = False
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +68,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return self._n_samples == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != self._n_samples
+        self._samples_length = self._n_samples
         return is_changed
 
     @property
@@ -67,12 +87,25 @@ cdef class TradingIntensityIndicator:
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(self._quote_timestamps[::-1].tolist(), self._quote_prices[::-1].tolist())]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        # The quotes are received in descending timestamp order
+        self._quote_timestamps = np.array([float(quote["timestamp"]) for quote in reversed(value)], dtype=float)
+        self._quote_prices = np.array([float(quote["price"]) for quote in reversed(value)], dtype=float)
+
+    @property
+    def trade_samples(self) -> Dict[float, List[Dict[str, float]]]:
+        """A helper method to be used in unit tests"""
+        trade_samples = {}
+        for timestamp, price_level, amount in zip(self._sample_timestamps.tolist(),
+                                                  self._sample_price_levels.tolist(),
+                                                  self._sample_amounts.tolist()):
+            trade_samples.setdefault(timestamp, []).append({"price_level": price_level, "amount": amount})
+        return trade_samples
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
@@ -80,41 +113,63 @@ cdef class TradingIntensityIndicator:
 
     cdef c_calculate(self, timestamp):
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
-
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+        self._quote_timestamps = np.append(self._quote_timestamps, float(timestamp))
+        self._quote_prices = np.append(self._quote_prices, float(price))
 
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
+        if len(self._current_trade_sample) > 0:
+            self.c_sample_trades()
+            # There are no trades left to process
+            self._current_trade_sample = []
 
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+        if self._n_samples > self._sampling_length:
+            self.c_trim_samples()
 
-        # THere are no trades left to process
-        self._current_trade_sample = []
-        # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        if self.is_sampling_buffer_full and self.c_should_refit():
+            self.c_estimate_intensity()
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+    cdef c_sample_trades(self):
+        trades_timestamps = np.array([trade.timestamp for trade in self._current_trade_sample], dtype=float)
+        trades_prices = np.array([trade.price for trade in self._current_trade_sample], dtype=float)
+        trades_amounts = np.array([trade.amount for trade in self._current_trade_sample], dtype=float)
+
+        # Each trade is matched with the latest quote before it, if any
+        quote_indexes = np.searchsorted(self._quote_timestamps, trades_timestamps, side="left") - 1
+        matched = quote_indexes >= 0
+        if not matched.any():
+            return
+        quote_indexes = quote_indexes[matched]
+        trades_amounts = trades_amounts[matched]
+
+        self._sample_timestamps = np.concatenate((self._sample_timestamps,
+                                                  self._quote_timestamps[quote_indexes] + 1))
+        self._sample_price_levels = np.concatenate((self._sample_price_levels,
+                                                    np.abs(trades_prices[matched] - self._quote_prices[quote_indexes])))
+        self._sample_amounts = np.concatenate((self._sample_amounts, trades_amounts))
+        self._volume_changed_since_fit += trades_amounts.sum()
+        self._samples_changed = True
 
-        if self.is_sampling_buffer_full:
-            self.c_estimate_intensity()
+        # Store quotes that happened after the latest trade + one before
+        latest_processed_quote_idx = quote_indexes.max()
+        self._quote_timestamps = self._quote_timestamps[latest_processed_quote_idx:]
+        self._quote_prices = self._quote_prices[latest_processed_quote_idx:]
+
+        self._n_samples = len(np.unique(self._sample_timestamps))
+
+    cdef c_trim_samples(self):
+        # Keep the trades of the latest sampling_length sample timestamps
+        sample_timestamps = np.unique(self._sample_timestamps)
+        kept = self._sample_timestamps >= sample_timestamps[-self._sampling_length]
+        self._volume_changed_since_fit += self._sample_amounts[~kept].sum()
+        self._sample_timestamps = self._sample_timestamps[kept]
+        self._sample_price_levels = self._sample_price_levels[kept]
+        self._sample_amounts = self._sample_amounts[kept]
+        self._n_samples = self._sampling_length
+        self._samples_changed = True
+
+    cdef bint c_should_refit(self):
+        if not self._samples_changed:
+            return False
+        return self._volume_changed_since_fit >= self._min_refit_change * self._sample_amounts.sum()
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -124,32 +179,17 @@ cdef class TradingIntensityIndicator:
         self._current_trade_sample.append(trade)
 
     cdef c_estimate_intensity(self):
-        cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        # Consolidate the traded amounts by price level, in descending price level order
+        price_levels, level_indexes = np.unique(self._sample_price_levels, return_inverse=True)
+        lambdas = np.bincount(level_indexes, weights=self._sample_amounts)
+        price_levels = price_levels[::-1]
+        lambdas = lambdas[::-1]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas_adj = np.where(lambdas == 0, 10**-10, lambdas)
+
+        self._samples_changed = False
+        self._volume_changed_since_fit = 0.0
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
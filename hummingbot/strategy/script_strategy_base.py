@@ -81,6 +81,30 @@ class ScriptStrategyBase(StrategyPyBase):
         """
         pass
 
+    def enable_order_book_wakeups(self,
+                                  market_trading_pair_tuples: Optional[List[MarketTradingPairTuple]] = None,
+                                  min_interval: float = 0.05,
+                                  debounce_interval: float = 0.01):
+        """
+        Runs on_tick as soon as the best bid or ask price of the order books changes, instead of waiting for the next
+        clock tick, with at least `min_interval` seconds between two ticks.
+
+        :param market_trading_pair_tuples: the markets whose order books wake the strategy up, defaults to all the
+        markets of the script
+        :param min_interval: the minimum time in seconds between two ticks
+        :param debounce_interval: the minimum time in seconds between two top of book changed events of an order book
+        """
+        if market_trading_pair_tuples is None:
+            market_trading_pair_tuples = [
+                self._market_trading_pair_tuple(connector_name, trading_pair)
+                for connector_name, trading_pairs in self.markets.items()
+                for trading_pair in trading_pairs
+                if connector_name in self.connectors
+            ]
+        super().enable_order_book_wakeups(market_trading_pair_tuples,
+                                          min_interval=min_interval,
+                                          debounce_interval=debounce_interval)
+
     async def on_stop(self):
         pass
 
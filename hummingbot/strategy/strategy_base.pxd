@@ -1,5 +1,7 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.event.event_listener cimport EventListener
 
@@ -25,6 +27,13 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_range_position_update_failure_listener
         EventListener _sb_range_position_fee_collected_listener
         EventListener _sb_range_position_closed_listener
+        EventListener _sb_top_of_book_changed_listener
+        list _sb_wakeup_market_pairs
+        dict _sb_wakeup_order_books
+        double _sb_wakeup_min_interval
+        double _sb_wakeup_debounce_interval
+        object _sb_pending_wakeup
+        int64_t _sb_early_wakeups
         bint _sb_delegate_lock
         public OrderTracker _sb_order_tracker
 
@@ -47,6 +56,9 @@ cdef class StrategyBase(TimeIterator):
     cdef c_did_fail_lp_update(self, object fail_lp_update_event)
     cdef c_did_collect_fee(self, object collect_fee_event)
     cdef c_did_close_position(self, object closed_event)
+    cdef c_did_change_top_of_book(self, object top_of_book_changed_event)
+    cdef c_register_wakeup_order_books(self)
+    cdef c_unregister_wakeup_order_books(self)
 
     cdef c_did_fail_order_tracker(self, object order_failed_event)
     cdef c_did_cancel_order_tracker(self, object order_cancelled_event)
@@ -1,10 +1,14 @@
+import asyncio
 from decimal import Decimal
 import logging
+import time
 import pandas as pd
 from typing import (
     List)
 
 from hummingbot.core.clock cimport Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.event.events import MarketEvent, AccountEvent
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.network_iterator import NetworkStatus
@@ -111,6 +115,11 @@ cdef class RangePositionFeeCollectedListener(BaseStrategyEventListener):
 cdef class RangePositionClosedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
         self._owner.c_did_close_position(arg)
+
+
+cdef class TopOfBookChangedListener(BaseStrategyEventListener):
+    cdef c_call(self, object arg):
+        self._owner.c_did_change_top_of_book(arg)
 # </editor-fold>
 
 
@@ -158,6 +167,14 @@ cdef class StrategyBase(TimeIterator):
         self._sb_range_position_update_failure_listener = RangePositionUpdateFailureListener(self)
         self._sb_range_position_fee_collected_listener = RangePositionFeeCollectedListener(self)
         self._sb_range_position_closed_listener = RangePositionClosedListener(self)
+        self._sb_top_of_book_changed_listener = TopOfBookChangedListener(self)
+
+        self._sb_wakeup_market_pairs = []
+        self._sb_wakeup_order_books = {}
+        self._sb_wakeup_min_interval = 0
+        self._sb_wakeup_debounce_interval = 0
+        self._sb_pending_wakeup = None
+        self._sb_early_wakeups = 0
 
         self._sb_delegate_lock = False
 
@@ -190,7 +207,7 @@ cdef class StrategyBase(TimeIterator):
     def trades(self) -> List[Trade]:
         """
         Returns a list of all completed trades from the market.
-        The trades are taken from the market event logs.
+        The trades are taken from the market order filled events, including the ones spilled to disk.
         """
         def event_to_trade(order_filled_event: OrderFilledEvent, market_name: str):
             return Trade(order_filled_event.trading_pair,
@@ -203,9 +220,7 @@ cdef class StrategyBase(TimeIterator):
                          order_filled_event.trade_fee)
         past_trades = []
         for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
-            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
+            past_trades += [event_to_trade(ofe, market.display_name) for ofe in market.iter_order_filled_events()]
 
         return sorted(past_trades, key=lambda x: x.timestamp)
 
@@ -304,12 +319,123 @@ cdef class StrategyBase(TimeIterator):
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self._sb_order_tracker.c_tick(timestamp)
+        if len(self._sb_wakeup_market_pairs) > 0:
+            self.c_register_wakeup_order_books()
 
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._sb_order_tracker.c_stop(clock)
+        self.c_unregister_wakeup_order_books()
         self.c_remove_markets(list(self._sb_markets))
 
+    # <editor-fold desc="+ Order book wakeups">
+    # ----------------------------------------------------------------------------------------------------------
+    @property
+    def order_book_wakeups_enabled(self) -> bool:
+        return len(self._sb_wakeup_market_pairs) > 0
+
+    @property
+    def early_wakeups_count(self) -> int:
+        """
+        The number of ticks triggered by order book changes instead of the clock
+        """
+        return self._sb_early_wakeups
+
+    def enable_order_book_wakeups(self,
+                                  market_trading_pair_tuples: List[MarketTradingPairTuple],
+                                  min_interval: float = 0.05,
+                                  debounce_interval: float = 0.01):
+        """
+        Ticks the strategy as soon as the best bid or ask price of one of the order books changes, instead of waiting
+        for the next clock tick. Only applies to real time clocks.
+
+        :param market_trading_pair_tuples: the markets whose order books wake the strategy up
+        :param min_interval: the minimum time in seconds between two ticks of the strategy. No early tick is triggered
+        when the next clock tick is closer than this interval
+        :param debounce_interval: the minimum time in seconds between two top of book changed events of an order book
+        """
+        self.c_unregister_wakeup_order_books()
+        self._sb_wakeup_market_pairs = [(market_info.market, market_info.trading_pair)
+                                        for market_info in market_trading_pair_tuples]
+        self._sb_wakeup_min_interval = min_interval
+        self._sb_wakeup_debounce_interval = debounce_interval
+        self.c_register_wakeup_order_books()
+
+    def disable_order_book_wakeups(self):
+        self.c_unregister_wakeup_order_books()
+        self._sb_wakeup_market_pairs = []
+
+    cdef c_register_wakeup_order_books(self):
+        """
+        Listens to the order books of the wakeup markets. Called on every tick, since the order books are only
+        available once the connectors are ready, and can be replaced when their trackers restart.
+        """
+        cdef:
+            OrderBook order_book
+            OrderBook previous_order_book
+
+        for market, trading_pair in self._sb_wakeup_market_pairs:
+            try:
+                order_book = market.get_order_book(trading_pair)
+            except Exception:
+                continue
+            previous_order_book = self._sb_wakeup_order_books.get((market, trading_pair))
+            if previous_order_book is order_book:
+                continue
+            if previous_order_book is not None:
+                previous_order_book.c_remove_listener(OrderBook.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                                                      self._sb_top_of_book_changed_listener)
+            order_book.enable_top_of_book_events(self._sb_wakeup_debounce_interval)
+            order_book.c_add_listener(OrderBook.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                                      self._sb_top_of_book_changed_listener)
+            self._sb_wakeup_order_books[(market, trading_pair)] = order_book
+
+    cdef c_unregister_wakeup_order_books(self):
+        cdef:
+            OrderBook order_book
+
+        for order_book in self._sb_wakeup_order_books.values():
+            order_book.c_remove_listener(OrderBook.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                                         self._sb_top_of_book_changed_listener)
+            if len(order_book.c_get_listeners(OrderBook.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG)) == 0:
+                order_book.disable_top_of_book_events()
+        self._sb_wakeup_order_books.clear()
+        if self._sb_pending_wakeup is not None:
+            self._sb_pending_wakeup.cancel()
+            self._sb_pending_wakeup = None
+
+    cdef c_did_change_top_of_book(self, object top_of_book_changed_event):
+        cdef:
+            double delay
+
+        if (self._sb_pending_wakeup is not None
+                or self._clock is None
+                or self._clock.clock_mode is not ClockMode.REALTIME):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # The tick is never run from the order book update itself, the strategy might be reading the order book
+        delay = max(self._current_timestamp + self._sb_wakeup_min_interval - time.time(), 0)
+        self._sb_pending_wakeup = loop.call_later(delay, self._wake_up)
+
+    def _wake_up(self):
+        self._sb_pending_wakeup = None
+        if self._clock is None:
+            return
+        now = time.time()
+        if now >= self._clock.current_timestamp + self._clock.tick_size - self._sb_wakeup_min_interval:
+            # The next clock tick is close enough
+            return
+        self._sb_early_wakeups += 1
+        try:
+            self.c_tick(now)
+        except Exception:
+            self.logger().error("Unexpected error running an early strategy tick.", exc_info=True)
+    # ----------------------------------------------------------------------------------------------------------
+    # </editor-fold>
+
     cdef c_add_markets(self, list markets):
         cdef:
             ConnectorBase typed_market
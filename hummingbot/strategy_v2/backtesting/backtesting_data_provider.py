@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 import pandas as pd
 
@@ -10,7 +10,9 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import LazyDict, PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import StreamingIndicator, calculate_indicators
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 
 # Set up logging
@@ -25,13 +27,20 @@ class BacktestingDataProvider(MarketDataProvider):
                            "coinbase_advanced_trade", "kraken", "dydx_v4_perpetual", "hitbtc",
                            "hyperliquid", "injective_v2_perpetual", "injective_v2"]
 
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
+    def __init__(self, connectors: Dict[str, ConnectorBase], candles_store: Optional[CandlesStore] = None):
+        """
+        :param connectors: the connectors used to get the trading rules
+        :param candles_store: if provided, the historical candles are read from this local store, and only the ranges
+        not stored yet are downloaded
+        """
         super().__init__(connectors)
+        self.candles_store = candles_store
         self.start_time = None
         self.end_time = None
         self.prices = {}
         self._time = None
         self.trading_rules = {}
+        self._indicators_cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[pd.DataFrame, pd.DataFrame]] = {}
         self.conn_settings = AllConnectorSettings.get_connector_settings()
         self.connectors = LazyDict[str, Optional[ConnectorBase]](
             lambda name: self.get_connector(name) if (
@@ -106,24 +115,39 @@ class BacktestingDataProvider(MarketDataProvider):
             interval=config.interval,
             start_time=self.start_time - candles_buffer,
             end_time=self.end_time,
-        ))
+        ), candles_store=self.candles_store)
         # TODO: fix pandas-ta improper float index slicing to allow us to use float indexes
         # candles_df = self.ensure_epoch_index(candles_df)
         self.candles_feeds[key] = candles_df
         return candles_df
 
-    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500,
+                       indicators: Optional[Sequence[StreamingIndicator]] = None):
         """
         Retrieves the candles for a trading pair from the specified connector.
         :param connector_name: str
         :param trading_pair: str
         :param interval: str
         :param max_records: int
+        :param indicators: indicators whose columns are added to the candles, calculated once over the whole feed
         :return: Candles dataframe.
         """
-        candles_df = self.candles_feeds.get(f"{connector_name}_{trading_pair}_{interval}")
+        key = f"{connector_name}_{trading_pair}_{interval}"
+        candles_df = self.candles_feeds.get(key)
+        if indicators:
+            candles_df = self._get_candles_df_with_indicators(key, candles_df, indicators)
         return candles_df[(candles_df["timestamp"] >= self.start_time) & (candles_df["timestamp"] <= self.end_time)]
 
+    def _get_candles_df_with_indicators(self, key: str, candles_df: pd.DataFrame,
+                                        indicators: Sequence[StreamingIndicator]) -> pd.DataFrame:
+        cache_key = (key, tuple(column for indicator in indicators for column in indicator.columns))
+        source_df, cached_df = self._indicators_cache.get(cache_key, (None, None))
+        if source_df is not candles_df:
+            # The feed was downloaded again, so the indicators are calculated again
+            cached_df = pd.concat([candles_df, calculate_indicators(candles_df, indicators)], axis=1)
+            self._indicators_cache[cache_key] = (candles_df, cached_df)
+        return cached_df
+
     def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType):
         """
         Retrieves the price for a trading pair from the specified connector based on the price type.
@@ -1,8 +1,10 @@
+import heapq
 import importlib
 import inspect
+import itertools
 import os
 from decimal import Decimal
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import pandas as pd
@@ -10,6 +12,7 @@ import yaml
 
 from hummingbot.client import settings
 from hummingbot.core.data_type.common import LazyDict, TradeType
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
@@ -31,11 +34,13 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 class BacktestingEngineBase:
     __controller_class_cache = LazyDict[str, Type[ControllerBase]]()
+    # Columns required by the executor simulators
+    SIMULATION_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
 
-    def __init__(self):
+    def __init__(self, candles_store: Optional[CandlesStore] = None):
         self.controller = None
         self.backtesting_resolution = None
-        self.backtesting_data_provider = BacktestingDataProvider(connectors={})
+        self.backtesting_data_provider = BacktestingDataProvider(connectors={}, candles_store=candles_store)
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
 
@@ -83,7 +88,8 @@ class BacktestingEngineBase:
                               controller_config: ControllerConfigBase,
                               start: int, end: int,
                               backtesting_resolution: str = "1m",
-                              trade_cost=0.0006):
+                              trade_cost=0.0006,
+                              vectorized: bool = False):
         controller_class = self.__controller_class_cache.get_or_add(controller_config.controller_name, controller_config.get_controller_class)
         # controller_class = controller_config.get_controller_class()
         # Load historical candles
@@ -94,7 +100,10 @@ class BacktestingEngineBase:
         self.backtesting_resolution = backtesting_resolution
         await self.initialize_backtesting_data_provider()
         await self.controller.update_processed_data()
-        executors_info = await self.simulate_execution(trade_cost=trade_cost)
+        if vectorized:
+            executors_info = await self.simulate_execution_vectorized(trade_cost=trade_cost)
+        else:
+            executors_info = await self.simulate_execution(trade_cost=trade_cost)
         results = self.summarize_results(executors_info, controller_config.total_amount_quote)
         return {
             "executors": executors_info,
@@ -137,6 +146,152 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
+    async def simulate_execution_vectorized(self, trade_cost: float) -> list:
+        """
+        Event driven version of simulate_execution. The market data is read from NumPy column arrays instead of
+        iterating the rows of the DataFrame, the active executors are kept in a heap keyed by their close timestamp,
+        and the controller is only evaluated on the bars where:
+            - one of the signal columns declared by the controller changes
+            - an active executor closes
+            - the wakeup interval of the controller (e.g. its cooldown) expires while the signal is still active
+            - the bar follows one where the controller created or stopped executors
+
+        This gives the same executors as simulate_execution as long as the decisions of the controller only depend on
+        the columns returned by its get_signal_columns, its executors and the elapsed time. Controllers that don't
+        declare their signal columns are evaluated on every bar.
+
+        Args:
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        processed_features = self.prepare_market_data()
+        self.active_executor_simulations: List[ExecutorSimulation] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+        self._executors_heap: List[Tuple[float, int, ExecutorSimulation]] = []
+        self._active_simulations_by_id: Dict[str, ExecutorSimulation] = {}
+        self._executors_counter = itertools.count()
+        if processed_features.empty:
+            return self.controller.executors_info
+
+        columns = {column: processed_features[column].to_numpy() for column in processed_features.columns}
+        timestamps = processed_features["timestamp"].to_numpy(dtype=float)
+        closes = processed_features["close_bt"].to_numpy(dtype=float)
+        market_data = processed_features[[column for column in self.SIMULATION_COLUMNS
+                                          if column in processed_features.columns]]
+        change_indexes = np.flatnonzero(self.controller_wakeup_mask(processed_features))
+        pending_signal = self.pending_signal_mask(processed_features)
+        wakeup_interval = self.controller.get_wakeup_interval()
+
+        n_bars = len(timestamps)
+        change_pos = 0
+        scheduled_bars: List[int] = []
+        executors_info: Optional[List[ExecutorInfo]] = None
+        i = 0
+        while i < n_bars:
+            timestamp = timestamps[i]
+            self.update_state_vectorized(columns, i, timestamp, closes[i])
+            if i == n_bars - 1:
+                # As in simulate_execution, the results are the executors info before the actions of the last bar
+                executors_info = self.controller.executors_info
+            actions = self.controller.determine_executor_actions()
+            for action in actions:
+                if isinstance(action, CreateExecutorAction):
+                    executor_simulation = self.simulate_executor(action.executor_config, market_data.iloc[i:], trade_cost)
+                    if executor_simulation is not None and executor_simulation.close_type != CloseType.FAILED:
+                        self.push_active_executor(executor_simulation)
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action_vectorized(action, timestamp)
+
+            # Jump to the next bar where the decision of the controller can change
+            if len(actions) > 0:
+                # The executors changed, so the controller can take another decision on the next bar
+                heapq.heappush(scheduled_bars, i + 1)
+            if wakeup_interval is not None and pending_signal[i]:
+                # The wakeups stay scheduled until reached, so that evaluating a bar in between doesn't delay them
+                heapq.heappush(scheduled_bars, timestamps.searchsorted(timestamp + wakeup_interval, side="right"))
+            while len(scheduled_bars) > 0 and scheduled_bars[0] <= i:
+                heapq.heappop(scheduled_bars)
+            next_bars = scheduled_bars[:1]
+            while change_pos < len(change_indexes) and change_indexes[change_pos] <= i:
+                change_pos += 1
+            if change_pos < len(change_indexes):
+                next_bars.append(change_indexes[change_pos])
+            next_close_timestamp = self.next_executor_close_timestamp()
+            if next_close_timestamp is not None:
+                next_bars.append(max(i + 1, timestamps.searchsorted(next_close_timestamp, side="left")))
+            i = int(min(next_bars, default=n_bars))
+
+        if executors_info is None:
+            # The controller was not evaluated on the last bar, the executors are updated up to it
+            self.update_executors_info_vectorized(timestamps[-1])
+            executors_info = self.controller.executors_info
+        return executors_info
+
+    def controller_wakeup_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """
+        Flags the bars where any of the signal columns of the controller differs from the previous bar. If the
+        controller does not declare them, or the features have none of them, it is evaluated on every bar.
+        """
+        signal_columns = [column for column in self.controller.get_signal_columns() or [] if column in features.columns]
+        if len(signal_columns) == 0:
+            return np.ones(len(features), dtype=bool)
+        mask = np.zeros(len(features), dtype=bool)
+        mask[0] = True
+        for column in signal_columns:
+            values = features[column].to_numpy()
+            mask[1:] |= values[1:] != values[:-1]
+        return mask
+
+    def pending_signal_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """
+        Flags the bars where the controller could still act once its wakeup interval expires. When the controller
+        acts on a signal column, that is only the case while the signal is not 0.
+        """
+        if "signal" not in (self.controller.get_signal_columns() or []) or "signal" not in features.columns:
+            return np.ones(len(features), dtype=bool)
+        return features["signal"].to_numpy() != 0
+
+    def update_state_vectorized(self, columns: Dict[str, np.ndarray], index: int, timestamp: float, close: float):
+        key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
+        self.controller.market_data_provider.prices = {key: Decimal(close)}
+        self.controller.market_data_provider._time = timestamp
+        self.controller.processed_data.update({column: values[index] for column, values in columns.items()})
+        self.update_executors_info_vectorized(timestamp)
+
+    def update_executors_info_vectorized(self, timestamp: float):
+        while len(self._executors_heap) > 0 and self._executors_heap[0][0] <= timestamp:
+            _, _, simulation = heapq.heappop(self._executors_heap)
+            if self._active_simulations_by_id.pop(simulation.config.id, None) is not None:
+                self.stopped_executors_info.append(simulation.get_executor_info_at_timestamp(timestamp))
+        active_executors_info = [simulation.get_executor_info_at_timestamp(timestamp)
+                                 for simulation in self._active_simulations_by_id.values()]
+        self.active_executor_simulations = list(self._active_simulations_by_id.values())
+        self.controller.executors_info = active_executors_info + self.stopped_executors_info
+
+    def push_active_executor(self, simulation: ExecutorSimulation):
+        if not simulation.executor_simulation.empty:
+            close_timestamp = float(simulation.executor_simulation.index.max())
+            heapq.heappush(self._executors_heap, (close_timestamp, next(self._executors_counter), simulation))
+            self._active_simulations_by_id[simulation.config.id] = simulation
+
+    def next_executor_close_timestamp(self) -> Optional[float]:
+        # Executors stopped early stay in the heap until they reach the top
+        while len(self._executors_heap) > 0 and self._executors_heap[0][2].config.id not in self._active_simulations_by_id:
+            heapq.heappop(self._executors_heap)
+        return self._executors_heap[0][0] if len(self._executors_heap) > 0 else None
+
+    def handle_stop_action_vectorized(self, action: StopExecutorAction, timestamp: float):
+        simulation = self._active_simulations_by_id.pop(action.executor_id, None)
+        if simulation is not None:
+            executor_info = simulation.get_executor_info_at_timestamp(timestamp)
+            executor_info.status = RunnableStatus.TERMINATED
+            executor_info.close_type = CloseType.EARLY_STOP
+            executor_info.is_active = False
+            executor_info.close_timestamp = timestamp
+            self.stopped_executors_info.append(executor_info)
+
     async def update_state(self, row):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
@@ -0,0 +1,239 @@
+import asyncio
+import itertools
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client import settings
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+
+def grid_overrides(param_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Builds the config overrides for every combination of the values of the grid.
+    :param param_grid: the candidate values of each config parameter
+    :return: a list of overrides, one per combination
+    """
+    keys = list(param_grid.keys())
+    return [dict(zip(keys, values)) for values in itertools.product(*(param_grid[key] for key in keys))]
+
+
+def random_overrides(param_grid: Dict[str, List[Any]], n_samples: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Samples distinct combinations of the values of the grid, without building the whole grid.
+    :param param_grid: the candidate values of each config parameter
+    :param n_samples: the number of combinations to sample, the whole grid is returned if it is smaller
+    :param seed: the seed of the random generator, to get reproducible samples
+    :return: a list of overrides, one per sampled combination
+    """
+    keys = list(param_grid.keys())
+    sizes = [len(param_grid[key]) for key in keys]
+    total_combinations = math.prod(sizes)
+    if total_combinations <= n_samples:
+        return grid_overrides(param_grid)
+    overrides = []
+    for combination_index in random.Random(seed).sample(range(total_combinations), n_samples):
+        override = {}
+        for key, size in zip(reversed(keys), reversed(sizes)):
+            combination_index, value_index = divmod(combination_index, size)
+            override[key] = param_grid[key][value_index]
+        overrides.append({key: override[key] for key in keys})
+    return overrides
+
+
+@dataclass
+class SharedCandles:
+    """
+    Reference to a candles DataFrame copied into a shared memory block, that the worker processes attach to.
+    """
+    key: str
+    shm_name: str
+    shape: Tuple[int, int]
+    columns: List[str]
+
+
+@dataclass
+class SweepTask:
+    base_config: Dict[str, Any]
+    overrides: Dict[str, Any]
+    start: int
+    end: int
+    backtesting_resolution: str
+    trade_cost: float
+    vectorized: bool
+    controllers_module: str
+
+
+# State of each worker process, initialized once by _init_worker and reused by all the tasks of the process
+_worker_shared_memories: List[shared_memory.SharedMemory] = []
+_worker_engine: Optional[BacktestingEngineBase] = None
+
+
+def _init_worker(shared_candles: List[SharedCandles], trading_rules: Dict[str, Dict], candles_store: Optional[CandlesStore]):
+    global _worker_engine
+    _worker_engine = BacktestingEngineBase(candles_store=candles_store)
+    data_provider = _worker_engine.backtesting_data_provider
+    data_provider.trading_rules = trading_rules
+    for candles in shared_candles:
+        shm = shared_memory.SharedMemory(name=candles.shm_name)
+        values = np.ndarray(candles.shape, dtype=np.float64, buffer=shm.buf)
+        values.flags.writeable = False
+        data_provider.candles_feeds[candles.key] = pd.DataFrame(values, columns=candles.columns, copy=False)
+        _worker_shared_memories.append(shm)
+
+
+def _run_backtest_in_process(task: SweepTask) -> Dict[str, Any]:
+    return asyncio.run(_run_backtest(task))
+
+
+async def _run_backtest(task: SweepTask) -> Dict[str, Any]:
+    row = dict(task.overrides)
+    try:
+        controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+            {**task.base_config, **task.overrides}, task.controllers_module)
+        backtesting_result = await _worker_engine.run_backtesting(
+            controller_config=controller_config,
+            start=task.start,
+            end=task.end,
+            backtesting_resolution=task.backtesting_resolution,
+            trade_cost=task.trade_cost,
+            vectorized=task.vectorized,
+        )
+        row.update(backtesting_result["results"])
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    return row
+
+
+class BacktestingSweepRunner:
+    """
+    Runs the backtests of many variants of a controller config in a pool of processes.
+
+    The candles and trading rules required by the base config are downloaded once, the candles are copied into shared
+    memory blocks that every worker process maps without copying, and the summary of each backtest is yielded as soon
+    as it finishes.
+    """
+
+    def __init__(self,
+                 base_config: Dict[str, Any],
+                 start: int,
+                 end: int,
+                 backtesting_resolution: str = "1m",
+                 trade_cost: float = 0.0006,
+                 max_workers: Optional[int] = None,
+                 vectorized: bool = False,
+                 candles_store: Optional[CandlesStore] = None,
+                 controllers_module: str = settings.CONTROLLERS_MODULE):
+        """
+        :param base_config: the controller config (as loaded from its yml file) the overrides are applied to
+        :param start: the start timestamp of the backtests
+        :param end: the end timestamp of the backtests
+        :param backtesting_resolution: the interval of the candles used to simulate the executors
+        :param trade_cost: the cost per trade
+        :param max_workers: the number of worker processes, defaults to the number of CPUs
+        :param vectorized: whether to use the vectorized simulation of the BacktestingEngineBase
+        :param candles_store: the local candles store used to download the candles
+        :param controllers_module: the module where the controllers are defined
+        """
+        self._base_config = base_config
+        self._start = start
+        self._end = end
+        self._backtesting_resolution = backtesting_resolution
+        self._trade_cost = trade_cost
+        self._max_workers = max_workers or os.cpu_count()
+        self._vectorized = vectorized
+        self._candles_store = candles_store
+        self._controllers_module = controllers_module
+        self._shared_memories: List[shared_memory.SharedMemory] = []
+
+    @staticmethod
+    def results_columns(overrides: List[Dict[str, Any]]) -> List[str]:
+        override_keys = list(dict.fromkeys(key for override in overrides for key in override))
+        return override_keys + list(BacktestingEngineBase.summarize_results([]).keys()) + ["error"]
+
+    async def run(self, overrides: List[Dict[str, Any]], output_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        Runs the backtests of all the overrides.
+        :param overrides: the config overrides of each backtest
+        :param output_path: if provided, each result is appended to this CSV file as soon as it is available
+        :return: a DataFrame with the overrides and the summary of each backtest
+        """
+        columns = self.results_columns(overrides)
+        if output_path is not None:
+            pd.DataFrame(columns=columns).to_csv(output_path, index=False)
+        rows = []
+        async for row in self.iter_results(overrides):
+            if output_path is not None:
+                pd.DataFrame([row], columns=columns).to_csv(output_path, mode="a", index=False, header=False)
+            rows.append(row)
+        return pd.DataFrame(rows, columns=columns)
+
+    async def iter_results(self, overrides: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Runs the backtests of all the overrides, yielding the result of each one in completion order.
+        """
+        shared_candles, trading_rules = await self._prepare_shared_data()
+        try:
+            with ProcessPoolExecutor(max_workers=self._max_workers,
+                                     initializer=_init_worker,
+                                     initargs=(shared_candles, trading_rules, self._candles_store)) as executor:
+                loop = asyncio.get_event_loop()
+                futures = [loop.run_in_executor(executor, _run_backtest_in_process, self._task(override))
+                           for override in overrides]
+                for future in asyncio.as_completed(futures):
+                    yield await future
+        finally:
+            self._release_shared_memories()
+
+    def _task(self, overrides: Dict[str, Any]) -> SweepTask:
+        return SweepTask(
+            base_config=self._base_config,
+            overrides=overrides,
+            start=self._start,
+            end=self._end,
+            backtesting_resolution=self._backtesting_resolution,
+            trade_cost=self._trade_cost,
+            vectorized=self._vectorized,
+            controllers_module=self._controllers_module,
+        )
+
+    async def _prepare_shared_data(self) -> Tuple[List[SharedCandles], Dict[str, Dict]]:
+        engine = BacktestingEngineBase(candles_store=self._candles_store)
+        data_provider = engine.backtesting_data_provider
+        controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+            dict(self._base_config), self._controllers_module)
+        data_provider.update_backtesting_time(self._start, self._end)
+        await data_provider.initialize_trading_rules(controller_config.connector_name)
+        candles_configs = [CandlesConfig(connector=controller_config.connector_name,
+                                         trading_pair=controller_config.trading_pair,
+                                         interval=self._backtesting_resolution)] + list(controller_config.candles_config)
+        for candles_config in candles_configs:
+            await data_provider.get_candles_feed(candles_config)
+
+        shared_candles = [self._share_candles(key, candles_df)
+                          for key, candles_df in data_provider.candles_feeds.items() if not candles_df.empty]
+        trading_rule = data_provider.get_trading_rules(controller_config.connector_name, controller_config.trading_pair)
+        trading_rules = {controller_config.connector_name: {controller_config.trading_pair: trading_rule}}
+        return shared_candles, trading_rules
+
+    def _share_candles(self, key: str, candles_df: pd.DataFrame) -> SharedCandles:
+        values = candles_df.to_numpy(dtype=np.float64)
+        shm = shared_memory.SharedMemory(create=True, size=values.nbytes)
+        np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+        self._shared_memories.append(shm)
+        return SharedCandles(key=key, shm_name=shm.name, shape=values.shape, columns=list(candles_df.columns))
+
+    def _release_shared_memories(self):
+        for shm in self._shared_memories:
+            shm.close()
+            shm.unlink()
+        self._shared_memories = []
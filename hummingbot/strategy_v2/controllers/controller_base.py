@@ -2,7 +2,7 @@ import asyncio
 import importlib
 import inspect
 from decimal import Decimal
-from typing import TYPE_CHECKING, Callable, List
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 from pydantic import ConfigDict, Field, field_validator
 
@@ -200,6 +200,21 @@ class ControllerBase(RunnableBase):
         """
         raise NotImplementedError
 
+    def get_signal_columns(self) -> Optional[List[str]]:
+        """
+        Returns the columns of the processed features that the decisions of the controller depend on. The vectorized
+        backtesting only evaluates the controller on the bars where one of them changes, where an executor closes or
+        after the wakeup interval. None, the default, evaluates the controller on every bar.
+        """
+        return None
+
+    def get_wakeup_interval(self) -> Optional[float]:
+        """
+        Returns the time after which the controller can take another decision without any change of its signal
+        columns or executors (e.g. a cooldown), or None if its decisions do not depend on the elapsed time.
+        """
+        return None
+
     def to_format_status(self) -> List[str]:
         """
         This method should be overridden by the derived classes to implement the logic to format the status of the
@@ -213,6 +213,15 @@ class DirectionalTradingControllerBase(ControllerBase):
         stop_actions = []
         return stop_actions
 
+    def get_signal_columns(self) -> Optional[List[str]]:
+        """
+        The executors are created from the signal. Controllers acting on other features have to add them.
+        """
+        return ["signal"]
+
+    def get_wakeup_interval(self) -> Optional[float]:
+        return float(self.config.cooldown_time)
+
     def get_executor_config(self, trade_type: TradeType, price: Decimal, amount: Decimal):
         """
         Get the executor config based on the trade_type, price and amount. This method can be overridden by the
@@ -297,6 +297,19 @@ class MarketMakingControllerBase(ControllerBase):
             controller_id=self.config.id,
             executor_id=executor.id) for executor in executors_to_refresh]
 
+    def get_signal_columns(self) -> Optional[List[str]]:
+        """
+        The levels are placed around the reference price with the spread multiplier. Controllers acting on other
+        features have to add them.
+        """
+        return ["reference_price", "spread_multiplier"]
+
+    def get_wakeup_interval(self) -> Optional[float]:
+        """
+        The executors are refreshed, and the levels stopped by a stop loss are placed again, after some time.
+        """
+        return float(min(self.config.executor_refresh_time, self.config.cooldown_time))
+
     def executors_to_early_stop(self) -> List[ExecutorAction]:
         """
         Get the executors to early stop based on the current state of market data. This method can be overridden to
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, Union
+from typing import Dict, Tuple, Union
 
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -318,6 +318,10 @@ class ArbitrageExecutor(ExecutorBase):
             self.place_sell_arbitrage_order()
             self._cumulative_failures += 1
 
+    def get_custom_info_state(self) -> Tuple:
+        return (self._last_buy_price, self._last_sell_price, self._trade_pnl_pct, self._last_tx_cost,
+                self._current_profitability, self._cumulative_failures)
+
     def get_custom_info(self) -> Dict:
         return {
             "buy_connector": self.buying_market.connector_name,
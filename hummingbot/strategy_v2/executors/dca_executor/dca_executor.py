@@ -2,7 +2,7 @@ import asyncio
 import logging
 import math
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -518,6 +518,10 @@ class DCAExecutor(ExecutorBase):
             self._total_executed_amount_backup += event.amount
         self.update_tracked_orders_with_order_id(event.order_id)
 
+    def get_custom_info_state(self) -> Tuple:
+        return (self.current_market_price, self.close_price, len(self._open_orders), len(self._close_orders),
+                self._trailing_stop_trigger_pct, self._total_executed_amount_backup, self._current_retries)
+
     def get_custom_info(self) -> Dict:
         return {
             "side": self.config.side,
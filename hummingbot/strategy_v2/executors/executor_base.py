@@ -45,6 +45,8 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp: Optional[float] = None
         self._strategy: ScriptStrategyBase = strategy
         self._held_position_orders = []  # Keep track of orders that become held positions
+        self._executor_info: Optional[ExecutorInfo] = None
+        self._executor_info_key: Optional[Tuple] = None
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
@@ -106,8 +108,40 @@ class ExecutorBase(RunnableBase):
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
+        Returns the executor info. The snapshot is cached and only rebuilt when the status, the close type, the fills,
+        the fees or the PnL of the executor changed since it was built, or when it was invalidated.
         """
+        key = self._get_executor_info_key()
+        if self._executor_info is None or key != self._executor_info_key:
+            self._executor_info = self._build_executor_info()
+            self._executor_info_key = key
+        return self._executor_info
+
+    def invalidate_executor_info(self):
+        """
+        Forces the executor info to be rebuilt the next time it is accessed.
+        """
+        self._executor_info = None
+
+    def _get_executor_info_key(self) -> Tuple:
+        """
+        Returns the values that the cached executor info depends on. The PnL is included to reflect the price driven
+        updates.
+        """
+        values = (self._status, self.close_type, self.close_timestamp, self.net_pnl_quote, self.filled_amount_quote,
+                  self.cum_fees_quote, len(self._held_position_orders)) + self.get_custom_info_state()
+        # NaN is never equal to itself, it is replaced to compare the keys
+        return tuple(None if isinstance(value, Decimal) and value.is_nan() else value for value in values)
+
+    def get_custom_info_state(self) -> Tuple:
+        """
+        Returns the values of the custom info that can change while the status, the fills and the PnL of the executor
+        stay the same, including the market prices it reports. Returns an empty tuple by default, and can be
+        reimplemented by subclasses.
+        """
+        return ()
+
+    def _build_executor_info(self) -> ExecutorInfo:
         ei = ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
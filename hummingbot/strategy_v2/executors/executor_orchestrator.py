@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.data_types import PositionSummary
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.order_executor.order_executor import OrderExecutor
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -132,6 +133,65 @@ class PositionHold:
             cum_fees_quote=self.cum_fees_quote)
 
 
+class ActiveExecutorsPerformance:
+    """
+    Running performance totals of the active executors of a controller. Each executor contributes the values of its
+    last executor info snapshot, which are only replaced when the executor returns a new snapshot.
+    """
+    def __init__(self):
+        self.realized_pnl_quote = Decimal("0")
+        self.unrealized_pnl_quote = Decimal("0")
+        self.volume_traded = Decimal("0")
+        self.close_type_counts: Dict[CloseType, int] = {}
+        self._snapshots: Dict[ExecutorBase, ExecutorInfo] = {}
+
+    def update(self, executor: ExecutorBase, executor_info: ExecutorInfo):
+        previous_info = self._snapshots.get(executor)
+        if previous_info is executor_info:
+            return
+        if previous_info is not None:
+            self._apply(previous_info, -1)
+        self._apply(executor_info, 1)
+        self._snapshots[executor] = executor_info
+
+    def remove(self, executor: ExecutorBase):
+        previous_info = self._snapshots.pop(executor, None)
+        if previous_info is not None:
+            self._apply(previous_info, -1)
+
+    def retain(self, executors: List[ExecutorBase]):
+        """
+        Removes the contributions of the executors that are no longer active.
+        """
+        if len(self._snapshots) > len(executors) or any(executor not in self._snapshots for executor in executors):
+            active_executors = set(executors)
+            for executor in [executor for executor in self._snapshots if executor not in active_executors]:
+                self.remove(executor)
+
+    @staticmethod
+    def _finite_or_zero(value: Decimal) -> Decimal:
+        """
+        Non finite values (e.g. the NaN pnl of an executor without a market price yet) would poison the running
+        totals forever, so they contribute zero. Being a pure function of the snapshot, the same value is subtracted
+        when the snapshot is replaced.
+        """
+        return Decimal("0") if isinstance(value, Decimal) and not value.is_finite() else value
+
+    def _apply(self, executor_info: ExecutorInfo, sign: int):
+        net_pnl_quote = self._finite_or_zero(executor_info.net_pnl_quote)
+        if not executor_info.is_done:
+            self.unrealized_pnl_quote += sign * net_pnl_quote
+        else:
+            self.realized_pnl_quote += sign * net_pnl_quote
+            if executor_info.close_type:
+                count = self.close_type_counts.get(executor_info.close_type, 0) + sign
+                if count:
+                    self.close_type_counts[executor_info.close_type] = count
+                else:
+                    self.close_type_counts.pop(executor_info.close_type, None)
+        self.volume_traded += sign * self._finite_or_zero(executor_info.filled_amount_quote)
+
+
 class ExecutorOrchestrator:
     """
     Orchestrator for various executors.
@@ -165,6 +225,7 @@ class ExecutorOrchestrator:
         self.positions_held = {}
         self.executors_ids_position_held = deque(maxlen=50)
         self.cached_performance = {}
+        self.active_executors_performance: Dict[str, ActiveExecutorsPerformance] = {}
         self.initial_positions_by_controller = initial_positions_by_controller or {}
         self._initialize_cached_performance()
 
@@ -305,6 +366,7 @@ class ExecutorOrchestrator:
         self.store_all_positions()
         # Clear executors and trigger garbage collection
         self.active_executors.clear()
+        self.active_executors_performance.clear()
 
     def store_all_positions(self):
         """
@@ -350,6 +412,7 @@ class ExecutorOrchestrator:
                 MarketsRecorder.get_instance().store_or_update_executor(executor)
         # Remove the executors from the list
         self.active_executors = {}
+        self.active_executors_performance = {}
 
     def execute_action(self, action: ExecutorAction):
         """
@@ -522,6 +585,8 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor info: {executor.executor_info} | Config: {executor.config}")
 
         self.active_executors[controller_id].remove(executor)
+        if controller_id in self.active_executors_performance:
+            self.active_executors_performance[controller_id].remove(executor)
         del executor
         # Trigger garbage collection after executor cleanup
 
@@ -530,10 +595,31 @@ class ExecutorOrchestrator:
         Generate a report of all executors.
         """
         report = {}
-        for controller_id, executors_list in self.active_executors.items():
-            report[controller_id] = [executor.executor_info for executor in executors_list if executor]
+        for controller_id in self.active_executors.keys():
+            report[controller_id] = self._update_active_executors_performance(controller_id)
+        for controller_id in [controller_id for controller_id in self.active_executors_performance
+                              if controller_id not in self.active_executors]:
+            del self.active_executors_performance[controller_id]
         return report
 
+    def _update_active_executors_performance(self, controller_id: str) -> List[ExecutorInfo]:
+        """
+        Update the running performance of the active executors of a controller with their executor info snapshots.
+        Only the executors whose snapshot changed since the last update are accounted again.
+        """
+        executors_list = [executor for executor in self.active_executors.get(controller_id, []) if executor]
+        performance = self.active_executors_performance.get(controller_id)
+        if performance is None:
+            performance = ActiveExecutorsPerformance()
+            self.active_executors_performance[controller_id] = performance
+        performance.retain(executors_list)
+        executors_info = []
+        for executor in executors_list:
+            executor_info = executor.executor_info
+            performance.update(executor, executor_info)
+            executors_info.append(executor_info)
+        return executors_info
+
     def get_positions_report(self) -> Dict[str, List[PositionSummary]]:
         """
         Generate a report of all positions held.
@@ -570,12 +656,20 @@ class ExecutorOrchestrator:
             controller_id: {
                 "executors": executors_report.get(controller_id, []),
                 "positions": positions_report.get(controller_id, []),
-                "performance": self.generate_performance_report(controller_id)
+                "performance": self._build_performance_report(controller_id)
             }
             for controller_id in all_controller_ids
         }
 
     def generate_performance_report(self, controller_id: str) -> PerformanceReport:
+        self._update_active_executors_performance(controller_id)
+        return self._build_performance_report(controller_id)
+
+    def _build_performance_report(self, controller_id: str) -> PerformanceReport:
+        """
+        Build the performance report of a controller from the cached performance of the stored executors, the running
+        performance of the active executors and the positions held.
+        """
         # Create a new report starting from cached base values
         report = PerformanceReport()
         cached_report = self.cached_performance.get(controller_id, PerformanceReport())
@@ -586,20 +680,15 @@ class ExecutorOrchestrator:
         report.close_type_counts = cached_report.close_type_counts.copy() if cached_report.close_type_counts else {}
 
         # Add data from active executors
-        active_executors = self.active_executors.get(controller_id, [])
+        active_performance = self.active_executors_performance.get(controller_id)
+        if active_performance is not None:
+            report.unrealized_pnl_quote += active_performance.unrealized_pnl_quote
+            report.realized_pnl_quote += active_performance.realized_pnl_quote
+            report.volume_traded += active_performance.volume_traded
+            for close_type, count in active_performance.close_type_counts.items():
+                report.close_type_counts[close_type] = report.close_type_counts.get(close_type, 0) + count
         positions = self.positions_held.get(controller_id, [])
 
-        for executor in active_executors:
-            executor_info = executor.executor_info
-            if not executor_info.is_done:
-                report.unrealized_pnl_quote += executor_info.net_pnl_quote
-            else:
-                report.realized_pnl_quote += executor_info.net_pnl_quote
-                if executor_info.close_type:
-                    report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type, 0) + 1
-
-            report.volume_traded += executor_info.filled_amount_quote
-
         # Add data from positions held and collect position summaries
         positions_summary = []
         for position in positions:
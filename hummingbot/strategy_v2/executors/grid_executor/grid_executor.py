@@ -2,7 +2,7 @@ import asyncio
 import logging
 import math
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -670,6 +670,10 @@ class GridExecutor(ExecutorBase):
                 self.logger().debug("Removing open order")
                 self.logger().debug(f"Executor ID: {self.config.id} - Canceling open order {order.order_id}")
 
+    def get_custom_info_state(self) -> Tuple:
+        return (tuple(level.state for level in self.grid_levels), len(self._filled_orders), len(self._failed_orders),
+                len(self._canceled_orders), self.open_liquidity_placed, self.close_liquidity_placed)
+
     def get_custom_info(self) -> Dict:
         held_position_value = sum([
             Decimal(order["executed_amount_quote"])
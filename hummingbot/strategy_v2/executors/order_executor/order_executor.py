@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
@@ -259,6 +259,11 @@ class OrderExecutor(ExecutorBase):
             self.logger().error(f"Order failed {event.order_id}. Retrying {self._current_retries}/{self._max_retries}")
             self._current_retries += 1
 
+    def get_custom_info_state(self) -> Tuple:
+        return (self._current_retries,
+                self._order.order_id if self._order else None,
+                self._order.last_update_timestamp if self._order else None)
+
     def get_custom_info(self) -> Dict:
         """
         Get custom information about the executor.
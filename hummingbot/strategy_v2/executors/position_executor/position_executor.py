@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -692,6 +692,13 @@ class PositionExecutor(ExecutorBase):
             self._take_profit_limit_order = None
             self.logger().error(f"Take profit order failed {event.order_id}. Retrying {self._current_retries}/{self._max_retries}")
 
+    def get_custom_info_state(self) -> Tuple:
+        return (self.close_price,
+                self._current_retries,
+                self._open_order.last_update_timestamp if self._open_order else None,
+                tuple(order.order_id for order in [self._open_order, self._close_order, self._take_profit_limit_order]
+                      if order))
+
     def get_custom_info(self) -> Dict:
         return {
             "level_id": self.config.level_id,
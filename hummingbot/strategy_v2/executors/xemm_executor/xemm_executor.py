@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Tuple
 
 from hummingbot.connector.connector_base import ConnectorBase, Union
 from hummingbot.connector.utils import split_hb_trading_pair
@@ -297,6 +297,10 @@ class XEMMExecutor(ExecutorBase):
             self._current_retries += 1
             self.place_taker_order()
 
+    def get_custom_info_state(self) -> Tuple:
+        return (self._current_trade_profitability, self._tx_cost, self._tx_cost_pct, self._taker_result_price,
+                self._maker_target_price)
+
     def get_custom_info(self) -> Dict:
         # Since we can't make this method async, we'll skip the profitability calculation
         # The profitability will still be shown in the status message which is async
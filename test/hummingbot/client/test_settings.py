@@ -1,8 +1,19 @@
+import json
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot import root_path
+from hummingbot.client.settings import (
+    AllConnectorSettings,
+    ConnectorSetting,
+    ConnectorType,
+    LazyConfigKeys,
+    LazyConnectorSetting,
+)
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -61,3 +72,100 @@ class SettingsTest(unittest.TestCase):
         }
 
         self.assertEqual(expected_params, params)
+
+
+class AllConnectorSettingsManifestTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.previous_settings = AllConnectorSettings.all_connector_settings
+        self.manifest_dir = tempfile.TemporaryDirectory()
+        manifest_path_patch = patch.object(AllConnectorSettings, "connector_settings_manifest_path",
+                                           os.path.join(self.manifest_dir.name, "manifest.json"))
+        util_modules_patch = patch.object(
+            AllConnectorSettings, "_connector_util_modules",
+            return_value=[("exchange", "binance", str(root_path() / "hummingbot" / "connector" / "exchange" / "binance"))])
+        manifest_path_patch.start()
+        util_modules_patch.start()
+        self.addCleanup(manifest_path_patch.stop)
+        self.addCleanup(util_modules_patch.stop)
+
+    def tearDown(self):
+        AllConnectorSettings.all_connector_settings = self.previous_settings
+        self.manifest_dir.cleanup()
+        super().tearDown()
+
+    def test_settings_are_read_from_manifest_without_importing_utils_modules(self):
+        settings = AllConnectorSettings.create_connector_settings()
+        self.assertTrue(os.path.exists(AllConnectorSettings.connector_settings_manifest_path))
+
+        with patch.object(AllConnectorSettings, "_import_connector_settings") as import_mock:
+            cached_settings = AllConnectorSettings.create_connector_settings()
+
+        import_mock.assert_not_called()
+        self.assertEqual(["binance", "binance_us"], sorted(cached_settings.keys()))
+        self.assertEqual(settings["binance"].trade_fee_schema, cached_settings["binance"].trade_fee_schema)
+        self.assertEqual("us", cached_settings["binance_us"].domain_parameter)
+        self.assertEqual("binance_us", cached_settings["binance_us"].config_keys.connector)
+        self.assertEqual("binance", cached_settings["binance"].config_keys.connector)
+
+    def test_manifest_is_stored_as_json_with_the_hummingbot_version(self):
+        AllConnectorSettings.create_connector_settings()
+
+        with open(AllConnectorSettings.connector_settings_manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        version = (root_path() / "hummingbot" / "VERSION").read_text().strip()
+        self.assertEqual(version, manifest["key"]["version"])
+        self.assertEqual("exchange", manifest["connector_settings"]["binance"]["type"])
+        self.assertNotIn("config_keys", manifest["connector_settings"]["binance"])
+
+    def test_manifest_is_rebuilt_when_the_version_changes(self):
+        AllConnectorSettings.create_connector_settings()
+        manifest_key = AllConnectorSettings._connector_settings_manifest_key(
+            AllConnectorSettings._connector_util_modules())
+
+        with patch.object(AllConnectorSettings, "_connector_settings_manifest_key",
+                          return_value={**manifest_key, "version": "0.0.0"}):
+            with patch.object(AllConnectorSettings, "_import_connector_settings",
+                              return_value=({}, True)) as import_mock:
+                AllConnectorSettings.create_connector_settings()
+
+        import_mock.assert_called_once()
+
+    def test_corrupted_manifest_is_ignored(self):
+        AllConnectorSettings.create_connector_settings()
+        with open(AllConnectorSettings.connector_settings_manifest_path, "w") as manifest_file:
+            manifest_file.write("not json")
+
+        with patch.object(AllConnectorSettings, "_import_connector_settings",
+                          return_value=({}, True)) as import_mock:
+            AllConnectorSettings.create_connector_settings()
+
+        import_mock.assert_called_once()
+
+    def test_manifest_is_rebuilt_when_utils_modules_change(self):
+        AllConnectorSettings.create_connector_settings()
+
+        with patch.object(AllConnectorSettings, "_connector_settings_manifest_key",
+                          return_value={"version": "", "files": [["changed", 1]]}):
+            with patch.object(AllConnectorSettings, "_import_connector_settings",
+                              return_value=({}, True)) as import_mock:
+                AllConnectorSettings.create_connector_settings()
+
+        import_mock.assert_called_once()
+
+    def test_manifest_is_not_written_if_a_connector_cannot_be_imported(self):
+        with patch.object(AllConnectorSettings, "_import_connector_settings", return_value=({}, False)):
+            AllConnectorSettings.create_connector_settings()
+
+        self.assertFalse(os.path.exists(AllConnectorSettings.connector_settings_manifest_path))
+
+    def test_paper_trade_settings_keep_config_keys_lazy(self):
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        paper_trade_settings = AllConnectorSettings.all_connector_settings["binance_paper_trade"]
+        self.assertIsInstance(paper_trade_settings, LazyConnectorSetting)
+        self.assertEqual(LazyConfigKeys("hummingbot.connector.exchange.binance.binance_utils"),
+                         tuple.__getitem__(paper_trade_settings, ConnectorSetting._fields.index("config_keys")))
+        self.assertEqual("binance", paper_trade_settings.parent_name)
+        self.assertEqual("binance", paper_trade_settings.config_keys.connector)
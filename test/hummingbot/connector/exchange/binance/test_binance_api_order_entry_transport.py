@@ -0,0 +1,46 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
+from hummingbot.connector.exchange.binance.binance_api_order_entry_transport import BinanceAPIOrderEntryTransport
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+
+
+class BinanceAPIOrderEntryTransportTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        mock_time_provider = MagicMock()
+        mock_time_provider.time.return_value = 1234567890.000
+        self.auth = BinanceAuth(api_key="testApiKey", secret_key="testSecret", time_provider=mock_time_provider)
+        self.transport = BinanceAPIOrderEntryTransport(
+            auth=self.auth,
+            api_factory=WebAssistantsFactory(throttler=AsyncThrottler(CONSTANTS.RATE_LIMITS)))
+
+    def test_request_payload_is_signed(self):
+        params = {"symbol": "COINALPHAHBOT", "origClientOrderId": "OID1"}
+
+        payload = self.transport._request_payload(
+            request_id="7", method=CONSTANTS.WS_API_ORDER_CANCEL_METHOD, params=params)
+
+        self.assertEqual("7", payload["id"])
+        self.assertEqual(CONSTANTS.WS_API_ORDER_CANCEL_METHOD, payload["method"])
+        self.assertEqual(self.auth.add_auth_to_ws_api_params(params=params), payload["params"])
+
+    def test_response_request_id(self):
+        self.assertEqual("7", self.transport._response_request_id({"id": "7", "status": 200, "result": {}}))
+        self.assertIsNone(self.transport._response_request_id({"e": "executionReport"}))
+
+    def test_process_response(self):
+        result = {"orderId": 28, "transactTime": 1507725176595}
+
+        self.assertEqual(result, self.transport._process_response(
+            method=CONSTANTS.WS_API_ORDER_PLACE_METHOD, response={"id": "1", "status": 200, "result": result}))
+
+        error_response = {"id": "2", "status": 400, "error": {"code": -2011, "msg": "Unknown order sent."}}
+        with self.assertRaises(IOError) as context:
+            self.transport._process_response(method=CONSTANTS.WS_API_ORDER_CANCEL_METHOD, response=error_response)
+        self.assertIn("-2011", str(context.exception))
+        self.assertIn("Unknown order sent", str(context.exception))
@@ -49,3 +49,29 @@ class BinanceAuthTests(TestCase):
         self.assertEqual(now * 1e3, configured_request.params["timestamp"])
         self.assertEqual(expected_signature, configured_request.params["signature"])
         self.assertEqual({"X-MBX-APIKEY": self._api_key}, configured_request.headers)
+
+    def test_add_auth_to_ws_api_params(self):
+        now = 1234567890.000
+        mock_time_provider = MagicMock()
+        mock_time_provider.time.return_value = now
+
+        params = {
+            "symbol": "LTCBTC",
+            "side": "BUY",
+            "type": "LIMIT",
+            "quantity": "1",
+        }
+
+        auth = BinanceAuth(api_key=self._api_key, secret_key=self._secret, time_provider=mock_time_provider)
+        signed_params = auth.add_auth_to_ws_api_params(params=params)
+
+        expected_payload = (f"apiKey={self._api_key}&quantity=1&side=BUY&symbol=LTCBTC&timestamp=1234567890000"
+                            f"&type=LIMIT")
+        expected_signature = hmac.new(
+            self._secret.encode("utf-8"),
+            expected_payload.encode("utf-8"),
+            hashlib.sha256).hexdigest()
+        self.assertEqual(["apiKey", "quantity", "side", "symbol", "timestamp", "type", "signature"],
+                         list(signed_params.keys()))
+        self.assertEqual(expected_signature, signed_params["signature"])
+        self.assertNotIn("apiKey", params)
@@ -3,13 +3,14 @@ import json
 import re
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Tuple
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
 
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.order_entry_transport import OrderEntryTransportNotConnectedError
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -1153,6 +1154,114 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 price=Decimal("2"),
             ))
 
+    def test_place_order_through_ws_api_when_connected(self):
+        self.exchange._order_entry_transport = MagicMock(is_connected=True)
+        self.exchange._order_entry_transport.send_request = AsyncMock(
+            return_value=self.order_creation_request_successful_mock_response)
+
+        o_id, transact_time = self.async_run_with_timeout(self.exchange._place_order_through_available_transport(
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            amount=Decimal("1"),
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("2"),
+        ))
+
+        self.assertEqual(str(self.expected_exchange_order_id), o_id)
+        self.assertEqual(1507725176.595, transact_time)
+        self.exchange._order_entry_transport.send_request.assert_awaited_once_with(
+            method=CONSTANTS.WS_API_ORDER_PLACE_METHOD,
+            params={"symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                    "side": CONSTANTS.SIDE_BUY,
+                    "quantity": "1",
+                    "type": "LIMIT",
+                    "newClientOrderId": "OID1",
+                    "price": "2",
+                    "timeInForce": CONSTANTS.TIME_IN_FORCE_GTC},
+            throttler_limit_id=CONSTANTS.ORDER_PATH_URL)
+
+    @aioresponses()
+    def test_place_order_through_ws_api_manage_server_overloaded_error_unknown_order(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        transport = self.exchange._create_order_entry_transport()
+        overloaded_error_response = {
+            "id": "1",
+            "status": 503,
+            "error": {"code": -1000, "msg": "Unknown error, please check your request or try again later."},
+        }
+        other_error_response = {"id": "2", "status": 503, "error": {"code": -1000, "msg": "Service Unavailable."}}
+        errors = []
+        for response in (overloaded_error_response, other_error_response):
+            with self.assertRaises(IOError) as context:
+                transport._process_response(CONSTANTS.WS_API_ORDER_PLACE_METHOD, response)
+            errors.append(context.exception)
+        self.exchange._order_entry_transport = MagicMock(is_connected=True)
+        self.exchange._order_entry_transport.send_request = AsyncMock(side_effect=errors)
+        url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        mock_api.post(url, body=json.dumps(self.order_creation_request_successful_mock_response))
+        order_params = dict(
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            amount=Decimal("1"),
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("2"),
+        )
+
+        o_id, _ = self.async_run_with_timeout(
+            self.exchange._place_order_through_available_transport(**order_params))
+
+        self.assertEqual("UNKNOWN", o_id)
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.exchange._place_order_through_available_transport(**order_params))
+        # The request reached the exchange, so the order is never sent again through REST
+        self.assertEqual(0, len(self._all_executed_requests(mock_api, url)))
+
+    @aioresponses()
+    def test_place_order_falls_back_to_rest_when_ws_api_is_disconnected(self, mock_api):
+        self.exchange._order_entry_transport = MagicMock(is_connected=True)
+        self.exchange._order_entry_transport.send_request = AsyncMock(
+            side_effect=OrderEntryTransportNotConnectedError("disconnected"))
+        url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        mock_api.post(url, body=json.dumps(self.order_creation_request_successful_mock_response))
+
+        o_id, _ = self.async_run_with_timeout(self.exchange._place_order_through_available_transport(
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            amount=Decimal("1"),
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("2"),
+        ))
+
+        self.assertEqual(str(self.expected_exchange_order_id), o_id)
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, url)))
+
+    def test_place_cancel_through_ws_api_when_connected(self):
+        self.exchange._order_entry_transport = MagicMock(is_connected=True)
+        self.exchange._order_entry_transport.send_request = AsyncMock(
+            return_value={"origClientOrderId": "OID1", "status": "CANCELED"})
+        order = InFlightOrder(
+            client_order_id="OID1",
+            exchange_order_id=str(self.expected_exchange_order_id),
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("2"),
+            creation_timestamp=1640780000)
+
+        cancelled = self.async_run_with_timeout(
+            self.exchange._place_cancel_through_available_transport(order_id="OID1", tracked_order=order))
+
+        self.assertTrue(cancelled)
+        self.exchange._order_entry_transport.send_request.assert_awaited_once_with(
+            method=CONSTANTS.WS_API_ORDER_CANCEL_METHOD,
+            params={"symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                    "origClientOrderId": "OID1"},
+            throttler_limit_id=CONSTANTS.ORDER_PATH_URL)
+
     def test_format_trading_rules__min_notional_present(self):
         trading_rules = [{
             "symbol": "COINALPHAHBOT",
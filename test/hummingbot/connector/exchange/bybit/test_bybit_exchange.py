@@ -18,6 +18,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -767,6 +768,99 @@ class TestBybitExchange(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_batch_order_create_places_orders_in_one_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_PLACE_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "EOID1", "orderLinkId": "OID1",
+                     "createAt": "1640780000000"},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "", "orderLinkId": "OID2",
+                     "createAt": ""},
+                ]
+            },
+            "retExtInfo": {"list": [{"code": 0, "msg": "OK"}, {"code": 170131, "msg": "Insufficient balance."}]},
+            "time": 1640780000000
+        }
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        orders = [
+            LimitOrder(client_order_id=order_id, trading_pair=self.trading_pair, is_buy=order_id == "OID1",
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("100"))
+            for order_id in ["OID1", "OID2"]
+        ]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self._validate_auth_credentials_present(order_request[1][0])
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(self.exchange._category, request_data["category"])
+        self.assertEqual(["OID1", "OID2"], [order_data["orderLinkId"] for order_data in request_data["request"]])
+        self.assertEqual([CONSTANTS.SIDE_BUY, CONSTANTS.SIDE_SELL],
+                         [order_data["side"] for order_data in request_data["request"]])
+        self.assertEqual(self.ex_trading_pair, request_data["request"][0]["symbol"])
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID2", failure_event.order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_cancels_orders_in_one_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id in ["OID1", "OID2"]:
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"E{order_id}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "EOID1", "orderLinkId": "OID1"},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "EOID2", "orderLinkId": "OID2"},
+                ]
+            },
+            "retExtInfo": {"list": [{"code": 0, "msg": "OK"}, {"code": 170213, "msg": "Order does not exist."}]},
+            "time": 1640780000000
+        }
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        orders_to_cancel = [order.to_limit_order() for order in self.exchange.in_flight_orders.values()]
+        results = self.async_run_with_timeout(
+            self.exchange._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        request_data = json.loads(cancel_request[1][0].kwargs["data"])
+        self.assertEqual([{"symbol": self.ex_trading_pair, "orderId": "EOID1"},
+                          {"symbol": self.ex_trading_pair, "orderId": "EOID2"}],
+                         request_data["request"])
+        self.assertEqual({"OID1": True, "OID2": False}, {result.order_id: result.success for result in results})
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertEqual("OID1", self.order_cancelled_logger.event_log[0].order_id)
+        self.assertIn("OID2", self.exchange.in_flight_orders)
+
     @aioresponses()
     def test_cancel_orders_with_cancel_all(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import TokenAmount
@@ -847,6 +848,79 @@ class TestGateIoExchange(IsolatedAsyncioWrapperTestCase):
             )
         )
 
+    @aioresponses()
+    async def test_batch_order_create_places_orders_in_one_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CREATE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = [
+            {**self.get_order_create_response_mock(), "text": "OID1", "id": "EOID1", "succeeded": True},
+            {"text": "OID2", "succeeded": False, "label": "BALANCE_NOT_ENOUGH", "message": "Not enough balance"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp), status=201)
+
+        orders = [
+            LimitOrder(client_order_id=order_id, trading_pair=self.trading_pair, is_buy=True,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("5.1"), quantity=Decimal("1"))
+            for order_id in ["OID1", "OID2"]
+        ]
+        await self.exchange._execute_batch_order_create(orders_to_create=orders)
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order_data["text"] for order_data in request_data])
+        self.assertEqual(self.ex_trading_pair, request_data[0]["currency_pair"])
+        self.assertEqual(Decimal("5.1"), Decimal(request_data[0]["price"]))
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID2", failure_event.order_id)
+
+    @aioresponses()
+    async def test_batch_order_cancel_cancels_orders_in_one_request(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id in ["OID1", "OID2", "OID3"]:
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"E{order_id}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_DELETE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = [
+            {"currency_pair": self.ex_trading_pair, "id": "EOID1", "succeeded": True},
+            {"currency_pair": self.ex_trading_pair, "id": "EOID2", "succeeded": False,
+             "label": CONSTANTS.ERR_LABEL_ORDER_NOT_FOUND, "message": "Order not found"},
+            {"currency_pair": self.ex_trading_pair, "id": "EOID3", "succeeded": False,
+             "label": "SERVER_ERROR", "message": "Internal server error"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp))
+
+        orders_to_cancel = [order.to_limit_order() for order in self.exchange.in_flight_orders.values()]
+        results = await self.exchange._execute_batch_cancel(orders_to_cancel=orders_to_cancel)
+
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        self.assertEqual(
+            [{"currency_pair": self.ex_trading_pair, "id": f"EOID{i}"} for i in range(1, 4)],
+            json.loads(cancel_request[1][0].kwargs["data"]))
+        self.assertEqual([CancellationResult("OID1", True),
+                          CancellationResult("OID2", False),
+                          CancellationResult("OID3", False)], results)
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertEqual("OID1", self.order_cancelled_logger.event_log[0].order_id)
+        self.assertTrue(self._is_logged("WARNING", "Failed to cancel order OID2 (order not found)"))
+        self.assertIn("OID3", self.exchange.in_flight_orders)
+
     def test_cancel_order_without_exchange_order_id_marks_order_as_fail_after_retries(self):
         update_event = MagicMock()
         update_event.wait.side_effect = asyncio.TimeoutError
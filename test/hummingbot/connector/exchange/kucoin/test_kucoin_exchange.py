@@ -19,6 +19,8 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase, TradeFeeSchema
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -713,6 +715,57 @@ class KucoinExchangeTests(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    @patch("hummingbot.connector.exchange.kucoin.kucoin_exchange.KucoinExchange.get_price")
+    def test_batch_order_create_places_limit_orders_in_one_request(self, mock_api, get_price_mock):
+        get_price_mock.return_value = Decimal(1000)
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        multi_url = web_utils.private_rest_url(CONSTANTS.ORDERS_PATH_URL + CONSTANTS.MULTIPLE_ORDERS_PATH_SUFFIX)
+        url = web_utils.private_rest_url(CONSTANTS.ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{url}$".replace(".", r"\.").replace("?", r"\?"))
+
+        multi_creation_response = {
+            "code": "200000",
+            "data": {
+                "data": [
+                    {"symbol": self.exchange_trading_pair, "id": "EOID1", "clientOid": "OID1", "status": "success",
+                     "failMsg": None},
+                    {"symbol": self.exchange_trading_pair, "id": None, "clientOid": "OID2", "status": "fail",
+                     "failMsg": "Balance insufficient!"},
+                ]
+            }}
+        mock_api.post(multi_url, body=json.dumps(multi_creation_response))
+        mock_api.post(regex_url, body=json.dumps({"code": "200000", "data": {"orderId": "EOID3"}}))
+
+        orders = [
+            LimitOrder(client_order_id=order_id, trading_pair=self.trading_pair, is_buy=True,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("100"))
+            for order_id in ["OID1", "OID2"]
+        ]
+        orders.append(MarketOrder(order_id="OID3", trading_pair=self.trading_pair, is_buy=False,
+                                  base_asset=self.base_asset, quote_asset=self.quote_asset,
+                                  amount=Decimal("100"), timestamp=1640780000))
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders))
+
+        multi_request = next(value for key, value in mock_api.requests.items() if key[1].human_repr() == multi_url)[0]
+        self._validate_auth_credentials_present(multi_request)
+        request_data = json.loads(multi_request.kwargs["data"])
+        self.assertEqual(self.exchange_trading_pair, request_data["symbol"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clientOid"] for order_data in request_data["orderList"]])
+        self.assertEqual(["limit", "limit"], [order_data["type"] for order_data in request_data["orderList"]])
+        self.assertNotIn("symbol", request_data["orderList"][0])
+        # Kucoin can't create market orders in batch
+        single_request = next(value for key, value in mock_api.requests.items() if key[1].human_repr() == url)[0]
+        self.assertEqual("OID3", json.loads(single_request.kwargs["data"])["clientOid"])
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual("EOID3", self.exchange.in_flight_orders["OID3"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID2", failure_event.order_id)
+
     @aioresponses()
     def test_create_order_fails_and_raises_failure_event(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -14,8 +14,15 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
-from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderCancelledEvent, OrderType, TradeType
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderType,
+    TradeType,
+)
 
 
 class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -1350,3 +1357,82 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 f"{Decimal('100.000000')} {self.trading_pair} at {Decimal('10000')}."
             )
         )
+
+    @aioresponses()
+    def test_batch_order_create_sends_orders_in_batch_requests(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        orders = [
+            LimitOrder(client_order_id=f"OID{i}", trading_pair=self.trading_pair, is_buy=i % 2 == 0,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("1"))
+            for i in range(CONSTANTS.MAX_ORDERS_PER_BATCH + 1)
+        ]
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_PLACE_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": order.client_order_id, "ordId": f"EOID{i}", "tag": "",
+                 "sCode": "51008" if i == 1 else "0", "sMsg": "Insufficient balance" if i == 1 else ""}
+                for i, order in enumerate(orders[:CONSTANTS.MAX_ORDERS_PER_BATCH])
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        mock_api.post(self.order_creation_url, body=json.dumps(self.order_creation_request_successful_mock_response))
+
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders))
+
+        batch_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(batch_request)
+        request_data = json.loads(batch_request.kwargs["data"])
+        self.assertEqual([order.client_order_id for order in orders[:CONSTANTS.MAX_ORDERS_PER_BATCH]],
+                         [order_data["clOrdId"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data[:2]])
+        self.assertEqual("10000.0000", request_data[0]["px"])
+        # The order left alone after splitting the orders in batches is created with the single order endpoint
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+
+        self.assertEqual("EOID0", self.exchange.in_flight_orders["OID0"].exchange_order_id)
+        self.assertNotIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual(CONSTANTS.MAX_ORDERS_PER_BATCH,
+                         len(self.buy_order_created_logger.event_log) + len(self.sell_order_created_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID1", failure_event.order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_sends_cancelations_in_one_request(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id in ["OID1", "OID2", "OID3"]:
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"E{order_id}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+        orders_to_cancel = [order.to_limit_order() for order in self.exchange.in_flight_orders.values()]
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": "OID1", "ordId": "EOID1", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "OID2", "ordId": "EOID2", "sCode": "51401", "sMsg": "Order has been canceled"},
+                {"clOrdId": "OID3", "ordId": "EOID3", "sCode": "51410", "sMsg": "Order is pending cancel"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
+        cancel_request = self._all_executed_requests(mock_api, url)[0]
+        self.assertEqual([{"clOrdId": order_id, "instId": self.trading_pair} for order_id in ["OID1", "OID2", "OID3"]],
+                         json.loads(cancel_request.kwargs["data"]))
+        self.assertEqual({"OID1": True, "OID2": True, "OID3": False},
+                         {result.order_id: result.success for result in results})
+        self.assertTrue(self.exchange.in_flight_orders["OID1"].is_pending_cancel_confirmation)
+        self.assertTrue(self.exchange.in_flight_orders["OID2"].is_pending_cancel_confirmation)
+        self.assertTrue(self.exchange.in_flight_orders["OID3"].is_open)
@@ -70,6 +70,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
         self.mock_client.__aexit__.return_value = None
         self.mock_client.is_open = Mock(return_value=True)
         self.data_source._get_client = AsyncMock(return_value=self.mock_client)
+        self.connector._connection_pool.client = Mock(return_value=self.mock_client)
 
     def tearDown(self) -> None:
         # self.listening_task and self.listening_task.cancel()
@@ -246,6 +247,35 @@ class XRPLAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(0, len(bids))
         self.assertEqual(0, len(asks))
 
+    @patch("xrpl.models.requests.BookOffers")
+    async def test_request_order_book_snapshot_uses_pooled_connection(self, mock_book_offers):
+        mock_book_offers.return_value.status = "success"
+        mock_book_offers.return_value.result = {"offers": []}
+        self.mock_client.request.return_value = mock_book_offers.return_value
+
+        await self.data_source._request_order_book_snapshot("SOLO-XRP")
+        await self.data_source._request_order_book_snapshot("SOLO-XRP")
+
+        self.assertEqual(2, self.connector._connection_pool.client.call_count)
+        self.data_source._get_client.assert_not_awaited()
+        # The pooled connection is shared, it is never closed after a request
+        self.mock_client.close.assert_not_awaited()
+
+    @patch("xrpl.models.requests.BookOffers")
+    async def test_request_order_book_snapshot_retries_after_connection_error(self, mock_book_offers):
+        mock_book_offers.return_value.status = "success"
+        mock_book_offers.return_value.result = {"offers": []}
+        self.connector._node_pool._nodes = ["wss://sample.com", "wss://sample2.com"]
+        self.mock_client.request.side_effect = [ConnectionError("Connection lost"),
+                                                mock_book_offers.return_value,
+                                                mock_book_offers.return_value,
+                                                mock_book_offers.return_value]
+
+        order_book = await self.data_source._request_order_book_snapshot("SOLO-XRP")
+
+        self.assertEqual({"asks": [], "bids": []}, order_book)
+        self.assertEqual(2, self.connector._connection_pool.client.call_count)
+
     @patch("xrpl.models.requests.BookOffers")
     async def test_request_order_book_snapshot_exception(self, mock_book_offers):
         mock_book_offers.return_value.status = "error"
@@ -134,6 +134,7 @@ class XRPLExchangeUnitTests(IsolatedAsyncioTestCase):
         self.connector._user_stream_tracker = UserStreamTracker(data_source=self.user_stream_source)
 
         self.connector._get_async_client = AsyncMock(return_value=self.mock_client)
+        self.connector._connection_pool.get_client = AsyncMock(return_value=self.mock_client)
 
         self.connector._lock_delay_seconds = 0
 
@@ -5596,16 +5597,32 @@ class XRPLExchangeUnitTests(IsolatedAsyncioTestCase):
 
     async def test_make_network_check_request_coverage(self):
         """Test _make_network_check_request for basic coverage"""
-        # Mock the _get_async_client method
-        mock_client = AsyncMock()
-        self.connector._get_async_client = AsyncMock(return_value=mock_client)
-
-        # Should open and close client properly
+        # Should get a connection from the pool, without closing it
         await self.connector._make_network_check_request()
 
-        # Verify client was opened and closed
-        mock_client.open.assert_called_once()
-        mock_client.close.assert_called_once()
+        self.connector._connection_pool.get_client.assert_awaited_once()
+        self.mock_client.close.assert_not_called()
+
+    async def test_request_with_retry_reuses_pooled_client(self):
+        self.mock_client.request = AsyncMock(return_value="success")
+        self.connector._sleep = AsyncMock()
+
+        await self.connector.request_with_retry(Request(method=RequestMethod.ACCOUNT_INFO))
+        await self.connector.request_with_retry(Request(method=RequestMethod.ACCOUNT_INFO))
+
+        self.assertEqual(2, self.mock_client.request.await_count)
+        self.mock_client.open.assert_not_called()
+        self.mock_client.close.assert_not_called()
+
+    async def test_request_with_retry_evicts_client_on_connection_error(self):
+        self.mock_client.request = AsyncMock(side_effect=[ConnectionError("Connection lost"), "success"])
+        self.connector._sleep = AsyncMock()
+        self.connector._connection_pool.evict = AsyncMock()
+
+        result = await self.connector.request_with_retry(Request(method=RequestMethod.ACCOUNT_INFO))
+
+        self.assertEqual("success", result)
+        self.connector._connection_pool.evict.assert_awaited_once_with(self.mock_client.url)
 
     async def test_make_trading_rules_request_none_trading_pairs(self):
         """Test _make_trading_rules_request with None trading pairs"""
@@ -5653,7 +5670,7 @@ class XRPLExchangeUnitTests(IsolatedAsyncioTestCase):
                 await self.connector._network_status_ping()
 
             # Network check request success
-            with patch.object(self.connector, '_get_async_client') as client_mock:
+            with patch.object(self.connector._connection_pool, 'get_client') as client_mock:
                 mock_client = AsyncMock()
                 mock_client.request.return_value = Response(
                     type_=ResponseType.RESPONSE, result={"server_info": {}},
@@ -5872,7 +5889,7 @@ class XRPLExchangeUnitTests(IsolatedAsyncioTestCase):
                     pass
 
             # Test 2: Network error in balance update
-            with patch.object(self.connector, '_get_async_client', side_effect=Exception("Network error")):
+            with patch.object(self.connector._connection_pool, 'get_client', side_effect=Exception("Network error")):
                 try:
                     await self.connector._update_balances()
                 except Exception:
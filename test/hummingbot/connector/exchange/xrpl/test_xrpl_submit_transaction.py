@@ -20,12 +20,12 @@ class TestXRPLSubmitTransaction(IsolatedAsyncioTestCase):
         )
         self.exchange._sleep = AsyncMock()
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient")
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient")
     async def test_submit_transaction_success(self, mock_client_class):
         """Test successful transaction submission with proper mocking."""
         # Setup client mock
         mock_client_instance = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_class.return_value = mock_client_instance
 
         # Setup transaction mocks
         mock_transaction = MagicMock(spec=Transaction)
@@ -69,13 +69,13 @@ class TestXRPLSubmitTransaction(IsolatedAsyncioTestCase):
                     mock_signed_tx, mock_client_instance, mock_wallet, autofill=False, fail_hard=True
                 )
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient")
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_constants.PLACE_ORDER_MAX_RETRY", 1)
     async def test_submit_transaction_error_response(self, mock_client_class):
         """Test transaction submission with error response."""
         # Setup client mock
         mock_client_instance = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_class.return_value = mock_client_instance
 
         # Setup transaction mocks
         mock_transaction = MagicMock(spec=Transaction)
@@ -106,13 +106,13 @@ class TestXRPLSubmitTransaction(IsolatedAsyncioTestCase):
                 # Verify error message
                 self.assertIn("Transaction failed after 1 attempts", str(context.exception))
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient")
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_constants.PLACE_ORDER_MAX_RETRY", 1)
     async def test_submit_transaction_exception(self, mock_client_class):
         """Test transaction submission with exception."""
         # Setup client mock
         mock_client_instance = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_class.return_value = mock_client_instance
 
         # Setup transaction mocks
         mock_transaction = MagicMock(spec=Transaction)
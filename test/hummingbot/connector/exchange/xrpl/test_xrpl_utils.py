@@ -1,8 +1,10 @@
 import time
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from websockets.exceptions import ConnectionClosed
 from xrpl.asyncio.clients import XRPLRequestFailureException
+from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
 from xrpl.asyncio.transaction import XRPLReliableSubmissionException
 from xrpl.models import OfferCancel, Response
 from xrpl.models.response import ResponseStatus
@@ -11,6 +13,7 @@ from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS
 from hummingbot.connector.exchange.xrpl.xrpl_utils import (
     RateLimiter,
     XRPLConfigMap,
+    XRPLConnectionPool,
     XRPLNodePool,
     _wait_for_final_transaction_outcome,
     autofill,
@@ -534,6 +537,104 @@ class TestXRPLNodePool(IsolatedAsyncioWrapperTestCase):
         self.assertNotEqual(self.node_pool.current_node, test_node)
 
 
+class TestXRPLConnectionPool(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        self.node_url = "wss://test1.ripple.com/"
+        self.node_pool = XRPLNodePool(node_urls=[self.node_url], proactive_switch_interval=0, cooldown=60)
+        self.connection_pool = XRPLConnectionPool(node_pool=self.node_pool, max_idle_time=60)
+
+    def mock_client(self) -> AsyncMock:
+        client = AsyncMock()
+        client.url = self.node_url
+        client.is_open = MagicMock(return_value=True)
+        return client
+
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient")
+    async def test_get_client_reuses_open_client(self, mock_client_class):
+        mock_client = self.mock_client()
+        mock_client_class.return_value = mock_client
+
+        first_client = await self.connection_pool.get_client()
+        second_client = await self.connection_pool.get_client()
+
+        self.assertIs(mock_client, first_client)
+        self.assertIs(first_client, second_client)
+        mock_client_class.assert_called_once_with(self.node_url)
+        mock_client.open.assert_awaited_once()
+        self.assertEqual([self.node_url], self.connection_pool.open_nodes)
+
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient")
+    async def test_get_client_reopens_closed_client(self, mock_client_class):
+        closed_client = self.mock_client()
+        new_client = self.mock_client()
+        mock_client_class.side_effect = [closed_client, new_client]
+
+        await self.connection_pool.get_client()
+        closed_client.is_open.return_value = False
+        client = await self.connection_pool.get_client()
+
+        self.assertIs(new_client, client)
+
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient")
+    async def test_client_context_evicts_client_on_connection_error(self, mock_client_class):
+        mock_client = self.mock_client()
+        mock_client_class.return_value = mock_client
+
+        with self.assertRaises(ConnectionError):
+            async with self.connection_pool.client():
+                raise ConnectionError("Connection lost")
+
+        mock_client.close.assert_awaited_once()
+        self.assertEqual([], self.connection_pool.open_nodes)
+        self.assertIn(self.node_url, self.node_pool._bad_nodes)
+
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient")
+    async def test_client_context_evicts_client_on_websocket_closed(self, mock_client_class):
+        for exception in (ConnectionClosed(rcvd=None, sent=None), XRPLWebsocketException("Websocket is not open")):
+            with self.subTest(exception=type(exception).__name__):
+                mock_client = self.mock_client()
+                mock_client_class.return_value = mock_client
+                self.node_pool._bad_nodes.clear()
+
+                with self.assertRaises(type(exception)):
+                    async with self.connection_pool.client():
+                        raise exception
+
+                mock_client.close.assert_awaited_once()
+                self.assertEqual([], self.connection_pool.open_nodes)
+                self.assertIn(self.node_url, self.node_pool._bad_nodes)
+
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient")
+    async def test_check_clients_health(self, mock_client_class):
+        mock_client = self.mock_client()
+        mock_client_class.return_value = mock_client
+        await self.connection_pool.get_client()
+
+        await self.connection_pool.check_clients_health()
+        mock_client.request.assert_awaited_once()
+        self.assertEqual([self.node_url], self.connection_pool.open_nodes)
+
+        mock_client.request.side_effect = TimeoutError("Test timeout")
+        await self.connection_pool.check_clients_health()
+        mock_client.close.assert_awaited_once()
+        self.assertEqual([], self.connection_pool.open_nodes)
+        self.assertIn(self.node_url, self.node_pool._bad_nodes)
+
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient")
+    async def test_check_clients_health_closes_idle_clients(self, mock_client_class):
+        mock_client = self.mock_client()
+        mock_client_class.return_value = mock_client
+        await self.connection_pool.get_client()
+        self.connection_pool._last_used_times[self.node_url] = time.time() - 61
+
+        await self.connection_pool.check_clients_health()
+
+        mock_client.request.assert_not_awaited()
+        mock_client.close.assert_awaited_once()
+        self.assertEqual([], self.connection_pool.open_nodes)
+        self.assertNotIn(self.node_url, self.node_pool._bad_nodes)
+
+
 class TestParseOfferCreateTransaction(IsolatedAsyncioWrapperTestCase):
     def test_normal_offer_node(self):
         tx = {
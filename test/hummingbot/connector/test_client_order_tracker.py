@@ -1130,3 +1130,112 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def test_orders_by_exchange_order_id_follow_order_lifecycle(self):
+        self.tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=1)
+        orders = [
+            InFlightOrder(
+                client_order_id=f"someClientOrderId{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            for i in range(3)
+        ]
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+
+        self.assertNotIn("someExchangeOrderId0", self.tracker.all_fillable_orders_by_exchange_order_id)
+
+        # The exchange order id is assigned either with an order update or directly to the order
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=orders[0].client_order_id,
+            exchange_order_id="someExchangeOrderId0",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=update))
+        orders[1].update_exchange_order_id("someExchangeOrderId1")
+        orders[2].update_exchange_order_id("someExchangeOrderId2")
+
+        self.assertIs(orders[0], self.tracker.all_updatable_orders_by_exchange_order_id["someExchangeOrderId0"])
+        self.assertIs(orders[1], self.tracker.all_fillable_orders_by_exchange_order_id.get("someExchangeOrderId1"))
+        self.assertIs(orders[2], self.tracker.fetch_order(exchange_order_id="someExchangeOrderId2"))
+        self.assertEqual({f"someExchangeOrderId{i}": orders[i] for i in range(3)},
+                         dict(self.tracker.all_fillable_orders_by_exchange_order_id))
+
+        # Completed orders are only fillable, lost orders are still updatable
+        self.tracker.stop_tracking_order(orders[1].client_order_id)
+        self.async_run_with_timeout(self.tracker.process_order_not_found(orders[2].client_order_id))
+        self.async_run_with_timeout(self.tracker.process_order_not_found(orders[2].client_order_id))
+
+        self.assertIs(orders[1], self.tracker.all_fillable_orders_by_exchange_order_id.get("someExchangeOrderId1"))
+        self.assertIsNone(self.tracker.all_updatable_orders_by_exchange_order_id.get("someExchangeOrderId1"))
+        self.assertIs(orders[2], self.tracker.all_updatable_orders_by_exchange_order_id.get("someExchangeOrderId2"))
+        self.assertIs(orders[2], self.tracker.fetch_lost_order(exchange_order_id="someExchangeOrderId2"))
+        self.assertEqual(2, len(self.tracker.all_updatable_orders))
+
+        # Orders dropped from the cache are no longer found
+        self.tracker._cached_orders.clear()
+
+        self.assertNotIn("someExchangeOrderId1", self.tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertNotIn(orders[1].client_order_id, self.tracker.all_fillable_orders)
+
+    def test_all_orders_are_copies_while_views_follow_tracked_orders(self):
+        orders = [
+            InFlightOrder(
+                client_order_id=f"someClientOrderId{i}",
+                exchange_order_id=f"someExchangeOrderId{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+                initial_state=OrderState.OPEN,
+            )
+            for i in range(3)
+        ]
+        for order in orders[:2]:
+            self.tracker.start_tracking_order(order)
+        fillable_orders_view = self.tracker.all_fillable_orders_view
+        updatable_orders_by_exchange_order_id_view = self.tracker.all_updatable_orders_by_exchange_order_id_view
+
+        # The orders can start or stop being tracked while the copies are iterated
+        for client_order_id in self.tracker.all_fillable_orders:
+            self.tracker.start_tracking_order(orders[2])
+        for exchange_order_id in self.tracker.all_updatable_orders_by_exchange_order_id:
+            self.tracker.stop_tracking_order(orders[0].client_order_id)
+
+        self.assertEqual({order.client_order_id: order for order in orders}, dict(fillable_orders_view))
+        self.assertEqual(3, len(fillable_orders_view))
+        self.assertEqual({"someExchangeOrderId1": orders[1], "someExchangeOrderId2": orders[2]},
+                         dict(updatable_orders_by_exchange_order_id_view))
+        self.assertIs(orders[0], self.tracker.all_orders_view.get(orders[0].client_order_id))
+        with self.assertRaises(RuntimeError):
+            for client_order_id in self.tracker.all_updatable_orders_view:
+                self.tracker.stop_tracking_order(client_order_id)
+
+    def test_exchange_order_id_index_is_pruned(self):
+        for i in range(2 * ClientOrderTracker.MAX_CACHE_SIZE + 10):
+            order = InFlightOrder(
+                client_order_id=f"someClientOrderId{i}",
+                exchange_order_id=f"someExchangeOrderId{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+                initial_state=OrderState.OPEN,
+            )
+            self.tracker.start_tracking_order(order)
+            self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertLessEqual(len(self.tracker._orders_by_exchange_order_id), 2 * ClientOrderTracker.MAX_CACHE_SIZE)
+        self.assertEqual(ClientOrderTracker.MAX_CACHE_SIZE, len(self.tracker.cached_orders))
+        self.assertIn(order.exchange_order_id, self.tracker.all_fillable_orders_by_exchange_order_id)
@@ -9,6 +9,8 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.event_logger import MAX_ORDER_FILLED_EVENTS_IN_MEMORY, EventLogger
+from hummingbot.core.event.events import MarketEvent
 
 
 class InFightOrderTest(InFlightOrderBase):
@@ -568,3 +570,60 @@ class ConnectorBaseUnitTest(unittest.TestCase):
                                 + (current_sell_order.executed_amount_quote)
                                 - (extra_fill_event.amount * extra_fill_event.price))
         self.assertEqual(expected_hbot_amount, estimated_hbot_balance)
+
+    def test_order_filled_balances_include_fill_events_spilled_to_disk(self):
+        connector = ConnectorBase()
+        n_events = MAX_ORDER_FILLED_EVENTS_IN_MEMORY + 10
+        start_timestamp = 1640000000
+
+        for i in range(n_events):
+            connector.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+                timestamp=start_timestamp + i,
+                order_id=f"OID{i}",
+                trading_pair="COINALPHA-HBOT",
+                trade_type=TradeType.BUY if i % 2 == 0 else TradeType.SELL,
+                order_type=OrderType.LIMIT,
+                price=Decimal(100 + i),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+            ))
+
+        self.assertLessEqual(len(connector.event_logs), MAX_ORDER_FILLED_EVENTS_IN_MEMORY + 50)
+        self.assertEqual([f"OID{i}" for i in range(n_events)], [e.order_id for e in connector.iter_order_filled_events()])
+        expected_balances = {"COINALPHA": Decimal(0), "HBOT": Decimal(n_events // 2)}
+        self.assertEqual(expected_balances, connector.order_filled_balances())
+        # Calculated again after the balances of the spilled events were cached
+        self.assertEqual(expected_balances, connector.order_filled_balances())
+        self.assertEqual({"COINALPHA": Decimal(-1), "HBOT": Decimal(100 + n_events - 1)},
+                         connector.order_filled_balances(starting_timestamp=start_timestamp + n_events - 2))
+        self.assertEqual({"COINALPHA": Decimal(0), "HBOT": Decimal((n_events - 4) // 2)},
+                         connector.order_filled_balances(starting_timestamp=start_timestamp + 3))
+
+    def test_order_filled_balances_of_spilled_fill_events_recalculated_after_clear(self):
+        connector = ConnectorBase()
+        n_events = MAX_ORDER_FILLED_EVENTS_IN_MEMORY + 10
+
+        def trigger_fill_events(trade_type: TradeType):
+            for i in range(n_events):
+                connector.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+                    timestamp=1640000000 + i,
+                    order_id=f"OID{i}",
+                    trading_pair="COINALPHA-HBOT",
+                    trade_type=trade_type,
+                    order_type=OrderType.LIMIT,
+                    price=Decimal(100),
+                    amount=Decimal(1),
+                    trade_fee=AddedToCostTradeFee(),
+                ))
+
+        trigger_fill_events(TradeType.BUY)
+        self.assertEqual({"COINALPHA": Decimal(n_events), "HBOT": Decimal(-100 * n_events)},
+                         connector.order_filled_balances())
+
+        # The same number of events is spilled again after clearing the logs
+        event_logger = next(listener for listener in connector.get_listeners(MarketEvent.OrderFilled)
+                            if isinstance(listener, EventLogger))
+        event_logger.clear()
+        trigger_fill_events(TradeType.SELL)
+        self.assertEqual({"COINALPHA": Decimal(-n_events), "HBOT": Decimal(100 * n_events)},
+                         connector.order_filled_balances())
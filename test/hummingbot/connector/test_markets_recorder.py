@@ -1,8 +1,11 @@
 import asyncio
+import os
+import tempfile
+import threading
 import time
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
-from typing import Awaitable
+from typing import Awaitable, Tuple
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
@@ -24,8 +27,10 @@ from hummingbot.core.event.events import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
+from hummingbot.model.sql_batch_writer import SQLBatchWriter
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
@@ -401,6 +406,130 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
 
+    def write_behind_recorder(self) -> Tuple[MarketsRecorder, SQLConnectionManager]:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(temp_dir.name, "test.sqlite"),
+        )
+        self.addCleanup(manager.engine.dispose)
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_behind=True,
+        )
+        self.addCleanup(recorder._db_writer.stop)
+        return recorder, manager
+
+    def buy_order_created_event(self) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(2),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+
+    def test_write_behind_records_order_events_in_writer_thread(self):
+        recorder, manager = self.write_behind_recorder()
+        self.assertTrue(recorder.write_behind)
+
+        create_event = self.buy_order_created_event()
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        for i in range(2):
+            self.tracking_states = {"OID1": {"executed_amount_base": str(i + 1)}}
+            fill_event = OrderFilledEvent(
+                timestamp=1642020000 + i,
+                order_id=create_event.order_id,
+                trading_pair=create_event.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=create_event.type,
+                price=Decimal(1010),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id=f"TradeId{i}"
+            )
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642020002,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * create_event.price,
+            order_type=create_event.type)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+        recorder.flush()
+
+        with manager.get_new_session() as session:
+            order = session.query(Order).one()
+            statuses = [status.status for status in order.status]
+            trade_fills = order.trade_fills
+            market_state = session.query(MarketState).one()
+
+        self.assertEqual(MarketEvent.BuyOrderCompleted.name, order.last_status)
+        self.assertEqual([MarketEvent.BuyOrderCreated.name,
+                          MarketEvent.OrderFilled.name,
+                          MarketEvent.OrderFilled.name,
+                          MarketEvent.BuyOrderCompleted.name], statuses)
+        self.assertEqual(2, len(trade_fills))
+        self.assertEqual({"OID1": {"executed_amount_base": "2"}}, market_state.saved_state)
+
+    def test_write_behind_keeps_state_of_operations_retried_after_batch_failure(self):
+        recorder, manager = self.write_behind_recorder()
+        self.tracking_states = {"OID1": {"executed_amount_base": "0"}}
+        blocker = threading.Event()
+        recorder._db_writer.submit(lambda session: blocker.wait())
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event())
+
+        def fail(session):
+            raise ValueError("Invalid operation")
+
+        recorder._db_writer.submit(fail)
+        blocker.set()
+        with self.assertLogs(logger=SQLBatchWriter.logger(), level="ERROR"):
+            recorder.flush()
+
+        with manager.get_new_session() as session:
+            self.assertEqual("OID1", session.query(Order).one().id)
+            self.assertEqual(self.tracking_states, session.query(MarketState).one().saved_state)
+        self.assertIn("OID1", recorder._order_ids)
+        self.assertEqual({}, recorder._pending_market_states)
+
+    def test_write_behind_does_not_cache_order_of_rolled_back_transaction(self):
+        recorder, manager = self.write_behind_recorder()
+        self.tracking_states = {"OID1": {"executed_amount_base": "0"}}
+
+        with patch.object(recorder, "_save_market_states", side_effect=ValueError("Invalid state")):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event())
+            with self.assertLogs(logger=SQLBatchWriter.logger(), level="ERROR"):
+                recorder.flush()
+
+        with manager.get_new_session() as session:
+            self.assertEqual(0, session.query(Order).count())
+        self.assertNotIn("OID1", recorder._order_ids)
+        # The states are saved by the next write
+        self.assertEqual(self.tracking_states, recorder._pending_market_states[self.display_name])
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event())
+        recorder.flush()
+        with manager.get_new_session() as session:
+            self.assertEqual(self.tracking_states, session.query(MarketState).one().saved_state)
+        self.assertIn("OID1", recorder._order_ids)
+
     @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
     def test_market_data_collection_enabled(self, sleep_mock):
         sleep_mock.side_effect = [0.1, asyncio.CancelledError]
@@ -0,0 +1,128 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Dict, List, Optional
+
+from hummingbot.connector.order_entry_transport import OrderEntryTransportNotConnectedError, WSOrderEntryTransport
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+
+class WSAssistantStub:
+    def __init__(self):
+        self.sent_payloads: List[Dict[str, Any]] = []
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.disconnected = False
+
+    async def send(self, request: WSRequest):
+        self.sent_payloads.append(request.payload)
+
+    async def iter_messages(self):
+        while True:
+            message = await self.messages.get()
+            if message is None:
+                return
+            yield WSResponse(data=message)
+
+    async def disconnect(self):
+        self.disconnected = True
+        self.messages.put_nowait(None)
+
+
+class WSOrderEntryTransportStub(WSOrderEntryTransport):
+    def __init__(self, api_factory: WebAssistantsFactory, request_timeout: float = 1.0):
+        super().__init__(api_factory=api_factory, request_timeout=request_timeout, reconnect_delay=0)
+        self.ws_assistants: List[WSAssistantStub] = []
+
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        ws_assistant = WSAssistantStub()
+        self.ws_assistants.append(ws_assistant)
+        return ws_assistant
+
+    def _request_payload(self, request_id: str, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"id": request_id, "method": method, "params": params}
+
+    def _response_request_id(self, response: Any) -> Optional[str]:
+        return response.get("id")
+
+    def _process_response(self, method: str, response: Any) -> Any:
+        if "error" in response:
+            raise IOError(f"Error executing request {method}. Error: {response['error']}")
+        return response["result"]
+
+
+class WSOrderEntryTransportTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.transport = WSOrderEntryTransportStub(
+            api_factory=WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[])))
+        self.transport.start()
+        await asyncio.wait_for(self.transport.wait_until_connected(), timeout=1)
+
+    async def asyncTearDown(self) -> None:
+        await self.transport.stop()
+        await super().asyncTearDown()
+
+    async def wait_for_sent_requests(self, ws_assistant: WSAssistantStub, count: int):
+        while len(ws_assistant.sent_payloads) < count:
+            await asyncio.sleep(0)
+
+    async def test_responses_are_routed_to_their_requests(self):
+        ws_assistant = self.transport.ws_assistants[0]
+        first_request = asyncio.ensure_future(self.transport.send_request(method="order.place", params={"p": 1}))
+        second_request = asyncio.ensure_future(self.transport.send_request(method="order.place", params={"p": 2}))
+        await asyncio.wait_for(self.wait_for_sent_requests(ws_assistant, 2), timeout=1)
+
+        first_id, second_id = [payload["id"] for payload in ws_assistant.sent_payloads]
+        self.assertNotEqual(first_id, second_id)
+        ws_assistant.messages.put_nowait({"event": "heartbeat"})
+        ws_assistant.messages.put_nowait({"id": second_id, "result": "second"})
+        ws_assistant.messages.put_nowait({"id": first_id, "result": "first"})
+
+        self.assertEqual("first", await asyncio.wait_for(first_request, timeout=1))
+        self.assertEqual("second", await asyncio.wait_for(second_request, timeout=1))
+        self.assertEqual({"p": 1}, ws_assistant.sent_payloads[0]["params"])
+        self.assertEqual(0, self.transport.pending_requests_count)
+
+    async def test_rejected_request_raises_error(self):
+        ws_assistant = self.transport.ws_assistants[0]
+        request = asyncio.ensure_future(self.transport.send_request(method="order.cancel", params={}))
+        await asyncio.wait_for(self.wait_for_sent_requests(ws_assistant, 1), timeout=1)
+        ws_assistant.messages.put_nowait({"id": ws_assistant.sent_payloads[0]["id"], "error": "Unknown order"})
+
+        with self.assertRaises(IOError) as context:
+            await asyncio.wait_for(request, timeout=1)
+        self.assertIn("Unknown order", str(context.exception))
+
+    async def test_request_without_response_times_out(self):
+        self.transport._request_timeout = 0.01
+
+        with self.assertRaises(IOError):
+            await self.transport.send_request(method="order.place", params={})
+        self.assertEqual(0, self.transport.pending_requests_count)
+
+    async def test_request_is_not_sent_while_disconnected(self):
+        await self.transport.stop()
+
+        with self.assertRaises(OrderEntryTransportNotConnectedError):
+            await self.transport.send_request(method="order.place", params={})
+        self.assertEqual([], self.transport.ws_assistants[0].sent_payloads)
+
+    async def test_disconnection_fails_pending_requests_and_reconnects(self):
+        ws_assistant = self.transport.ws_assistants[0]
+        request = asyncio.ensure_future(self.transport.send_request(method="order.place", params={}))
+        await asyncio.wait_for(self.wait_for_sent_requests(ws_assistant, 1), timeout=1)
+
+        ws_assistant.messages.put_nowait(None)
+
+        # The request was sent, it must not be reported as not sent
+        with self.assertRaises(IOError) as context:
+            await asyncio.wait_for(request, timeout=1)
+        self.assertNotIsInstance(context.exception, OrderEntryTransportNotConnectedError)
+        self.assertTrue(ws_assistant.disconnected)
+
+        while len(self.transport.ws_assistants) < 2 or not self.transport.is_connected:
+            await asyncio.sleep(0)
+        self.assertTrue(self.transport.is_connected)
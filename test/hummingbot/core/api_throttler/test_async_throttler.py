@@ -11,7 +11,8 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -275,3 +276,58 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_execute_task_uses_priority_from_context(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertEqual(RequestPriority.STATUS, context._priority)
+
+        with request_priority(RequestPriority.CANCEL):
+            context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertEqual(RequestPriority.CANCEL, context._priority)
+
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID, priority=RequestPriority.CREATE)
+        self.assertEqual(RequestPriority.CREATE, context._priority)
+
+    def test_reserved_capacity_only_available_for_top_priority(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits, reserved_capacity_pct=0.2)
+        for _ in range(8):
+            throttler._task_logs.append(
+                TaskLog(timestamp=time.time(), rate_limit=throttler._id_to_limit_map[TEST_WEIGHTED_POOL_ID], weight=1))
+
+        create_context = throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID, priority=RequestPriority.CREATE)
+        cancel_context = throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID, priority=RequestPriority.CANCEL)
+
+        self.assertFalse(create_context.within_capacity())
+        self.assertTrue(cancel_context.within_capacity())
+
+    def test_lower_priority_waits_while_higher_priority_is_waiting(self):
+        self.throttler._waiting_priorities[(TEST_WEIGHTED_POOL_ID, RequestPriority.CANCEL)] = 1
+        status_context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                                     priority=RequestPriority.STATUS)
+        cancel_context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                                     priority=RequestPriority.CANCEL)
+
+        self.assertTrue(status_context.higher_priority_waiting())
+        self.assertFalse(cancel_context.higher_priority_waiting())
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(asyncio.wait_for(status_context.acquire(), 0.3))
+
+        self.throttler._waiting_priorities[(TEST_WEIGHTED_POOL_ID, RequestPriority.CANCEL)] = 0
+        self.ev_loop.run_until_complete(asyncio.wait_for(status_context.acquire(), 0.3))
+        self.assertEqual(0, self.throttler._waiting_priorities[(TEST_WEIGHTED_TASK_2_ID, RequestPriority.STATUS)])
+        self.assertEqual(0, self.throttler._waiting_priorities[(TEST_WEIGHTED_POOL_ID, RequestPriority.STATUS)])
+
+    def test_lower_priority_not_blocked_by_higher_priority_waiting_on_unrelated_limit(self):
+        self.throttler._waiting_priorities[(TEST_POOL_ID, RequestPriority.CANCEL)] = 1
+        status_context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                                     priority=RequestPriority.STATUS)
+        related_status_context = self.throttler.execute_task(limit_id=TEST_PATH_URL,
+                                                             priority=RequestPriority.STATUS)
+
+        self.assertFalse(status_context.higher_priority_waiting())
+        self.assertTrue(related_status_context.higher_priority_waiting())
+        self.ev_loop.run_until_complete(asyncio.wait_for(status_context.acquire(), 0.3))
+        self.assertEqual(1, self._count_task_logs(TEST_WEIGHTED_TASK_2_ID))
+
+    def _count_task_logs(self, limit_id: str) -> int:
+        return len([task for task in self.throttler._task_logs if task.rate_limit.limit_id == limit_id])
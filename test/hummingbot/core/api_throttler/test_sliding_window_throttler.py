@@ -0,0 +1,137 @@
+import asyncio
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import RateLimitWindow, SlidingWindowThrottler
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class RateLimitWindowTests(IsolatedAsyncioWrapperTestCase):
+
+    def test_evicts_expired_entries(self):
+        window = RateLimitWindow(limit=2, duration=1.0)
+        window.add(10.0, 1)
+        window.add(10.5, 1)
+
+        self.assertFalse(window.has_capacity(1))
+        window.evict(11.0)
+        self.assertEqual(1, window.used)
+        self.assertTrue(window.has_capacity(1))
+
+    def test_time_until_capacity(self):
+        window = RateLimitWindow(limit=3, duration=1.0)
+        window.add(10.0, 1)
+        window.add(10.4, 2)
+
+        self.assertEqual(0.0, window.time_until_capacity(0, 10.5))
+        self.assertAlmostEqual(0.5, window.time_until_capacity(1, 10.5))
+        self.assertAlmostEqual(0.9, window.time_until_capacity(2, 10.5))
+
+
+class SlidingWindowThrottlerTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, safety_margin_pct=0)
+
+    async def test_acquire_within_capacity_does_not_wait(self):
+        start = time.time()
+        async with self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID):
+            pass
+        self.assertLess(time.time() - start, 0.05)
+        self.assertEqual(1, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+        self.assertEqual(1, self.throttler._windows[TEST_WEIGHTED_TASK_2_ID].used)
+
+    async def test_linked_weighted_limits(self):
+        async with self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID):
+            pass
+        async with self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID):
+            pass
+
+        self.assertEqual(6, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    async def test_waiter_is_woken_when_capacity_frees_up(self):
+        async with self.throttler.execute_task(limit_id=TEST_PATH_URL):
+            pass
+
+        start = time.time()
+        async with self.throttler.execute_task(limit_id=TEST_POOL_ID):
+            pass
+        elapsed = time.time() - start
+
+        self.assertGreaterEqual(elapsed, 0.15)
+        self.assertLess(elapsed, 0.4)
+
+    async def test_waiters_are_served_in_order(self):
+        order = []
+
+        async def task(name: str):
+            async with self.throttler.execute_task(limit_id=TEST_POOL_ID):
+                order.append(name)
+
+        await asyncio.gather(task("first"), task("second"), task("third"))
+
+        self.assertEqual(["first", "second", "third"], order)
+
+    async def test_cancelled_waiter_is_skipped(self):
+        async with self.throttler.execute_task(limit_id=TEST_POOL_ID):
+            pass
+
+        waiter = asyncio.get_event_loop().create_task(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        await asyncio.wait_for(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire(), 1)
+        self.assertEqual(0, len(self.throttler._waiters))
+
+    async def test_unknown_limit_id_does_not_wait(self):
+        context = self.throttler.execute_task(limit_id="unknown")
+        self.assertTrue(context.within_capacity())
+        await asyncio.wait_for(context.acquire(), 0.1)
+
+    async def test_higher_priority_waiters_are_served_first(self):
+        order = []
+
+        async def task(name: str, priority: RequestPriority):
+            async with self.throttler.execute_task(limit_id=TEST_POOL_ID, priority=priority):
+                order.append(name)
+
+        await asyncio.gather(task("first", RequestPriority.STATUS),
+                             task("status", RequestPriority.STATUS),
+                             task("cancel", RequestPriority.CANCEL))
+
+        self.assertEqual(["first", "cancel", "status"], order)
+
+    async def test_reserved_capacity_only_available_for_top_priority(self):
+        throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, safety_margin_pct=0, reserved_capacity_pct=0.2)
+        for _ in range(8):
+            async with throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID):
+                pass
+
+        self.assertFalse(
+            throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID, priority=RequestPriority.CREATE).within_capacity())
+        self.assertTrue(
+            throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID, priority=RequestPriority.CANCEL).within_capacity())
@@ -3,6 +3,9 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +53,121 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_top_entries_iterators(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertEqual([3., 2.], [row.price for row in order_book.bid_entries_top(2)])
+        self.assertEqual([4., 5.], [row.price for row in order_book.ask_entries_top(2)])
+        self.assertEqual(3, len(list(order_book.bid_entries_top(10))))
+        self.assertEqual([], list(order_book.ask_entries_top(0)))
+
+    def test_fill_book_arrays(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        out = np.zeros((2, 3), dtype=np.float64)
+        self.assertEqual(2, order_book.fill_bids_array(out))
+        self.assertEqual([[3., 1., 3.], [2., 1., 2.]], out.tolist())
+        self.assertEqual(2, order_book.fill_asks_array(out))
+        self.assertEqual([[4., 1., 1.], [5., 1., 2.]], out.tolist())
+
+        self.assertEqual((3, 3), order_book.get_bids_array().shape)
+        self.assertEqual([[4., 1., 1.]], order_book.get_asks_array(1).tolist())
+
+        with self.assertRaises(ValueError):
+            order_book.fill_bids_array(np.zeros((2, 2), dtype=np.float64))
+
+    def test_snapshot_with_depth(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.get_snapshot(depth=2)
+        self.assertEqual(2, len(bids))
+        self.assertEqual(2, len(asks))
+        self.assertEqual([3., 1., 3.], bids.iloc[0].tolist())
+
+        bids, asks = order_book.snapshot
+        self.assertEqual(3, len(bids))
+        self.assertEqual(4, len(asks))
+
+    def test_apply_raw_snapshot_and_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["2", "1"], ["1", "1"]], [["3", "1"], ["4", "2"]], 10)
+        self.assertEqual(2., order_book.get_price(False))
+        self.assertEqual(3., order_book.get_price(True))
+        self.assertEqual(10, order_book.snapshot_uid)
+
+        order_book.apply_raw_diffs([["2.5", "0.5", "extra"], ["2", "0"]], [[3, 0]], 11)
+        self.assertEqual([[2.5, 0.5, 11.], [1., 1., 10.]], order_book.get_bids_array().tolist())
+        self.assertEqual([[4., 2., 10.]], order_book.get_asks_array().tolist())
+        self.assertEqual(11, order_book.last_diff_uid)
+
+    def test_apply_buffer_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["2", "1"]], [["3", "1"]], 1)
+        order_book.apply_buffer_diffs(np.array([[2.1, 1.]]), np.array([[3., 0.], [3.2, 4.]]), 2)
+        self.assertEqual([[2.1, 1., 2.], [2., 1., 1.]], order_book.get_bids_array().tolist())
+        self.assertEqual([[3.2, 4., 2.]], order_book.get_asks_array().tolist())
+
+    def test_apply_messages(self):
+        order_book = OrderBook()
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 1, "bids": [["2", "1"]], "asks": [["3", "1"]]},
+            timestamp=1)
+        diff = OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 2, "bids": [["2", "0"]], "asks": [["2.9", "1"]]},
+            timestamp=2)
+        order_book.apply_snapshot_message(snapshot)
+        order_book.apply_diff_message(diff)
+
+        self.assertEqual(0, len(order_book.get_bids_array()))
+        self.assertEqual([[2.9, 1., 2.], [3., 1., 1.]], order_book.get_asks_array().tolist())
+
+    def test_top_of_book_changed_events(self):
+        order_book = OrderBook()
+        events = []
+        forwarder = EventForwarder(events.append)
+        order_book.add_listener(OrderBookEvent.TopOfBookChangedEvent, forwarder)
+        order_book.apply_raw_snapshot([["2", "1"], ["1", "1"]], [["3", "1"]], 1)
+        order_book.apply_raw_diffs([["2.5", "1"]], [], 2)
+        self.assertEqual(0, len(events))
+        self.assertFalse(order_book.top_of_book_events_enabled)
+
+        order_book.enable_top_of_book_events()
+        order_book.apply_raw_diffs([["2.6", "1"]], [], 3)
+        order_book.apply_raw_diffs([["1", "5"]], [["4", "1"]], 4)
+        order_book.apply_raw_diffs([], [["3", "0"]], 5)
+        order_book.apply_raw_snapshot([["2", "1"]], [["4", "1"]], 6)
+
+        self.assertEqual([(2.6, 3., 3), (2.6, 4., 5), (2., 4., 6)],
+                         [(event.best_bid, event.best_ask, event.update_id) for event in events])
+
+    def test_top_of_book_changed_events_are_debounced(self):
+        order_book = OrderBook()
+        events = []
+        forwarder = EventForwarder(events.append)
+        order_book.add_listener(OrderBookEvent.TopOfBookChangedEvent, forwarder)
+        order_book.apply_raw_snapshot([["2", "1"]], [["3", "1"]], 1)
+        order_book.enable_top_of_book_events(debounce_interval=60)
+
+        order_book.apply_raw_diffs([["2.1", "1"]], [], 2)
+        order_book.apply_raw_diffs([["2.2", "1"]], [], 3)
+        self.assertEqual([2.1], [event.best_bid for event in events])
+
+        order_book.disable_top_of_book_events()
+        order_book.enable_top_of_book_events(debounce_interval=0)
+        order_book.apply_raw_diffs([["2", "3"]], [], 4)
+        self.assertEqual([2.1, 2.2], [event.best_bid for event in events])
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,222 @@
+import asyncio
+import math
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest import TestCase
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecorder,
+    OrderBookRecordingReader,
+    decode_message,
+    encode_message,
+)
+from hummingbot.core.data_type.order_book_replay_data_source import OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+def snapshot_message(trading_pair: str, update_id: int, bids, asks) -> OrderBookMessage:
+    return OrderBookMessage(
+        OrderBookMessageType.SNAPSHOT,
+        {"trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+        timestamp=float(update_id))
+
+
+def diff_message(trading_pair: str, update_id: int, bids, asks) -> OrderBookMessage:
+    return OrderBookMessage(
+        OrderBookMessageType.DIFF,
+        {"trading_pair": trading_pair, "first_update_id": update_id, "update_id": update_id, "bids": bids,
+         "asks": asks},
+        timestamp=float(update_id))
+
+
+def trade_message(trading_pair: str, trade_id, price: float, amount: float) -> OrderBookMessage:
+    return OrderBookMessage(
+        OrderBookMessageType.TRADE,
+        {"trading_pair": trading_pair, "trade_type": float(TradeType.SELL.value), "trade_id": trade_id,
+         "price": price, "amount": amount},
+        timestamp=1000.)
+
+
+class OrderBookRecorderTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recorder = OrderBookRecorder(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.recorder.close()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_encode_decode_round_trip(self):
+        snapshot = snapshot_message(self.trading_pair, 5, [["10.5", "1"], ["10", "2"]], [["11", "3"]])
+        diff = diff_message(self.trading_pair, 6, [["10.5", "0"]], [])
+        trade = trade_message(self.trading_pair, "abc-1", 10.5, 0.25)
+
+        decoded_snapshot = decode_message(OrderBookMessageType.SNAPSHOT, self.trading_pair, encode_message(snapshot))
+        decoded_diff = decode_message(OrderBookMessageType.DIFF, self.trading_pair, encode_message(diff))
+        decoded_trade = decode_message(OrderBookMessageType.TRADE, self.trading_pair, encode_message(trade))
+
+        self.assertEqual(snapshot.bids, decoded_snapshot.bids)
+        self.assertEqual(snapshot.asks, decoded_snapshot.asks)
+        self.assertEqual(5, decoded_snapshot.update_id)
+        self.assertEqual(5., decoded_snapshot.timestamp)
+        self.assertEqual(diff.bids, decoded_diff.bids)
+        self.assertEqual([], decoded_diff.asks)
+        self.assertEqual(6, decoded_diff.first_update_id)
+        self.assertEqual(self.trading_pair, decoded_trade.trading_pair)
+        self.assertEqual("abc-1", decoded_trade.trade_id)
+        self.assertEqual(float(TradeType.SELL.value), decoded_trade.content["trade_type"])
+        self.assertEqual(10.5, decoded_trade.content["price"])
+        self.assertEqual(0.25, decoded_trade.content["amount"])
+
+    def test_encode_decode_float_update_ids(self):
+        snapshot = snapshot_message(self.trading_pair, 1700000000.123456, [["10", "1"]], [["11", "1"]])
+        diff = diff_message(self.trading_pair, 1700000000.5, [], [["11", "0"]])
+        large_id_diff = diff_message(self.trading_pair, 2 ** 62 + 1, [], [])
+
+        decoded_snapshot = decode_message(OrderBookMessageType.SNAPSHOT, self.trading_pair, encode_message(snapshot))
+        decoded_diff = decode_message(OrderBookMessageType.DIFF, self.trading_pair, encode_message(diff))
+        decoded_large_id_diff = decode_message(OrderBookMessageType.DIFF, self.trading_pair,
+                                               encode_message(large_id_diff))
+
+        self.assertEqual(1700000000.123456, decoded_snapshot.update_id)
+        self.assertEqual(1700000000.5, decoded_diff.update_id)
+        self.assertEqual(1700000000.5, decoded_diff.first_update_id)
+        self.assertEqual(snapshot.bids, decoded_snapshot.bids)
+        self.assertEqual(diff.asks, decoded_diff.asks)
+        self.assertEqual(2 ** 62 + 1, decoded_large_id_diff.update_id)
+        self.assertIsInstance(decoded_large_id_diff.update_id, int)
+
+    def test_recording_is_read_in_order_and_indexed_by_snapshot(self):
+        self.recorder.record_message(snapshot_message(self.trading_pair, 1, [["10", "1"]], [["11", "1"]]),
+                                     received_timestamp=100.)
+        self.recorder.record_message(diff_message(self.trading_pair, 2, [["10", "2"]], []), received_timestamp=101.)
+        self.recorder.record_message(trade_message(self.trading_pair, 7, 11., 1.), received_timestamp=102.)
+        self.recorder.record_message(snapshot_message(self.trading_pair, 3, [["10", "3"]], [["11", "1"]]),
+                                     received_timestamp=103.)
+        self.recorder.record_message(diff_message(self.trading_pair, 4, [], [["11", "0"]]), received_timestamp=104.)
+        self.recorder.flush()
+
+        reader = OrderBookRecordingReader(self.temp_dir.name, self.trading_pair)
+        recorded = list(reader.iter_messages())
+
+        self.assertEqual([100., 101., 102., 103., 104.], [message.received_timestamp for message in recorded])
+        self.assertEqual(7, recorded[2].message.trade_id)
+        self.assertEqual([(100., recorded[0].offset), (103., recorded[3].offset)], reader.snapshots_index)
+        self.assertEqual(recorded[0].offset, reader.offset_for_timestamp(102.5))
+        self.assertEqual(recorded[3].offset, reader.offset_for_timestamp(103.))
+        self.assertEqual([3, 4], [message.message.update_id
+                                  for message in reader.iter_messages(reader.offset_for_timestamp(200.))])
+
+    def test_truncated_record_ends_the_recording(self):
+        self.recorder.record_message(diff_message(self.trading_pair, 1, [["10", "1"]], []), received_timestamp=1.)
+        self.recorder.record_message(diff_message(self.trading_pair, 2, [["10", "2"]], []), received_timestamp=2.)
+        self.recorder.close()
+        reader = OrderBookRecordingReader(self.temp_dir.name, self.trading_pair)
+        with open(reader._records_path, "r+b") as file:
+            file.truncate(file.seek(0, 2) - 1)
+
+        self.assertEqual([1], [message.message.update_id for message in reader.iter_messages()])
+
+    def test_missing_recording_raises_error(self):
+        with self.assertRaises(FileNotFoundError):
+            OrderBookRecordingReader(self.temp_dir.name, "WETH-HBOT")
+
+
+class OrderBookReplayDataSourceTests(IsolatedAsyncioWrapperTestCase):
+    trading_pairs = ["COINALPHA-HBOT", "WETH-HBOT"]
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    async def asyncTearDown(self):
+        self.temp_dir.cleanup()
+        await super().asyncTearDown()
+
+    def record_session(self):
+        recorder = OrderBookRecorder(self.temp_dir.name)
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["10", "1"], ["9", "2"]], [["11", "1"]], 1)
+        recorder.record_order_book(self.trading_pairs[0], order_book, received_timestamp=100.)
+        recorder.record_message(snapshot_message(self.trading_pairs[1], 1, [["2", "5"]], [["3", "5"]]),
+                                received_timestamp=100.5)
+        recorder.record_message(diff_message(self.trading_pairs[0], 2, [["10", "0"], ["9.5", "4"]], []),
+                                received_timestamp=101.)
+        recorder.record_message(trade_message(self.trading_pairs[1], 1, 3., 1.), received_timestamp=101.5)
+        recorder.record_message(diff_message(self.trading_pairs[1], 2, [], [["3", "4"]]), received_timestamp=102.)
+        recorder.record_message(diff_message(self.trading_pairs[0], 3, [], [["11", "0"], ["12", "1"]]),
+                                received_timestamp=103.)
+        recorder.close()
+
+    async def test_tracker_replays_recording(self):
+        self.record_session()
+        data_source = OrderBookReplayDataSource(self.trading_pairs, self.temp_dir.name)
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs)
+
+        tracker.start()
+        await asyncio.wait_for(data_source.wait_replay_finished(), timeout=1)
+        await asyncio.sleep(0.01)
+        tracker.stop()
+
+        self.assertEqual(4, data_source.replayed_messages_count)
+        first_book = tracker.order_books[self.trading_pairs[0]]
+        second_book = tracker.order_books[self.trading_pairs[1]]
+        self.assertEqual([[9.5, 4., 2.], [9., 2., 1.]], first_book.get_bids_array().tolist())
+        self.assertEqual([[12., 1., 3.]], first_book.get_asks_array().tolist())
+        self.assertEqual([[3., 4., 2.]], second_book.get_asks_array().tolist())
+        self.assertEqual(3., second_book.last_trade_price)
+        last_traded_prices = await data_source.get_last_traded_prices(self.trading_pairs)
+        self.assertTrue(math.isnan(last_traded_prices[self.trading_pairs[0]]))
+        self.assertEqual(3., last_traded_prices[self.trading_pairs[1]])
+
+    async def test_replay_starts_from_snapshot_before_start_timestamp(self):
+        self.record_session()
+        recorder = OrderBookRecorder(self.temp_dir.name)
+        recorder.record_message(snapshot_message(self.trading_pairs[0], 10, [["5", "1"]], [["6", "1"]]),
+                                received_timestamp=110.)
+        recorder.record_message(diff_message(self.trading_pairs[0], 11, [["5", "3"]], []), received_timestamp=111.)
+        recorder.close()
+        data_source = OrderBookReplayDataSource(self.trading_pairs[:1], self.temp_dir.name, start_timestamp=110.5)
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs[:1])
+
+        tracker.start()
+        await asyncio.wait_for(data_source.wait_replay_finished(), timeout=1)
+        await asyncio.sleep(0.01)
+        tracker.stop()
+
+        self.assertEqual(1, data_source.replayed_messages_count)
+        order_book = tracker.order_books[self.trading_pairs[0]]
+        self.assertEqual([[5., 3., 11.]], order_book.get_bids_array().tolist())
+        self.assertEqual(10, order_book.snapshot_uid)
+
+    async def test_tracker_records_received_messages(self):
+        self.record_session()
+        data_source = OrderBookReplayDataSource(self.trading_pairs, self.temp_dir.name)
+        with tempfile.TemporaryDirectory() as recording_dir:
+            recorder = OrderBookRecorder(recording_dir)
+            tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs, recorder=recorder)
+
+            tracker.start()
+            await asyncio.wait_for(data_source.wait_replay_finished(), timeout=1)
+            await asyncio.sleep(0.01)
+            tracker.stop()
+            recorder.close()
+
+            for trading_pair in self.trading_pairs:
+                original = [message.message for message in
+                            OrderBookRecordingReader(self.temp_dir.name, trading_pair).iter_messages()]
+                recorded = [message.message for message in
+                            OrderBookRecordingReader(recording_dir, trading_pair).iter_messages()]
+                self.assertEqual([(message.type, message.update_id, message.bids, message.asks)
+                                  for message in original if message.type is not OrderBookMessageType.TRADE],
+                                 [(message.type, message.update_id, message.bids, message.asks)
+                                  for message in recorded if message.type is not OrderBookMessageType.TRADE])
+                self.assertEqual([message.trade_id for message in original],
+                                 [message.trade_id for message in recorded])
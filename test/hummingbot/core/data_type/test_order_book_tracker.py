@@ -0,0 +1,173 @@
+import asyncio
+from collections import deque
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.data_source = MagicMock()
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=[self.trading_pair],
+                                        coalesce_diffs=True)
+
+    def _diff(self, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=update_id)
+
+    def test_coalesce_diff_messages_keeps_latest_amount_per_price(self):
+        messages = [
+            self._diff(1, [["10", "1"], ["9", "2"]], [["11", "1"]]),
+            self._diff(2, [["10", "0"]], []),
+            self._diff(3, [["9", "5"]], [["12", "3"]]),
+        ]
+
+        bids, asks = OrderBookTracker._coalesce_diff_messages(messages)
+
+        self.assertEqual([[10., 0., 2.], [9., 5., 3.]], bids.tolist())
+        self.assertEqual([[11., 1., 1.], [12., 3., 3.]], asks.tolist())
+
+    def test_drain_diff_messages_stops_at_snapshot(self):
+        queue = asyncio.Queue()
+        first = self._diff(1, [["10", "1"]], [])
+        second = self._diff(2, [["10", "2"]], [])
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 3, "bids": [], "asks": []},
+            timestamp=3)
+        third = self._diff(4, [["10", "3"]], [])
+        for message in (second, snapshot, third):
+            queue.put_nowait(message)
+
+        diffs, pending = self.tracker._drain_diff_messages(first, deque(), queue)
+
+        self.assertEqual([first, second], diffs)
+        self.assertIs(snapshot, pending)
+        self.assertEqual(1, queue.qsize())
+
+    def test_drain_diff_messages_takes_saved_messages_before_queued_ones(self):
+        queue = asyncio.Queue()
+        first = self._diff(1, [["10", "1"]], [])
+        saved = deque([self._diff(2, [["10", "2"]], []), self._diff(3, [["10", "3"]], [])])
+        queued = self._diff(4, [["10", "4"]], [])
+        queue.put_nowait(queued)
+
+        diffs, pending = self.tracker._drain_diff_messages(first, saved, queue)
+
+        self.assertEqual([1, 2, 3, 4], [diff.update_id for diff in diffs])
+        self.assertIsNone(pending)
+        self.assertEqual(0, len(saved))
+        self.assertTrue(queue.empty())
+
+    def test_drain_diff_messages_keeps_saved_messages_after_a_saved_snapshot(self):
+        queue = asyncio.Queue()
+        first = self._diff(1, [["10", "1"]], [])
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 2, "bids": [], "asks": []},
+            timestamp=2)
+        later_saved = self._diff(3, [["10", "3"]], [])
+        saved = deque([snapshot, later_saved])
+        queue.put_nowait(self._diff(4, [["10", "4"]], []))
+
+        diffs, pending = self.tracker._drain_diff_messages(first, saved, queue)
+
+        self.assertEqual([first], diffs)
+        self.assertIs(snapshot, pending)
+        self.assertEqual([later_saved], list(saved))
+        self.assertEqual(1, queue.qsize())
+
+    async def test_track_single_book_applies_coalesced_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["10", "1"]], [["11", "1"]], 1)
+        self.tracker._order_books[self.trading_pair] = order_book
+        queue = asyncio.Queue()
+        self.tracker._tracking_message_queues[self.trading_pair] = queue
+        for message in (self._diff(2, [["10", "0"], ["9", "1"]], []),
+                        self._diff(3, [["9", "4"]], [["11", "2"]])):
+            queue.put_nowait(message)
+
+        task = asyncio.get_event_loop().create_task(self.tracker._track_single_book(self.trading_pair))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        self.assertEqual([[9., 4., 3.]], order_book.get_bids_array().tolist())
+        self.assertEqual([[11., 2., 3.]], order_book.get_asks_array().tolist())
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual(2, len(self.tracker._past_diffs_windows[self.trading_pair]))
+
+    async def test_track_single_book_applies_saved_diffs_before_queued_ones(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["10", "1"]], [["11", "1"]], 1)
+        self.tracker._order_books[self.trading_pair] = order_book
+        queue = asyncio.Queue()
+        self.tracker._tracking_message_queues[self.trading_pair] = queue
+        self.tracker._saved_message_queues[self.trading_pair].extend(
+            [self._diff(2, [["10", "2"]], []), self._diff(3, [["10", "3"]], [])])
+        queue.put_nowait(self._diff(4, [["10", "4"]], []))
+
+        task = asyncio.get_event_loop().create_task(self.tracker._track_single_book(self.trading_pair))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        self.assertEqual([[10., 4., 4.]], order_book.get_bids_array().tolist())
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    async def test_track_single_book_advances_update_id_of_fully_cancelled_batch(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["10", "1"]], [["11", "1"]], 1)
+        self.tracker._order_books[self.trading_pair] = order_book
+        queue = asyncio.Queue()
+        self.tracker._tracking_message_queues[self.trading_pair] = queue
+        for message in (self._diff(2, [], []), self._diff(3, [], [])):
+            queue.put_nowait(message)
+
+        task = asyncio.get_event_loop().create_task(self.tracker._track_single_book(self.trading_pair))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        self.assertEqual([[10., 1., 1.]], order_book.get_bids_array().tolist())
+        self.assertEqual(3, order_book.last_diff_uid)
+
+    async def test_init_order_books_runs_concurrently_and_marks_pairs_ready(self):
+        trading_pairs = ["COINALPHA-HBOT", "WETH-HBOT", "BTC-HBOT"]
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=trading_pairs, init_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+        release = asyncio.Event()
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            if trading_pair != "COINALPHA-HBOT":
+                await release.wait()
+            in_flight -= 1
+            return OrderBook()
+
+        self.data_source.get_new_order_book = get_new_order_book
+        init_task = asyncio.get_event_loop().create_task(tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.assertTrue(tracker.is_order_book_ready("COINALPHA-HBOT"))
+        self.assertFalse(tracker.is_order_book_ready("WETH-HBOT"))
+        self.assertEqual(["COINALPHA-HBOT"], tracker.ready_trading_pairs)
+        self.assertFalse(tracker.ready)
+
+        release.set()
+        await init_task
+
+        self.assertEqual(2, max_in_flight)
+        self.assertTrue(tracker.ready)
+        self.assertEqual(trading_pairs, tracker.ready_trading_pairs)
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
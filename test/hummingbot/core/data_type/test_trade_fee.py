@@ -168,6 +168,20 @@ class TradeFeeTests(TestCase):
         self.assertEqual("HBOT", fee.percent_token)
         self.assertEqual([TokenAmount(token="COINALPHA", amount=Decimal("20"))], fee.flat_fees)
 
+    def test_trade_fee_schema_json_serialization_round_trip(self):
+        schema = TradeFeeSchema(
+            percent_fee_token="HBOT",
+            maker_percent_fee_decimal=Decimal("0.001"),
+            taker_percent_fee_decimal=Decimal("0.002"),
+            maker_fixed_fees=[TokenAmount(token="COINALPHA", amount=Decimal("1.5"))],
+        )
+
+        schema_json = schema.to_json()
+
+        self.assertEqual("0.001", schema_json["maker_percent_fee_decimal"])
+        self.assertEqual([{"token": "COINALPHA", "amount": "1.5"}], schema_json["maker_fixed_fees"])
+        self.assertEqual(schema, TradeFeeSchema.from_json(schema_json))
+
     def test_added_to_cost_json_serialization(self):
         token_amount = TokenAmount(token="COINALPHA", amount=Decimal("20.6"))
         fee = AddedToCostTradeFee(
@@ -0,0 +1,70 @@
+import asyncio
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderCancelledEvent, OrderFilledEvent
+
+
+class EventLoggerTest(unittest.TestCase):
+
+    def fill_event(self, index: int) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1640000000 + index,
+            order_id=f"OID{index}",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")),
+        )
+
+    def test_generic_events_are_bounded(self):
+        event_logger = EventLogger()
+        for i in range(100):
+            event_logger(OrderCancelledEvent(timestamp=i, order_id=f"OID{i}"))
+
+        self.assertEqual(50, len(event_logger.event_log))
+        self.assertEqual("OID50", event_logger.event_log[0].order_id)
+
+    def test_older_fill_events_are_spilled_to_disk(self):
+        event_logger = EventLogger(max_order_filled_events=10)
+        events = [self.fill_event(i) for i in range(25)]
+        for event in events:
+            event_logger(event)
+
+        self.assertLessEqual(len(event_logger.event_log), 10)
+        self.assertEqual(25, event_logger.order_filled_events_count)
+        self.assertEqual(events, list(event_logger.iter_order_filled_events()))
+        self.assertEqual(events[20:], list(event_logger.iter_order_filled_events(starting_timestamp=1640000019)))
+
+    def test_fill_events_are_kept_in_memory_without_limit(self):
+        event_logger = EventLogger(max_order_filled_events=None)
+        for i in range(25):
+            event_logger(self.fill_event(i))
+
+        self.assertEqual(25, len(event_logger.event_log))
+        self.assertEqual(0, len(event_logger.spilled_order_filled_events))
+
+    def test_clear_removes_spilled_events(self):
+        event_logger = EventLogger(max_order_filled_events=2)
+        for i in range(5):
+            event_logger(self.fill_event(i))
+
+        event_logger.clear()
+
+        self.assertEqual(0, event_logger.order_filled_events_count)
+        self.assertEqual([], list(event_logger.iter_order_filled_events()))
+
+    def test_wait_for_returns_logged_event(self):
+        async def wait_for_fill():
+            event_logger = EventLogger(max_order_filled_events=1)
+            wait_task = asyncio.ensure_future(event_logger.wait_for(OrderFilledEvent, timeout_seconds=1))
+            await asyncio.sleep(0)
+            event_logger(self.fill_event(0))
+            return await wait_task
+
+        self.assertEqual(self.fill_event(0), asyncio.run(wait_for_fill()))
@@ -0,0 +1,144 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.client.config.client_config_map import GatewayConfigMap
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.core.gateway.gateway_metadata_cache import (
+    GatewayMetadataCache,
+    GatewayMetadataKey,
+    GatewayMetadataType,
+)
+
+
+class GatewayMetadataCacheTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.current_time = 1000.0
+        self.cache = GatewayMetadataCache(ttls={GatewayMetadataType.TOKENS: 10})
+        self.cache._time = lambda: self.current_time
+        self.key = GatewayMetadataKey(metadata_type=GatewayMetadataType.TOKENS, params=("solana", "mainnet-beta"))
+
+    async def test_value_is_cached_until_expiration(self):
+        fetch = AsyncMock(side_effect=[["SOL"], ["SOL", "USDC"]])
+
+        self.assertEqual(["SOL"], await self.cache.get(self.key, fetch))
+        self.current_time += 9
+        self.assertEqual(["SOL"], await self.cache.get(self.key, fetch))
+        self.assertEqual(1, fetch.await_count)
+
+        self.current_time += 1
+        self.assertEqual(["SOL", "USDC"], await self.cache.get(self.key, fetch))
+        self.assertEqual(2, fetch.await_count)
+
+    async def test_concurrent_lookups_share_the_same_request(self):
+        fetch_started = asyncio.Event()
+        release_fetch = asyncio.Event()
+        fetch_calls = []
+
+        async def fetch():
+            fetch_calls.append(1)
+            fetch_started.set()
+            await release_fetch.wait()
+            return ["SOL"]
+
+        first_lookup = asyncio.create_task(self.cache.get(self.key, fetch))
+        await fetch_started.wait()
+        second_lookup = asyncio.create_task(self.cache.get(self.key, fetch))
+        await asyncio.sleep(0)
+        release_fetch.set()
+
+        self.assertEqual([["SOL"], ["SOL"]], await asyncio.gather(first_lookup, second_lookup))
+        self.assertEqual(1, len(fetch_calls))
+
+    async def test_failed_and_not_cacheable_lookups_are_not_cached(self):
+        fetch = AsyncMock(side_effect=[IOError("Gateway offline"), {"error": "Not found"}, ["SOL"]])
+
+        def is_cacheable(value):
+            return "error" not in value
+
+        with self.assertRaises(IOError):
+            await self.cache.get(self.key, fetch, is_cacheable=is_cacheable)
+        self.assertEqual({"error": "Not found"}, await self.cache.get(self.key, fetch, is_cacheable=is_cacheable))
+        self.assertEqual(["SOL"], await self.cache.get(self.key, fetch, is_cacheable=is_cacheable))
+        self.assertEqual(["SOL"], await self.cache.get(self.key, fetch, is_cacheable=is_cacheable))
+        self.assertEqual(3, fetch.await_count)
+
+    async def test_cancelled_lookup_does_not_cancel_the_other_callers(self):
+        release_fetch = asyncio.Event()
+
+        async def fetch():
+            await release_fetch.wait()
+            return ["SOL"]
+
+        first_lookup = asyncio.create_task(self.cache.get(self.key, fetch))
+        await asyncio.sleep(0)
+        second_lookup = asyncio.create_task(self.cache.get(self.key, fetch))
+        await asyncio.sleep(0)
+        first_lookup.cancel()
+        await asyncio.sleep(0)
+        release_fetch.set()
+
+        self.assertEqual(["SOL"], await second_lookup)
+        with self.assertRaises(asyncio.CancelledError):
+            await first_lookup
+
+    async def test_invalidate_only_removes_the_given_types(self):
+        pool_key = GatewayMetadataKey(metadata_type=GatewayMetadataType.POOL, params=("SOL-USDC",))
+        await self.cache.get(self.key, AsyncMock(return_value=["SOL"]))
+        await self.cache.get(pool_key, AsyncMock(return_value={"address": "pool"}))
+
+        self.cache.invalidate(GatewayMetadataType.TOKENS)
+        self.assertEqual(1, len(self.cache))
+        self.assertEqual({"address": "pool"}, await self.cache.get(pool_key, AsyncMock()))
+
+        self.cache.invalidate()
+        self.assertEqual(0, len(self.cache))
+
+    async def test_lookup_in_flight_during_invalidation_is_not_cached(self):
+        release_fetch = asyncio.Event()
+
+        async def fetch():
+            await release_fetch.wait()
+            return ["SOL"]
+
+        lookup = asyncio.create_task(self.cache.get(self.key, fetch))
+        await asyncio.sleep(0)
+        self.cache.invalidate(GatewayMetadataType.TOKENS)
+        release_fetch.set()
+
+        self.assertEqual(["SOL"], await lookup)
+        self.assertEqual(0, len(self.cache))
+
+
+class GatewayHttpClientMetadataCacheTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = GatewayHttpClient(GatewayConfigMap())
+
+    async def test_get_tokens_is_served_from_cache(self):
+        tokens = {"tokens": [{"symbol": "SOL"}]}
+        with patch.object(self.client, "api_request", AsyncMock(return_value=tokens)) as api_request:
+            self.assertEqual(tokens, await self.client.get_tokens("solana", "mainnet-beta"))
+            self.assertEqual(tokens, await self.client.get_tokens("solana", "mainnet-beta"))
+            await self.client.get_tokens("solana", "devnet")
+
+        self.assertEqual(2, api_request.await_count)
+
+    async def test_error_responses_are_not_cached(self):
+        with patch.object(self.client, "api_request", AsyncMock(return_value={})) as api_request:
+            await self.client.get_connectors(fail_silently=True)
+            await self.client.get_connectors(fail_silently=True)
+
+        self.assertEqual(2, api_request.await_count)
+
+    async def test_add_token_invalidates_cached_tokens(self):
+        tokens = {"tokens": [{"symbol": "SOL"}]}
+        with patch.object(self.client, "api_request", AsyncMock(return_value=tokens)) as api_request:
+            await self.client.get_tokens("solana", "mainnet-beta")
+            await self.client.add_token("solana", "mainnet-beta", {"symbol": "USDC"})
+            await self.client.get_tokens("solana", "mainnet-beta")
+
+        self.assertEqual(3, api_request.await_count)
@@ -5,6 +5,7 @@ import unittest
 import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
@@ -122,3 +123,55 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_run_til_records_timing_profile(self):
+        slow_iterator = SlowTimeIterator(duration=0.15)
+        fast_iterator = SlowTimeIterator(duration=0.0)
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        clock.add_iterator(slow_iterator)
+        clock.add_iterator(fast_iterator)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.55))
+
+        profile = clock.timing_profile
+        slow_profile, fast_profile = profile.iterator_profiles
+        self.assertEqual(len(slow_iterator.ticks), slow_profile.durations.count)
+        self.assertEqual(len(slow_iterator.ticks), slow_profile.overruns)
+        self.assertEqual(0, fast_profile.overruns)
+        self.assertEqual(len(fast_iterator.ticks), profile.ticks)
+        self.assertEqual(profile.ticks, profile.overruns)
+        self.assertGreater(profile.missed_ticks, 0)
+        self.assertGreaterEqual(slow_profile.durations.max, 0.15)
+        self.assertEqual("SlowTimeIterator", slow_profile.name)
+
+        clock.remove_iterator(slow_iterator)
+        self.assertEqual([fast_profile], profile.iterator_profiles)
+
+    def test_run_til_skips_overrunning_iterators(self):
+        slow_iterator = SlowTimeIterator(duration=0.25)
+        fast_iterator = SlowTimeIterator(duration=0.0)
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1, skip_overrunning_iterators=True)
+        clock.add_iterator(slow_iterator)
+        clock.add_iterator(fast_iterator)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 1.0))
+
+        slow_profile, fast_profile = clock.timing_profile.iterator_profiles
+        self.assertGreater(slow_profile.skipped_ticks, 0)
+        self.assertEqual(0, fast_profile.skipped_ticks)
+        self.assertEqual(len(fast_iterator.ticks), len(slow_iterator.ticks) + slow_profile.skipped_ticks)
+        self.assertEqual(len(slow_iterator.ticks), slow_profile.durations.count)
+
+
+class SlowTimeIterator(PyTimeIterator):
+
+    def __init__(self, duration: float):
+        super().__init__()
+        self.duration = duration
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+        time.sleep(self.duration)
@@ -0,0 +1,58 @@
+import unittest
+
+from hummingbot.core.clock_profile import ClockTimingProfile, TimingHistogram
+
+
+class TimingHistogramTests(unittest.TestCase):
+
+    def test_record_durations(self):
+        histogram = TimingHistogram()
+        for duration in [0.0002, 0.0003, 0.004, 0.02, 3.0]:
+            histogram.record(duration)
+
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(3.0245, histogram.total)
+        self.assertEqual(3.0, histogram.max)
+        self.assertEqual(3.0, histogram.last)
+        self.assertEqual(2, histogram.bucket_counts[0.0005])
+        self.assertEqual(1, histogram.bucket_counts[0.005])
+        self.assertEqual(1, histogram.bucket_counts[5.0])
+
+    def test_percentile_is_bucket_upper_bound_capped_by_max(self):
+        histogram = TimingHistogram()
+        self.assertEqual(0.0, histogram.percentile(99))
+        for _ in range(98):
+            histogram.record(0.0007)
+        histogram.record(0.3)
+        histogram.record(7.0)
+
+        self.assertEqual(0.001, histogram.percentile(50))
+        self.assertEqual(0.5, histogram.percentile(99))
+        self.assertEqual(7.0, histogram.percentile(100))
+
+
+class ClockTimingProfileTests(unittest.TestCase):
+
+    def test_record_ticks_and_reset(self):
+        profile = ClockTimingProfile(tick_size=1.0)
+        iterator = object()
+        profile.record_iterator_tick(iterator, 0.5)
+        profile.record_iterator_tick(iterator, 1.5)
+        profile.record_tick(lag=0.01, duration=0.6, missed_ticks=0)
+        profile.record_tick(lag=0.02, duration=1.6, missed_ticks=1)
+
+        self.assertEqual(2, profile.ticks)
+        self.assertEqual(1, profile.overruns)
+        self.assertEqual(1, profile.missed_ticks)
+        self.assertTrue(profile.has_delays)
+        self.assertEqual(1, profile.iterator_profile(iterator).overruns)
+        status = profile.to_dict()
+        self.assertEqual("object", status["iterators"][0]["name"])
+        self.assertEqual(2, status["iterators"][0]["count"])
+        self.assertIn("2 ticks of 1.0s, 1 overruns, 1 missed ticks", profile.format_status())
+
+        profile.reset()
+
+        self.assertEqual(0, profile.ticks)
+        self.assertFalse(profile.has_delays)
+        self.assertEqual(0, profile.iterator_profile(iterator).durations.count)
@@ -630,6 +630,17 @@ class TradingCoreTest(IsolatedAsyncioWrapperTestCase):
                 # Verify
                 self.assertEqual(result, Decimal("5.0"))
                 mock_calc_perf.assert_called_once_with(mock_trades)
+                # The trade fills queued by the recorder are written before reading them
+                self.trading_core.markets_recorder.flush.assert_called_once()
+
+    def test_flush_trade_fills(self):
+        """Test flush_trade_fills waits for the markets recorder writes, if there is a recorder"""
+        self.trading_core.markets_recorder = None
+        self.trading_core.flush_trade_fills()
+
+        self.trading_core.markets_recorder = Mock()
+        self.trading_core.flush_trade_fills()
+        self.trading_core.markets_recorder.flush.assert_called_once()
 
     @patch("hummingbot.core.trading_core.PerformanceMetrics")
     async def test_calculate_performance_metrics_by_connector_pair(self, mock_perf_metrics_class):
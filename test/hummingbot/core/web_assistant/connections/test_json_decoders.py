@@ -0,0 +1,56 @@
+import json
+import unittest
+
+from hummingbot.core.web_assistant.connections.json_decoders import (
+    MsgspecDecoder,
+    OrjsonDecoder,
+    StdlibJSONDecoder,
+    default_json_decoder,
+    msgspec,
+    orjson,
+)
+
+
+class JSONDecodersTests(unittest.TestCase):
+
+    def _assert_decoder_behavior(self, decoder):
+        self.assertEqual({"a": [1, "2.5"]}, decoder.decode(json.dumps({"a": [1, "2.5"]})))
+        self.assertEqual({"a": 1}, decoder.decode(b'{"a": 1}'))
+        self.assertEqual("pong", decoder.decode("pong"))
+        self.assertEqual({"a": 1.5}, decoder.decode(b'{"a": 1.5}'))
+
+    def test_stdlib_decoder(self):
+        decoder = StdlibJSONDecoder()
+        self._assert_decoder_behavior(decoder)
+        self.assertEqual({"id": 2 ** 70}, decoder.decode(json.dumps({"id": 2 ** 70})))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_decoder(self):
+        self._assert_decoder_behavior(OrjsonDecoder())
+
+    @unittest.skipIf(msgspec is None, "msgspec is not installed")
+    def test_msgspec_decoder(self):
+        self._assert_decoder_behavior(MsgspecDecoder())
+
+    @unittest.skipIf(msgspec is None, "msgspec is not installed")
+    def test_msgspec_schema_decoder(self):
+        class DepthUpdate(msgspec.Struct):
+            e: str
+            b: list
+
+        decoder = MsgspecDecoder(schema_type=DepthUpdate)
+
+        decoded = decoder.decode('{"e": "depthUpdate", "b": [["1", "2"]], "extra": 1}')
+        self.assertIsInstance(decoded, DepthUpdate)
+        self.assertEqual([["1", "2"]], decoded.b)
+        self.assertEqual({"result": None, "id": 1}, decoder.decode('{"result": null, "id": 1}'))
+
+    def test_default_decoder(self):
+        decoder = default_json_decoder()
+        if orjson is not None:
+            self.assertIsInstance(decoder, OrjsonDecoder)
+        elif msgspec is not None:
+            self.assertIsInstance(decoder, MsgspecDecoder)
+        else:
+            self.assertIsInstance(decoder, StdlibJSONDecoder)
+        self._assert_decoder_behavior(decoder)
@@ -9,6 +9,7 @@ from aiohttp import WebSocketError
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoders import StdlibJSONDecoder
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -121,6 +122,23 @@ class WSConnectionTest(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_uses_configured_decoder(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.ws_connection.decoder = StdlibJSONDecoder()
+        await self.ws_connection.connect(self.ws_url)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps({"one": 1})
+        )
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message="pong"
+        )
+
+        response = await self.ws_connection.receive()
+        self.assertEqual({"one": 1}, response.data)
+        response = await self.ws_connection.receive()
+        self.assertEqual("pong", response.data)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     async def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
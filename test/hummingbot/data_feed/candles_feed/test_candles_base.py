@@ -2,6 +2,7 @@ import asyncio
 import json
 import os
 import re
+import tempfile
 import time
 from abc import ABC
 from collections import deque
@@ -13,7 +14,10 @@ import pandas as pd
 from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.streaming_indicators import RSI
 
 
 class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
@@ -79,6 +83,13 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
         self.assertEqual(len(self.data_feed._candles), 0)
         self.assertEqual(self.data_feed._candles.maxlen, self.max_records)
 
+    def test_requests_use_a_sliding_window_throttler(self):
+        throttler = self.data_feed._api_factory.throttler
+        self.assertIsInstance(throttler, SlidingWindowThrottler)
+        self.assertEqual(
+            sorted(rate_limit.limit_id for rate_limit in self.data_feed.rate_limits),
+            sorted(rate_limit.limit_id for rate_limit in throttler._rate_limits))
+
     def test_ready_property(self):
         self.assertFalse(self.data_feed.ready)
         self.data_feed._candles.extend(range(self.max_records))
@@ -90,6 +101,27 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_modified_by_caller_does_not_change_cache(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+        expected_df = pd.DataFrame(self._candles_data_mock(), columns=self.data_feed.columns, dtype=float)
+
+        candles_df = self.data_feed.candles_df
+        candles_df["close"] = 0.0
+        candles_df.loc[0, "open"] = 0.0
+        candles_df.values[:, 0] = 0.0
+        candles_df["RSI_2"] = 1.0
+
+        pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
+
+    def test_get_candles_df_with_indicators(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+
+        candles_df = self.data_feed.get_candles_df_with_indicators([RSI(length=2)])
+
+        self.assertEqual(list(self.data_feed.columns) + ["RSI_2"], list(candles_df.columns))
+        self.assertEqual(len(self._candles_data_mock()), len(candles_df))
+        np.testing.assert_array_equal(candles_df["RSI_2"].to_numpy(), self.data_feed.get_indicator_values("RSI_2"))
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -416,3 +448,34 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
             result = await self.data_feed.get_historical_candles(config)
             self.assertIsInstance(result, pd.DataFrame)
             mock_fetch_candles.assert_called_once()
+
+    async def test_get_historical_candles_with_candles_store(self):
+        from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+             patch.object(self.data_feed, '_round_timestamp_to_interval_multiple', side_effect=lambda x: x), \
+             patch.object(self.data_feed, 'initialize_exchange_data', new_callable=AsyncMock), \
+             patch.object(self.data_feed, 'fetch_candles', new_callable=AsyncMock) as mock_fetch_candles:
+
+            mock_fetch_candles.return_value = np.array([
+                [1622505600, 50100, 50200, 49950, 50150, 1000, 0, 0, 0, 0],
+                [1622505660, 50150, 50250, 50000, 50200, 1000, 0, 0, 0, 0],
+            ])
+            candles_store = CandlesStore(root_path=tmp_dir)
+            config = HistoricalCandlesConfig(
+                connector_name="test",
+                trading_pair="BTC-USDT",
+                interval="1m",
+                start_time=1622505600,
+                end_time=1622505660
+            )
+
+            result = await self.data_feed.get_historical_candles(config, candles_store=candles_store)
+            fetch_calls = mock_fetch_candles.call_count
+            cached_result = await self.data_feed.get_historical_candles(config, candles_store=candles_store)
+
+            # The second request is served from the store without fetching
+            self.assertEqual(fetch_calls, mock_fetch_candles.call_count)
+            self.assertEqual(2, len(result))
+            self.assertEqual(result["timestamp"].tolist(), cached_result["timestamp"].tolist())
+            self.assertEqual(result["close"].tolist(), cached_result["close"].tolist())
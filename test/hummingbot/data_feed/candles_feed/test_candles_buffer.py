@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesRingBuffer
+
+
+class CandlesRingBufferTest(unittest.TestCase):
+
+    def candle(self, timestamp: float):
+        return [timestamp, timestamp + 1, timestamp + 2]
+
+    def test_append_drops_oldest_when_full(self):
+        buffer = CandlesRingBuffer(maxlen=3, n_columns=3)
+        buffer.extend(self.candle(ts) for ts in range(5))
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual([2.0, 3.0, 4.0], buffer.column(0).tolist())
+        self.assertEqual(self.candle(4), buffer[-1])
+        self.assertEqual(self.candle(2), buffer[0])
+
+    def test_appendleft_drops_newest_when_full(self):
+        buffer = CandlesRingBuffer(maxlen=3, n_columns=3)
+        buffer.append(self.candle(10))
+        buffer.extendleft(self.candle(ts) for ts in (9, 8, 7))
+
+        self.assertEqual([7.0, 8.0, 9.0], buffer.column(0).tolist())
+
+    def test_many_appends_keep_chronological_view(self):
+        buffer = CandlesRingBuffer(maxlen=4, n_columns=3)
+        buffer.extend(self.candle(ts) for ts in range(100))
+
+        np.testing.assert_array_equal(np.array([self.candle(ts) for ts in range(96, 100)], dtype=float),
+                                      buffer.view())
+        np.testing.assert_array_equal(buffer.view(), np.array(buffer))
+
+    def test_setitem_updates_candle_and_version(self):
+        buffer = CandlesRingBuffer(maxlen=3, n_columns=3)
+        buffer.extend(self.candle(ts) for ts in range(2))
+        version = buffer.version
+
+        buffer[-1] = self.candle(5)
+
+        self.assertEqual(self.candle(5), buffer[-1])
+        self.assertGreater(buffer.version, version)
+
+    def test_view_is_read_only(self):
+        buffer = CandlesRingBuffer(maxlen=3, n_columns=3)
+        buffer.append(self.candle(1))
+
+        with self.assertRaises(ValueError):
+            buffer.view()[0, 0] = 5
+
+    def test_clear_and_index_error(self):
+        buffer = CandlesRingBuffer(maxlen=3, n_columns=3)
+        buffer.append(self.candle(1))
+        buffer.clear()
+
+        self.assertEqual(0, len(buffer))
+        self.assertFalse(buffer)
+        with self.assertRaises(IndexError):
+            buffer[-1]
+
+    def test_iteration(self):
+        buffer = CandlesRingBuffer(maxlen=3, n_columns=3)
+        buffer.extend(self.candle(ts) for ts in range(3))
+
+        self.assertEqual([self.candle(ts) for ts in range(3)], list(buffer))
+        self.assertEqual([self.candle(ts) for ts in reversed(range(3))], list(reversed(buffer)))
@@ -0,0 +1,77 @@
+import tempfile
+import unittest
+
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class CandlesStoreTest(unittest.TestCase):
+    columns = ["timestamp", "open", "high", "low", "close", "volume"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = CandlesStore(root_path=self.tmp_dir.name)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def candles_df(self, start: int, end: int, close: float = 1.0) -> pd.DataFrame:
+        return pd.DataFrame([[ts, close, close, close, close, 10.0] for ts in range(start, end + 60, 60)],
+                            columns=self.columns)
+
+    def write(self, start: int, end: int, close: float = 1.0):
+        self.store.write("binance", "BTC-USDT", "1m", self.candles_df(start, end, close),
+                         start_time=start, end_time=end, interval_in_seconds=60)
+
+    def test_empty_store(self):
+        self.assertEqual([], self.store.covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual([(0, 600)], self.store.missing_ranges("binance", "BTC-USDT", "1m", 0, 600, 60))
+        self.assertTrue(self.store.read("binance", "BTC-USDT", "1m", 0, 600).empty)
+
+    def test_missing_ranges_with_gaps(self):
+        self.write(120, 240)
+        self.write(480, 600)
+
+        self.assertEqual([(120, 240), (480, 600)], self.store.covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual([(0, 60), (300, 420), (660, 720)],
+                         self.store.missing_ranges("binance", "BTC-USDT", "1m", 0, 720, 60))
+        self.assertEqual([], self.store.missing_ranges("binance", "BTC-USDT", "1m", 480, 600, 60))
+
+    def test_contiguous_ranges_are_merged(self):
+        self.write(0, 120)
+        self.write(180, 300)
+
+        self.assertEqual([(0, 300)], self.store.covered_ranges("binance", "BTC-USDT", "1m"))
+
+    def test_read_range(self):
+        self.write(0, 600)
+
+        candles = self.store.read("binance", "BTC-USDT", "1m", 120, 240)
+
+        self.assertEqual(self.columns, list(candles.columns))
+        self.assertEqual([120, 180, 240], candles["timestamp"].tolist())
+
+    def test_write_keeps_latest_candles_sorted(self):
+        self.write(120, 240, close=1.0)
+        self.write(0, 180, close=2.0)
+
+        candles = self.store.read("binance", "BTC-USDT", "1m", 0, 240)
+
+        self.assertEqual([0, 60, 120, 180, 240], candles["timestamp"].tolist())
+        self.assertEqual([2.0, 2.0, 2.0, 2.0, 1.0], candles["close"].tolist())
+
+    def test_range_without_candles_is_covered(self):
+        self.store.write("binance", "BTC-USDT", "1m", pd.DataFrame(columns=self.columns),
+                         start_time=0, end_time=600, interval_in_seconds=60)
+
+        self.assertEqual([], self.store.missing_ranges("binance", "BTC-USDT", "1m", 0, 600, 60))
+        self.assertTrue(self.store.read("binance", "BTC-USDT", "1m", 0, 600).empty)
+
+    def test_clear(self):
+        self.write(0, 600)
+        self.store.clear("binance", "BTC-USDT", "1m")
+
+        self.assertEqual([], self.store.covered_ranges("binance", "BTC-USDT", "1m"))
@@ -0,0 +1,152 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesRingBuffer
+from hummingbot.data_feed.candles_feed.streaming_indicators import (
+    MACD,
+    NATR,
+    RSI,
+    BBands,
+    CandlesIndicators,
+    SuperTrend,
+    calculate_indicators,
+)
+
+
+class StreamingIndicatorsTest(unittest.TestCase):
+    columns = ["timestamp", "open", "high", "low", "close", "volume"]
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        rng = np.random.default_rng(7)
+        close = 100 + np.cumsum(rng.normal(0, 1, 300))
+        cls.candles_df = pd.DataFrame({
+            "timestamp": np.arange(300, dtype=float) * 60,
+            "open": close + rng.normal(0, 0.2, 300),
+            "high": close + rng.uniform(0.5, 1.5, 300),
+            "low": close - rng.uniform(0.5, 1.5, 300),
+            "close": close,
+            "volume": rng.uniform(1, 10, 300),
+        })
+
+    @staticmethod
+    def wilder_average(values: pd.Series, length: int) -> pd.Series:
+        values = values.to_numpy()
+        result = np.full(len(values), np.nan)
+        first = int(np.argmax(~np.isnan(values)))
+        result[first + length - 1] = values[first:first + length].mean()
+        for i in range(first + length, len(values)):
+            result[i] = result[i - 1] + (values[i] - result[i - 1]) / length
+        return pd.Series(result)
+
+    def test_bbands_match_rolling_mean_and_std(self):
+        result = calculate_indicators(self.candles_df, [BBands(length=20, lower_std=2.0, upper_std=2.0)])
+
+        close = self.candles_df["close"]
+        mid = close.rolling(20).mean()
+        std = close.rolling(20).std(ddof=0)
+        np.testing.assert_allclose(mid, result["BBM_20_2.0_2.0"], equal_nan=True)
+        np.testing.assert_allclose(mid - 2 * std, result["BBL_20_2.0_2.0"], equal_nan=True)
+        np.testing.assert_allclose((close - (mid - 2 * std)) / (4 * std), result["BBP_20_2.0_2.0"], equal_nan=True)
+
+    def test_rsi_and_natr_use_wilder_smoothing(self):
+        result = calculate_indicators(self.candles_df, [RSI(length=14), NATR(length=14)])
+
+        change = self.candles_df["close"].diff()
+        avg_gain = self.wilder_average(change.clip(lower=0), 14)
+        avg_loss = self.wilder_average(-change.clip(upper=0), 14)
+        np.testing.assert_allclose(100 * avg_gain / (avg_gain + avg_loss), result["RSI_14"], equal_nan=True)
+
+        prev_close = self.candles_df["close"].shift()
+        true_range = pd.concat([self.candles_df["high"] - self.candles_df["low"],
+                                (self.candles_df["high"] - prev_close).abs(),
+                                (self.candles_df["low"] - prev_close).abs()], axis=1).max(axis=1, skipna=False)
+        atr = self.wilder_average(true_range, 14)
+        np.testing.assert_allclose(100 * atr / self.candles_df["close"], result["NATR_14"], equal_nan=True)
+
+    def test_macd_matches_seeded_ema(self):
+        result = calculate_indicators(self.candles_df, [MACD(fast=12, slow=26, signal=9)])
+
+        close = self.candles_df["close"]
+        slow = close.copy()
+        slow.iloc[:25] = np.nan
+        slow.iloc[25] = close.iloc[:26].mean()
+        fast = close.copy()
+        fast.iloc[:25] = np.nan
+        fast.iloc[25] = close.iloc[14:26].mean()
+        macd = fast.ewm(span=12, adjust=False).mean() - slow.ewm(span=26, adjust=False).mean()
+        signal = macd.copy()
+        signal.iloc[:33] = np.nan
+        signal.iloc[33] = macd.iloc[25:34].mean()
+        signal = signal.ewm(span=9, adjust=False).mean()
+
+        self.assertTrue(result["MACD_12_26_9"].iloc[:33].isna().all())
+        np.testing.assert_allclose(macd.iloc[33:], result["MACD_12_26_9"].iloc[33:])
+        np.testing.assert_allclose(signal.iloc[33:], result["MACDs_12_26_9"].iloc[33:])
+        np.testing.assert_allclose((macd - signal).iloc[33:], result["MACDh_12_26_9"].iloc[33:])
+
+    def test_supertrend_direction_and_bands(self):
+        result = calculate_indicators(self.candles_df, [SuperTrend(length=7, multiplier=3.0)])
+
+        direction = result["SUPERTd_7_3.0"]
+        self.assertTrue(direction.isin([1, -1]).all())
+        self.assertTrue(result["SUPERT_7_3.0"].iloc[:7].isna().all())
+        long_trend = direction.iloc[7:] > 0
+        np.testing.assert_allclose(result["SUPERT_7_3.0"].iloc[7:][long_trend],
+                                   result["SUPERTl_7_3.0"].iloc[7:][long_trend])
+        self.assertTrue(result["SUPERTs_7_3.0"].iloc[7:][long_trend].isna().all())
+
+    def test_streaming_updates_match_batch_calculation(self):
+        indicators = [BBands(length=20), MACD(), RSI(), NATR(), SuperTrend()]
+        expected = calculate_indicators(self.candles_df, [BBands(length=20), MACD(), RSI(), NATR(), SuperTrend()])
+        buffer = CandlesRingBuffer(maxlen=500, n_columns=len(self.columns))
+        candles_indicators = CandlesIndicators(buffer)
+        for indicator in indicators:
+            candles_indicators.add(indicator)
+
+        for candle in self.candles_df.to_numpy():
+            # Every candle is first received in progress, with a different close, and later updated
+            in_progress = candle.copy()
+            in_progress[4] = candle[4] + 5
+            buffer.append(in_progress)
+            candles_indicators.sync()
+            buffer[-1] = candle
+            candles_indicators.sync()
+
+        np.testing.assert_allclose(expected.to_numpy(), candles_indicators.get_df().to_numpy(), equal_nan=True)
+
+    def test_history_filled_before_the_first_candle_recalculates_values(self):
+        candles = self.candles_df.to_numpy()
+        buffer = CandlesRingBuffer(maxlen=500, n_columns=len(self.columns))
+        candles_indicators = CandlesIndicators(buffer)
+        candles_indicators.add(RSI())
+        buffer.extend(candles[200:])
+        candles_indicators.sync()
+
+        buffer.extendleft(candles[:200][::-1])
+
+        expected = calculate_indicators(self.candles_df, [RSI()])
+        np.testing.assert_allclose(expected["RSI_14"], candles_indicators.get_column("RSI_14"), equal_nan=True)
+
+    def test_oldest_candles_dropped_keep_alignment(self):
+        candles = self.candles_df.to_numpy()
+        buffer = CandlesRingBuffer(maxlen=50, n_columns=len(self.columns))
+        candles_indicators = CandlesIndicators(buffer)
+        candles_indicators.add(RSI())
+        for candle in candles:
+            buffer.append(candle)
+            candles_indicators.sync()
+
+        expected = calculate_indicators(self.candles_df, [RSI()])
+        np.testing.assert_allclose(expected["RSI_14"].iloc[-50:], candles_indicators.get_column("RSI_14"))
+
+    def test_add_returns_existing_indicator_with_same_columns(self):
+        candles_indicators = CandlesIndicators(CandlesRingBuffer(maxlen=10, n_columns=len(self.columns)))
+        rsi = candles_indicators.add(RSI(length=14))
+
+        self.assertIs(rsi, candles_indicators.add(RSI(length=14)))
+        candles_indicators.add(RSI(length=7))
+        self.assertEqual(["RSI_14", "RSI_7"], candles_indicators.columns)
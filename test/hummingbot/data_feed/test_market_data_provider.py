@@ -84,9 +84,10 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
 
     def test_get_order_book_snapshot(self):
         mock_order_book = MagicMock()
-        mock_order_book.snapshot = (pd.DataFrame(), pd.DataFrame())
+        mock_order_book.get_snapshot.return_value = (pd.DataFrame(), pd.DataFrame())
         self.mock_connector.get_order_book.return_value = mock_order_book
         snapshot = self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT")
+        mock_order_book.get_snapshot.assert_called_once_with(None)
         self.assertIsInstance(snapshot, tuple)
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
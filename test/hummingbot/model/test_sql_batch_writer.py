@@ -0,0 +1,108 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_batch_writer import SQLBatchWriter, after_commit
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLBatchWriterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(self.temp_dir.name, "test.sqlite"),
+        )
+        self.writer = SQLBatchWriter(self.manager, max_batch_size=10)
+
+    def tearDown(self) -> None:
+        self.writer.stop()
+        self.manager.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def stored_keys(self):
+        with self.manager.get_new_session() as session:
+            return sorted(row.key for row in session.query(Metadata).filter(Metadata.key.like("key_%")))
+
+    def test_operations_are_written_by_the_writer_thread(self):
+        threads = []
+
+        def add(key: str):
+            def operation(session):
+                threads.append(threading.current_thread())
+                session.add(Metadata(key=key, value="1"))
+            return operation
+
+        for i in range(25):
+            self.writer.submit(add(f"key_{i:02d}"))
+        self.writer.flush()
+
+        self.assertEqual([f"key_{i:02d}" for i in range(25)], self.stored_keys())
+        self.assertEqual(0, self.writer.pending_operations)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_failing_operation_does_not_discard_the_batch(self):
+        blocker = threading.Event()
+        self.writer.submit(lambda session: blocker.wait())
+        self.writer.submit(lambda session: session.add(Metadata(key="key_1", value="1")))
+
+        def fail(session):
+            raise ValueError("Invalid operation")
+
+        self.writer.submit(fail)
+        self.writer.submit(lambda session: session.add(Metadata(key="key_2", value="2")))
+        blocker.set()
+
+        with self.assertLogs(logger=SQLBatchWriter.logger(), level="ERROR"):
+            self.writer.flush()
+
+        self.assertEqual(["key_1", "key_2"], self.stored_keys())
+
+    def test_after_commit_callbacks_only_run_for_committed_operations(self):
+        committed = []
+        blocker = threading.Event()
+        self.writer.submit(lambda session: blocker.wait())
+
+        def add(key: str):
+            def operation(session):
+                session.add(Metadata(key=key, value="1"))
+                after_commit(session, lambda: committed.append(key))
+            return operation
+
+        def fail(session):
+            after_commit(session, lambda: committed.append("failed"))
+            raise ValueError("Invalid operation")
+
+        self.writer.submit(add("key_1"))
+        self.writer.submit(fail)
+        self.writer.submit(add("key_2"))
+        blocker.set()
+
+        with self.assertLogs(logger=SQLBatchWriter.logger(), level="ERROR"):
+            self.writer.flush()
+
+        self.assertEqual(["key_1", "key_2"], committed)
+        self.assertEqual(["key_1", "key_2"], self.stored_keys())
+
+    def test_stop_writes_pending_operations(self):
+        for i in range(5):
+            self.writer.submit(lambda session, i=i: session.add(Metadata(key=f"key_{i}", value="1")))
+
+        self.writer.stop()
+
+        self.assertFalse(self.writer.is_running)
+        self.assertEqual([f"key_{i}" for i in range(5)], self.stored_keys())
+
+    def test_sqlite_database_uses_wal_mode(self):
+        with self.manager.engine.connect() as conn:
+            journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+
+        self.assertEqual("wal", journal_mode)
@@ -1,5 +1,8 @@
+import asyncio
+import time
 import unittest
 from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from typing import List
 
 import pandas as pd
@@ -8,6 +11,7 @@ from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import Quant
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.event.events import OrderType
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
@@ -149,3 +153,57 @@ class ScriptStrategyBaseTest(unittest.TestCase):
                 message=f"({self.trading_pair}) Canceling the limit order {order_id}."
             )
         )
+
+
+class OrderBookWakeupScriptStrategy(ScriptStrategyBase):
+
+    def __init__(self, connectors):
+        super().__init__(connectors)
+        self.on_tick_timestamps = []
+
+    def on_tick(self):
+        self.on_tick_timestamps.append(self.current_timestamp)
+
+
+class ScriptStrategyOrderBookWakeupsTest(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "HBOT-USDT"
+    connector_name = "mock_paper_exchange"
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.connector = MockPaperExchange()
+        self.connector.set_balanced_order_book(trading_pair=self.trading_pair,
+                                               mid_price=100,
+                                               min_price=50,
+                                               max_price=150,
+                                               price_step_size=1,
+                                               volume_step_size=10)
+        OrderBookWakeupScriptStrategy.markets = {self.connector_name: {self.trading_pair}}
+        self.strategy = OrderBookWakeupScriptStrategy({self.connector_name: self.connector})
+        self.strategy.ready_to_trade = True
+        self.clock = Clock(ClockMode.REALTIME, tick_size=60)
+        self.clock.add_iterator(self.strategy)
+
+    async def test_top_of_book_change_ticks_strategy_early(self):
+        order_book = self.connector.get_order_book(self.trading_pair)
+        self.strategy.enable_order_book_wakeups(min_interval=0.01, debounce_interval=0)
+        self.assertTrue(self.strategy.order_book_wakeups_enabled)
+        self.assertTrue(order_book.top_of_book_events_enabled)
+
+        with self.clock:
+            clock_task = asyncio.get_running_loop().create_task(self.clock.run_til(time.time() + 120))
+            await asyncio.sleep(0.01)
+            order_book.apply_diffs([OrderBookRow(99.7, 1, 2)], [], 2)
+            order_book.apply_diffs([OrderBookRow(99.8, 1, 3)], [], 3)
+            await asyncio.sleep(0.05)
+            early_wakeups = self.strategy.early_wakeups_count
+            on_tick_timestamps = list(self.strategy.on_tick_timestamps)
+            clock_task.cancel()
+
+        self.assertEqual(1, early_wakeups)
+        self.assertEqual(1, len(on_tick_timestamps))
+        self.assertGreater(on_tick_timestamps[0], self.clock.current_timestamp)
+
+        self.strategy.disable_order_book_wakeups()
+        self.assertFalse(self.strategy.order_book_wakeups_enabled)
+        self.assertFalse(order_book.top_of_book_events_enabled)
@@ -256,3 +256,55 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def make_trade(self, timestamp: float, price: float, amount: float) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(
+            trading_pair="COINALPHAHBOT",
+            timestamp=timestamp,
+            price=price,
+            amount=amount,
+            type=TradeType.SELL,
+        )
+
+    def test_trades_are_matched_with_latest_previous_quote(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 5)
+        indicator.last_quotes = [{"timestamp": 3, "price": 10}, {"timestamp": 2, "price": 20}, {"timestamp": 1, "price": 30}]
+
+        indicator.register_trade(self.make_trade(timestamp=2.5, price=21, amount=1))
+        indicator.register_trade(self.make_trade(timestamp=1.5, price=35, amount=2))
+        indicator.register_trade(self.make_trade(timestamp=0.5, price=35, amount=3))
+        indicator.calculate(4)
+
+        self.assertEqual({2: [{"price_level": 5, "amount": 2}], 3: [{"price_level": 1, "amount": 1}]},
+                         indicator.trade_samples)
+        # Only the quotes after the latest matched quote are kept
+        self.assertEqual([4, 3, 2], [quote["timestamp"] for quote in indicator.last_quotes])
+
+    def test_only_latest_samples_are_kept(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 1}]
+
+        for i in range(1, 5):
+            indicator.register_trade(self.make_trade(timestamp=self.start_timestamp + i - 0.5, price=2, amount=1))
+            indicator.calculate(self.start_timestamp + i)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertEqual([self.start_timestamp + 3, self.start_timestamp + 4], sorted(indicator.trade_samples.keys()))
+
+    def test_intensity_is_not_fitted_again_until_samples_change_enough(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, min_refit_change=0.5)
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 1}]
+        for price, amount in zip([2, 3, 4, 5], [2, 1.5, 1, 0.5]):
+            indicator.register_trade(self.make_trade(timestamp=self.start_timestamp + 0.5, price=price, amount=amount))
+        indicator.calculate(self.start_timestamp + 1)
+        first_value = indicator.current_value
+
+        indicator.register_trade(self.make_trade(timestamp=self.start_timestamp + 0.5, price=6, amount=1))
+        indicator.calculate(self.start_timestamp + 2)
+
+        self.assertEqual(first_value, indicator.current_value)
+
+        indicator.register_trade(self.make_trade(timestamp=self.start_timestamp + 0.5, price=7, amount=5))
+        indicator.calculate(self.start_timestamp + 3)
+
+        self.assertNotEqual(first_value, indicator.current_value)
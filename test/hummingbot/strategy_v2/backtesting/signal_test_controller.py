@@ -0,0 +1,69 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+from hummingbot.strategy_v2.models.executor_actions import ExecutorAction, StopExecutorAction
+
+
+class SignalTestControllerConfig(DirectionalTradingControllerConfigBase):
+    """
+    Config of the controller used by the backtesting tests, loaded with controllers_module "test.hummingbot.strategy_v2"
+    """
+    controller_type: str = "backtesting"
+    controller_name: str = "signal_test_controller"
+    interval: str = "1m"
+    sma_length: int = 10
+
+
+class SignalTestController(DirectionalTradingControllerBase):
+    """
+    Goes long when the close is above its moving average and short when it is below, stopping the executors of the
+    opposite side when the signal flips.
+    """
+
+    async def update_processed_data(self):
+        df = self.market_data_provider.get_candles_df(connector_name=self.config.connector_name,
+                                                      trading_pair=self.config.trading_pair,
+                                                      interval=self.config.interval)
+        features = df[["timestamp", "close"]].copy()
+        sma = features["close"].rolling(self.config.sma_length).mean()
+        features["signal"] = np.where(features["close"] > sma, 1, -1)
+        features.loc[sma.isna(), "signal"] = 0
+        self.processed_data = {"signal": int(features["signal"].iloc[-1]), "features": features}
+
+    def stop_actions_proposal(self) -> List[ExecutorAction]:
+        signal = self.processed_data["signal"]
+        if signal == 0:
+            return []
+        opposite_side = TradeType.SELL if signal > 0 else TradeType.BUY
+        return [StopExecutorAction(controller_id=self.config.id, executor_id=executor.id)
+                for executor in self.executors_info if executor.is_active and executor.side == opposite_side]
+
+
+def sample_candles(start: int, n_bars: int, interval: int = 60) -> pd.DataFrame:
+    """
+    Builds deterministic candles oscillating around 100 with some noise, so that the signal flips many times.
+    """
+    timestamps = np.arange(start, start + n_bars * interval, interval, dtype=float)
+    random_state = np.random.RandomState(42)
+    closes = 100 + 2 * np.sin(np.arange(n_bars) / 15) + random_state.normal(0, 0.3, n_bars).cumsum() * 0.1
+    opens = np.concatenate([[closes[0]], closes[:-1]])
+    spreads = np.abs(random_state.normal(0, 0.2, n_bars))
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": opens,
+        "high": np.maximum(opens, closes) + spreads,
+        "low": np.minimum(opens, closes) - spreads,
+        "close": closes,
+        "volume": np.full(n_bars, 10.0),
+        "quote_asset_volume": closes * 10,
+        "n_trades": np.full(n_bars, 5.0),
+        "taker_buy_base_volume": np.full(n_bars, 5.0),
+        "taker_buy_quote_volume": closes * 5,
+    })
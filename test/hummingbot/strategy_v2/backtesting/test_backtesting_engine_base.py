@@ -0,0 +1,157 @@
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.signal_test_controller import (
+    SignalTestController,
+    SignalTestControllerConfig,
+    sample_candles,
+)
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import patch
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class TriggerTestController(SignalTestController):
+    """
+    Creates executors on the bars flagged by the "trigger" feature, a column that is not one of the signal columns
+    declared by the directional controllers
+    """
+
+    async def update_processed_data(self):
+        await super().update_processed_data()
+        features = self.processed_data["features"]
+        features["trigger"] = (features.index % 25 == 20).astype(int)
+        features["signal"] = 0
+        self.processed_data["signal"] = 0
+
+    def determine_executor_actions(self):
+        self.processed_data["signal"] = self.processed_data.get("trigger", 0)
+        return super().determine_executor_actions()
+
+
+class DeclaredTriggerTestController(TriggerTestController):
+
+    def get_signal_columns(self):
+        return super().get_signal_columns() + ["trigger"]
+
+
+class BacktestingEngineBaseTest(IsolatedAsyncioWrapperTestCase):
+    start = 1_700_000_000
+    n_bars = 600
+
+    def setUp(self) -> None:
+        super().setUp()
+        rate_sources_patch = patch.object(MarketDataProvider, "initialize_rate_sources")
+        rate_sources_patch.start()
+        self.addCleanup(rate_sources_patch.stop)
+        self.controller_config = SignalTestControllerConfig(
+            id="test",
+            connector_name="binance_perpetual",
+            trading_pair="ETH-USDT",
+            total_amount_quote=Decimal("1000"),
+            max_executors_per_side=2,
+            cooldown_time=60 * 3,
+            stop_loss=Decimal("0.01"),
+            take_profit=Decimal("0.01"),
+            time_limit=60 * 20,
+        )
+
+    def create_engine(self) -> BacktestingEngineBase:
+        engine = BacktestingEngineBase()
+        data_provider = engine.backtesting_data_provider
+        data_provider.candles_feeds["binance_perpetual_ETH-USDT_1m"] = sample_candles(self.start, self.n_bars)
+        data_provider.trading_rules = {"binance_perpetual": {"ETH-USDT": TradingRule(trading_pair="ETH-USDT")}}
+        return engine
+
+    async def run_backtesting(self, vectorized: bool, controller_class=SignalTestController):
+        engine = self.create_engine()
+        with patch.object(SignalTestControllerConfig, "get_controller_class", return_value=controller_class):
+            return await engine.run_backtesting(controller_config=self.controller_config,
+                                                start=self.start,
+                                                end=self.start + (self.n_bars - 1) * 60,
+                                                backtesting_resolution="1m",
+                                                vectorized=vectorized)
+
+    def create_controller(self, engine: BacktestingEngineBase, controller_class=SignalTestController):
+        engine.controller = controller_class(config=self.controller_config,
+                                             market_data_provider=engine.backtesting_data_provider,
+                                             actions_queue=None)
+        return engine.controller
+
+    def assert_same_executors(self, iterrows_executors_info, vectorized_executors_info):
+        iterrows_executors = self.executors_summary(iterrows_executors_info)
+        vectorized_executors = self.executors_summary(vectorized_executors_info)
+        self.assertEqual(iterrows_executors, vectorized_executors)
+        return iterrows_executors
+
+    @staticmethod
+    def executors_summary(executors_info):
+        return sorted(
+            (executor.timestamp, executor.side, executor.close_type, executor.close_timestamp,
+             round(float(executor.net_pnl_quote), 8))
+            for executor in executors_info
+        )
+
+    async def test_vectorized_simulation_matches_iterrows_simulation(self):
+        iterrows_result = await self.run_backtesting(vectorized=False)
+        vectorized_result = await self.run_backtesting(vectorized=True)
+
+        iterrows_executors = self.assert_same_executors(iterrows_result["executors"], vectorized_result["executors"])
+        self.assertGreater(len(iterrows_executors), 10)
+        # The signal flips and the cooldown are both exercised
+        close_types = {executor[2] for executor in iterrows_executors}
+        self.assertIn(CloseType.EARLY_STOP, close_types)
+        self.assertGreater(len(close_types), 1)
+        self.assertAlmostEqual(iterrows_result["results"]["net_pnl_quote"],
+                               vectorized_result["results"]["net_pnl_quote"])
+        self.assertEqual(iterrows_result["results"]["total_executors"],
+                         vectorized_result["results"]["total_executors"])
+
+    async def test_vectorized_simulation_matches_iterrows_simulation_with_single_executor_per_side(self):
+        self.controller_config.max_executors_per_side = 1
+
+        iterrows_result = await self.run_backtesting(vectorized=False)
+        vectorized_result = await self.run_backtesting(vectorized=True)
+
+        self.assert_same_executors(iterrows_result["executors"], vectorized_result["executors"])
+        self.assertAlmostEqual(iterrows_result["results"]["net_pnl_quote"],
+                               vectorized_result["results"]["net_pnl_quote"])
+
+    async def test_vectorized_simulation_ignores_columns_not_in_signal_columns(self):
+        # The controller is not evaluated on the bars where only a column outside its signal columns changes, so a
+        # controller acting on such a column diverges from the iterrows simulation unless the column is declared
+        self.controller_config.controller_name = "trigger_test_controller"
+        iterrows_result = await self.run_backtesting(vectorized=False, controller_class=TriggerTestController)
+        vectorized_result = await self.run_backtesting(vectorized=True, controller_class=TriggerTestController)
+
+        self.assertGreater(len(iterrows_result["executors"]), 0)
+        self.assertEqual(0, len(vectorized_result["executors"]))
+
+        self.controller_config.controller_name = "declared_trigger_test_controller"
+        declared_result = await self.run_backtesting(vectorized=True, controller_class=DeclaredTriggerTestController)
+        self.assert_same_executors(iterrows_result["executors"], declared_result["executors"])
+
+    async def test_vectorized_simulation_without_market_data(self):
+        engine = self.create_engine()
+        self.create_controller(engine).processed_data = {}
+        with patch.object(engine, "prepare_market_data", return_value=sample_candles(self.start, 5).iloc[0:0]):
+            self.assertEqual([], await engine.simulate_execution_vectorized(trade_cost=0.0006))
+
+    def test_controller_wakeup_mask(self):
+        engine = self.create_engine()
+        controller = self.create_controller(engine)
+        features = sample_candles(self.start, 5)
+        features["signal"] = [0, 1, 1, -1, -1]
+        features["reference_price"] = [1, 1, 1, 1, 2]
+
+        self.assertEqual([True, True, False, True, False], list(engine.controller_wakeup_mask(features)))
+        self.assertEqual([True] * 5, list(engine.controller_wakeup_mask(sample_candles(self.start, 5))))
+        self.assertEqual([False, True, True, True, True], list(engine.pending_signal_mask(features)))
+        self.assertEqual(60 * 3, controller.get_wakeup_interval())
+
+        # Controllers that don't declare their signal columns are evaluated on every bar
+        with patch.object(controller, "get_signal_columns", return_value=None):
+            self.assertEqual([True] * 5, list(engine.controller_wakeup_mask(features)))
+            self.assertEqual([True] * 5, list(engine.pending_signal_mask(features)))
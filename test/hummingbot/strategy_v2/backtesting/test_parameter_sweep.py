@@ -0,0 +1,152 @@
+import gc
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.signal_test_controller import SignalTestControllerConfig, sample_candles
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import patch
+
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.strategy_v2.backtesting import parameter_sweep
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.parameter_sweep import BacktestingSweepRunner, grid_overrides, random_overrides
+
+
+class ParameterSweepTest(unittest.TestCase):
+    param_grid = {
+        "take_profit": [0.01, 0.02, 0.03],
+        "stop_loss": [0.01, 0.02],
+        "time_limit": [600, 1200],
+    }
+
+    def test_grid_overrides(self):
+        overrides = grid_overrides(self.param_grid)
+
+        self.assertEqual(12, len(overrides))
+        self.assertEqual({"take_profit": 0.01, "stop_loss": 0.01, "time_limit": 600}, overrides[0])
+        self.assertEqual({"take_profit": 0.03, "stop_loss": 0.02, "time_limit": 1200}, overrides[-1])
+
+    def test_random_overrides_are_distinct_grid_combinations(self):
+        overrides = random_overrides(self.param_grid, n_samples=5, seed=1)
+
+        self.assertEqual(5, len(overrides))
+        grid = grid_overrides(self.param_grid)
+        for override in overrides:
+            self.assertIn(override, grid)
+            self.assertEqual(list(self.param_grid.keys()), list(override.keys()))
+        self.assertEqual(5, len({tuple(override.values()) for override in overrides}))
+
+    def test_random_overrides_are_reproducible(self):
+        self.assertEqual(random_overrides(self.param_grid, n_samples=5, seed=1),
+                         random_overrides(self.param_grid, n_samples=5, seed=1))
+
+    def test_random_overrides_return_whole_grid_when_smaller_than_sample(self):
+        self.assertEqual(grid_overrides(self.param_grid), random_overrides(self.param_grid, n_samples=100))
+
+    def test_results_columns(self):
+        columns = BacktestingSweepRunner.results_columns(grid_overrides(self.param_grid))
+
+        self.assertEqual(["take_profit", "stop_loss", "time_limit"], columns[:3])
+        self.assertIn("net_pnl_quote", columns)
+        self.assertEqual("error", columns[-1])
+
+
+class BacktestingSweepRunnerTest(IsolatedAsyncioWrapperTestCase):
+    start = 1_700_000_000
+    n_bars = 300
+    candles_key = "binance_perpetual_ETH-USDT_1m"
+    base_config = {
+        "id": "test",
+        "controller_name": "signal_test_controller",
+        "controller_type": "backtesting",
+        "connector_name": "binance_perpetual",
+        "trading_pair": "ETH-USDT",
+        "total_amount_quote": 1000,
+        "cooldown_time": 180,
+        "time_limit": 1200,
+    }
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.downloaded_feeds = []
+        for patcher in (
+            patch.object(MarketDataProvider, "initialize_rate_sources"),
+            patch.object(BacktestingDataProvider, "get_candles_feed", autospec=True, side_effect=self.get_candles_feed),
+            patch.object(BacktestingDataProvider, "initialize_trading_rules", autospec=True,
+                         side_effect=self.initialize_trading_rules),
+            # The workers run in threads of this process, so that the patches apply to them
+            patch.object(parameter_sweep, "ProcessPoolExecutor", ThreadPoolExecutor),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.release_worker_state)
+
+    async def get_candles_feed(self, data_provider, config):
+        key = f"{config.connector}_{config.trading_pair}_{config.interval}"
+        if key not in data_provider.candles_feeds:
+            self.downloaded_feeds.append(key)
+            data_provider.candles_feeds[key] = sample_candles(self.start, self.n_bars)
+        return data_provider.candles_feeds[key]
+
+    async def initialize_trading_rules(self, data_provider, connector_name):
+        if len(data_provider.trading_rules.get(connector_name, {})) == 0:
+            data_provider.trading_rules[connector_name] = {"ETH-USDT": TradingRule(trading_pair="ETH-USDT")}
+
+    @staticmethod
+    def release_worker_state():
+        parameter_sweep._worker_engine = None
+        gc.collect()
+        for shm in parameter_sweep._worker_shared_memories:
+            shm.close()
+        parameter_sweep._worker_shared_memories.clear()
+
+    def create_runner(self) -> BacktestingSweepRunner:
+        return BacktestingSweepRunner(base_config=self.base_config,
+                                      start=self.start,
+                                      end=self.start + (self.n_bars - 1) * 60,
+                                      max_workers=1,
+                                      controllers_module="test.hummingbot.strategy_v2")
+
+    async def test_run_grid(self):
+        overrides = grid_overrides({"take_profit": [0.005, 0.01], "stop_loss": [0.005, 0.01]})
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "sweep.csv")
+            results_df = await self.create_runner().run(overrides, output_path=output_path)
+            csv_df = pd.read_csv(output_path)
+
+        self.assertEqual(BacktestingSweepRunner.results_columns(overrides), list(results_df.columns))
+        self.assertEqual(4, len(results_df))
+        self.assertEqual(4, len(csv_df))
+        self.assertTrue(results_df["error"].isna().all())
+        self.assertTrue((results_df["total_executors"] > 0).all())
+        self.assertEqual(sorted(tuple(override.values()) for override in overrides),
+                         sorted(results_df[["take_profit", "stop_loss"]].itertuples(index=False, name=None)))
+        # The candles were only downloaded once, the worker reads them from the shared memory
+        self.assertEqual([self.candles_key], self.downloaded_feeds)
+        worker_candles = parameter_sweep._worker_engine.backtesting_data_provider.candles_feeds[self.candles_key]
+        self.assertFalse(worker_candles.to_numpy().flags.writeable)
+        self.assertEqual([], self.create_runner()._shared_memories)
+
+        # Each result is the same as running the backtest directly
+        engine = BacktestingEngineBase()
+        engine.backtesting_data_provider.candles_feeds[self.candles_key] = sample_candles(self.start, self.n_bars)
+        controller_config = SignalTestControllerConfig(**{**self.base_config, **overrides[0]})
+        direct_result = await engine.run_backtesting(controller_config=controller_config,
+                                                     start=self.start,
+                                                     end=self.start + (self.n_bars - 1) * 60)
+        sweep_result = results_df[(results_df["take_profit"] == 0.005) & (results_df["stop_loss"] == 0.005)].iloc[0]
+        self.assertAlmostEqual(float(direct_result["results"]["net_pnl_quote"]), sweep_result["net_pnl_quote"])
+        self.assertEqual(Decimal("0.005"), controller_config.take_profit)
+
+    async def test_failed_backtest_is_reported_in_error_column(self):
+        results_df = await self.create_runner().run([{"take_profit": -1}])
+
+        self.assertEqual(1, len(results_df))
+        self.assertIn("ValidationError", results_df["error"].iloc[0])
@@ -69,6 +69,25 @@ class TestDCAExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.assertEqual(executor.max_amount_quote, Decimal("60"))
         self.assertEqual(executor.close_filled_amount_quote, Decimal("0"))
 
+    @patch.object(DCAExecutor, "get_price")
+    def test_executor_info_follows_market_price(self, mock_price):
+        mock_price.return_value = Decimal("120")
+        config = DCAExecutorConfig(id="test", timestamp=123, side=TradeType.BUY, connector_name="binance",
+                                   trading_pair="ETH-USDT",
+                                   amounts_quote=[Decimal(10), Decimal(20), Decimal(30)],
+                                   prices=[Decimal(100), Decimal(80), Decimal(60)])
+        executor = self.get_dca_executor_from_config(config)
+        executor._status = RunnableStatus.RUNNING
+
+        executor_info = executor.executor_info
+        self.assertEqual(Decimal("120"), executor_info.custom_info["current_market_price"])
+        self.assertIs(executor_info, executor.executor_info)
+
+        mock_price.return_value = Decimal("110")
+        executor_info = executor.executor_info
+        self.assertEqual(Decimal("110"), executor_info.custom_info["current_market_price"])
+        self.assertEqual(Decimal("110"), executor_info.custom_info["close_price"])
+
     @patch.object(DCAExecutor, "get_price")
     def test_get_custom_info(self, get_price_mock):
         get_price_mock.return_value = Decimal("120")
@@ -727,6 +727,51 @@ class TestPositionExecutor(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(executor_info.close_type, CloseType.FAILED)
         self.assertEqual(executor_info.net_pnl_pct, Decimal("0"))
 
+    @patch.object(PositionExecutor, "filled_amount_quote", new_callable=PropertyMock, return_value=Decimal("100"))
+    @patch.object(PositionExecutor, "get_net_pnl_pct", return_value=Decimal("0"))
+    @patch.object(PositionExecutor, "get_cum_fees_quote", return_value=Decimal("0"))
+    @patch.object(PositionExecutor, "get_net_pnl_quote")
+    def test_executor_info_is_cached_until_it_changes(self, net_pnl_quote_mock, *_):
+        net_pnl_quote_mock.return_value = Decimal("1")
+        position_config = self.get_position_config_market_long()
+        position_executor = self.get_position_executor_running_from_config(position_config)
+
+        executor_info = position_executor.executor_info
+        self.assertIs(executor_info, position_executor.executor_info)
+        self.assertEqual(Decimal("1"), executor_info.net_pnl_quote)
+
+        net_pnl_quote_mock.return_value = Decimal("2")
+        updated_executor_info = position_executor.executor_info
+        self.assertIsNot(executor_info, updated_executor_info)
+        self.assertEqual(Decimal("2"), updated_executor_info.net_pnl_quote)
+        self.assertIs(updated_executor_info, position_executor.executor_info)
+
+        position_executor._current_retries += 1
+        self.assertEqual(1, position_executor.executor_info.custom_info["current_retries"])
+
+        position_executor._status = RunnableStatus.TERMINATED
+        position_executor.close_type = CloseType.TAKE_PROFIT
+        self.assertTrue(position_executor.executor_info.is_done)
+        self.assertEqual(CloseType.TAKE_PROFIT, position_executor.executor_info.close_type)
+
+        closed_executor_info = position_executor.executor_info
+        position_executor.invalidate_executor_info()
+        self.assertIsNot(closed_executor_info, position_executor.executor_info)
+
+    @patch.object(PositionExecutor, "filled_amount_quote", new_callable=PropertyMock, return_value=Decimal("0"))
+    @patch.object(PositionExecutor, "get_net_pnl_quote", return_value=Decimal("0"))
+    @patch.object(PositionExecutor, "get_price")
+    def test_executor_info_follows_market_price(self, mock_price, *_):
+        mock_price.return_value = Decimal("100")
+        position_executor = self.get_position_executor_running_from_config(self.get_position_config_market_long())
+
+        executor_info = position_executor.executor_info
+        self.assertEqual(Decimal("100"), executor_info.custom_info["close_price"])
+        self.assertIs(executor_info, position_executor.executor_info)
+
+        mock_price.return_value = Decimal("101")
+        self.assertEqual(Decimal("101"), position_executor.executor_info.custom_info["close_price"])
+
     @patch.object(PositionExecutor, "get_trading_rules")
     @patch.object(PositionExecutor, "get_price")
     def test_early_stop(self, mock_price, trading_rules_mock):
@@ -15,7 +15,11 @@ from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import Arbit
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
-from hummingbot.strategy_v2.executors.executor_orchestrator import ExecutorOrchestrator, PositionHold
+from hummingbot.strategy_v2.executors.executor_orchestrator import (
+    ActiveExecutorsPerformance,
+    ExecutorOrchestrator,
+    PositionHold,
+)
 from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
@@ -367,6 +371,79 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.orchestrator.active_executors["test"] = [position_executor]
         self.orchestrator.stop_executor(StopExecutorAction(executor_id="123", controller_id="test"))
 
+    @patch("hummingbot.strategy_v2.executors.executor_orchestrator.MarketsRecorder.get_instance")
+    def test_performance_report_updates_running_totals_of_active_executors(self, mock_get_instance: MagicMock):
+        mock_get_instance.return_value = MagicMock(spec=MarketsRecorder)
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+
+        def executor_info(status: RunnableStatus, net_pnl_quote: Decimal, close_type=None) -> ExecutorInfo:
+            return ExecutorInfo(
+                id=config.id, timestamp=1234, type="position_executor", status=status, config=config,
+                close_type=close_type, filled_amount_quote=Decimal(100), net_pnl_quote=net_pnl_quote,
+                net_pnl_pct=Decimal(0), cum_fees_quote=Decimal(1), is_trading=True,
+                is_active=status != RunnableStatus.TERMINATED, custom_info={"side": TradeType.BUY})
+
+        running_executor = MagicMock(spec=PositionExecutor)
+        running_executor.executor_info = executor_info(RunnableStatus.RUNNING, Decimal(5))
+        running_executor.config = config
+        running_executor.is_active = True
+        done_executor = MagicMock(spec=PositionExecutor)
+        done_executor.executor_info = executor_info(RunnableStatus.TERMINATED, Decimal(3), CloseType.TAKE_PROFIT)
+        done_executor.config = MagicMock(id="done")
+        done_executor.is_active = False
+        self.orchestrator.active_executors["test"] = [running_executor, done_executor]
+        self.orchestrator.cached_performance["test"] = PerformanceReport()
+
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(5), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(3), report.realized_pnl_quote)
+        self.assertEqual(Decimal(200), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, report.close_type_counts)
+
+        running_executor.executor_info = executor_info(RunnableStatus.TERMINATED, Decimal(-2), CloseType.STOP_LOSS)
+        report = self.orchestrator.get_all_reports()["test"]["performance"]
+        self.assertEqual(Decimal(0), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(1), report.realized_pnl_quote)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+
+        self.orchestrator.execute_action(StoreExecutorAction(executor_id="done", controller_id="test"))
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(1), report.realized_pnl_quote)
+        self.assertEqual(Decimal(200), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+        self.assertEqual(Decimal(3), self.orchestrator.cached_performance["test"].realized_pnl_quote)
+
+    def test_active_executors_performance_ignores_nan_pnl(self):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+
+        def executor_info(net_pnl_quote: Decimal) -> ExecutorInfo:
+            return ExecutorInfo(
+                id=config.id, timestamp=1234, type="position_executor", status=RunnableStatus.RUNNING, config=config,
+                close_type=None, filled_amount_quote=Decimal(100), net_pnl_quote=net_pnl_quote,
+                net_pnl_pct=Decimal(0), cum_fees_quote=Decimal(1), is_trading=True, is_active=True,
+                custom_info={"side": TradeType.BUY})
+
+        executor = MagicMock(spec=PositionExecutor)
+        performance = ActiveExecutorsPerformance()
+
+        # The snapshot is copied without validation, as the executors can report a NaN pnl before having a price
+        performance.update(executor, executor_info(Decimal(0)).model_copy(update={"net_pnl_quote": Decimal("NaN")}))
+        self.assertEqual(Decimal(0), performance.unrealized_pnl_quote)
+        self.assertEqual(Decimal(100), performance.volume_traded)
+
+        performance.update(executor, executor_info(Decimal(5)))
+        self.assertEqual(Decimal(5), performance.unrealized_pnl_quote)
+
+        performance.remove(executor)
+        self.assertEqual(Decimal(0), performance.unrealized_pnl_quote)
+        self.assertEqual(Decimal(0), performance.volume_traded)
+
     @patch("hummingbot.strategy_v2.executors.executor_orchestrator.MarketsRecorder.get_instance")
     def test_generate_performance_report_with_loaded_positions(self, mock_get_instance: MagicMock):
         # Create mock markets recorder